@@ -0,0 +1,512 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the Parser of the Arguments of the Command Line from the ArgParse Library
+from argparse import ArgumentParser
+
+# Import the Dumps (i.e., Serialization to JSON) from the JSON Library
+from json import dumps
+
+# Import the Context of the Processes from the MultiProcessing Library
+from multiprocessing import get_context
+
+# Import the number of CPU Cores from the OS Library
+from os import cpu_count
+
+# Import the Platform's description and the Python's version from the Platform Library
+from platform import platform, python_version
+
+# Import the Platform's name and the Standard Output from the System Library
+from sys import platform as system_platform, stdout
+
+# Import the current Time and the Performance Counter from the Time Library
+from time import time, perf_counter
+
+# Import the versions of the Qiskit's Packages from Qiskit
+from qiskit import __qiskit_version__
+
+# Import the String IDs for the Types of the Communication Physical Medium
+# from Common.Enumerations.CommunicationPhysicalMediumTypes
+from src.common.enumerations.CommunicationPhysicalMediumTypes import FIBER_OPTIC
+
+# Import the String IDs for the Types of the Quantum Signal Variable Mode
+# from Common.Enumerations.QuantumSignalVariableModeTypes
+from src.common.enumerations.QuantumSignalVariableModeTypes import DISCRETE_VARIABLES
+
+# Import GHZ_STATE and W_STATE IDs from Common.QuantumEntanglementTypes
+from src.common.enumerations.QuantumEntanglementTypes import GHZ_STATE, W_STATE
+
+# Import the possible Strategies for the Eavesdropping Detection
+# from Common.Enumerations.StrategiesForEavesdroppingDetection
+from src.common.enumerations.StrategiesForEavesdroppingDetection import \
+    POSSIBLE_STRATEGIES_FOR_EAVESDROPPING_DETECTION
+
+# Import the possible Execution Modes and the String ID for the Sequential Execution
+# from Common.Enumerations.SemiQuantumCryptographyProtocolExecutionModeTypes
+from src.common.enumerations.SemiQuantumCryptographyProtocolExecutionModeTypes import \
+    POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_EXECUTION_MODE_TYPES, SEQUENTIAL_EXECUTION
+
+# Import the possible Types of Quantum Simulators and the String ID for the Aer QASM Simulator
+# from Common.Enumerations.QuantumSimulatorTypes
+from src.common.enumerations.QuantumSimulatorTypes import POSSIBLE_QUANTUM_SIMULATOR_TYPES, AER_QASM_SIMULATOR
+
+# Import the possible Layouts of Quantum Circuits and the String ID for the Expanded Layout
+# from Common.Enumerations.QuantumCircuitLayoutTypes
+from src.common.enumerations.QuantumCircuitLayoutTypes import POSSIBLE_QUANTUM_CIRCUIT_LAYOUT_TYPES, EXPANDED_LAYOUT
+
+# Import the possible Diagnostics Levels and the String ID for the Basic Diagnostics
+# from Common.Enumerations.SemiQuantumCryptographyProtocolDiagnosticsLevelTypes
+from src.common.enumerations.SemiQuantumCryptographyProtocolDiagnosticsLevelTypes import \
+    POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_DIAGNOSTICS_LEVEL_TYPES, BASIC_DIAGNOSTICS
+
+# Import ProtocolEventLog from Common.Events
+from src.common.events import ProtocolEventLog
+
+# Import the Null and the Latency Sinks for the Events of the Protocol from Common.Events.Sinks
+from src.common.events.sinks import NullProtocolEventSink, LatencyProtocolEventSink
+
+# Import the User/Client from Common.User_Client
+from src.common.user_client import UserClient
+
+# Import QiskitSQCKAProtocolExecutorService from IBM_Qiskit.Cryptography.SemiQuantumConferenceKeyAgreement
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement \
+    .services.executor.QiskitSQCKAProtocolExecutorService import QiskitSQCKAProtocolExecutorService
+
+# Try to import the Resource Usage from the Resource Library
+# (i.e., only available on POSIX Platforms, and thus, the peak Resident Set Size is not measured on the other ones)
+try:
+    from resource import getrusage, RUSAGE_SELF
+
+# If the Resource Library is not available
+except ImportError:
+
+    # Set the Resource Usage as not available
+    getrusage = RUSAGE_SELF = None
+
+
+# Constants
+
+# The default numbers of Parties involved in the Protocol, for the Benchmark
+DEFAULT_BENCHMARK_NUM_PARTIES = list(range(2, 13))
+
+# The default numbers of Rounds of the Protocol, for the Benchmark
+DEFAULT_BENCHMARK_NUM_ROUNDS = [16, 256, 4096, 100000]
+
+# The default types of the Quantum Entanglement, for the Benchmark
+# (i.e., the ones whose valid Quantum States are known by the Executor Service)
+DEFAULT_BENCHMARK_QUANTUM_ENTANGLEMENT_TYPES = [GHZ_STATE, W_STATE]
+
+# The default Strategies for the Eavesdropping Detection, for the Benchmark
+DEFAULT_BENCHMARK_STRATEGIES_FOR_EAVESDROPPING_DETECTION = POSSIBLE_STRATEGIES_FOR_EAVESDROPPING_DETECTION
+
+# The default Seed of the Sessions of the Protocol, for the Benchmark
+DEFAULT_BENCHMARK_SEED = 2023
+
+# The default maximum time (in seconds) for each configuration of the Benchmark, before it is terminated
+DEFAULT_BENCHMARK_TIMEOUT_SECONDS = 3600
+
+# The Status of a configuration of the Benchmark which was executed successfully
+BENCHMARK_STATUS_OK = "OK"
+
+# The Status of a configuration of the Benchmark which is not valid for the Protocol
+# (e.g., a GHZ State for only 2 Parties)
+BENCHMARK_STATUS_INVALID_CONFIGURATION = "INVALID_CONFIGURATION"
+
+# The Status of a configuration of the Benchmark whose execution failed
+BENCHMARK_STATUS_FAILED = "FAILED"
+
+# The Status of a configuration of the Benchmark whose execution exceeded the maximum time
+BENCHMARK_STATUS_TIMEOUT = "TIMEOUT"
+
+
+# Return the peak Resident Set Size (RSS), in bytes, of the current Process
+# (i.e., None, if it can not be measured on the current Platform)
+def get_peak_resident_set_size_bytes():
+
+    # If the Resource Usage is not available
+    if getrusage is None:
+
+        # Return None, since the peak Resident Set Size can not be measured
+        return None
+
+    # Retrieve the peak Resident Set Size of the current Process
+    # (i.e., in bytes, on macOS, and in kilobytes, on the other POSIX Platforms)
+    peak_resident_set_size = getrusage(RUSAGE_SELF).ru_maxrss
+
+    # Return the peak Resident Set Size, in bytes
+    return peak_resident_set_size if system_platform == "darwin" else (peak_resident_set_size * 1024)
+
+
+# Return the description of the Environment where the Benchmark is executed
+def get_benchmark_environment():
+
+    # Return the description of the Platform, Python, Qiskit's Packages and number of CPU Cores
+    return {"platform": platform(), "python_version": python_version(),
+            "qiskit_versions": dict(__qiskit_version__), "cpu_count": cpu_count()}
+
+
+# Create and initialise the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+# for the given configuration of the Benchmark, with the Distributor (Alice) connected to all the other Parties
+def create_benchmark_qiskit_sqcka_protocol_executor_service(benchmark_configuration):
+
+    # Retrieve the number of Parties involved in the Protocol
+    num_parties = benchmark_configuration["num_parties"]
+
+    # The name of the Parties involved in the Protocol (i.e., Alice, as the Distributor, and the Bobs)
+    parties_names = ["Alice"] + ["Bob_{}".format(num_bob) for num_bob in range(1, num_parties)]
+
+    # The Communication Path's Edges between the Parties' Names (i.e., from and to the Distributor)
+    communication_path_edges_between_parties_names = []
+
+    # For each Semi-Quantum Party involved in the Protocol
+    for party_name in parties_names[1:]:
+
+        # Append the Communication Path's Edges from and to the Distributor
+        communication_path_edges_between_parties_names += [["Alice", party_name], [party_name, "Alice"]]
+
+    # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service
+    qiskit_sqcka_protocol_executor_service = QiskitSQCKAProtocolExecutorService()
+
+    # Configure the Parameters of the Protocol, from the configuration of the Benchmark
+    qiskit_sqcka_protocol_executor_service \
+        .configure_protocol_parameters(num_parties, benchmark_configuration["num_rounds"],
+                                       (num_parties - 1), (num_parties - 1),
+                                       DISCRETE_VARIABLES, FIBER_OPTIC, ["X", "Z"],
+                                       benchmark_configuration["quantum_entanglement_type"],
+                                       benchmark_configuration["strategy_for_eavesdropping_detection"],
+                                       communication_path_edges_between_parties_names, ([50] * (num_parties - 1)),
+                                       execution_mode_type=benchmark_configuration["execution_mode_type"],
+                                       quantum_simulator_type=benchmark_configuration["quantum_simulator_type"],
+                                       seed=benchmark_configuration["seed"],
+                                       diagnostics_level_type=benchmark_configuration["diagnostics_level_type"],
+                                       quantum_circuit_layout_type=benchmark_configuration
+                                       ["quantum_circuit_layout_type"])
+
+    # Generate the Bipartite Pre-Shared Key, shared by the Distributor and each Semi-Quantum Party
+    bipartite_pre_shared_key = qiskit_sqcka_protocol_executor_service.generate_protocol_bipartite_pre_shared_key()
+
+    # Create the Users/Clients of the Parties involved in the Protocol
+    users_clients = [UserClient.UserClient(party_name) for party_name in parties_names]
+
+    # For each Semi-Quantum Party involved in the Protocol
+    for user_client in users_clients[1:]:
+
+        # Add the Bipartite Pre-Shared Key, between the Distributor Party Entity and the current Semi-Quantum Party
+        qiskit_sqcka_protocol_executor_service \
+            .add_protocol_bipartite_pre_shared_key(users_clients[0], user_client, bipartite_pre_shared_key)
+
+    # Set the Bipartite Pre-Shared Keys of the Protocol, as initialised
+    qiskit_sqcka_protocol_executor_service.set_protocol_bipartite_pre_shared_keys_initialised()
+
+    # Set the Parties (including the Distributor Party Entity) of the Protocol
+    qiskit_sqcka_protocol_executor_service \
+        .set_protocol_party_entities(users_clients, parties_names, "Alice",
+                                     qiskit_sqcka_protocol_executor_service.get_protocol_bipartite_pre_shared_keys())
+
+    # Initialise the final object for the Protocol
+    qiskit_sqcka_protocol_executor_service.initialise_protocol()
+
+    # Return the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service
+    return qiskit_sqcka_protocol_executor_service
+
+
+# Run one configuration of the Benchmark, in the current Process, returning its Results, as a Dictionary,
+# with the set up and start latencies, the throughput of Rounds, the peak Resident Set Size (RSS) and,
+# if requested, the summary of the latencies of the phases of the Protocol, measured from its Events
+# NOTE: The peak Resident Set Size is the one of the whole Process, and thus, it is only meaningful for
+#       the first configuration executed by the Process (i.e., each configuration should run in its own Process)
+def run_benchmark_configuration(benchmark_configuration):
+
+    # Initialise the Results of the configuration of the Benchmark, with the configuration itself
+    benchmark_results = dict(benchmark_configuration)
+
+    # If the latencies of the phases of the Protocol are meant to be measured
+    if benchmark_configuration["phases_latencies_flag"]:
+
+        # Create the Latency Sink, to measure the latencies of the phases of the Protocol, from its Events
+        protocol_event_sink = LatencyProtocolEventSink.LatencyProtocolEventSink("latency_protocol_event_sink")
+
+    # If the latencies of the phases of the Protocol are not meant to be measured
+    else:
+
+        # Create the Null Sink, such that the Protocol does not even create its Events
+        protocol_event_sink = NullProtocolEventSink.NullProtocolEventSink("null_protocol_event_sink")
+
+    # Configure the default Event Log, only with the created Sink
+    ProtocolEventLog.ProtocolEventLog.configure_default_protocol_event_log([protocol_event_sink])
+
+    # Retrieve the Performance Counter before the set up of the Protocol
+    set_up_perf_counter = perf_counter()
+
+    # Try to set up the Protocol, for the configuration of the Benchmark
+    try:
+        qiskit_sqcka_protocol_executor_service = \
+            create_benchmark_qiskit_sqcka_protocol_executor_service(benchmark_configuration)
+
+    # If the configuration of the Benchmark is not valid for the Protocol
+    except ValueError as value_error:
+
+        # Set the Status and the Error of the configuration of the Benchmark
+        benchmark_results.update(status=BENCHMARK_STATUS_INVALID_CONFIGURATION, error=str(value_error))
+
+        # Return the Results of the configuration of the Benchmark
+        return benchmark_results
+
+    # Set the latency of the set up of the Protocol, and the peak Resident Set Size, after it
+    benchmark_results.update(set_up_seconds=(perf_counter() - set_up_perf_counter),
+                             peak_rss_bytes_after_set_up=get_peak_resident_set_size_bytes())
+
+    # If the latencies of the phases of the Protocol are meant to be measured
+    if benchmark_configuration["phases_latencies_flag"]:
+
+        # Discard the latencies measured during the set up of the Protocol
+        protocol_event_sink.reset()
+
+    # Retrieve the Performance Counter before the start of the Protocol
+    start_protocol_perf_counter = perf_counter()
+
+    # Try to start the Protocol, executing all its Rounds
+    try:
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+    # If the configuration of the Benchmark is not valid for the Rounds of the Protocol
+    # (e.g., a GHZ State for only 2 Parties, which is only checked when its Quantum Entanglement is prepared)
+    except ValueError as value_error:
+
+        # Set the Status and the Error of the configuration of the Benchmark
+        benchmark_results.update(status=BENCHMARK_STATUS_INVALID_CONFIGURATION, error=str(value_error))
+
+        # Return the Results of the configuration of the Benchmark
+        return benchmark_results
+
+    # If the execution of the Rounds of the Protocol failed (e.g., too many Qubits for the Simulator)
+    except (RuntimeError, MemoryError) as execution_error:
+
+        # Set the Status and the Error of the configuration of the Benchmark
+        benchmark_results.update(status=BENCHMARK_STATUS_FAILED,
+                                 error="{}: {}".format(type(execution_error).__name__, execution_error))
+
+        # Return the Results of the configuration of the Benchmark
+        return benchmark_results
+
+    # Compute the latency of the start of the Protocol
+    start_protocol_seconds = perf_counter() - start_protocol_perf_counter
+
+    # Retrieve the number of Rounds executed (i.e., less than the configured ones, if the Protocol was aborted)
+    num_rounds_executed = \
+        len(qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds())
+
+    # Set the Status, latency of the start of the Protocol, throughput of Rounds and peak Resident Set Size
+    benchmark_results.update(status=BENCHMARK_STATUS_OK, error=None, num_rounds_executed=num_rounds_executed,
+                             start_protocol_seconds=start_protocol_seconds,
+                             rounds_per_second=((num_rounds_executed / start_protocol_seconds)
+                                                if start_protocol_seconds > 0 else None),
+                             peak_rss_bytes=get_peak_resident_set_size_bytes())
+
+    # Set the summary of the latencies of the phases of the Protocol, if they were measured
+    benchmark_results["phases_latencies"] = \
+        (protocol_event_sink.get_phases_latencies_summary()
+         if benchmark_configuration["phases_latencies_flag"] else None)
+
+    # Return the Results of the configuration of the Benchmark
+    return benchmark_results
+
+
+# Run one configuration of the Benchmark, in a dedicated (spawned) Process,
+# sending its Results through the given Connection of a Pipe
+def run_benchmark_configuration_in_dedicated_process(benchmark_configuration, connection):
+
+    # Try to run the configuration of the Benchmark
+    try:
+        benchmark_results = run_benchmark_configuration(benchmark_configuration)
+
+    # If any unexpected Error occurred, while running the configuration of the Benchmark
+    except Exception as unexpected_error:
+
+        # Set the Results of the configuration of the Benchmark, as failed, with the unexpected Error
+        benchmark_results = dict(benchmark_configuration, status=BENCHMARK_STATUS_FAILED,
+                                 error="{}: {}".format(type(unexpected_error).__name__, unexpected_error))
+
+    # Send the Results of the configuration of the Benchmark and close the Connection
+    connection.send(benchmark_results)
+    connection.close()
+
+
+# Run one configuration of the Benchmark, isolated in a dedicated (spawned) Process, returning its Results
+# NOTE: Each configuration runs in its own Process, such that its peak Resident Set Size (RSS) is not
+#       inherited from the previous configurations, and it can be terminated, if it exceeds the given timeout
+def run_benchmark_configuration_isolated(benchmark_configuration, timeout_seconds=DEFAULT_BENCHMARK_TIMEOUT_SECONDS):
+
+    # Retrieve the Context of the Processes, spawning new ones, instead of forking the current one
+    # (i.e., forking a Process with the running Threads of the Simulators can lead to deadlocks)
+    spawn_context = get_context("spawn")
+
+    # Create the Pipe, to receive the Results from the dedicated Process
+    parent_connection, child_connection = spawn_context.Pipe(duplex=False)
+
+    # Create and start the dedicated Process, for the configuration of the Benchmark
+    benchmark_process = spawn_context.Process(target=run_benchmark_configuration_in_dedicated_process,
+                                              args=(benchmark_configuration, child_connection))
+    benchmark_process.start()
+
+    # Close the Connection of the child, in the current Process, such that the end of the Pipe is detected
+    child_connection.close()
+
+    # If the Results are received, before the timeout
+    # NOTE: The Results are received before the dedicated Process is joined, to not block it on a full Pipe
+    if parent_connection.poll(timeout_seconds):
+
+        # Try to receive the Results of the configuration of the Benchmark
+        try:
+            benchmark_results = parent_connection.recv()
+
+        # If the dedicated Process ended, without sending its Results (e.g., killed by lack of Memory)
+        except EOFError:
+
+            # Set the Results of the configuration of the Benchmark, as failed
+            benchmark_results = dict(benchmark_configuration, status=BENCHMARK_STATUS_FAILED,
+                                     error="The dedicated Process ended without sending its Results!!!")
+
+    # If the Results are not received, before the timeout
+    else:
+
+        # Terminate the dedicated Process
+        benchmark_process.terminate()
+
+        # Set the Results of the configuration of the Benchmark, as timed out
+        benchmark_results = dict(benchmark_configuration, status=BENCHMARK_STATUS_TIMEOUT,
+                                 error="The configuration exceeded {} seconds!!!".format(timeout_seconds))
+
+    # Wait for the end of the dedicated Process and close the Connection of the parent
+    benchmark_process.join()
+    parent_connection.close()
+
+    # Return the Results of the configuration of the Benchmark
+    return benchmark_results
+
+
+# Build all the configurations of the Benchmark, from the Cartesian product of
+# the given numbers of Parties and Rounds, types of Quantum Entanglement and Strategies for Eavesdropping Detection
+def build_benchmark_configurations(num_parties_list, num_rounds_list, quantum_entanglement_types,
+                                   strategies_for_eavesdropping_detection,
+                                   execution_mode_type=SEQUENTIAL_EXECUTION,
+                                   quantum_simulator_type=AER_QASM_SIMULATOR,
+                                   quantum_circuit_layout_type=EXPANDED_LAYOUT,
+                                   diagnostics_level_type=BASIC_DIAGNOSTICS,
+                                   seed=DEFAULT_BENCHMARK_SEED, phases_latencies_flag=True):
+
+    # Return the configurations of the Benchmark, from the smallest to the largest ones
+    return [{"num_parties": num_parties, "num_rounds": num_rounds,
+             "quantum_entanglement_type": quantum_entanglement_type,
+             "strategy_for_eavesdropping_detection": strategy_for_eavesdropping_detection,
+             "execution_mode_type": execution_mode_type, "quantum_simulator_type": quantum_simulator_type,
+             "quantum_circuit_layout_type": quantum_circuit_layout_type,
+             "diagnostics_level_type": diagnostics_level_type, "seed": seed,
+             "phases_latencies_flag": phases_latencies_flag}
+            for num_rounds in num_rounds_list
+            for num_parties in num_parties_list
+            for quantum_entanglement_type in quantum_entanglement_types
+            for strategy_for_eavesdropping_detection in strategies_for_eavesdropping_detection]
+
+
+# Run the Benchmark of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+# from the given Arguments of the Command Line, writing the Results of each configuration,
+# as one JSON Object per line (i.e., JSON Lines), to the Standard Output or to the given File
+def main(arguments=None):
+
+    # Create the Parser of the Arguments of the Command Line
+    argument_parser = ArgumentParser(description="Benchmark of the scaling curve of the Semi-Quantum Conference "
+                                                 "Key Agreement (SQCKA) Protocol, as JSON Lines")
+
+    # Add the Arguments for the grid of the configurations of the Benchmark
+    argument_parser.add_argument("--num-parties", type=int, nargs="+", default=DEFAULT_BENCHMARK_NUM_PARTIES)
+    argument_parser.add_argument("--num-rounds", type=int, nargs="+", default=DEFAULT_BENCHMARK_NUM_ROUNDS)
+    argument_parser.add_argument("--quantum-entanglement-types", nargs="+",
+                                 default=DEFAULT_BENCHMARK_QUANTUM_ENTANGLEMENT_TYPES)
+    argument_parser.add_argument("--strategies-for-eavesdropping-detection", nargs="+",
+                                 default=DEFAULT_BENCHMARK_STRATEGIES_FOR_EAVESDROPPING_DETECTION,
+                                 choices=POSSIBLE_STRATEGIES_FOR_EAVESDROPPING_DETECTION)
+
+    # Add the Arguments for the Parameters of the Protocol, shared by all the configurations of the Benchmark
+    argument_parser.add_argument("--execution-mode-type", default=SEQUENTIAL_EXECUTION,
+                                 choices=POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_EXECUTION_MODE_TYPES)
+    argument_parser.add_argument("--quantum-simulator-type", default=AER_QASM_SIMULATOR,
+                                 choices=POSSIBLE_QUANTUM_SIMULATOR_TYPES)
+    argument_parser.add_argument("--quantum-circuit-layout-type", default=EXPANDED_LAYOUT,
+                                 choices=POSSIBLE_QUANTUM_CIRCUIT_LAYOUT_TYPES)
+    argument_parser.add_argument("--diagnostics-level-type", default=BASIC_DIAGNOSTICS,
+                                 choices=POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_DIAGNOSTICS_LEVEL_TYPES)
+    argument_parser.add_argument("--seed", type=int, default=DEFAULT_BENCHMARK_SEED)
+
+    # Add the Arguments for the execution of the Benchmark itself
+    argument_parser.add_argument("--no-phases-latencies", action="store_true",
+                                 help="do not measure the latencies of the phases (i.e., no Events are created)")
+    argument_parser.add_argument("--timeout-seconds", type=float, default=DEFAULT_BENCHMARK_TIMEOUT_SECONDS)
+    argument_parser.add_argument("--output", default=None, help="the JSON Lines File (default: Standard Output)")
+
+    # Parse the Arguments of the Command Line
+    parsed_arguments = argument_parser.parse_args(arguments)
+
+    # Build all the configurations of the Benchmark
+    benchmark_configurations = \
+        build_benchmark_configurations(parsed_arguments.num_parties, parsed_arguments.num_rounds,
+                                       parsed_arguments.quantum_entanglement_types,
+                                       parsed_arguments.strategies_for_eavesdropping_detection,
+                                       execution_mode_type=parsed_arguments.execution_mode_type,
+                                       quantum_simulator_type=parsed_arguments.quantum_simulator_type,
+                                       quantum_circuit_layout_type=parsed_arguments.quantum_circuit_layout_type,
+                                       diagnostics_level_type=parsed_arguments.diagnostics_level_type,
+                                       seed=parsed_arguments.seed,
+                                       phases_latencies_flag=(not parsed_arguments.no_phases_latencies))
+
+    # Retrieve the description of the Environment where the Benchmark is executed
+    benchmark_environment = get_benchmark_environment()
+
+    # Open the JSON Lines File for the Results, or use the Standard Output
+    benchmark_output = stdout if parsed_arguments.output is None \
+        else open(parsed_arguments.output, "a", encoding="utf-8")
+
+    # Try to run all the configurations of the Benchmark
+    try:
+
+        # For each configuration of the Benchmark
+        for benchmark_configuration in benchmark_configurations:
+
+            # Run the current configuration of the Benchmark, isolated in its own Process
+            benchmark_results = run_benchmark_configuration_isolated(benchmark_configuration,
+                                                                     parsed_arguments.timeout_seconds)
+
+            # Set the Timestamp and the Environment of the Results of the current configuration of the Benchmark
+            benchmark_results.update(timestamp=time(), environment=benchmark_environment)
+
+            # Write the Results of the current configuration, as one JSON Object per line, as soon as they are known
+            benchmark_output.write(dumps(benchmark_results) + "\n")
+            benchmark_output.flush()
+
+    # Close the JSON Lines File for the Results, if it is not the Standard Output
+    finally:
+
+        # If the Results were written to a JSON Lines File
+        if benchmark_output is not stdout:
+
+            # Close the JSON Lines File
+            benchmark_output.close()
+
+
+# Run the Benchmark, when this Module is executed as a Script
+# (e.g., python -m benchmark.BenchmarkQiskitSQCKAProtocolExecutorService --num-parties 3 4 --num-rounds 16)
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# The Enumerations and Constants
+
+# The possible Information Reconciliation Types
+POSSIBLE_INFORMATION_RECONCILIATION_TYPES = ["CASCADE_RECONCILIATION", "LDPC_RECONCILIATION"]
+
+# The String ID for the Cascade Information Reconciliation
+# (i.e., interactive, by comparing the parities of blocks of the keys and bisecting the ones with different parities,
+# over several passes, with shuffled positions and blocks of increasing sizes)
+CASCADE_RECONCILIATION = "CASCADE_RECONCILIATION"
+
+# The String ID for the Low-Density Parity-Check (LDPC) Information Reconciliation
+# (i.e., one-way, by sending the syndromes of frames of the key, for a sparse Parity-Check Matrix,
+# which are decoded with Belief Propagation)
+LDPC_RECONCILIATION = "LDPC_RECONCILIATION"
@@ -0,0 +1,28 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# The Enumerations and Constants
+
+# The possible Layout Types of the Quantum Circuits of the Rounds of the Protocol
+POSSIBLE_QUANTUM_CIRCUIT_LAYOUT_TYPES = ["EXPANDED_LAYOUT", "COMPACT_LAYOUT"]
+
+# The String ID for the Expanded Layout of the Quantum Circuits of the Rounds of the Protocol
+# (i.e., (3n - 2) Qubits, for the Distributor, Quantum Communication Channels and Semi-Quantum Party Registers,
+# where the Qubits are sent and received, by swapping them between those Registers)
+EXPANDED_LAYOUT = "EXPANDED_LAYOUT"
+
+# The String ID for the Compact Layout of the Quantum Circuits of the Rounds of the Protocol
+# (i.e., only n Qubits, one for each Party Entity, where the Quantum Communication Channels are modeled logically,
+# by tracking which Party Entity holds each Qubit, instead of swapping it between physical Registers)
+COMPACT_LAYOUT = "COMPACT_LAYOUT"
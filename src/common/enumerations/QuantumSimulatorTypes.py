@@ -0,0 +1,40 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# The Enumerations and Constants
+
+# The possible Quantum Simulator Types, for the execution of the Quantum Circuits
+POSSIBLE_QUANTUM_SIMULATOR_TYPES = ["AER_QASM_SIMULATOR", "STABILIZER_SIMULATOR", "SPARSE_STATE_VECTOR_SIMULATOR",
+                                    "BATCHED_STATE_VECTOR_SIMULATOR"]
+
+# The possible types of Bipartite and Multipartite Quantum Entanglements supported by the Stabilizer Simulator
+# (i.e., the ones prepared and inverted only with Clifford Gates)
+POSSIBLE_QUANTUM_ENTANGLEMENT_TYPES_FOR_STABILIZER_SIMULATOR = ["BELL_STATE", "GHZ_STATE",
+                                                                "RESOURCE_STATE", "GRAPH_STATE"]
+
+# The possible types of Bipartite and Multipartite Quantum Entanglements supported by the Sparse State Vector Simulator
+# (i.e., the ones with a small number of non-null Amplitudes, on the Computational Basis)
+POSSIBLE_QUANTUM_ENTANGLEMENT_TYPES_FOR_SPARSE_STATE_VECTOR_SIMULATOR = ["BELL_STATE", "GHZ_STATE", "W_STATE"]
+
+# The String ID for the QASM (Quantum ASseMbly) Simulator of the IBM Qiskit's Aer
+AER_QASM_SIMULATOR = "AER_QASM_SIMULATOR"
+
+# The String ID for the Stabilizer Simulator (i.e., Tableau-based, for Clifford Quantum Circuits)
+STABILIZER_SIMULATOR = "STABILIZER_SIMULATOR"
+
+# The String ID for the Sparse State Vector Simulator (i.e., keeping only the non-null Amplitudes of the State Vector)
+SPARSE_STATE_VECTOR_SIMULATOR = "SPARSE_STATE_VECTOR_SIMULATOR"
+
+# The String ID for the Batched State Vector Simulator (i.e., executing all the Shots at once, as a stack)
+BATCHED_STATE_VECTOR_SIMULATOR = "BATCHED_STATE_VECTOR_SIMULATOR"
@@ -0,0 +1,33 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# The Enumerations and Constants
+
+# The possible Semi-Quantum Cryptography Protocol Diagnostics Level Types
+POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_DIAGNOSTICS_LEVEL_TYPES = ["NO_DIAGNOSTICS", "BASIC_DIAGNOSTICS",
+                                                                       "STATE_VECTOR_DIAGNOSTICS"]
+
+# The String ID for No Diagnostics of the Rounds of the Protocol
+# (i.e., the prepared Multipartite Entanglements are not represented at all)
+NO_DIAGNOSTICS = "NO_DIAGNOSTICS"
+
+# The String ID for the Basic Diagnostics of the Rounds of the Protocol
+# (i.e., the prepared Multipartite Entanglements are represented from their known structure,
+# computed only once, for each type of Quantum Entanglement and number of Parties)
+BASIC_DIAGNOSTICS = "BASIC_DIAGNOSTICS"
+
+# The String ID for the State Vector Diagnostics of the Rounds of the Protocol
+# (i.e., the prepared Multipartite Entanglements are represented from their State Vectors,
+# simulated on every Round, which is expensive, since the Quantum Circuits have (3n - 2) Qubits)
+STATE_VECTOR_DIAGNOSTICS = "STATE_VECTOR_DIAGNOSTICS"
@@ -0,0 +1,89 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# The Enumerations and Constants
+
+# The possible Semi-Quantum Cryptography Protocol Event Types
+POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_EVENT_TYPES = ["ROUND_STARTED", "ENTANGLEMENT_PREPARED",
+                                                           "QUBITS_SENT", "QUBIT_RECEIVED", "QUBIT_MEASURED",
+                                                           "QUBIT_REFLECTED", "QUBITS_RESET", "QUBIT_RESENT",
+                                                           "QUBIT_SENT_BACK", "ROUND_RESULT_OBTAINED",
+                                                           "ENTANGLEMENT_MEASURED", "EAVESDROPPING_ALERT",
+                                                           "ROUND_FINISHED", "ROUNDS_SUMMARY",
+                                                           "QUANTUM_BIT_ERROR_RATE_ESTIMATED", "PROTOCOL_ABORTED",
+                                                           "RAW_CONFERENCE_KEY_RECONCILED",
+                                                           "CONFERENCE_KEYS_PRIVACY_AMPLIFIED",
+                                                           "SWAP_TESTS_PERFORMED"]
+
+# The String ID for the Event of the start of a Round of the Protocol
+ROUND_STARTED = "ROUND_STARTED"
+
+# The String ID for the Event of the preparation of the Multipartite Entanglement, by the Distributor Party Entity
+ENTANGLEMENT_PREPARED = "ENTANGLEMENT_PREPARED"
+
+# The String ID for the Event of the sending of the Qubits (Particles), by the Distributor Party Entity
+QUBITS_SENT = "QUBITS_SENT"
+
+# The String ID for the Event of the reception of a Qubit (Particle), by a Semi-Quantum Party Entity
+QUBIT_RECEIVED = "QUBIT_RECEIVED"
+
+# The String ID for the Event of the Measurement of a Qubit (Particle), by a Semi-Quantum Party Entity
+QUBIT_MEASURED = "QUBIT_MEASURED"
+
+# The String ID for the Event of the reflection of a Qubit (Particle), by a Semi-Quantum Party Entity
+QUBIT_REFLECTED = "QUBIT_REFLECTED"
+
+# The String ID for the Event of the reset of the Qubits (Particles), after their Measurement
+QUBITS_RESET = "QUBITS_RESET"
+
+# The String ID for the Event of the recreation of a measured Qubit (Particle), before resending it
+QUBIT_RESENT = "QUBIT_RESENT"
+
+# The String ID for the Event of the sending back of a Qubit (Particle), by a Semi-Quantum Party Entity
+QUBIT_SENT_BACK = "QUBIT_SENT_BACK"
+
+# The String ID for the Event of the Result obtained for a SIFT (Measure and Resend) Round
+ROUND_RESULT_OBTAINED = "ROUND_RESULT_OBTAINED"
+
+# The String ID for the Event of the Measurement of the Multipartite Entanglement reflected back,
+# by the Distributor Party Entity, for a CTRL (Reflect) Round
+ENTANGLEMENT_MEASURED = "ENTANGLEMENT_MEASURED"
+
+# The String ID for the Event of the Detection of Eavesdropping
+EAVESDROPPING_ALERT = "EAVESDROPPING_ALERT"
+
+# The String ID for the Event of the end of a Round of the Protocol
+ROUND_FINISHED = "ROUND_FINISHED"
+
+# The String ID for the Event of the summary of several Rounds of the Protocol, executed at once
+ROUNDS_SUMMARY = "ROUNDS_SUMMARY"
+
+# The String ID for the Event of the estimation of the Quantum Bit Error Rate (QBER),
+# for a block of CTRL (Reflect) Rounds
+QUANTUM_BIT_ERROR_RATE_ESTIMATED = "QUANTUM_BIT_ERROR_RATE_ESTIMATED"
+
+# The String ID for the Event of the early abort of the Protocol,
+# since the Quantum Bit Error Rate (QBER) crossed the threshold to abort it
+PROTOCOL_ABORTED = "PROTOCOL_ABORTED"
+
+# The String ID for the Event of the Information Reconciliation of the Raw Conference Key of a Party,
+# with the Raw Conference Key of the Distributor
+RAW_CONFERENCE_KEY_RECONCILED = "RAW_CONFERENCE_KEY_RECONCILED"
+
+# The String ID for the Event of the Privacy Amplification of the Reconciled Conference Keys of all the Parties
+CONFERENCE_KEYS_PRIVACY_AMPLIFIED = "CONFERENCE_KEYS_PRIVACY_AMPLIFIED"
+
+# The String ID for the Event of the SWAP Tests of all the CTRL (Reflect) Rounds, performed at once,
+# with the estimation of the overlap between the Multipartite Entanglement reflected back and a fresh copy of it
+SWAP_TESTS_PERFORMED = "SWAP_TESTS_PERFORMED"
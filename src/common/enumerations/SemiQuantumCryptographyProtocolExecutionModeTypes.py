@@ -0,0 +1,47 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# The Enumerations and Constants
+
+# The possible Semi-Quantum Cryptography Protocol Execution Mode Types
+POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_EXECUTION_MODE_TYPES = ["SEQUENTIAL_EXECUTION", "BATCHED_EXECUTION",
+                                                                    "ANALYTIC_EXECUTION", "PARALLEL_EXECUTION",
+                                                                    "CHAINED_EXECUTION", "MULTIPLEXED_EXECUTION"]
+
+# The String ID for the Sequential Execution of the Rounds of the Protocol
+# (i.e., each Round is built and executed on the Simulator, one after the other)
+SEQUENTIAL_EXECUTION = "SEQUENTIAL_EXECUTION"
+
+# The String ID for the Batched Execution of the Rounds of the Protocol
+# (i.e., the Quantum Circuits of several Rounds are submitted to the Simulator, as one single Job)
+BATCHED_EXECUTION = "BATCHED_EXECUTION"
+
+# The String ID for the Analytic Execution of the Rounds of the Protocol
+# (i.e., the Results of all the Rounds are sampled at once, from the known outcome distributions of
+# the Multipartite Entanglements, for the ideal case, without building or executing any Quantum Circuit)
+ANALYTIC_EXECUTION = "ANALYTIC_EXECUTION"
+
+# The String ID for the Parallel Execution of the Rounds of the Protocol
+# (i.e., the Rounds are split in shards, executed in batches, by several Processes, in parallel)
+PARALLEL_EXECUTION = "PARALLEL_EXECUTION"
+
+# The String ID for the Chained Execution of the Rounds of the Protocol
+# (i.e., the Quantum Circuits of several Rounds are chained in one single Quantum Circuit, on the same Qubits,
+# separated by Resets, and executed, as one single Job, with one single Shot)
+CHAINED_EXECUTION = "CHAINED_EXECUTION"
+
+# The String ID for the Multiplexed Execution of the Rounds of the Protocol
+# (i.e., the Rounds sharing the same Quantum Circuit are executed, as one single Job, with one Shot for each Round,
+# assigning the Measurement result of each Shot to each one of them)
+MULTIPLEXED_EXECUTION = "MULTIPLEXED_EXECUTION"
@@ -0,0 +1,75 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the current Time from the Time Library
+from time import time
+
+
+# Class of the Event of a Protocol
+# NOTE: The human-readable message of the Event is only formatted on demand (i.e., lazily),
+#       from its format and fields, and thus, the Sinks which do not need it, do not pay for it
+class ProtocolEvent:
+
+    # Constructor for the Event of a Protocol
+    def __init__(self, event_type, num_round, message_format, event_fields):
+
+        # Set the type of the Event
+        self.event_type = event_type
+
+        # Set the number of the Round of the Protocol, in which the Event occurred
+        # (i.e., None, if the Event is not related to a specific Round)
+        self.num_round = num_round
+
+        # Set the format of the human-readable message of the Event
+        self.message_format = message_format
+
+        # Set the Dictionary of the fields of the Event
+        self.event_fields = event_fields
+
+        # Set the Timestamp of the Event
+        self.timestamp = time()
+
+    # Return the type of the Event
+    def get_event_type(self):
+        return self.event_type
+
+    # Return the number of the Round of the Protocol, in which the Event occurred
+    def get_num_round(self):
+        return self.num_round
+
+    # Return the Dictionary of the fields of the Event
+    def get_event_fields(self):
+        return self.event_fields
+
+    # Return the Timestamp of the Event
+    def get_timestamp(self):
+        return self.timestamp
+
+    # Return the human-readable message of the Event, formatting it from its fields
+    def get_message(self):
+        return self.message_format.format(num_round=self.num_round, **self.event_fields)
+
+    # Return the Event, as a Dictionary (e.g., to be serialized to JSON)
+    def to_dictionary(self):
+
+        # Initialise the Dictionary of the Event, with its type, Timestamp and number of the Round
+        event_dictionary = {"event_type": self.event_type, "timestamp": self.timestamp, "num_round": self.num_round}
+
+        # Add the fields of the Event to the Dictionary
+        event_dictionary.update(self.event_fields)
+
+        # Return the Dictionary of the Event
+        return event_dictionary
@@ -0,0 +1,109 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import ProtocolEvent from Common.Events
+from src.common.events import ProtocolEvent
+
+# Import StandardOutputProtocolEventSink from Common.Events.Sinks
+from src.common.events.sinks import StandardOutputProtocolEventSink
+
+
+# Class of the Event Log of a Protocol
+# NOTE: This Event Log dispatches the structured Events emitted by the Protocol to its pluggable Sinks
+#       (e.g., Null, Ring Buffer, JSON Lines File or Standard Output), and if none of its Sinks is enabled,
+#       the Events are not even created, and thus, the Protocol pays nothing for them
+class ProtocolEventLog:
+
+    # The default Event Log, shared by the whole process
+    default_protocol_event_log = None
+
+    # Constructor for the Event Log of a Protocol
+    def __init__(self, name, protocol_event_sinks):
+
+        # Set the name of the Event Log
+        self.name = name
+
+        # Set the Sinks of the Event Log, keeping only the enabled ones
+        self.protocol_event_sinks = [protocol_event_sink for protocol_event_sink in protocol_event_sinks
+                                     if protocol_event_sink.is_enabled()]
+
+        # Set the boolean flag about if the Event Log is enabled (i.e., if it has, at least, one enabled Sink)
+        self.enabled = (len(self.protocol_event_sinks) > 0)
+
+    # Retrieve the default Event Log, shared by the whole process
+    @staticmethod
+    def get_default_protocol_event_log():
+
+        # If the default Event Log was not created yet
+        if ProtocolEventLog.default_protocol_event_log is None:
+
+            # Create the default Event Log, printing the Events to the Standard Output
+            ProtocolEventLog.default_protocol_event_log = \
+                ProtocolEventLog("default_protocol_event_log",
+                                 [StandardOutputProtocolEventSink
+                                  .StandardOutputProtocolEventSink("standard_output_protocol_event_sink")])
+
+        # Return the default Event Log
+        return ProtocolEventLog.default_protocol_event_log
+
+    # Configure the default Event Log, shared by the whole process, with the given Sinks
+    @staticmethod
+    def configure_default_protocol_event_log(protocol_event_sinks):
+
+        # Replace the default Event Log, by a new one, with the given Sinks
+        ProtocolEventLog.default_protocol_event_log = \
+            ProtocolEventLog("default_protocol_event_log", protocol_event_sinks)
+
+        # Return the new default Event Log
+        return ProtocolEventLog.default_protocol_event_log
+
+    # Return the boolean flag about if the Event Log is enabled
+    def is_enabled(self):
+        return self.enabled
+
+    # Return the Sinks of the Event Log
+    def get_protocol_event_sinks(self):
+        return self.protocol_event_sinks
+
+    # Emit an Event, with the given type, number of the Round, format of the human-readable message and fields,
+    # to all the Sinks of the Event Log
+    # NOTE: The format of the human-readable message is only applied to the fields,
+    #       by the Sinks which need it (e.g., the Standard Output Sink)
+    def emit(self, event_type, num_round, message_format, **event_fields):
+
+        # If the Event Log is not enabled
+        if not self.enabled:
+
+            # Return, without creating the Event
+            return
+
+        # Create the Event, with the given type, number of the Round, format of the message and fields
+        protocol_event = ProtocolEvent.ProtocolEvent(event_type, num_round, message_format, event_fields)
+
+        # For each Sink of the Event Log
+        for protocol_event_sink in self.protocol_event_sinks:
+
+            # Write the Event to the current Sink
+            protocol_event_sink.write_event(protocol_event)
+
+    # Close all the Sinks of the Event Log
+    def close(self):
+
+        # For each Sink of the Event Log
+        for protocol_event_sink in self.protocol_event_sinks:
+
+            # Close the current Sink
+            protocol_event_sink.close()
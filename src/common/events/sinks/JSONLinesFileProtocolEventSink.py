@@ -0,0 +1,52 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import Dumps from the JSON Library
+from json import dumps
+
+
+# Class of the JSON Lines File Sink for the Events of a Protocol
+# NOTE: This Sink writes each Event, as one JSON Object per line, with its structured fields,
+#       without formatting their human-readable messages
+class JSONLinesFileProtocolEventSink:
+
+    # Constructor for the JSON Lines File Sink for the Events of a Protocol
+    def __init__(self, name, file_path):
+
+        # Set the name of the Sink
+        self.name = name
+
+        # Set the path of the JSON Lines File
+        self.file_path = file_path
+
+        # Open the JSON Lines File, appending the Events to it
+        self.json_lines_file = open(file_path, "a", encoding="utf-8")
+
+    # Return the boolean flag about if the Sink is enabled
+    def is_enabled(self):
+        return True
+
+    # Return the path of the JSON Lines File
+    def get_file_path(self):
+        return self.file_path
+
+    # Write an Event to the Sink, as one JSON Object per line
+    def write_event(self, protocol_event):
+        self.json_lines_file.write("{}\n".format(dumps(protocol_event.to_dictionary(), ensure_ascii=False)))
+
+    # Close the Sink, flushing the Events written to the JSON Lines File
+    def close(self):
+        self.json_lines_file.close()
@@ -0,0 +1,92 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the Performance Counter from the Time Library
+from time import perf_counter
+
+# Import Percentile from NumPy
+from numpy import percentile
+
+
+# Class of the Latency Sink for the Events of a Protocol
+# NOTE: This Sink does not keep the Events themselves, but only the elapsed time (in seconds) before each one,
+#       since the previous Event, grouped by the type of the Event, which marks the end of a phase of the Protocol
+#       (e.g., the latency of the ENTANGLEMENT_PREPARED phase, is the time since the Round was started),
+#       and thus, it is meant to measure the per-phase latencies of the Protocol, with a negligible overhead
+class LatencyProtocolEventSink:
+
+    # Constructor for the Latency Sink for the Events of a Protocol
+    def __init__(self, name):
+
+        # Set the name of the Sink
+        self.name = name
+
+        # Set the Performance Counter of the last Event written to the Sink
+        # (i.e., the creation of the Sink, before the first Event)
+        self.last_protocol_event_perf_counter = perf_counter()
+
+        # Initialise the Dictionary of the latencies of the phases of the Protocol, indexed by the types of the Events
+        self.phases_latencies = {}
+
+    # Return the boolean flag about if the Sink is enabled
+    def is_enabled(self):
+        return True
+
+    # Restart the measurement of the latencies, discarding the ones already measured
+    # (e.g., to not account the set up of the Protocol, as the latency of its first phase)
+    def reset(self):
+
+        # Set the Performance Counter of the last Event, as the current one
+        self.last_protocol_event_perf_counter = perf_counter()
+
+        # Discard the latencies of the phases of the Protocol, already measured
+        self.phases_latencies = {}
+
+    # Return the Dictionary of the lists of the latencies (in seconds) of the phases of the Protocol,
+    # indexed by the types of the Events
+    def get_phases_latencies(self):
+        return self.phases_latencies
+
+    # Return the Dictionary of the summaries of the latencies (in seconds) of the phases of the Protocol,
+    # indexed by the types of the Events
+    # (i.e., number of occurrences, total, mean, median, 95th percentile and maximum)
+    def get_phases_latencies_summary(self):
+
+        # Return the summary of the latencies of each phase of the Protocol
+        return {event_type: {"count": len(phase_latencies),
+                             "total_seconds": float(sum(phase_latencies)),
+                             "mean_seconds": float(sum(phase_latencies) / len(phase_latencies)),
+                             "p50_seconds": float(percentile(phase_latencies, 50)),
+                             "p95_seconds": float(percentile(phase_latencies, 95)),
+                             "max_seconds": float(max(phase_latencies))}
+                for event_type, phase_latencies in self.phases_latencies.items()}
+
+    # Write an Event to the Sink, accounting the elapsed time since the previous Event, as the latency of its phase
+    def write_event(self, protocol_event):
+
+        # Retrieve the current Performance Counter
+        protocol_event_perf_counter = perf_counter()
+
+        # Append the elapsed time since the previous Event, to the latencies of the phase ended by the Event
+        self.phases_latencies.setdefault(protocol_event.get_event_type(), []) \
+            .append(protocol_event_perf_counter - self.last_protocol_event_perf_counter)
+
+        # Set the Performance Counter of the last Event written to the Sink
+        self.last_protocol_event_perf_counter = protocol_event_perf_counter
+
+    # Close the Sink
+    def close(self):
+        pass
@@ -0,0 +1,34 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Class of the Null Sink for the Events of a Protocol
+# NOTE: This Sink discards all the Events, and since it is not enabled,
+#       the Event Log does not even create the Events, when it only has this kind of Sinks
+class NullProtocolEventSink:
+
+    # Constructor for the Null Sink for the Events of a Protocol
+    def __init__(self, name):
+        self.name = name
+
+    # Return the boolean flag about if the Sink is enabled
+    def is_enabled(self):
+        return False
+
+    # Write an Event to the Sink, discarding it
+    def write_event(self, protocol_event):
+        pass
+
+    # Close the Sink
+    def close(self):
+        pass
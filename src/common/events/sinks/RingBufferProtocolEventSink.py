@@ -0,0 +1,55 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the Double-Ended Queue from the Collections Library
+from collections import deque
+
+
+# Class of the Ring Buffer Sink for the Events of a Protocol
+# NOTE: This Sink keeps in memory only the most recent Events, up to its capacity,
+#       without formatting their human-readable messages
+class RingBufferProtocolEventSink:
+
+    # Constructor for the Ring Buffer Sink for the Events of a Protocol
+    def __init__(self, name, capacity):
+
+        # If the capacity of the Ring Buffer is not valid
+        if capacity < 1:
+
+            # Raise a Value Error
+            raise ValueError("The capacity of the Ring Buffer must be, at least, 1!!!")
+
+        # Set the name of the Sink
+        self.name = name
+
+        # Set the Ring Buffer of the Events, with the given capacity
+        self.protocol_events = deque(maxlen=capacity)
+
+    # Return the boolean flag about if the Sink is enabled
+    def is_enabled(self):
+        return True
+
+    # Return the list of the most recent Events kept in the Ring Buffer, from the oldest to the newest
+    def get_protocol_events(self):
+        return list(self.protocol_events)
+
+    # Write an Event to the Sink, appending it to the Ring Buffer (i.e., discarding the oldest one, if it is full)
+    def write_event(self, protocol_event):
+        self.protocol_events.append(protocol_event)
+
+    # Close the Sink
+    def close(self):
+        pass
@@ -0,0 +1,33 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Class of the Standard Output Sink for the Events of a Protocol
+# NOTE: This Sink prints the human-readable message of each Event, followed by a blank line
+class StandardOutputProtocolEventSink:
+
+    # Constructor for the Standard Output Sink for the Events of a Protocol
+    def __init__(self, name):
+        self.name = name
+
+    # Return the boolean flag about if the Sink is enabled
+    def is_enabled(self):
+        return True
+
+    # Write an Event to the Sink, printing its human-readable message
+    def write_event(self, protocol_event):
+        print("{}\n".format(protocol_event.get_message()))
+
+    # Close the Sink
+    def close(self):
+        pass
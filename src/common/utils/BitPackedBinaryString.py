@@ -0,0 +1,164 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import some functions and the Unsigned Integer (8 bits) from NumPy
+from numpy import array, frombuffer, packbits, unpackbits, flatnonzero, asarray, uint8, int64
+
+
+# Constants
+
+# The ASCII code of the character '0', used to convert Binary Strings to arrays of bits, and vice-versa
+ASCII_CODE_CHARACTER_ZERO = ord("0")
+
+# The table of the number of bits set to 1 (i.e., the Hamming Weight), for each possible byte
+POPCOUNT_TABLE_BYTES = array([bin(byte).count("1") for byte in range(256)], dtype=uint8)
+
+
+# Class of Bit-Packed Binary String
+# NOTE: The bits are packed, 8 per byte, in a NumPy array of Unsigned Integers (8 bits), from the most significant bit
+#       of each byte (i.e., the bit #0 of the Binary String is the most significant bit of the byte #0),
+#       with the padding bits of the last byte always set to 0, in order to keep the Hamming Weight exact;
+#       Indexing a Bit-Packed Binary String returns the bit as an integer (i.e., 0 or 1), in O(1) time,
+#       and thus, it can be used everywhere a Binary String of '0'/'1' characters was used before
+class BitPackedBinaryString:
+
+    # Constructor of Bit-Packed Binary String
+    def __init__(self, packed_bits, length):
+
+        # If the length is not valid, for the given number of packed bytes
+        if (length < 0) or (((length + 7) // 8) != len(packed_bits)):
+
+            # Raise a Value Error
+            raise ValueError("The length of the Bit-Packed Binary String does not match its number of bytes!!!")
+
+        # Set the packed bits of the Bit-Packed Binary String
+        self.packed_bits = asarray(packed_bits, dtype=uint8)
+
+        # Set the length (i.e., the number of bits) of the Bit-Packed Binary String
+        self.length = length
+
+    # Create a Bit-Packed Binary String, from a given array of bits (i.e., of 0s and 1s)
+    @staticmethod
+    def from_bits(bits):
+
+        # Convert the given bits to an array of Unsigned Integers (8 bits)
+        bits = asarray(bits, dtype=uint8)
+
+        # Pack the bits and return the Bit-Packed Binary String
+        return BitPackedBinaryString(packbits(bits), len(bits))
+
+    # Create a Bit-Packed Binary String, from a given Binary String of '0'/'1' characters,
+    # or from another Bit-Packed Binary String, which is returned as it is
+    @staticmethod
+    def from_binary_string(binary_string):
+
+        # If the given Binary String is already a Bit-Packed Binary String
+        if isinstance(binary_string, BitPackedBinaryString):
+
+            # Return the given Bit-Packed Binary String
+            return binary_string
+
+        # Convert the characters of the Binary String to an array of bits
+        bits = frombuffer(binary_string.encode("ascii"), dtype=uint8) - ASCII_CODE_CHARACTER_ZERO
+
+        # If the Binary String has characters other than '0' and '1'
+        # (i.e., the subtraction above wrapped around or exceeded 1)
+        if bits.size and (bits.max() > 1):
+
+            # Raise a Value Error
+            raise ValueError("A Binary String can only contain the characters '0' and '1'!!!")
+
+        # Pack the bits and return the Bit-Packed Binary String
+        return BitPackedBinaryString.from_bits(bits)
+
+    # Return the packed bits of the Bit-Packed Binary String
+    def get_packed_bits(self):
+        return self.packed_bits
+
+    # Return the length (i.e., the number of bits) of the Bit-Packed Binary String
+    def __len__(self):
+        return self.length
+
+    # Return the bit in the given index, as an integer, or a new Bit-Packed Binary String, for the given slice
+    def __getitem__(self, index):
+
+        # If a slice of the Bit-Packed Binary String was requested
+        if isinstance(index, slice):
+
+            # Return the Bit-Packed Binary String, for the bits in the given slice
+            return BitPackedBinaryString.from_bits(self.to_bits()[index])
+
+        # If the index is negative
+        if index < 0:
+
+            # Convert the index, as an index counted from the end of the Bit-Packed Binary String
+            index += self.length
+
+        # If the index is out of the range of the Bit-Packed Binary String
+        if (index < 0) or (index >= self.length):
+
+            # Raise an Index Error
+            raise IndexError("The index of the bit is out of the range of the Bit-Packed Binary String!!!")
+
+        # Return the bit in the given index, from its byte
+        return (int(self.packed_bits[index >> 3]) >> (7 - (index & 7))) & 1
+
+    # Iterate over the bits of the Bit-Packed Binary String, as integers
+    def __iter__(self):
+        return iter(self.to_bits().tolist())
+
+    # Return the boolean flag about if the Bit-Packed Binary String is equal to
+    # another Bit-Packed Binary String, or to a Binary String of '0'/'1' characters
+    def __eq__(self, other):
+
+        # If the other object is a Binary String of '0'/'1' characters
+        if isinstance(other, str):
+
+            # Compare the Bit-Packed Binary String with the Binary String
+            return self.to_binary_string() == other
+
+        # If the other object is a Bit-Packed Binary String
+        if isinstance(other, BitPackedBinaryString):
+
+            # Compare the lengths and the packed bits of both Bit-Packed Binary Strings
+            return (self.length == other.length) and (self.packed_bits.tobytes() == other.packed_bits.tobytes())
+
+        # The comparison is not implemented, for other types of objects
+        return NotImplemented
+
+    # Return the Binary String of '0'/'1' characters of the Bit-Packed Binary String
+    def __str__(self):
+        return self.to_binary_string()
+
+    # Return the representation of the Bit-Packed Binary String
+    def __repr__(self):
+        return "BitPackedBinaryString('{}')".format(self.to_binary_string())
+
+    # Return the bits of the Bit-Packed Binary String, unpacked, as an array of Unsigned Integers (8 bits)
+    def to_bits(self):
+        return unpackbits(self.packed_bits, count=self.length)
+
+    # Return the Binary String of '0'/'1' characters of the Bit-Packed Binary String
+    def to_binary_string(self):
+        return (self.to_bits() + ASCII_CODE_CHARACTER_ZERO).tobytes().decode("ascii")
+
+    # Compute the Hamming Weight of the Bit-Packed Binary String, directly over its packed bits
+    def compute_hamming_weight(self):
+        return int(POPCOUNT_TABLE_BYTES[self.packed_bits].sum(dtype=int64))
+
+    # Return the indexes of the bits set to the given bit (i.e., 0 or 1) of the Bit-Packed Binary String
+    def get_indexes_of_bits(self, bit):
+        return flatnonzero(self.to_bits() == bit)
@@ -0,0 +1,177 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import some functions, the Unsigned Integer (8 bits) and the Integer (64 bits) from NumPy
+from numpy import asarray, bitwise_xor, concatenate, count_nonzero, cumsum, diff, flatnonzero, frombuffer, \
+    int64, uint8
+
+# Import the Logarithm of base 2 from Math
+from math import log2
+
+# Import BitPackedBinaryString from Common.Utils
+from src.common.utils import BitPackedBinaryString
+
+# Import the table of the Hamming Weights of the bytes and the ASCII code of the character '0'
+# from Common.Utils.BitPackedBinaryString
+from src.common.utils.BitPackedBinaryString import POPCOUNT_TABLE_BYTES, ASCII_CODE_CHARACTER_ZERO
+
+
+# Class of the Statistics of Bits
+# NOTE: All the Statistics accept Binary Strings of '0'/'1' characters, Bit-Packed Binary Strings or
+#       NumPy arrays of bits (i.e., of 0s and 1s), and are computed in a vectorized way, without Python loops
+class BitStatistics:
+
+    # Convert the given bits (i.e., a Binary String, a Bit-Packed Binary String or an array of bits)
+    # to a NumPy array of bits, as Unsigned Integers (8 bits)
+    @staticmethod
+    def convert_to_bits(bits):
+
+        # If the bits are given as a Binary String of '0'/'1' characters
+        if isinstance(bits, str):
+
+            # Convert the characters of the Binary String to an array of bits
+            return frombuffer(bits.encode("ascii"), dtype=uint8) - ASCII_CODE_CHARACTER_ZERO
+
+        # If the bits are given as a Bit-Packed Binary String
+        if isinstance(bits, BitPackedBinaryString.BitPackedBinaryString):
+
+            # Unpack the bits of the Bit-Packed Binary String
+            return bits.to_bits()
+
+        # Convert the given bits to an array of Unsigned Integers (8 bits)
+        return asarray(bits, dtype=uint8)
+
+    # Compute the Hamming Weight (i.e., the number of bits set to 1) of the given bits
+    @staticmethod
+    def compute_hamming_weight(bits):
+
+        # If the bits are given as a Binary String of '0'/'1' characters
+        if isinstance(bits, str):
+
+            # Count the characters '1' of the Binary String
+            return bits.count("1")
+
+        # If the bits are given as a Bit-Packed Binary String
+        if isinstance(bits, BitPackedBinaryString.BitPackedBinaryString):
+
+            # Compute the Hamming Weight directly over the packed bits
+            return bits.compute_hamming_weight()
+
+        # Count the bits set to 1 of the array of bits
+        return int(count_nonzero(asarray(bits)))
+
+    # Compute the Quantum Bit Error Rate (QBER) between two given keys, of the same length,
+    # as the fraction of the positions where their bits differ
+    @staticmethod
+    def compute_quantum_bit_error_rate(bits_1, bits_2):
+
+        # If the lengths of both keys are different
+        if len(bits_1) != len(bits_2):
+
+            # Raise a Value Error
+            raise ValueError("The Quantum Bit Error Rate (QBER) can only be computed between keys "
+                             "of the same length!!!")
+
+        # If both keys are empty
+        if len(bits_1) == 0:
+
+            # Raise a Value Error
+            raise ValueError("The Quantum Bit Error Rate (QBER) can not be computed between empty keys!!!")
+
+        # If both keys are given as Bit-Packed Binary Strings
+        if isinstance(bits_1, BitPackedBinaryString.BitPackedBinaryString) and \
+                isinstance(bits_2, BitPackedBinaryString.BitPackedBinaryString):
+
+            # Count the different bits directly over the packed bits, since their padding bits are always 0
+            num_different_bits = int(POPCOUNT_TABLE_BYTES[bitwise_xor(bits_1.get_packed_bits(),
+                                                                      bits_2.get_packed_bits())].sum(dtype=int64))
+
+        # If any of the keys is not given as a Bit-Packed Binary String
+        else:
+
+            # Count the different bits over the arrays of bits
+            num_different_bits = int(count_nonzero(BitStatistics.convert_to_bits(bits_1) !=
+                                                   BitStatistics.convert_to_bits(bits_2)))
+
+        # Return the Quantum Bit Error Rate (QBER)
+        return num_different_bits / len(bits_1)
+
+    # Compute the Binary Entropy of the given probability (i.e., the minimum fraction of bits to be disclosed,
+    # per bit of a key, to correct it, for a Quantum Bit Error Rate (QBER) with the given value)
+    @staticmethod
+    def compute_binary_entropy(probability):
+
+        # If the probability is not valid
+        if not (0.0 <= probability <= 1.0):
+
+            # Raise a Value Error
+            raise ValueError("The Binary Entropy can only be computed for probabilities in [0, 1]!!!")
+
+        # If the probability is certain (i.e., 0 or 1)
+        if probability in (0.0, 1.0):
+
+            # Return 0, since there is no uncertainty
+            return 0.0
+
+        # Return the Binary Entropy of the probability
+        return -(probability * log2(probability)) - ((1.0 - probability) * log2(1.0 - probability))
+
+    # Compute the bias of the given bits, as the deviation of the fraction of bits set to 1 from 1/2
+    # (i.e., between -1/2, for only 0s, and 1/2, for only 1s)
+    @staticmethod
+    def compute_bias(bits):
+
+        # If there are no bits
+        if len(bits) == 0:
+
+            # Raise a Value Error
+            raise ValueError("The bias can not be computed for empty bits!!!")
+
+        # Return the bias of the bits
+        return (BitStatistics.compute_hamming_weight(bits) / len(bits)) - 0.5
+
+    # Compute the lengths of the runs (i.e., the maximal sequences of equal consecutive bits) of the given bits
+    @staticmethod
+    def compute_runs_lengths(bits):
+
+        # Convert the given bits to an array of bits
+        bits = BitStatistics.convert_to_bits(bits)
+
+        # Compute the indexes where each run starts (i.e., 0 and the indexes where the bit changes)
+        runs_starts = concatenate(([0], (flatnonzero(diff(bits)) + 1)))
+
+        # Return the lengths of the runs, as the differences between their consecutive starts
+        return diff(concatenate((runs_starts, [len(bits)]))) if len(bits) > 0 else runs_starts[:0]
+
+    # Compute the Hamming Weights of the windows of the given bits, with the given size,
+    # starting every given step (i.e., contiguous blocks, if the step is the size of the windows)
+    @staticmethod
+    def compute_windowed_hamming_weights(bits, window_size, window_step=1):
+
+        # If the size or the step of the windows are not valid
+        if (window_size < 1) or (window_step < 1):
+
+            # Raise a Value Error
+            raise ValueError("The size and the step of the windows must be, at least, 1!!!")
+
+        # Compute the cumulative Hamming Weights of the bits, starting with 0
+        cumulative_hamming_weights = concatenate(([0], cumsum(BitStatistics.convert_to_bits(bits), dtype=int64)))
+
+        # Compute the Hamming Weights of all the windows, with the given size
+        windowed_hamming_weights = cumulative_hamming_weights[window_size:] - cumulative_hamming_weights[:-window_size]
+
+        # Return the Hamming Weights of the windows starting every given step
+        return windowed_hamming_weights[::window_step]
@@ -20,18 +20,22 @@ from datetime import datetime as date_time
 # Import TimeDelta from the DateTime Library, as time_delta alias
 from datetime import timedelta as time_delta
 
-# Import the Random Intervals from the Random Library
-from random import randrange as random_range
+# Import the Random (Generator) from the Random Library
+from random import Random
 
 
 # Class of the Timestamp's Generator
 class TimestampGenerator:
 
     # Constructor for Timestamp's Generator
-    def __init__(self, timestamp_generator_name):
+    # NOTE: If no Seed is given, the Random Generator is seeded from the Operating System
+    def __init__(self, timestamp_generator_name, seed=None):
         self.now = date_time.now()
         self.timestamp_generator_name = timestamp_generator_name
 
+        # Set the Random Generator of the Timestamp's Generator, with the given Seed
+        self.random_generator = Random(seed)
+
     # Retrieve the Now's DateTime
     def get_now(self):
 
@@ -104,43 +108,43 @@ class TimestampGenerator:
             if weeks_delta == 0:
                 weeks_random_range = 0
             else:
-                weeks_random_range = random_range(weeks_delta)
+                weeks_random_range = self.random_generator.randrange(weeks_delta)
 
             # If Days' Delta is set up, define the random range between 0 and that value
             if days_delta == 0:
                 days_random_range = 0
             else:
-                days_random_range = random_range(days_delta)
+                days_random_range = self.random_generator.randrange(days_delta)
 
             # If Hours' Delta is set up, define the random range between 0 and that value
             if hours_delta == 0:
                 hours_random_range = 0
             else:
-                hours_random_range = random_range(hours_delta)
+                hours_random_range = self.random_generator.randrange(hours_delta)
 
             # If Minutes' Delta is set up, define the random range between 0 and that value
             if minutes_delta == 0:
                 minutes_random_range = 0
             else:
-                minutes_random_range = random_range(minutes_delta)
+                minutes_random_range = self.random_generator.randrange(minutes_delta)
 
             # If Seconds' Delta is set up, define the random range between 0 and that value
             if seconds_delta == 0:
                 seconds_random_range = 0
             else:
-                seconds_random_range = random_range(seconds_delta)
+                seconds_random_range = self.random_generator.randrange(seconds_delta)
 
             # If Milliseconds' Delta is set up, define the random range between 0 and that value
             if milliseconds_delta == 0:
                 milliseconds_random_range = 0
             else:
-                milliseconds_random_range = random_range(milliseconds_delta)
+                milliseconds_random_range = self.random_generator.randrange(milliseconds_delta)
 
             # If Microseconds' Delta is set up, define the random range between 0 and that value
             if microseconds_delta == 0:
                 microseconds_random_range = 0
             else:
-                microseconds_random_range = random_range(microseconds_delta)
+                microseconds_random_range = self.random_generator.randrange(microseconds_delta)
 
             # Generate the current Pseudo Random Timestamp
             current_pseudo_random_timestamp = now_timestamp + time_delta(weeks=weeks_random_range,
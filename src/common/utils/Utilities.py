@@ -12,25 +12,19 @@ Acknowledgments:
 - Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
 """
 
+# Import Packages and Libraries
+
+# Import BitStatistics from Common.Utils
+from src.common.utils import BitStatistics
+
 
 # Class of Utilities
 class Utilities:
 
     # Compute the Hamming Weight of a given Binary String
+    # NOTE: The Binary String can also be given as a Bit-Packed Binary String or as an array of bits
     @staticmethod
     def compute_hamming_weight(binary_string):
 
-        # Initialise the Hamming Weight
-        hamming_weight = 0
-
-        # For each bit (binary digit)
-        for current_bit in range(len(binary_string)):
-
-            # If the current bit (binary digit) is set to 1
-            if binary_string[current_bit] == "1":
-
-                # Increase the Hamming Weight
-                hamming_weight += 1
-
-        # Return the computed Hamming Weight
-        return hamming_weight
+        # Compute and return the Hamming Weight, in a vectorized way
+        return BitStatistics.BitStatistics.compute_hamming_weight(binary_string)
@@ -35,11 +35,15 @@ class QiskitQuantumCircuit:
 
     # Constructor for IBM Qiskit's Quantum Circuit
     def __init__(self, name, quantum_registers=None, classical_registers=None, global_phase=0,
-                 quantum_circuit=None, memory_enumeration_tag=None):
+                 quantum_circuit=None, memory_enumeration_tag=None, barriers_flag=True):
 
         # The name of the Qiskit's Quantum Circuit
         self.name = name
 
+        # The boolean flag about if the Barriers are recorded in the Quantum Circuit
+        # (i.e., only useful for its visualization or export, since they block the optimizations of the transpiler)
+        self.barriers_flag = barriers_flag
+
         # The Enumeration Tag used, for the case of this Quantum Circuit represent a Memory
         self.memory_enumeration_tag = memory_enumeration_tag
 
@@ -151,6 +155,14 @@ class QiskitQuantumCircuit:
     def get_num_bits(self):
         return self.quantum_circuit.num_clbits
 
+    # Return the boolean flag about if the Barriers are recorded in the Quantum Circuit
+    def get_barriers_flag(self):
+        return self.barriers_flag
+
+    # Set the boolean flag about if the Barriers are recorded in the Quantum Circuit
+    def set_barriers_flag(self, barriers_flag):
+        self.barriers_flag = barriers_flag
+
     # Return the reverted Circuit (i.e., the reverted Quantum Gates)
     def reverse_quantum_circuit(self):
         return self.quantum_circuit.reverse_ops()
@@ -170,11 +182,40 @@ class QiskitQuantumCircuit:
         # Create the object for the IBM Qiskit's Quantum Circuit, from the previously combined one
         qiskit_combined_quantum_circuit = \
             QiskitQuantumCircuit(combined_quantum_circuit_name, quantum_registers, classical_registers,
-                                 global_phase, combined_quantum_circuit)
+                                 global_phase, combined_quantum_circuit, barriers_flag=self.barriers_flag)
 
         # Return the object for the IBM Qiskit's Quantum Circuit, from the previously combined one
         return qiskit_combined_quantum_circuit
 
+    # Compose another Quantum Circuit into the Quantum Circuit, in place, on the given Qubits' indexes
+    # (i.e., the Qubit #i of the other Quantum Circuit is mapped to the Qubit with the i-th given index)
+    def compose_quantum_circuit(self, other_quantum_circuit, qubit_indexes):
+
+        # The number of Qubits of the Quantum Circuit
+        num_qubits_quantum_circuit = self.get_num_qubits()
+
+        # If the number of given Qubits' indexes is not the same as the number of Qubits of the other Quantum Circuit,
+        # a Value Error exception will be raised
+        if len(qubit_indexes) != other_quantum_circuit.get_num_qubits():
+
+            # Raise the Value Error exception
+            raise ValueError("The number of Qubits' indexes must be equal to {}!!!"
+                             .format(other_quantum_circuit.get_num_qubits()))
+
+        # If the maximum Qubit's index is higher or equal than the number of Qubits of the Quantum Circuit,
+        # a Value Error exception will be raised
+        if max(qubit_indexes) >= num_qubits_quantum_circuit:
+
+            # Raise the Value Error exception
+            raise ValueError("The Qubits' indexes must be strictly lower than {}!!!"
+                             .format(num_qubits_quantum_circuit))
+
+        # Compose the other Quantum Circuit into the Quantum Circuit, on the given Qubits' indexes
+        self.quantum_circuit.compose(other_quantum_circuit.quantum_circuit, qubits=qubit_indexes, inplace=True)
+
+        # Return the Quantum Circuit, with the other Quantum Circuit composed into it
+        return self
+
     # Apply a Barrier to a given Qubit's index
     def apply_barrier(self, qubit_index):
 
@@ -187,8 +228,11 @@ class QiskitQuantumCircuit:
             raise ValueError("The Qubits' indexes must be strictly lower than {}!!!"
                              .format(num_qubits_quantum_circuit))
 
-        # Apply a Barrier to the given Qubit's index
-        self.quantum_circuit.barrier(qubit_index)
+        # If the Barriers are recorded in the Quantum Circuit
+        if self.barriers_flag:
+
+            # Apply a Barrier to the given Qubit's index
+            self.quantum_circuit.barrier(qubit_index)
 
     # Apply a Barrier to a given interval of Qubits' indexes
     def apply_barriers_interval(self, qubit_indexes):
@@ -210,6 +254,12 @@ class QiskitQuantumCircuit:
             raise ValueError("The Qubits' indexes must be strictly lower than {}!!!"
                              .format(num_qubits_quantum_circuit))
 
+        # If the Barriers are not recorded in the Quantum Circuit
+        if not self.barriers_flag:
+
+            # Return, without applying any Barrier
+            return
+
         # For each Qubit's index
         for qubit_index in qubit_indexes:
 
@@ -219,6 +269,12 @@ class QiskitQuantumCircuit:
     # Apply a Barrier to all Qubits' indexes
     def apply_barriers_to_all(self):
 
+        # If the Barriers are not recorded in the Quantum Circuit
+        if not self.barriers_flag:
+
+            # Return, without applying any Barrier
+            return
+
         # The number of Qubits of the Quantum Circuit
         num_qubits_quantum_circuit = self.get_num_qubits()
 
@@ -512,6 +568,12 @@ class QiskitQuantumCircuit:
     def apply_pauli_x(self, qubit_index):
         self.quantum_circuit.x(qubit_index)
 
+    # Apply the Pauli-X (Bit Flip) Gate to a given Qubit's index, classically conditioned on a given Bit's index
+    # (i.e., only applied if the Bit, previously measured in the same Quantum Circuit, has the given value)
+    def apply_pauli_x_conditioned_on_bit(self, classical_register_index, qubit_index, bit_index, bit_value=1):
+        self.quantum_circuit.x(qubit_index)\
+            .c_if(self.classical_registers[classical_register_index].classical_register[bit_index], bit_value)
+
     # Apply the Pauli-Y Gate to a given Qubit's index
     def apply_pauli_y(self, qubit_index):
         self.quantum_circuit.y(qubit_index)
@@ -20,3 +20,16 @@ QISKIT_LIBRARY_QASM_SIMULATOR_MAX_NUM_QUBITS = 32
 # The default number of counts for the Final Result,
 # for simulation or executions of Quantum Circuits
 QISKIT_DEFAULT_NUM_COUNTS = 1000
+
+# The name of the Backend of the QASM Simulator of the IBM's Qiskit Aer Library
+QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME = "qasm_simulator"
+
+# The name of the Backend of the State Vector Simulator of the IBM's Qiskit Aer Library
+QISKIT_AER_STATE_VECTOR_SIMULATOR_BACKEND_NAME = "statevector_simulator"
+
+# The default Simulation Method of the QASM Simulator of the IBM's Qiskit Aer Library
+QISKIT_AER_DEFAULT_SIMULATION_METHOD = "automatic"
+
+# The default maximum number of Threads of the Simulators of the IBM's Qiskit Aer Library
+# (i.e., 0 means that all the available CPU Cores can be used)
+QISKIT_AER_DEFAULT_MAX_PARALLEL_THREADS = 0
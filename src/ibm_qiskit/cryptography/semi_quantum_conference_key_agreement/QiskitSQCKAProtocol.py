@@ -12,12 +12,39 @@ Acknowledgments:
 - Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
 """
 
+# Import Packages and Libraries
+
+# Import the IDs and the Bits of the SIFT (Measure and Resend) Rounds
+# from Common.Enumerations.SemiQuantumCryptographyProtocolRoundTypes
+from src.common.enumerations.SemiQuantumCryptographyProtocolRoundTypes import \
+    SIFT_MEASURE_AND_RESEND_ROUND_3, SIFT_MEASURE_AND_RESEND_ROUND_BIT, CTRL_REFLECT_ROUND_3, CTRL_REFLECT_ROUND_BIT
+
+# Import the String IDs of the Events of the estimation of the Quantum Bit Error Rate (QBER), of
+# the Information Reconciliation of the Raw Conference Keys and of the Privacy Amplification of
+# the Reconciled Conference Keys from Common.Enumerations.SemiQuantumCryptographyProtocolEventTypes
+from src.common.enumerations.SemiQuantumCryptographyProtocolEventTypes import QUANTUM_BIT_ERROR_RATE_ESTIMATED, \
+    RAW_CONFERENCE_KEY_RECONCILED, CONFERENCE_KEYS_PRIVACY_AMPLIFIED
+
+# Import ProtocolEventLog from Common.Events
+from src.common.events import ProtocolEventLog
+
+# Import BitPackedBinaryString from Common.Utils
+from src.common.utils import BitPackedBinaryString
+
+# Import QiskitSQCKAProtocolRawConferenceKeysBuffer from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Common
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.common \
+    import QiskitSQCKAProtocolRawConferenceKeysBuffer
+
 
 # Class for IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
 class QiskitSQCKAProtocol:
 
     # Constructor for IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-    def __init__(self, party_entities, distributor_party_entity, bipartite_pre_shared_keys, parameters):
+    # NOTE: If no Estimator of the Quantum Bit Error Rate (QBER) is given,
+    #       the Results of the CTRL (Reflect) Rounds are not folded into any estimation
+    def __init__(self, party_entities, distributor_party_entity, bipartite_pre_shared_keys, parameters,
+                 quantum_bit_error_rate_estimator=None):
 
         # Set the Party Entities involved in the Protocol
         self.party_entities = party_entities
@@ -34,6 +61,39 @@ class QiskitSQCKAProtocol:
         # Initialise the list of the Rounds of the Protocol
         self.protocol_rounds = []
 
+        # Initialise the array of the Types of the Rounds of the Protocol, for the Analytic Execution
+        # (i.e., 0 for the SIFT (Measure and Resend) Rounds and 1 for the CTRL (Reflect) Rounds)
+        self.protocol_rounds_type_bits = None
+
+        # Initialise the array of the Results of the Rounds of the Protocol, for the Analytic Execution,
+        # with the shape (rounds × parties)
+        self.protocol_rounds_results_bits = None
+
+        # Retrieve the Bits of the Bipartite Pre-Shared Key, used for the Rounds of the Protocol
+        protocol_rounds_bipartite_pre_shared_key = \
+            bipartite_pre_shared_keys[0].get_bipartite_pre_shared_key()[:parameters.get_num_rounds()]
+
+        # Initialise the Buffer of the Raw Conference Keys of the Parties, with space for the Bits of
+        # all the SIFT (Measure and Resend) Rounds (i.e., the Rounds with the Bit 0 in the Bipartite Pre-Shared Key)
+        self.raw_conference_keys_buffer = QiskitSQCKAProtocolRawConferenceKeysBuffer \
+            .QiskitSQCKAProtocolRawConferenceKeysBuffer("raw_conference_keys_buffer", parameters.get_num_parties(),
+                                                        (len(protocol_rounds_bipartite_pre_shared_key) -
+                                                         protocol_rounds_bipartite_pre_shared_key
+                                                         .compute_hamming_weight()))
+
+        # Set the Estimator of the Quantum Bit Error Rate (QBER), from the Results of the CTRL (Reflect) Rounds
+        self.quantum_bit_error_rate_estimator = quantum_bit_error_rate_estimator
+
+        # Initialise the Reconciled Conference Keys of the Parties and
+        # the Statistics of their Information Reconciliation
+        # (i.e., only available after the Information Reconciliation of the Raw Conference Keys)
+        self.reconciled_conference_keys = None
+        self.information_reconciliation_statistics = None
+
+        # Initialise the Final Conference Keys of the Parties
+        # (i.e., only available after the Privacy Amplification of the Reconciled Conference Keys)
+        self.final_conference_keys = None
+
     # Return the Party Entities of the Protocol
     def get_party_entities(self):
         return self.party_entities
@@ -52,8 +112,294 @@ class QiskitSQCKAProtocol:
 
     # Return the list of the Rounds of the Protocol
     def get_protocol_rounds(self):
-        return self.parameters
+        return self.protocol_rounds
 
-    # Add a Round of the Protocol
+    # Add a Round of the Protocol, sifting its Results to the Raw Conference Keys of the Parties,
+    # if it is a SIFT (Measure and Resend) Round
     def add_protocol_round(self, protocol_round):
+
+        # Add the Round to the list of the Rounds of the Protocol
         self.protocol_rounds.append(protocol_round)
+
+        # If the Round is a SIFT (Measure and Resend) Round, with Results
+        if (protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3) and \
+                (protocol_round.get_round_results() is not None):
+
+            # Append the Results of the Round to the Raw Conference Keys of the Parties
+            self.raw_conference_keys_buffer.append_sift_round_results(protocol_round.get_round_results())
+
+        # If the Round is a CTRL (Reflect) Round, with Results, and there is an Estimator of
+        # the Quantum Bit Error Rate (QBER)
+        elif (protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3) and \
+                (protocol_round.get_round_results() is not None) and \
+                (self.quantum_bit_error_rate_estimator is not None):
+
+            # Fold the Results of the Round into the estimation of the Quantum Bit Error Rate (QBER)
+            self.emit_quantum_bit_error_rates_estimations(
+                self.quantum_bit_error_rate_estimator.add_ctrl_round_results(protocol_round.get_round_results())
+            )
+
+    # Return the array of the Types of the Rounds of the Protocol, for the Analytic Execution
+    def get_protocol_rounds_type_bits(self):
+        return self.protocol_rounds_type_bits
+
+    # Return the array of the Results of the Rounds of the Protocol, for the Analytic Execution
+    def get_protocol_rounds_results_bits(self):
+        return self.protocol_rounds_results_bits
+
+    # Set the arrays of the Types and the Results of the Rounds of the Protocol, for the Analytic Execution
+    # NOTE: The Results of the SIFT (Measure and Resend) Rounds are also sifted to the Raw Conference Keys,
+    #       and the ones of the CTRL (Reflect) Rounds are folded into the estimation of the Quantum Bit Error Rate
+    def set_protocol_rounds_results_bits(self, protocol_rounds_type_bits, protocol_rounds_results_bits):
+
+        # Set the arrays of the Types and the Results of the Rounds of the Protocol
+        self.protocol_rounds_type_bits = protocol_rounds_type_bits
+        self.protocol_rounds_results_bits = protocol_rounds_results_bits
+
+        # Append the Results of the SIFT (Measure and Resend) Rounds to the Raw Conference Keys of the Parties
+        self.raw_conference_keys_buffer.append_sift_rounds_results_bits(
+            protocol_rounds_results_bits[protocol_rounds_type_bits == SIFT_MEASURE_AND_RESEND_ROUND_BIT]
+        )
+
+        # If there is an Estimator of the Quantum Bit Error Rate (QBER)
+        if self.quantum_bit_error_rate_estimator is not None:
+
+            # Fold the Results of the CTRL (Reflect) Rounds into the estimation of the Quantum Bit Error Rate (QBER)
+            self.emit_quantum_bit_error_rates_estimations(
+                self.quantum_bit_error_rate_estimator.add_ctrl_rounds_results_bits(
+                    protocol_rounds_results_bits[protocol_rounds_type_bits == CTRL_REFLECT_ROUND_BIT]
+                )
+            )
+
+    # Emit the Events about the given estimations of the Quantum Bit Error Rate (QBER) of blocks of CTRL Rounds
+    def emit_quantum_bit_error_rates_estimations(self, blocks_quantum_bit_error_rates_estimations):
+
+        # For each estimation of the Quantum Bit Error Rate (QBER) of a block of CTRL (Reflect) Rounds
+        for (num_block, quantum_bit_error_rate, confidence_interval_lower_bound, confidence_interval_upper_bound) in \
+                blocks_quantum_bit_error_rates_estimations:
+
+            # Emit the Event about the estimation of the Quantum Bit Error Rate (QBER) of the block
+            ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+                .emit(QUANTUM_BIT_ERROR_RATE_ESTIMATED, None,
+                      "The QBER of the block #{num_block} of CTRL Rounds was estimated as "
+                      "{quantum_bit_error_rate:.4f}, in [{confidence_interval_lower_bound:.4f}, "
+                      "{confidence_interval_upper_bound:.4f}]...",
+                      num_block=num_block, quantum_bit_error_rate=quantum_bit_error_rate,
+                      confidence_interval_lower_bound=confidence_interval_lower_bound,
+                      confidence_interval_upper_bound=confidence_interval_upper_bound)
+
+    # Return the Estimator of the Quantum Bit Error Rate (QBER) of the Protocol
+    def get_quantum_bit_error_rate_estimator(self):
+        return self.quantum_bit_error_rate_estimator
+
+    # Return the Quantum Bit Error Rate (QBER) estimated from the CTRL (Reflect) Rounds
+    # (i.e., 0, if it can not be estimated)
+    def get_estimated_quantum_bit_error_rate(self):
+        return (self.quantum_bit_error_rate_estimator.get_quantum_bit_error_rate()
+                if self.quantum_bit_error_rate_estimator is not None else None) or 0.0
+
+    # Return the Quantum Bit Error Rates (QBERs) estimated from the CTRL (Reflect) Rounds, between
+    # the Raw Conference Key of each Party and the one of the Distributor, as a Dictionary indexed by
+    # the names of the Parties (i.e., 0, for all the Parties, if they can not be estimated)
+    # NOTE: The Bits of a Party differ from the ones of the Distributor, if any of them is erroneous, and thus,
+    #       the QBER of each Party is bounded by the sum of its own QBER with the one of the Distributor
+    def get_estimated_parties_quantum_bit_error_rates(self):
+
+        # Retrieve the Quantum Bit Error Rates (QBERs) of each Party, estimated from the CTRL (Reflect) Rounds
+        parties_quantum_bit_error_rates = self.quantum_bit_error_rate_estimator.get_parties_quantum_bit_error_rates() \
+            if self.quantum_bit_error_rate_estimator is not None else None
+
+        # If the Quantum Bit Error Rates (QBERs) of each Party can not be estimated
+        if parties_quantum_bit_error_rates is None:
+
+            # Return 0, for all the Parties
+            return {party_entity.get_party_user_client().get_user_client_name(): 0.0
+                    for party_entity in self.party_entities}
+
+        # Retrieve the ID of the Distributor and its Quantum Bit Error Rate (QBER)
+        distributor_party_entity_id = self.distributor_party_entity.get_party_entity_id()
+        distributor_quantum_bit_error_rate = float(parties_quantum_bit_error_rates[distributor_party_entity_id])
+
+        # Initialise the Dictionary of the Quantum Bit Error Rates (QBERs) between each Party and the Distributor
+        estimated_parties_quantum_bit_error_rates = {}
+
+        # For each Party Entity of the Protocol
+        for party_entity in self.party_entities:
+
+            # Retrieve the Quantum Bit Error Rate (QBER) of the current Party Entity
+            # (i.e., 0, for the Distributor, since it is already counted)
+            party_quantum_bit_error_rate = float(parties_quantum_bit_error_rates[party_entity.get_party_entity_id()]) \
+                if party_entity.get_party_entity_id() != distributor_party_entity_id else 0.0
+
+            # Keep the Quantum Bit Error Rate (QBER) between the current Party Entity and the Distributor,
+            # limited to 50%
+            estimated_parties_quantum_bit_error_rates[party_entity.get_party_user_client().get_user_client_name()] = \
+                min(0.5, (distributor_quantum_bit_error_rate + party_quantum_bit_error_rate))
+
+        # Return the Quantum Bit Error Rates (QBERs) between each Party and the Distributor
+        return estimated_parties_quantum_bit_error_rates
+
+    # Return the boolean flag about if the Protocol should be aborted,
+    # since the Quantum Bit Error Rate (QBER) crossed the threshold to abort it
+    def is_aborted(self):
+        return (self.quantum_bit_error_rate_estimator is not None) and \
+            self.quantum_bit_error_rate_estimator.is_abort_threshold_crossed()
+
+    # Return the Buffer of the Raw Conference Keys of the Parties of the Protocol
+    def get_raw_conference_keys_buffer(self):
+        return self.raw_conference_keys_buffer
+
+    # Return the Raw Conference Key of the Party with the given name, as a Bit-Packed Binary String
+    def get_raw_conference_key(self, party_name):
+
+        # For each Party Entity of the Protocol
+        for party_entity in self.party_entities:
+
+            # If the current Party Entity has the given name
+            if party_entity.get_party_user_client().get_user_client_name().lower() == party_name.lower():
+
+                # Return the Raw Conference Key of the current Party Entity
+                return self.raw_conference_keys_buffer.get_raw_conference_key(party_entity.get_party_entity_id())
+
+        # Raise a Value Error, since there is no Party Entity with the given name
+        raise ValueError("There is no Party Entity named {} in the Protocol!!!".format(party_name))
+
+    # Return the Raw Conference Keys of all the Parties of the Protocol,
+    # as a Dictionary of Bit-Packed Binary Strings, indexed by the names of the Parties
+    def get_raw_conference_keys(self):
+        return {party_entity.get_party_user_client().get_user_client_name():
+                self.raw_conference_keys_buffer.get_raw_conference_key(party_entity.get_party_entity_id())
+                for party_entity in self.party_entities}
+
+    # Reconcile the Raw Conference Keys of all the Semi-Quantum Parties with the Raw Conference Key of the Distributor,
+    # with the given Information Reconciliation, for the given Quantum Bit Error Rate (QBER), returning
+    # the Reconciled Conference Keys, as a Dictionary of Bit-Packed Binary Strings, indexed by the names of the Parties
+    # NOTE: If no Quantum Bit Error Rate (QBER) is given, the one estimated from the CTRL (Reflect) Rounds,
+    #       between each Party and the Distributor, is used for each Party (or 0, if it can not be estimated),
+    #       and the Raw Conference Key of the Distributor is kept unchanged
+    def reconcile_raw_conference_keys(self, information_reconciliation, quantum_bit_error_rate=None):
+
+        # Set the Quantum Bit Error Rates (QBERs) of each Party, as the given one, or, if no one is given,
+        # as the ones estimated from the CTRL (Reflect) Rounds, between each Party and the Distributor
+        parties_quantum_bit_error_rates = self.get_estimated_parties_quantum_bit_error_rates() \
+            if quantum_bit_error_rate is None else {party_entity.get_party_user_client().get_user_client_name():
+                                                    quantum_bit_error_rate for party_entity in self.party_entities}
+
+        # Retrieve the Bits of the Raw Conference Key of the Distributor (i.e., the reference one)
+        distributor_raw_conference_key_bits = self.raw_conference_keys_buffer\
+            .get_raw_conference_key_bits(self.distributor_party_entity.get_party_entity_id())
+
+        # Initialise the Dictionaries of the Reconciled Conference Keys and of the Statistics of
+        # their Information Reconciliation
+        (self.reconciled_conference_keys, self.information_reconciliation_statistics) = ({}, {})
+
+        # For each Party Entity of the Protocol
+        for party_entity in self.party_entities:
+
+            # Retrieve the name of the current Party Entity
+            party_name = party_entity.get_party_user_client().get_user_client_name()
+
+            # If the current Party Entity is the Distributor
+            if party_entity.get_party_entity_id() == self.distributor_party_entity.get_party_entity_id():
+
+                # Keep the Raw Conference Key of the Distributor, as its Reconciled Conference Key
+                self.reconciled_conference_keys[party_name] = BitPackedBinaryString.BitPackedBinaryString\
+                    .from_bits(distributor_raw_conference_key_bits)
+
+                # Proceed to the next Party Entity
+                continue
+
+            # Reconcile the Raw Conference Key of the current Party Entity with the one of the Distributor
+            (reconciled_conference_key_bits, information_reconciliation_statistics) = information_reconciliation\
+                .reconcile_key_bits(distributor_raw_conference_key_bits,
+                                    self.raw_conference_keys_buffer
+                                    .get_raw_conference_key_bits(party_entity.get_party_entity_id()),
+                                    parties_quantum_bit_error_rates[party_name])
+
+            # Keep the Reconciled Conference Key of the current Party Entity and
+            # the Statistics of its Information Reconciliation
+            self.reconciled_conference_keys[party_name] = BitPackedBinaryString.BitPackedBinaryString\
+                .from_bits(reconciled_conference_key_bits)
+            self.information_reconciliation_statistics[party_name] = information_reconciliation_statistics
+
+            # Emit the Event about the Information Reconciliation of the Raw Conference Key of the current Party Entity
+            ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+                .emit(RAW_CONFERENCE_KEY_RECONCILED, None,
+                      "The Raw Conference Key of {party_name} was reconciled ({num_key_bits} Bits), "
+                      "leaking {num_leaked_bits} Bits, in {elapsed_time:.3f} seconds...",
+                      party_name=party_name, num_key_bits=information_reconciliation_statistics.get_num_key_bits(),
+                      num_leaked_bits=information_reconciliation_statistics.get_num_leaked_bits(),
+                      elapsed_time=information_reconciliation_statistics.get_elapsed_time())
+
+        # Return the Reconciled Conference Keys of all the Parties of the Protocol
+        return self.reconciled_conference_keys
+
+    # Return the Reconciled Conference Keys of all the Parties of the Protocol
+    # (i.e., None, if the Raw Conference Keys were not reconciled yet)
+    def get_reconciled_conference_keys(self):
+        return self.reconciled_conference_keys
+
+    # Return the Statistics of the Information Reconciliation of the Raw Conference Keys of
+    # all the Semi-Quantum Parties of the Protocol (i.e., None, if the Raw Conference Keys were not reconciled yet)
+    def get_information_reconciliation_statistics(self):
+        return self.information_reconciliation_statistics
+
+    # Return the total number of Bits leaked during the Information Reconciliation of the Raw Conference Keys of
+    # all the Semi-Quantum Parties of the Protocol (i.e., None, if the Raw Conference Keys were not reconciled yet)
+    def get_num_information_reconciliation_leaked_bits(self):
+        return sum(information_reconciliation_statistics.get_num_leaked_bits()
+                   for information_reconciliation_statistics in self.information_reconciliation_statistics.values()) \
+            if self.information_reconciliation_statistics is not None else None
+
+    # Amplify the privacy of the Reconciled Conference Keys of all the Parties, with the given Privacy Amplification,
+    # for the given Quantum Bit Error Rate (QBER), returning the Final Conference Keys, as a Dictionary of
+    # Bit-Packed Binary Strings, indexed by the names of the Parties
+    # NOTE: If no Quantum Bit Error Rate (QBER) is given, the highest one estimated from the CTRL (Reflect) Rounds,
+    #       between each Party and the Distributor, is used (i.e., since all the Final Conference Keys have
+    #       the same length), and the Bits leaked during the Information Reconciliation of
+    #       all the Semi-Quantum Parties are discounted
+    def amplify_privacy_of_reconciled_conference_keys(self, privacy_amplification, quantum_bit_error_rate=None):
+
+        # If the Raw Conference Keys were not reconciled yet
+        if self.reconciled_conference_keys is None:
+
+            # Raise a Runtime Error
+            raise RuntimeError("The Raw Conference Keys must be reconciled before the Privacy Amplification!!!")
+
+        # If no Quantum Bit Error Rate (QBER) is given
+        if quantum_bit_error_rate is None:
+
+            # Use the highest Quantum Bit Error Rate (QBER) estimated from the CTRL (Reflect) Rounds,
+            # between each Party and the Distributor
+            quantum_bit_error_rate = max(self.get_estimated_parties_quantum_bit_error_rates().values())
+
+        # Retrieve the names of the Parties and their Reconciled Conference Keys
+        (parties_names, reconciled_conference_keys) = (list(self.reconciled_conference_keys.keys()),
+                                                       list(self.reconciled_conference_keys.values()))
+
+        # Amplify the privacy of the Reconciled Conference Keys of all the Parties, at once
+        (final_conference_keys_bits, elapsed_time) = privacy_amplification\
+            .amplify_privacy(reconciled_conference_keys, self.get_num_information_reconciliation_leaked_bits(),
+                             quantum_bit_error_rate)
+
+        # Keep the Final Conference Keys of all the Parties
+        self.final_conference_keys = {party_name: BitPackedBinaryString.BitPackedBinaryString
+                                      .from_bits(final_conference_key_bits)
+                                      for (party_name, final_conference_key_bits)
+                                      in zip(parties_names, final_conference_keys_bits)}
+
+        # Emit the Event about the Privacy Amplification of the Reconciled Conference Keys
+        ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+            .emit(CONFERENCE_KEYS_PRIVACY_AMPLIFIED, None,
+                  "The privacy of the Reconciled Conference Keys ({num_key_bits} Bits) was amplified to "
+                  "{num_final_key_bits} Bits, in {elapsed_time:.3f} seconds...",
+                  num_key_bits=len(reconciled_conference_keys[0]),
+                  num_final_key_bits=final_conference_keys_bits.shape[1], elapsed_time=elapsed_time)
+
+        # Return the Final Conference Keys of all the Parties of the Protocol
+        return self.final_conference_keys
+
+    # Return the Final Conference Keys of all the Parties of the Protocol
+    # (i.e., None, if the privacy of the Reconciled Conference Keys was not amplified yet)
+    def get_final_conference_keys(self):
+        return self.final_conference_keys
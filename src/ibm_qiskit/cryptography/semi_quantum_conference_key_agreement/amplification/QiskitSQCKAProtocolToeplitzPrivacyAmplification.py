@@ -0,0 +1,230 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the Floor function and the Logarithm of base 2 from Math
+from math import floor, log2
+
+# Import the Performance Counter from Time
+from time import perf_counter
+
+# Import some functions, the Unsigned Integer (8 bits) and the Integer (64 bits) from NumPy
+from numpy import abs as absolute, bitwise_and, empty, packbits, rint, stack, int64, uint8
+
+# Import the Real Fast Fourier Transform (FFT) and its inverse from NumPy.FFT
+from numpy.fft import irfft, rfft
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import the Sliding Window View from NumPy.Lib.Stride_Tricks
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Import BitStatistics from Common.Utils
+from src.common.utils.BitStatistics import BitStatistics
+
+# Import the table of the Hamming Weights of the bytes from Common.Utils.BitPackedBinaryString
+from src.common.utils.BitPackedBinaryString import POPCOUNT_TABLE_BYTES
+
+
+# Constants
+
+# The default security parameter of the Privacy Amplification
+# (i.e., the maximum distance of the final keys from perfectly secret ones)
+DEFAULT_SECURITY_PARAMETER = 1e-10
+
+# The minimum length of the keys for which the Toeplitz hashing is computed with the Fast Fourier Transform (FFT)
+# (i.e., the shorter keys are hashed with the matrix multiplication over GF(2), which is faster for them)
+MINIMUM_KEY_LENGTH_FOR_FAST_FOURIER_TRANSFORM = 1024
+
+# The maximum deviation from integers tolerated in the convolutions computed with the Fast Fourier Transform (FFT)
+# (i.e., above it, the precision of the floats is not enough to round them safely)
+FAST_FOURIER_TRANSFORM_ROUNDING_TOLERANCE = 0.25
+
+# The number of rows of the Toeplitz Matrix multiplied at once, over GF(2), to bound the memory used
+MATRIX_MULTIPLICATION_NUM_ROWS_PER_CHUNK = 1024
+
+
+# Class for IBM Qiskit's Privacy Amplification, with Toeplitz hashing, of the Reconciled Conference Keys of
+# the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+# NOTE: The Toeplitz Matrix (with the shape (final key length × key length)) is defined by a public random seed,
+#       with (final key length + key length - 1) bits, shared by all the Parties, and is never built:
+#       its product with a key is the slice of the convolution of the seed and the key, computed in O(n log n),
+#       with the Fast Fourier Transform (FFT), for all the keys at once, or, as a fallback, with the matrix
+#       multiplication over GF(2), of sliding windows of the seed with the packed bits of the keys
+class QiskitSQCKAProtocolToeplitzPrivacyAmplification:
+
+    # Constructor for IBM Qiskit's Privacy Amplification, with Toeplitz hashing, of the Reconciled Conference Keys of
+    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    def __init__(self, name, security_parameter=DEFAULT_SECURITY_PARAMETER, seed=None):
+
+        # If the security parameter is not valid
+        if not (0.0 < security_parameter < 1.0):
+
+            # Raise a Value Error
+            raise ValueError("The security parameter of the Privacy Amplification must be in ]0, 1[!!!")
+
+        # Set the name of the Privacy Amplification
+        self.name = name
+
+        # Set the security parameter of the Privacy Amplification
+        self.security_parameter = security_parameter
+
+        # Set the Random Generator, for the seeds of the Toeplitz Matrices
+        self.random_generator = default_rng(seed)
+
+    # Return the security parameter of the Privacy Amplification
+    def get_security_parameter(self):
+        return self.security_parameter
+
+    # Compute the length of the final keys, for the given length of the keys, number of Bits leaked during
+    # the Information Reconciliation and Quantum Bit Error Rate (QBER), as the length of the keys, minus the Bits
+    # which may be known by an Eavesdropper (i.e., given by the Binary Entropy of the QBER), minus the Bits leaked,
+    # minus the Bits sacrificed for the security parameter (i.e., by the Leftover Hash Lemma)
+    def compute_final_key_length(self, key_length, num_leaked_bits, quantum_bit_error_rate):
+        return max(0, floor((key_length * (1.0 - BitStatistics.compute_binary_entropy(quantum_bit_error_rate))) -
+                            num_leaked_bits - (2.0 * log2(1.0 / self.security_parameter))))
+
+    # Generate the random seed of a Toeplitz Matrix, for the given length of the keys and of the final keys
+    def generate_toeplitz_seed_bits(self, key_length, final_key_length):
+        return self.random_generator.integers(0, 2, (final_key_length + key_length - 1), dtype=uint8)
+
+    # Compute the Toeplitz hashes of the given keys (with the shape (keys × Bits)), for the given seed and
+    # length of the final keys, with the Fast Fourier Transform (FFT), returning None, if the precision of
+    # the floats is not enough to round the convolutions safely
+    @staticmethod
+    def compute_toeplitz_hashes_with_fast_fourier_transform(keys_bits, toeplitz_seed_bits, final_key_length):
+
+        # Retrieve the length of the keys
+        key_length = keys_bits.shape[1]
+
+        # Compute the length of the Fast Fourier Transforms (FFTs), as a power of 2, for the full convolutions
+        fast_fourier_transform_length = 1 << ((len(toeplitz_seed_bits) + key_length - 2).bit_length())
+
+        # Compute the convolutions of the seed with all the keys at once, in the frequency domain
+        convolutions = irfft((rfft(toeplitz_seed_bits, fast_fourier_transform_length)[None, :] *
+                              rfft(keys_bits, fast_fourier_transform_length, axis=1)),
+                             fast_fourier_transform_length, axis=1)[:, (key_length - 1):
+                                                                    (key_length - 1 + final_key_length)]
+
+        # Round the convolutions to the nearest integers
+        rounded_convolutions = rint(convolutions)
+
+        # If the convolutions deviate too much from integers
+        if (convolutions.size > 0) and \
+                (absolute(convolutions - rounded_convolutions).max() > FAST_FOURIER_TRANSFORM_ROUNDING_TOLERANCE):
+
+            # Return None, since the convolutions can not be rounded safely
+            return None
+
+        # Return the parities of the convolutions, as the Toeplitz hashes of the keys
+        return (rounded_convolutions.astype(int64) & 1).astype(uint8)
+
+    # Compute the Toeplitz hashes of the given keys (with the shape (keys × Bits)), for the given seed and
+    # length of the final keys, with the matrix multiplication over GF(2), by chunks of rows of the Toeplitz Matrix
+    @staticmethod
+    def compute_toeplitz_hashes_with_matrix_multiplication(keys_bits, toeplitz_seed_bits, final_key_length):
+
+        # Retrieve the length of the keys
+        key_length = keys_bits.shape[1]
+
+        # Pack the bits of the keys, with the shape (keys × bytes)
+        keys_packed_bits = packbits(keys_bits, axis=1)
+
+        # Build a view of the rows of the Toeplitz Matrix, from sliding windows of its seed, without copying it
+        # (i.e., the row i has the bits of the seed from i + key length - 1 down to i)
+        toeplitz_matrix_rows = sliding_window_view(toeplitz_seed_bits, key_length)[:, ::-1]
+
+        # Initialise the Toeplitz hashes of the keys
+        toeplitz_hashes = empty((len(keys_bits), final_key_length), dtype=uint8)
+
+        # For each chunk of rows of the Toeplitz Matrix
+        for first_num_row in range(0, final_key_length, MATRIX_MULTIPLICATION_NUM_ROWS_PER_CHUNK):
+
+            # Compute the last row of the chunk of rows of the Toeplitz Matrix
+            last_num_row = min((first_num_row + MATRIX_MULTIPLICATION_NUM_ROWS_PER_CHUNK), final_key_length)
+
+            # Pack the bits of the chunk of rows of the Toeplitz Matrix, with the shape (rows × bytes)
+            toeplitz_matrix_packed_rows = packbits(toeplitz_matrix_rows[first_num_row:last_num_row], axis=1)
+
+            # Compute the parities of the bitwise ANDs of the rows with all the keys, with the shape (keys × rows)
+            toeplitz_hashes[:, first_num_row:last_num_row] = \
+                (POPCOUNT_TABLE_BYTES[bitwise_and(keys_packed_bits[:, None, :],
+                                                  toeplitz_matrix_packed_rows[None, :, :])].sum(axis=2) & 1)
+
+        # Return the Toeplitz hashes of the keys
+        return toeplitz_hashes
+
+    # Compute the Toeplitz hashes of the given keys (with the shape (keys × Bits)), for the given seed and
+    # length of the final keys, with the Fast Fourier Transform (FFT), for the longer keys, falling back to
+    # the matrix multiplication over GF(2), for the shorter keys or if the precision of the floats is not enough
+    def compute_toeplitz_hashes(self, keys_bits, toeplitz_seed_bits, final_key_length):
+
+        # Initialise the Toeplitz hashes of the keys
+        toeplitz_hashes = None
+
+        # If the keys are long enough to be hashed with the Fast Fourier Transform (FFT)
+        if keys_bits.shape[1] >= MINIMUM_KEY_LENGTH_FOR_FAST_FOURIER_TRANSFORM:
+
+            # Compute the Toeplitz hashes of the keys, with the Fast Fourier Transform (FFT)
+            toeplitz_hashes = self.compute_toeplitz_hashes_with_fast_fourier_transform(keys_bits, toeplitz_seed_bits,
+                                                                                        final_key_length)
+
+        # If the Toeplitz hashes of the keys were not computed with the Fast Fourier Transform (FFT)
+        if toeplitz_hashes is None:
+
+            # Compute the Toeplitz hashes of the keys, with the matrix multiplication over GF(2)
+            toeplitz_hashes = self.compute_toeplitz_hashes_with_matrix_multiplication(keys_bits, toeplitz_seed_bits,
+                                                                                       final_key_length)
+
+        # Return the Toeplitz hashes of the keys
+        return toeplitz_hashes
+
+    # Amplify the privacy of the given keys (i.e., the Reconciled Conference Keys of all the Parties), for
+    # the given number of Bits leaked during the Information Reconciliation and Quantum Bit Error Rate (QBER),
+    # returning the final keys, with the shape (keys × Bits), and the time elapsed (in seconds)
+    def amplify_privacy(self, keys_bits, num_leaked_bits, quantum_bit_error_rate):
+
+        # Start the measurement of the time elapsed during the Privacy Amplification
+        start_time = perf_counter()
+
+        # Convert each key to an array of bits
+        keys_bits = [BitStatistics.convert_to_bits(key_bits) for key_bits in keys_bits]
+
+        # If there are no keys or the keys have different lengths
+        if len(set(len(key_bits) for key_bits in keys_bits)) != 1:
+
+            # Raise a Value Error
+            raise ValueError("The Privacy Amplification can only be performed over one or more keys "
+                             "of the same length!!!")
+
+        # Stack the keys in an array of bits, with the shape (keys × Bits)
+        keys_bits = stack(keys_bits)
+
+        # Compute the length of the final keys
+        final_key_length = self.compute_final_key_length(keys_bits.shape[1], num_leaked_bits, quantum_bit_error_rate)
+
+        # If no Bit of the keys can be kept secret
+        if final_key_length == 0:
+
+            # Return empty final keys, since the Privacy Amplification can not produce any secret Bit
+            return empty((len(keys_bits), 0), dtype=uint8), (perf_counter() - start_time)
+
+        # Generate the public random seed of the Toeplitz Matrix, shared by all the Parties
+        toeplitz_seed_bits = self.generate_toeplitz_seed_bits(keys_bits.shape[1], final_key_length)
+
+        # Return the Toeplitz hashes of the keys, as the final keys, and the time elapsed
+        return self.compute_toeplitz_hashes(keys_bits, toeplitz_seed_bits, final_key_length), \
+            (perf_counter() - start_time)
@@ -26,6 +26,18 @@ from src.common.enumerations import QuantumMeasurementBasisTypes
 # Import StrategiesForEavesdroppingDetection from Common.Enumerations
 from src.common.enumerations import StrategiesForEavesdroppingDetection
 
+# Import SemiQuantumCryptographyProtocolExecutionModeTypes from Common.Enumerations
+from src.common.enumerations import SemiQuantumCryptographyProtocolExecutionModeTypes
+
+# Import QuantumSimulatorTypes from Common.Enumerations
+from src.common.enumerations import QuantumSimulatorTypes
+
+# Import SemiQuantumCryptographyProtocolDiagnosticsLevelTypes from Common.Enumerations
+from src.common.enumerations import SemiQuantumCryptographyProtocolDiagnosticsLevelTypes
+
+# Import the possible Layout Types of the Quantum Circuits of the Rounds
+from src.common.enumerations import QuantumCircuitLayoutTypes
+
 
 # Constants
 
@@ -33,6 +45,18 @@ from src.common.enumerations import StrategiesForEavesdroppingDetection
 # the IBM Qiskit's Parameters for the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
 MINIMUM_NUMBER_PARTIES = 2
 
+# The default number of CTRL (Reflect) Rounds of each block, for the estimation of
+# the Quantum Bit Error Rate (QBER) of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+DEFAULT_QUANTUM_BIT_ERROR_RATE_ESTIMATION_BLOCK_SIZE = 256
+
+# The default confidence level of the confidence intervals, for the estimation of
+# the Quantum Bit Error Rate (QBER) of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+DEFAULT_QUANTUM_BIT_ERROR_RATE_CONFIDENCE_LEVEL = 0.95
+
+# The default number of Shots of each SWAP Test, for the estimation of the overlap between
+# the Multipartite Entanglement reflected back and a fresh copy of it, in the CTRL (Reflect) Rounds
+DEFAULT_NUM_SHOTS_FOR_SWAP_TEST = 1024
+
 
 # Class for IBM Qiskit's Parameters for the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
 class QiskitSQCKAProtocolParameters:
@@ -46,7 +70,17 @@ class QiskitSQCKAProtocolParameters:
                  preparing_bases, quantum_entanglement_type,
                  strategy_for_eavesdropping_detection,
                  communication_path_edges_between_parties_names=None,
-                 communication_path_distances_between_parties_names=None):
+                 communication_path_distances_between_parties_names=None,
+                 execution_mode_type=SemiQuantumCryptographyProtocolExecutionModeTypes.SEQUENTIAL_EXECUTION,
+                 quantum_simulator_type=QuantumSimulatorTypes.AER_QASM_SIMULATOR,
+                 num_parallel_workers=None, seed=None,
+                 diagnostics_level_type=SemiQuantumCryptographyProtocolDiagnosticsLevelTypes.BASIC_DIAGNOSTICS,
+                 quantum_bit_error_rate_estimation_block_size=DEFAULT_QUANTUM_BIT_ERROR_RATE_ESTIMATION_BLOCK_SIZE,
+                 quantum_bit_error_rate_confidence_level=DEFAULT_QUANTUM_BIT_ERROR_RATE_CONFIDENCE_LEVEL,
+                 quantum_bit_error_rate_abort_threshold=None,
+                 num_shots_for_swap_test=DEFAULT_NUM_SHOTS_FOR_SWAP_TEST,
+                 quantum_circuit_layout_type=QuantumCircuitLayoutTypes.EXPANDED_LAYOUT,
+                 barriers_for_visualization_flag=False, dynamic_circuits_flag=False):
 
         # If the number of Parties for the Protocol, is greater or equal than
         # the minimum number of necessary Parties for
@@ -117,6 +151,164 @@ class QiskitSQCKAProtocolParameters:
                         # Set the Strategy for Eavesdropping Detection
                         self.strategy_for_eavesdropping_detection = strategy_for_eavesdropping_detection
 
+                        # If the Type of the Execution Mode for the Rounds of the Protocol is valid
+                        if execution_mode_type.upper() in \
+                                SemiQuantumCryptographyProtocolExecutionModeTypes\
+                                .POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_EXECUTION_MODE_TYPES:
+
+                            # Set the Type of the Execution Mode for the Rounds of the Protocol
+                            self.execution_mode_type = execution_mode_type.upper()
+
+                        # If the Type of the Execution Mode for the Rounds of the Protocol is not valid
+                        else:
+
+                            # Raise a Value Error
+                            raise ValueError("The given Type of Execution Mode for the Rounds is not valid!!!")
+
+                        # If the Type of the Quantum Simulator is valid
+                        if quantum_simulator_type.upper() in QuantumSimulatorTypes.POSSIBLE_QUANTUM_SIMULATOR_TYPES:
+
+                            # If the Stabilizer Simulator is chosen for a Quantum Entanglement not supported by it
+                            if (quantum_simulator_type.upper() == QuantumSimulatorTypes.STABILIZER_SIMULATOR) and \
+                                    (self.quantum_entanglement_type not in QuantumSimulatorTypes
+                                     .POSSIBLE_QUANTUM_ENTANGLEMENT_TYPES_FOR_STABILIZER_SIMULATOR):
+
+                                # Raise a Value Error
+                                raise ValueError("The Stabilizer Simulator does not support "
+                                                 "the given Type of Quantum Entanglement!!!")
+
+                            # If the Stabilizer Simulator is chosen for the SWAP Test, whose Controlled-SWAP (Fredkin)
+                            # Gates are not Clifford Gates
+                            if (quantum_simulator_type.upper() == QuantumSimulatorTypes.STABILIZER_SIMULATOR) and \
+                                    (self.strategy_for_eavesdropping_detection ==
+                                     StrategiesForEavesdroppingDetection.SWAP_TEST):
+
+                                # Raise a Value Error
+                                raise ValueError("The Stabilizer Simulator does not support "
+                                                 "the SWAP Test, as Strategy for Eavesdropping Detection!!!")
+
+                            # If the Sparse State Vector Simulator is chosen for a Quantum Entanglement,
+                            # whose number of non-null Amplitudes is not small
+                            if (quantum_simulator_type.upper() == QuantumSimulatorTypes.SPARSE_STATE_VECTOR_SIMULATOR) \
+                                    and (self.quantum_entanglement_type not in QuantumSimulatorTypes
+                                         .POSSIBLE_QUANTUM_ENTANGLEMENT_TYPES_FOR_SPARSE_STATE_VECTOR_SIMULATOR):
+
+                                # Raise a Value Error
+                                raise ValueError("The Sparse State Vector Simulator does not support "
+                                                 "the given Type of Quantum Entanglement!!!")
+
+                            # Set the Type of the Quantum Simulator
+                            self.quantum_simulator_type = quantum_simulator_type.upper()
+
+                        # If the Type of the Quantum Simulator is not valid
+                        else:
+
+                            # Raise a Value Error
+                            raise ValueError("The given Type of Quantum Simulator is not valid!!!")
+
+                        # If the number of Parallel Workers for the Parallel Execution of the Rounds is not valid
+                        if (num_parallel_workers is not None) and (num_parallel_workers < 1):
+
+                            # Raise a Value Error
+                            raise ValueError("The number of Parallel Workers for the Rounds must be, at least, 1!!!")
+
+                        # Set the number of Parallel Workers for the Parallel Execution of the Rounds
+                        # (i.e., None means that all the available CPU Cores can be used)
+                        self.num_parallel_workers = num_parallel_workers
+
+                        # Set the Seed of the Session of the Protocol
+                        # (i.e., None means that the Session is not reproducible)
+                        self.seed = seed
+
+                        # If the Type of the Diagnostics Level for the Rounds of the Protocol is valid
+                        if diagnostics_level_type.upper() in \
+                                SemiQuantumCryptographyProtocolDiagnosticsLevelTypes\
+                                .POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_DIAGNOSTICS_LEVEL_TYPES:
+
+                            # Set the Type of the Diagnostics Level for the Rounds of the Protocol
+                            self.diagnostics_level_type = diagnostics_level_type.upper()
+
+                        # If the Type of the Diagnostics Level for the Rounds of the Protocol is not valid
+                        else:
+
+                            # Raise a Value Error
+                            raise ValueError("The given Type of Diagnostics Level for the Rounds is not valid!!!")
+
+                        # If the number of CTRL (Reflect) Rounds of each block,
+                        # for the estimation of the Quantum Bit Error Rate (QBER), is not valid
+                        if quantum_bit_error_rate_estimation_block_size < 1:
+
+                            # Raise a Value Error
+                            raise ValueError("The number of CTRL Rounds of each block, for the estimation of "
+                                             "the Quantum Bit Error Rate (QBER), must be, at least, 1!!!")
+
+                        # Set the number of CTRL (Reflect) Rounds of each block,
+                        # for the estimation of the Quantum Bit Error Rate (QBER)
+                        self.quantum_bit_error_rate_estimation_block_size = \
+                            quantum_bit_error_rate_estimation_block_size
+
+                        # If the confidence level, for the estimation of the Quantum Bit Error Rate (QBER), is not valid
+                        if not (0 < quantum_bit_error_rate_confidence_level < 1):
+
+                            # Raise a Value Error
+                            raise ValueError("The confidence level, for the estimation of "
+                                             "the Quantum Bit Error Rate (QBER), must be between 0 and 1!!!")
+
+                        # Set the confidence level, for the estimation of the Quantum Bit Error Rate (QBER)
+                        self.quantum_bit_error_rate_confidence_level = quantum_bit_error_rate_confidence_level
+
+                        # If the threshold of the Quantum Bit Error Rate (QBER), to abort the Protocol, is not valid
+                        if (quantum_bit_error_rate_abort_threshold is not None) and \
+                                not (0 <= quantum_bit_error_rate_abort_threshold <= 1):
+
+                            # Raise a Value Error
+                            raise ValueError("The threshold of the Quantum Bit Error Rate (QBER), "
+                                             "to abort the Protocol, must be between 0 and 1!!!")
+
+                        # Set the threshold of the Quantum Bit Error Rate (QBER), to abort the Protocol
+                        # (i.e., None means that the Protocol is never aborted)
+                        self.quantum_bit_error_rate_abort_threshold = quantum_bit_error_rate_abort_threshold
+
+                        # If the number of Shots of each SWAP Test is not valid
+                        if num_shots_for_swap_test < 1:
+
+                            # Raise a Value Error
+                            raise ValueError("The number of Shots of each SWAP Test must be, at least, 1!!!")
+
+                        # Set the number of Shots of each SWAP Test, for the estimation of the overlap between
+                        # the Multipartite Entanglement reflected back and a fresh copy of it
+                        self.num_shots_for_swap_test = num_shots_for_swap_test
+
+                        # If the Layout Type of the Quantum Circuits of the Rounds of the Protocol is valid
+                        if quantum_circuit_layout_type.upper() in \
+                                QuantumCircuitLayoutTypes.POSSIBLE_QUANTUM_CIRCUIT_LAYOUT_TYPES:
+
+                            # Set the Layout Type of the Quantum Circuits of the Rounds of the Protocol
+                            self.quantum_circuit_layout_type = quantum_circuit_layout_type.upper()
+
+                        # If the Layout Type of the Quantum Circuits of the Rounds of the Protocol is not valid
+                        else:
+
+                            # Raise a Value Error
+                            raise ValueError("The given Layout Type of the Quantum Circuits "
+                                             "for the Rounds is not valid!!!")
+
+                        # Set the boolean flag about if the Barriers are recorded in the Quantum Circuits of
+                        # the Rounds, only for their visualization or export (i.e., otherwise, they are omitted,
+                        # to not block the optimizations of the transpiler)
+                        self.barriers_for_visualization_flag = barriers_for_visualization_flag
+
+                        # Set the boolean flag about if the Rounds are executed as Dynamic Quantum Circuits
+                        # (i.e., the Semi-Quantum Parties' resending of the SIFT Rounds is applied as
+                        # a Pauli-X gate, classically conditioned on her Mid-Circuit Measurement,
+                        # in order to execute the whole Round in a single job of the Quantum Simulator)
+                        # NOTE: The Chained Execution of the Rounds always requires the Dynamic Quantum Circuits,
+                        #       since the Quantum Circuits of the Rounds can not depend on any previous Measurement
+                        self.dynamic_circuits_flag = \
+                            (dynamic_circuits_flag or
+                             (self.execution_mode_type ==
+                              SemiQuantumCryptographyProtocolExecutionModeTypes.CHAINED_EXECUTION))
+
                         # Set the probability of the all the receiving Parties reflect her destined Qubits,
                         # in the same round of the Protocol, as the probability of occurrence of
                         # a X-Measurement Round happen
@@ -398,6 +590,57 @@ class QiskitSQCKAProtocolParameters:
     def get_strategy_for_eavesdropping_detection(self):
         return self.strategy_for_eavesdropping_detection
 
+    # Return the type of the Execution Mode for the Rounds of the Protocol
+    def get_execution_mode_type(self):
+        return self.execution_mode_type
+
+    # Return the type of the Quantum Simulator, for the execution of the Quantum Circuits of the Protocol
+    def get_quantum_simulator_type(self):
+        return self.quantum_simulator_type
+
+    # Return the number of Parallel Workers, for the Parallel Execution of the Rounds of the Protocol
+    def get_num_parallel_workers(self):
+        return self.num_parallel_workers
+
+    # Return the Seed of the Session of the Protocol
+    def get_seed(self):
+        return self.seed
+
+    # Return the type of the Diagnostics Level for the Rounds of the Protocol
+    def get_diagnostics_level_type(self):
+        return self.diagnostics_level_type
+
+    # Return the number of CTRL (Reflect) Rounds of each block, for the estimation of the Quantum Bit Error Rate (QBER)
+    def get_quantum_bit_error_rate_estimation_block_size(self):
+        return self.quantum_bit_error_rate_estimation_block_size
+
+    # Return the confidence level, for the estimation of the Quantum Bit Error Rate (QBER)
+    def get_quantum_bit_error_rate_confidence_level(self):
+        return self.quantum_bit_error_rate_confidence_level
+
+    # Return the threshold of the Quantum Bit Error Rate (QBER), to abort the Protocol
+    def get_quantum_bit_error_rate_abort_threshold(self):
+        return self.quantum_bit_error_rate_abort_threshold
+
+    # Return the number of Shots of each SWAP Test, for the estimation of the overlap between
+    # the Multipartite Entanglement reflected back and a fresh copy of it
+    def get_num_shots_for_swap_test(self):
+        return self.num_shots_for_swap_test
+
+    # Return the Layout Type of the Quantum Circuits of the Rounds of the Protocol
+    def get_quantum_circuit_layout_type(self):
+        return self.quantum_circuit_layout_type
+
+    # Return the boolean flag about if the Barriers are recorded in the Quantum Circuits of the Rounds,
+    # only for their visualization or export
+    def get_barriers_for_visualization_flag(self):
+        return self.barriers_for_visualization_flag
+
+    # Return the boolean flag about if the Rounds are executed as Dynamic Quantum Circuits,
+    # in a single job of the Quantum Simulator
+    def get_dynamic_circuits_flag(self):
+        return self.dynamic_circuits_flag
+
     # Return the probability of the all the receiving Parties reflect her destined Qubits,
     # in the same round of the Protocol, as the probability of occurrence of a X-Measurement Round happen
     def get_probability_reflect_round(self):
@@ -456,6 +699,49 @@ class QiskitSQCKAProtocolParameters:
         print(" - Strategy for Eavesdropping Detection: {}"
               .format(self.get_strategy_for_eavesdropping_detection()))
 
+        # Print the type of the Execution Mode for the Rounds of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - Execution Mode Type: {}".format(self.get_execution_mode_type()))
+
+        # Print the type of the Quantum Simulator of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - Quantum Simulator Type: {}".format(self.get_quantum_simulator_type()))
+
+        # Print the number of Parallel Workers for the Rounds of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - Num. Parallel Workers: {}".format(self.get_num_parallel_workers()))
+
+        # Print the Seed of the Session of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - Seed: {}".format(self.get_seed()))
+
+        # Print the type of the Diagnostics Level for the Rounds of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - Diagnostics Level Type: {}".format(self.get_diagnostics_level_type()))
+
+        # Print the number of CTRL (Reflect) Rounds of each block, the confidence level and the threshold to abort,
+        # for the estimation of the Quantum Bit Error Rate (QBER) of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - QBER Estimation Block Size: {}".format(self.get_quantum_bit_error_rate_estimation_block_size()))
+        print(" - QBER Confidence Level: {}".format(self.get_quantum_bit_error_rate_confidence_level()))
+        print(" - QBER Abort Threshold: {}".format(self.get_quantum_bit_error_rate_abort_threshold()))
+
+        # Print the number of Shots of each SWAP Test of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - Num. Shots for SWAP Test: {}".format(self.get_num_shots_for_swap_test()))
+
+        # Print the Layout Type of the Quantum Circuits of the Rounds of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - Quantum Circuit Layout Type: {}".format(self.get_quantum_circuit_layout_type()))
+
+        # Print the boolean flag about if the Barriers are recorded in the Quantum Circuits of the Rounds of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - Barriers for Visualization: {}".format(self.get_barriers_for_visualization_flag()))
+
+        # Print the boolean flag about if the Rounds are executed as Dynamic Quantum Circuits of the
+        # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
+        print(" - Dynamic Circuits: {}".format(self.get_dynamic_circuits_flag()))
+
         # Print the probability of the all the receiving Parties reflect her destined Qubits,
         # in the same round of the Protocol, as the probability of occurrence of a X-Measurement Round happen,
         # used on the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Parameters
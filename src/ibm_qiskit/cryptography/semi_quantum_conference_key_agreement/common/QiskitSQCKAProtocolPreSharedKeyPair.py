@@ -17,8 +17,18 @@ Acknowledgments:
 # Import TimestampGenerator from Common.Utils
 from src.common.utils import TimestampGenerator
 
+# Import BitPackedBinaryString from Common.Utils
+from src.common.utils import BitPackedBinaryString
+
+# Import the Bits of the SIFT (Measure and Resend) and CTRL (Reflect) Rounds
+# from Common.Enumerations.SemiQuantumCryptographyProtocolRoundTypes
+from src.common.enumerations.SemiQuantumCryptographyProtocolRoundTypes import \
+    SIFT_MEASURE_AND_RESEND_ROUND_BIT, CTRL_REFLECT_ROUND_BIT
+
 
 # Class of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Pre-Shared Key Pair
+# NOTE: The Bipartite Pre-Shared Key can be given as a Binary String of '0'/'1' characters,
+#       or as a Bit-Packed Binary String, but it is always kept as a Bit-Packed Binary String
 class QiskitSQCKAProtocolPreSharedKeyPair:
 
     # Constructor of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Pre-Shared Key
@@ -26,7 +36,8 @@ class QiskitSQCKAProtocolPreSharedKeyPair:
 
         self.user_client_1 = user_client_1
         self.user_client_2 = user_client_2
-        self.bipartite_pre_shared_key = bipartite_pre_shared_key
+        self.bipartite_pre_shared_key = \
+            BitPackedBinaryString.BitPackedBinaryString.from_binary_string(bipartite_pre_shared_key)
         self.timestamp = \
             TimestampGenerator.TimestampGenerator("pre-shared-key-{}-{}"
                                                   .format(self.user_client_1.get_user_client_name().lower(),
@@ -44,6 +55,18 @@ class QiskitSQCKAProtocolPreSharedKeyPair:
     def get_bipartite_pre_shared_key(self):
         return self.bipartite_pre_shared_key
 
+    # Return the bit of the Bipartite Pre-Shared Key, corresponding to the given Round, as an integer
+    def get_bipartite_pre_shared_key_bit(self, num_round):
+        return self.bipartite_pre_shared_key[num_round]
+
+    # Return the indexes of the SIFT (Measure and Resend) Rounds, according to the Bipartite Pre-Shared Key
+    def get_sift_measure_and_resend_rounds_indexes(self):
+        return self.bipartite_pre_shared_key.get_indexes_of_bits(SIFT_MEASURE_AND_RESEND_ROUND_BIT)
+
+    # Return the indexes of the CTRL (Reflect) Rounds, according to the Bipartite Pre-Shared Key
+    def get_ctrl_reflect_rounds_indexes(self):
+        return self.bipartite_pre_shared_key.get_indexes_of_bits(CTRL_REFLECT_ROUND_BIT)
+
     # Return the Timestamp Generator of the Bipartite Pre-Shared Key
     def get_timestamp_generator(self):
         return self.timestamp
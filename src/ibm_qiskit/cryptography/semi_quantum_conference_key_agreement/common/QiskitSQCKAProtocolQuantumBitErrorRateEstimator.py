@@ -0,0 +1,206 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the Square Root from Math
+from math import sqrt
+
+# Import the Normal Distribution from Statistics
+from statistics import NormalDist
+
+# Import N-Dimensional Arrays from Buffers, Zeros, the Integer (64 bits) and
+# the Unsigned Integer (8 bits) from NumPy
+from numpy import array, frombuffer, int64, uint8, zeros
+
+
+# Class for IBM Qiskit's Estimator of the Quantum Bit Error Rate (QBER) of
+# the Semi-Quantum Conference Key Agreement (SQCKA) Protocol, from the Results of its CTRL (Reflect) Rounds
+# NOTE: The Results of each CTRL (Reflect) Round are folded, as they are obtained, into running counters
+#       (i.e., global, per Party and per block of CTRL Rounds), without keeping the Results themselves;
+#       A CTRL Round is erroneous if its Results are not one of the expected ones, and the Bit of a Party is
+#       erroneous if it differs from the one of the nearest expected Results (in the Hamming Distance);
+#       Each block of CTRL Rounds yields its QBER, with a Wilson score confidence interval, and once the lower bound
+#       of the confidence interval of the global QBER crosses the threshold to abort, the Protocol should be aborted
+class QiskitSQCKAProtocolQuantumBitErrorRateEstimator:
+
+    # Constructor for IBM Qiskit's Estimator of the Quantum Bit Error Rate (QBER) of
+    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    def __init__(self, name, num_parties, expected_ctrl_round_results_binary, block_size, confidence_level,
+                 abort_threshold=None):
+
+        # Set the name of the Estimator of the Quantum Bit Error Rate (QBER)
+        self.name = name
+
+        # Set the number of Parties of the Estimator of the Quantum Bit Error Rate (QBER)
+        self.num_parties = num_parties
+
+        # Set the array of the expected Results of the CTRL (Reflect) Rounds, with the shape (results × parties)
+        self.expected_ctrl_round_results_bits = array([[int(bit) for bit in expected_ctrl_round_results]
+                                                       for expected_ctrl_round_results
+                                                       in expected_ctrl_round_results_binary], dtype=uint8)
+
+        # Set the number of CTRL (Reflect) Rounds of each block
+        self.block_size = block_size
+
+        # Set the confidence level of the confidence intervals
+        self.confidence_level = confidence_level
+
+        # Set the threshold of the Quantum Bit Error Rate (QBER), to abort the Protocol
+        self.abort_threshold = abort_threshold
+
+        # Initialise the global counters of the CTRL (Reflect) Rounds and of the erroneous ones
+        self.num_ctrl_rounds = 0
+        self.num_erroneous_ctrl_rounds = 0
+
+        # Initialise the counters of the erroneous Bits of each Party
+        self.num_parties_erroneous_bits = zeros(num_parties, dtype=int64)
+
+        # Initialise the counters of the CTRL (Reflect) Rounds and of the erroneous ones, of the current block
+        self.num_ctrl_rounds_current_block = 0
+        self.num_erroneous_ctrl_rounds_current_block = 0
+
+        # Initialise the list of the estimations of the Quantum Bit Error Rate (QBER) of each block,
+        # as tuples (number of the block, QBER, lower bound and upper bound of the confidence interval)
+        self.blocks_quantum_bit_error_rates_estimations = []
+
+        # Initialise the boolean flag about if the threshold to abort the Protocol was crossed
+        self.abort_threshold_crossed = False
+
+    # Compute the Wilson score confidence interval of a Quantum Bit Error Rate (QBER),
+    # given the number of errors, the number of samples and the confidence level
+    @staticmethod
+    def compute_confidence_interval(num_errors, num_samples, confidence_level):
+
+        # Compute the quantile of the Standard Normal Distribution, for the given confidence level
+        z = NormalDist().inv_cdf(1 - ((1 - confidence_level) / 2))
+
+        # Compute the observed Quantum Bit Error Rate (QBER)
+        quantum_bit_error_rate = num_errors / num_samples
+
+        # Compute the denominator, the center and the half-width of the Wilson score confidence interval
+        denominator = 1 + ((z ** 2) / num_samples)
+        center = (quantum_bit_error_rate + ((z ** 2) / (2 * num_samples))) / denominator
+        half_width = (z * sqrt(((quantum_bit_error_rate * (1 - quantum_bit_error_rate)) / num_samples) +
+                               ((z ** 2) / (4 * (num_samples ** 2))))) / denominator
+
+        # Return the lower and the upper bounds of the confidence interval
+        return max(0.0, (center - half_width)), min(1.0, (center + half_width))
+
+    # Fold the Results of several CTRL (Reflect) Rounds, given as an array of Bits, with the shape (rounds × parties),
+    # returning the estimations of the Quantum Bit Error Rate (QBER) of the blocks completed by them
+    def add_ctrl_rounds_results_bits(self, ctrl_rounds_results_bits):
+
+        # Compute the Hamming Distances between the Results of each CTRL (Reflect) Round and all the expected ones
+        hamming_distances = (ctrl_rounds_results_bits[:, None, :] !=
+                             self.expected_ctrl_round_results_bits[None, :, :]).sum(axis=2)
+
+        # Compute the erroneous Bits of each Party, as the ones differing from the nearest expected Results
+        parties_erroneous_bits = \
+            ctrl_rounds_results_bits != self.expected_ctrl_round_results_bits[hamming_distances.argmin(axis=1)]
+
+        # Compute the erroneous CTRL (Reflect) Rounds, as the ones without any of the expected Results
+        erroneous_ctrl_rounds = hamming_distances.min(axis=1) > 0
+
+        # Update the counters of the erroneous Bits of each Party
+        self.num_parties_erroneous_bits += parties_erroneous_bits.sum(axis=0)
+
+        # Initialise the list of the estimations of the blocks completed
+        blocks_quantum_bit_error_rates_estimations = []
+
+        # Initialise the index of the next CTRL (Reflect) Round to be folded
+        num_ctrl_round = 0
+
+        # While there are CTRL (Reflect) Rounds to be folded
+        while num_ctrl_round < len(erroneous_ctrl_rounds):
+
+            # Compute the number of CTRL (Reflect) Rounds to be folded in the current block
+            num_ctrl_rounds_to_fold = min((self.block_size - self.num_ctrl_rounds_current_block),
+                                          (len(erroneous_ctrl_rounds) - num_ctrl_round))
+
+            # Compute the number of erroneous CTRL (Reflect) Rounds to be folded in the current block
+            num_erroneous_ctrl_rounds_to_fold = \
+                int(erroneous_ctrl_rounds[num_ctrl_round:(num_ctrl_round + num_ctrl_rounds_to_fold)].sum())
+
+            # Update the global counters and the counters of the current block
+            self.num_ctrl_rounds += num_ctrl_rounds_to_fold
+            self.num_erroneous_ctrl_rounds += num_erroneous_ctrl_rounds_to_fold
+            self.num_ctrl_rounds_current_block += num_ctrl_rounds_to_fold
+            self.num_erroneous_ctrl_rounds_current_block += num_erroneous_ctrl_rounds_to_fold
+
+            # Update the index of the next CTRL (Reflect) Round to be folded
+            num_ctrl_round += num_ctrl_rounds_to_fold
+
+            # If the current block was completed
+            if self.num_ctrl_rounds_current_block == self.block_size:
+
+                # Estimate the Quantum Bit Error Rate (QBER) of the current block and append it to the lists
+                block_quantum_bit_error_rate_estimation = \
+                    ((len(self.blocks_quantum_bit_error_rates_estimations) + 1),
+                     (self.num_erroneous_ctrl_rounds_current_block / self.block_size)) + \
+                    self.compute_confidence_interval(self.num_erroneous_ctrl_rounds_current_block, self.block_size,
+                                                     self.confidence_level)
+                self.blocks_quantum_bit_error_rates_estimations.append(block_quantum_bit_error_rate_estimation)
+                blocks_quantum_bit_error_rates_estimations.append(block_quantum_bit_error_rate_estimation)
+
+                # Reset the counters of the current block
+                self.num_ctrl_rounds_current_block = 0
+                self.num_erroneous_ctrl_rounds_current_block = 0
+
+                # If there is a threshold to abort the Protocol and the lower bound of
+                # the confidence interval of the global Quantum Bit Error Rate (QBER) crossed it
+                if (self.abort_threshold is not None) and \
+                        (self.get_quantum_bit_error_rate_confidence_interval()[0] > self.abort_threshold):
+
+                    # Set the threshold to abort the Protocol as crossed
+                    self.abort_threshold_crossed = True
+
+        # Return the estimations of the Quantum Bit Error Rate (QBER) of the blocks completed
+        return blocks_quantum_bit_error_rates_estimations
+
+    # Fold the Results of a CTRL (Reflect) Round, given as a Binary String, with one Bit per Party,
+    # returning the estimation of the Quantum Bit Error Rate (QBER) of the block completed by it, if any
+    def add_ctrl_round_results(self, ctrl_round_results):
+        return self.add_ctrl_rounds_results_bits((frombuffer(ctrl_round_results.encode("ascii"), dtype=uint8) -
+                                                  ord("0")).reshape(1, self.num_parties))
+
+    # Return the number of CTRL (Reflect) Rounds already folded
+    def get_num_ctrl_rounds(self):
+        return self.num_ctrl_rounds
+
+    # Return the number of erroneous CTRL (Reflect) Rounds already folded
+    def get_num_erroneous_ctrl_rounds(self):
+        return self.num_erroneous_ctrl_rounds
+
+    # Return the global Quantum Bit Error Rate (QBER) (i.e., None, if no CTRL (Reflect) Round was folded yet)
+    def get_quantum_bit_error_rate(self):
+        return (self.num_erroneous_ctrl_rounds / self.num_ctrl_rounds) if self.num_ctrl_rounds > 0 else None
+
+    # Return the confidence interval of the global Quantum Bit Error Rate (QBER)
+    # (i.e., None, if no CTRL (Reflect) Round was folded yet)
+    def get_quantum_bit_error_rate_confidence_interval(self):
+        return self.compute_confidence_interval(self.num_erroneous_ctrl_rounds, self.num_ctrl_rounds,
+                                                self.confidence_level) if self.num_ctrl_rounds > 0 else None
+
+    # Return the Quantum Bit Error Rates (QBERs) of each Party (i.e., None, if no CTRL (Reflect) Round was folded yet)
+    def get_parties_quantum_bit_error_rates(self):
+        return (self.num_parties_erroneous_bits / self.num_ctrl_rounds) if self.num_ctrl_rounds > 0 else None
+
+    # Return the list of the estimations of the Quantum Bit Error Rate (QBER) of each block completed
+    def get_blocks_quantum_bit_error_rates_estimations(self):
+        return self.blocks_quantum_bit_error_rates_estimations
+
+    # Return the boolean flag about if the threshold to abort the Protocol was crossed
+    def is_abort_threshold_crossed(self):
+        return self.abort_threshold_crossed
@@ -0,0 +1,93 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import N-Dimensional Arrays from Buffers, Zeros and the Unsigned Integer (8 bits) from NumPy
+from numpy import frombuffer, uint8, zeros
+
+# Import BitPackedBinaryString from Common.Utils
+from src.common.utils import BitPackedBinaryString
+
+
+# Class for IBM Qiskit's Buffer of the Raw Conference Keys of the Parties of
+# the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+# NOTE: The Raw Conference Key of each Party is built from its Bits of the Results of the SIFT (Measure and Resend)
+#       Rounds, accumulated (i.e., sifted) as the Rounds are completed, into a preallocated array of bits,
+#       with one row per Party (in the order of the IDs of the Party Entities), since the number of
+#       SIFT (Measure and Resend) Rounds is known beforehand, from the Bipartite Pre-Shared Keys
+class QiskitSQCKAProtocolRawConferenceKeysBuffer:
+
+    # Constructor for IBM Qiskit's Buffer of the Raw Conference Keys of the Parties of
+    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    def __init__(self, name, num_parties, max_num_raw_conference_key_bits):
+
+        # Set the name of the Buffer of the Raw Conference Keys
+        self.name = name
+
+        # Set the number of Parties of the Buffer of the Raw Conference Keys
+        self.num_parties = num_parties
+
+        # Initialise the preallocated array of the Bits of the Raw Conference Keys, with the shape (parties × bits)
+        self.raw_conference_keys_bits = zeros((num_parties, max_num_raw_conference_key_bits), dtype=uint8)
+
+        # Initialise the number of Bits already accumulated in the Raw Conference Keys
+        self.num_raw_conference_key_bits = 0
+
+    # Return the number of Bits already accumulated in the Raw Conference Keys
+    def get_num_raw_conference_key_bits(self):
+        return self.num_raw_conference_key_bits
+
+    # Return the maximum number of Bits of the Raw Conference Keys
+    def get_max_num_raw_conference_key_bits(self):
+        return self.raw_conference_keys_bits.shape[1]
+
+    # Append the Results of several SIFT (Measure and Resend) Rounds to the Raw Conference Keys,
+    # given as an array of Bits, with the shape (rounds × parties)
+    def append_sift_rounds_results_bits(self, sift_rounds_results_bits):
+
+        # Retrieve the number of SIFT (Measure and Resend) Rounds given
+        num_sift_rounds = len(sift_rounds_results_bits)
+
+        # If the Raw Conference Keys do not have space for the Results of the SIFT (Measure and Resend) Rounds given
+        if (self.num_raw_conference_key_bits + num_sift_rounds) > self.get_max_num_raw_conference_key_bits():
+
+            # Raise a Runtime Error
+            raise RuntimeError("The Raw Conference Keys can only have {} Bits!!!"
+                               .format(self.get_max_num_raw_conference_key_bits()))
+
+        # Copy the Results of the SIFT (Measure and Resend) Rounds to the Raw Conference Keys
+        self.raw_conference_keys_bits[:, self.num_raw_conference_key_bits:
+                                      (self.num_raw_conference_key_bits + num_sift_rounds)] = \
+            sift_rounds_results_bits.T
+
+        # Update the number of Bits already accumulated in the Raw Conference Keys
+        self.num_raw_conference_key_bits += num_sift_rounds
+
+    # Append the Results of a SIFT (Measure and Resend) Round to the Raw Conference Keys,
+    # given as a Binary String, with one Bit per Party
+    def append_sift_round_results(self, sift_round_results):
+
+        # Convert the Results of the SIFT (Measure and Resend) Round to an array of Bits, with the shape (1 × parties)
+        self.append_sift_rounds_results_bits((frombuffer(sift_round_results.encode("ascii"), dtype=uint8) -
+                                              ord("0")).reshape(1, self.num_parties))
+
+    # Return the Bits of the Raw Conference Key of the Party with the given ID, as a view of the Buffer
+    def get_raw_conference_key_bits(self, party_entity_id):
+        return self.raw_conference_keys_bits[party_entity_id, :self.num_raw_conference_key_bits]
+
+    # Return the Raw Conference Key of the Party with the given ID, as a Bit-Packed Binary String
+    def get_raw_conference_key(self, party_entity_id):
+        return BitPackedBinaryString.BitPackedBinaryString \
+            .from_bits(self.get_raw_conference_key_bits(party_entity_id))
@@ -35,6 +35,11 @@ class QiskitSQCKAProtocolRound:
         # the Slots of the Rounds of the Protocol
         self.party_entity_owner_times = party_entity_owner_times
 
+        # Set the Dictionary of the IDs of the Party Entities currently holding each Qubit of the Round,
+        # for the Compact Layout, where the Quantum Communication Channels are modeled logically
+        # (i.e., a Qubit in transit over a Quantum Communication Channel is held by no Party Entity)
+        self.qubits_holders_party_entities_ids = {}
+
     # Return the Number of the Round of the Protocol
     def get_num_round(self):
         return self.num_round
@@ -63,3 +68,14 @@ class QiskitSQCKAProtocolRound:
     # the Slots of the Rounds of the Protocol
     def get_party_owner_times(self):
         return self.party_entity_owner_times
+
+    # Return the ID of the Party Entity currently holding the given Qubit of the Round
+    # (i.e., None, if the Qubit is in transit over a Quantum Communication Channel), or the given default one,
+    # if the ownership of the Qubit was never transferred (e.g., for a Round created from a Template)
+    def get_qubit_holder_party_entity_id(self, qubit_index, default_party_entity_id=None):
+        return self.qubits_holders_party_entities_ids.get(qubit_index, default_party_entity_id)
+
+    # Transfer the ownership of the given Qubit of the Round to the given Party Entity
+    # (i.e., None, if the Qubit is sent over a Quantum Communication Channel)
+    def transfer_qubit_ownership(self, qubit_index, party_entity_id):
+        self.qubits_holders_party_entities_ids[qubit_index] = party_entity_id
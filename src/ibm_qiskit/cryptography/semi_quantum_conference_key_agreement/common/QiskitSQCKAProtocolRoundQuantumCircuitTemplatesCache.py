@@ -0,0 +1,96 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the String ID of the QASM Simulator of the IBM Qiskit's Aer
+from src.common.enumerations.QuantumSimulatorTypes import AER_QASM_SIMULATOR
+
+# Import QiskitQuantumCircuit from IBM_Qiskit.Circuit
+from src.ibm_qiskit.circuit import QiskitQuantumCircuit
+
+# Import QiskitSimulatorSession from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSimulatorSession
+
+
+# Class for IBM Qiskit's Cache of the Templates of the Quantum Circuits of
+# the Rounds for the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+# NOTE: The Quantum Circuit executed for a Round only depends on the number of Parties,
+#       the type of Quantum Entanglement, the type of the Round, the Strategy for Eavesdropping Detection and
+#       the Quantum Simulator used, since the Pauli-X/Pauli-I Gates applied to resend the Qubits (Particles),
+#       in the SIFT (Measure and Resend) Rounds, only take place after the (unique) Measurement executed;
+#       And thus, each Template is built and transpiled only once, and reused for all the equivalent Rounds
+class QiskitSQCKAProtocolRoundQuantumCircuitTemplatesCache:
+
+    # Constructor for IBM Qiskit's Cache of the Templates of the Quantum Circuits of
+    # the Rounds for the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    def __init__(self, name):
+
+        # Set the name of the Cache of the Templates of the Quantum Circuits
+        self.name = name
+
+        # Initialise the Dictionary of the Templates of the Quantum Circuits, indexed by their keys
+        self.qiskit_quantum_circuit_templates = {}
+
+        # Initialise the Dictionary of the Templates of the Quantum Circuits, ready to be executed
+        # (i.e., already transpiled, for the case of the QASM Simulator), indexed by their keys
+        self.quantum_circuit_templates_to_execute = {}
+
+    # Build the key of a Template of the Quantum Circuit of a Round,
+    # from the parameters which the structure of the Quantum Circuit depends on
+    @staticmethod
+    def build_quantum_circuit_template_key(num_parties, quantum_entanglement_type, type_round,
+                                           strategy_for_eavesdropping_detection, quantum_simulator_type):
+        return (num_parties, quantum_entanglement_type.upper(), type_round,
+                strategy_for_eavesdropping_detection, quantum_simulator_type)
+
+    # Return the number of Templates of the Quantum Circuits in the Cache
+    def get_num_quantum_circuit_templates(self):
+        return len(self.qiskit_quantum_circuit_templates)
+
+    # Return the boolean flag about if the Cache has a Template of the Quantum Circuit, for the given key
+    def has_quantum_circuit_template(self, quantum_circuit_template_key):
+        return quantum_circuit_template_key in self.qiskit_quantum_circuit_templates
+
+    # Return the Template of the Quantum Circuit, for the given key
+    # NOTE: The Template is shared by all the Rounds using it, and thus, it should not be modified
+    def get_qiskit_quantum_circuit_template(self, quantum_circuit_template_key):
+        return self.qiskit_quantum_circuit_templates[quantum_circuit_template_key]
+
+    # Return the Template of the Quantum Circuit, ready to be executed, for the given key
+    def get_quantum_circuit_template_to_execute(self, quantum_circuit_template_key):
+        return self.quantum_circuit_templates_to_execute[quantum_circuit_template_key]
+
+    # Add a Template of the Quantum Circuit, for the given key, from a copy of the given Quantum Circuit of a Round,
+    # transpiling it only once, for the case of the QASM Simulator
+    def add_quantum_circuit_template(self, quantum_circuit_template_key, qiskit_quantum_circuit):
+
+        # Copy the given Quantum Circuit of the Round, since it can be modified after this point
+        quantum_circuit_template = qiskit_quantum_circuit.quantum_circuit.copy()
+
+        # Add the Template of the Quantum Circuit, for the given key
+        self.qiskit_quantum_circuit_templates[quantum_circuit_template_key] = \
+            QiskitQuantumCircuit.QiskitQuantumCircuit(quantum_circuit_template.name,
+                                                      quantum_circuit=quantum_circuit_template,
+                                                      barriers_flag=qiskit_quantum_circuit.get_barriers_flag())
+
+        # If the Template of the Quantum Circuit is meant to be executed on the QASM Simulator of the IBM Qiskit's Aer
+        if quantum_circuit_template_key[-1] == AER_QASM_SIMULATOR:
+
+            # Transpile the Template of the Quantum Circuit, only once, on the default Simulator Session
+            quantum_circuit_template = QiskitSimulatorSession.QiskitSimulatorSession \
+                .get_default_qiskit_simulator_session().transpile_quantum_circuit(quantum_circuit_template)
+
+        # Add the Template of the Quantum Circuit, ready to be executed, for the given key
+        self.quantum_circuit_templates_to_execute[quantum_circuit_template_key] = quantum_circuit_template
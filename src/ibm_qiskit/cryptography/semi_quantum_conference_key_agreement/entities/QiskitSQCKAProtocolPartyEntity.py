@@ -13,8 +13,6 @@ Acknowledgments:
 """
 
 # Import Enumerations and Constants
-from qiskit import Aer, execute
-
 from src.common.enumerations.SemiQuantumCryptographyProtocolPartyEntityTypes \
     import POSSIBLE_SEMI_QUANTUM_CRYPTOGRAPHY_PROTOCOL_PARTY_ENTITY_TYPES, \
     QUANTUM_PARTY_ENTITY, SEMI_QUANTUM_PARTY_ENTITY
@@ -26,11 +24,25 @@ from src.common.enumerations.QuantumEntanglementTypes \
     BELL_STATE, EPR_PAIR_STATE, BELL_STATE_PHI_PLUS, BELL_STATE_PHI_MINUS, BELL_STATE_PSI_PLUS, BELL_STATE_PSI_MINUS,\
     GHZ_STATE, W_STATE, DICKE_STATE, RESOURCE_STATE, GRAPH_STATE, CLUSTER_STATE
 
+# Import the possible Quantum Simulator Types
+from src.common.enumerations.QuantumSimulatorTypes import AER_QASM_SIMULATOR, STABILIZER_SIMULATOR, \
+    SPARSE_STATE_VECTOR_SIMULATOR, BATCHED_STATE_VECTOR_SIMULATOR
+
+# Import the possible Layout Types of the Quantum Circuits of the Rounds
+from src.common.enumerations.QuantumCircuitLayoutTypes import EXPANDED_LAYOUT, COMPACT_LAYOUT
+
 # TODO
 from src.common.enumerations.SemiQuantumCryptographyProtocolRoundTypes \
     import SIFT_MEASURE_AND_RESEND_ROUND_BIT, CTRL_REFLECT_ROUND_BIT, \
     SIFT_MEASURE_AND_RESEND_ROUND_3, CTRL_REFLECT_ROUND_3
 
+# Import the possible types of the Events of the Protocol
+from src.common.enumerations.SemiQuantumCryptographyProtocolEventTypes \
+    import QUBIT_MEASURED, QUBIT_REFLECTED, QUBITS_RESET, QUBIT_RESENT
+
+# Import ProtocolEventLog from Common.Events
+from src.common.events import ProtocolEventLog
+
 # Import Packages and Libraries
 
 # Import QiskitBellState from IBM_Qiskit.Entanglements.Bipartite
@@ -49,6 +61,12 @@ from src.ibm_qiskit.entanglements.multipartite import QiskitWState
 # Import QiskitGraphState from IBM_Qiskit.Entanglements.Multipartite.Resource_States
 from src.ibm_qiskit.entanglements.multipartite.resource_states import QiskitGraphState
 
+# Import QiskitSWAPTest from IBM_Qiskit.Cryptography.Utils
+from src.ibm_qiskit.cryptography.utils import QiskitSWAPTest
+
+# Import QiskitSimulatorSession from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSimulatorSession
+
 
 # Constants
 
@@ -60,7 +78,9 @@ NUM_COUNTS_FOR_SIMULATION = 1000
 class QiskitSQCKAProtocolPartyEntity:
 
     # Constructor of the IBM Qiskit's Party Entity for the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-    def __init__(self, party_entity_id, party_user_client, resources_context, distributor_status_flag, bipartite_pre_shared_keys):
+    def __init__(self, party_entity_id, party_user_client, resources_context, distributor_status_flag, bipartite_pre_shared_keys,
+                 quantum_simulator_type=AER_QASM_SIMULATOR, quantum_circuit_layout_type=EXPANDED_LAYOUT,
+                 barriers_for_visualization_flag=False, dynamic_circuits_flag=False):
 
         # If the Resources' Context for the IBM Qiskit's Party Entity for
         # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol is valid
@@ -99,6 +119,22 @@ class QiskitSQCKAProtocolPartyEntity:
                 # Set the Pre-Shared Key, previously established between the Party Entities
                 self.bipartite_pre_shared_keys = bipartite_pre_shared_keys
 
+                # Set the type of the Quantum Simulator, used to execute the Quantum Circuits of the Rounds
+                self.quantum_simulator_type = quantum_simulator_type.upper()
+
+                # Set the Layout Type of the Quantum Circuits of the Rounds
+                self.quantum_circuit_layout_type = quantum_circuit_layout_type.upper()
+
+                # Set the boolean flag about if the Barriers are recorded in the Quantum Circuits of the Rounds,
+                # only for their visualization or export (i.e., otherwise, they are omitted,
+                # to not block the optimizations of the transpiler)
+                self.barriers_for_visualization_flag = barriers_for_visualization_flag
+
+                # Set the boolean flag about if the Rounds are executed as Dynamic Quantum Circuits
+                # (i.e., the resending of the Qubits in the SIFT Rounds is classically conditioned on
+                # the Mid-Circuit Measurements, and the whole Round is executed in a single job)
+                self.dynamic_circuits_flag = dynamic_circuits_flag
+
             # If the configuration of the Resources' Context for
             # the IBM Qiskit's Party Entity for the Semi-Quantum Conference Key Agreement (SQCKA) Protocol is not valid
             else:
@@ -150,6 +186,102 @@ class QiskitSQCKAProtocolPartyEntity:
     def get_bipartite_pre_shared_keys(self):
         return self.bipartite_pre_shared_keys
 
+    # Return the type of the Quantum Simulator, used to execute the Quantum Circuits of the Rounds
+    def get_quantum_simulator_type(self):
+        return self.quantum_simulator_type
+
+    # Return the Layout Type of the Quantum Circuits of the Rounds
+    def get_quantum_circuit_layout_type(self):
+        return self.quantum_circuit_layout_type
+
+    # Return the boolean flag about if the Barriers are recorded in the Quantum Circuits of the Rounds,
+    # only for their visualization or export
+    def get_barriers_for_visualization_flag(self):
+        return self.barriers_for_visualization_flag
+
+    # Return the boolean flag about if the Rounds are executed as Dynamic Quantum Circuits,
+    # in a single job of the Quantum Simulator
+    def get_dynamic_circuits_flag(self):
+        return self.dynamic_circuits_flag
+
+    # Return the number of Qubits and Bits of the Registers of the Party Entities and
+    # the Quantum Communication Channels, according to the Layout Type of the Quantum Circuits of the Rounds
+    # (i.e., (3n - 2) Qubits for the Expanded Layout, or only n Qubits for the Compact Layout)
+    def get_num_qubits_and_bits_for_party_registers(self, num_parties):
+
+        # If the Quantum Circuits of the Rounds use the Compact Layout
+        if self.get_quantum_circuit_layout_type() == COMPACT_LAYOUT:
+
+            # Return the number of Qubits and Bits, only with one Qubit for each Party Entity
+            return num_parties
+
+        # Return the number of Qubits and Bits of the Distributor, Channel and Party Registers
+        return ((3 * num_parties) - 2)
+
+    # Return the index of the Qubit (and Bit) of the Register of the given Semi-Quantum Party Entity,
+    # according to the Layout Type of the Quantum Circuits of the Rounds
+    def get_qubit_bit_index_of_semi_quantum_party_entity(self, num_parties, party_entity_id):
+
+        # If the Quantum Circuits of the Rounds use the Compact Layout
+        if self.get_quantum_circuit_layout_type() == COMPACT_LAYOUT:
+
+            # Return the index of the Qubit, prepared for the Semi-Quantum Party Entity,
+            # which is never moved from the Quantum Memory of the Distributor Party Entity
+            return party_entity_id
+
+        # Return the index of the Qubit of the Party Register of the Semi-Quantum Party Entity
+        return ((2 * num_parties) + party_entity_id - 2)
+
+    # Check if the given Qubit of the Round is held by the given Party Entity
+    # (i.e., None, if the Qubit should be in transit over a Quantum Communication Channel),
+    # for the Compact Layout, where the Quantum Communication Channels are modeled logically
+    @staticmethod
+    def check_qubit_holder_party_entity_id(protocol_round, qubit_index, party_entity_id):
+
+        # If the given Qubit of the Round is not held by the given Party Entity
+        if protocol_round.get_qubit_holder_party_entity_id(qubit_index, party_entity_id) != party_entity_id:
+
+            # Raise a Runtime Error
+            raise RuntimeError("The Qubit #{} of the Round #{} is not held by the expected Party Entity "
+                               "(or Quantum Communication Channel)!!!"
+                               .format(qubit_index, protocol_round.get_num_round()))
+
+    # Execute the given IBM Qiskit's Quantum Circuits, on the configured Quantum Simulator,
+    # returning the list of the Measurement results of each of them, as Dictionary Objects, for a frequency counting
+    # (i.e., or as lists of the Measurement results of each Shot, in order, if the memory is requested)
+    # NOTE: If the Quantum Circuits given were already transpiled, their transpilation is not repeated
+    def execute_quantum_circuits(self, quantum_circuits, num_shots=1, is_transpiled=False, memory=False):
+
+        # Retrieve the default Simulator Session, shared by the whole process
+        qiskit_simulator_session = QiskitSimulatorSession.QiskitSimulatorSession \
+            .get_default_qiskit_simulator_session()
+
+        # If the Quantum Circuits are meant to be executed on the Stabilizer Simulator
+        if self.get_quantum_simulator_type() == STABILIZER_SIMULATOR:
+
+            # Execute the Quantum Circuits on the Stabilizer Simulator of the Simulator Session
+            return qiskit_simulator_session.get_stabilizer_simulator() \
+                .execute_quantum_circuits(quantum_circuits, num_shots, memory=memory)
+
+        # If the Quantum Circuits are meant to be executed on the Sparse State Vector Simulator
+        if self.get_quantum_simulator_type() == SPARSE_STATE_VECTOR_SIMULATOR:
+
+            # Execute the Quantum Circuits on the Sparse State Vector Simulator of the Simulator Session
+            return qiskit_simulator_session.get_sparse_state_vector_simulator() \
+                .execute_quantum_circuits(quantum_circuits, num_shots, memory=memory)
+
+        # If the Quantum Circuits are meant to be executed on the Batched State Vector Simulator
+        if self.get_quantum_simulator_type() == BATCHED_STATE_VECTOR_SIMULATOR:
+
+            # Execute the Quantum Circuits on the Batched State Vector Simulator of the Simulator Session
+            return qiskit_simulator_session.get_batched_state_vector_simulator() \
+                .execute_quantum_circuits(quantum_circuits, num_shots, memory=memory)
+
+        # Execute the Quantum Circuits, as one single Job, on the QASM Simulator of the Simulator Session
+        return qiskit_simulator_session.execute_quantum_circuits_on_qasm_simulator(quantum_circuits, num_shots,
+                                                                                   is_transpiled=is_transpiled,
+                                                                                   memory=memory)
+
     # Print the information about
     # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol's Party Entity
     def print_info(self):
@@ -234,32 +366,50 @@ class QiskitSQCKAProtocolPartyEntity:
         print("|")
         print("|__")
 
-    # Create the Round for the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-    def create_protocol_round(self, num_round, num_qubits_and_bits_for_quantum_circuit):
+    # Retrieve the ID of the type of a Round for the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+    # according to the respective bit of the Pre-Shared Key
+    def get_protocol_round_type_id(self, num_round):
 
-        # If the Party is the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-        if self.is_distributor() and (self.get_resources_context().lower() == QUANTUM_PARTY_ENTITY.lower()):
+        # Retrieve the Bipartite Pre-Shared Keys of the Distributor of
+        # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        bipartite_pre_shared_keys = self.get_bipartite_pre_shared_keys()
 
-            # Retrieve the Bipartite Pre-Shared Keys of the Distributor of
-            # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-            bipartite_pre_shared_keys = self.get_bipartite_pre_shared_keys()
+        # Retrieve the bit of the Pre-Shared Key, corresponding to the current round
+        round_type_bit = bipartite_pre_shared_keys[0].get_bipartite_pre_shared_key_bit(num_round)
 
-            # Retrieve the bit of the Pre-Shared Key, corresponding to the current round
-            round_type_bit = bipartite_pre_shared_keys[0].get_bipartite_pre_shared_key()[num_round]  # TODO
+        # If the bit of the Pre-Shared Key, corresponding to the current round is zero
+        # (i.e., a SIFT / Measure and Resend Round)
+        if round_type_bit == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
 
-            # If the bit of the Pre-Shared Key, corresponding to the current round is zero
-            # (i.e., a SIFT / Measure and Resend Round)
-            if int(round_type_bit) == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
+            # Return the ID of the SIFT / Measure and Resend Round
+            return SIFT_MEASURE_AND_RESEND_ROUND_3
 
-                # Set the ID of the SIFT / Measure and Resend Round
-                round_type_id = SIFT_MEASURE_AND_RESEND_ROUND_3
+        # If the bit of the Pre-Shared Key, corresponding to the current round is one
+        # (i.e., a CTRL / Reflect Round)
+        else:
 
-            # If the bit of the Pre-Shared Key, corresponding to the current round is zero
-            # (i.e., a CTRL / Reflect Round)
-            else:
+            # Return the ID of the CTRL / Reflect Round
+            return CTRL_REFLECT_ROUND_3
+
+    # Create the Round for the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    # NOTE: If a Quantum Circuit is given (e.g., a cached Template of a Quantum Circuit),
+    #       it is used for the Round, instead of building a new one
+    def create_protocol_round(self, num_round, num_qubits_and_bits_for_quantum_circuit,
+                              qiskit_quantum_circuit=None):
+
+        # If the Party is the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        if self.is_distributor() and (self.get_resources_context().lower() == QUANTUM_PARTY_ENTITY.lower()):
+
+            # Retrieve the ID of the type of the current Round
+            round_type_id = self.get_protocol_round_type_id(num_round)
 
-                # Set the ID of the CTRL / Reflect Round
-                round_type_id = CTRL_REFLECT_ROUND_3
+            # If a Quantum Circuit was given for the Round
+            if qiskit_quantum_circuit is not None:
+
+                # Create and return the Round for
+                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, with the given Quantum Circuit
+                return QiskitSQCKAProtocolRound.QiskitSQCKAProtocolRound(num_round, round_type_id,
+                                                                         qiskit_quantum_circuit)
 
             # Creation of the IBM Qiskit's Quantum Register
             qiskit_quantum_register_sqcka_protocol_round = \
@@ -276,7 +426,8 @@ class QiskitSQCKAProtocolPartyEntity:
                 QiskitQuantumCircuit.QiskitQuantumCircuit("qcsqckaround{}".format(num_round),
                                                           qiskit_quantum_register_sqcka_protocol_round,
                                                           qiskit_classical_register_sqcka_protocol_round,
-                                                          global_phase=0)
+                                                          global_phase=0,
+                                                          barriers_flag=self.get_barriers_for_visualization_flag())
 
             # Create the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
             qiskit_sqcka_protocol_round = \
@@ -566,10 +717,24 @@ class QiskitSQCKAProtocolPartyEntity:
             # For each Semi-Quantum Entity
             for current_num_semi_quantum_entities in range(1, num_parties):
 
-                # Apply the Swap Gate, between the Qubits of the Distributor Party Entity and
-                # the Qubits of the Quantum Communication Channel
-                quantum_circuit.apply_swap(current_num_semi_quantum_entities,
-                                           (num_parties + current_num_semi_quantum_entities - 1))
+                # If the Quantum Circuits of the Rounds use the Compact Layout
+                if self.get_quantum_circuit_layout_type() == COMPACT_LAYOUT:
+
+                    # Check if the Qubit is held by the Distributor Party Entity
+                    self.check_qubit_holder_party_entity_id(protocol_round, current_num_semi_quantum_entities,
+                                                            self.party_entity_id)
+
+                    # Transfer the ownership of the Qubit to the Quantum Communication Channel,
+                    # instead of swapping it to a Qubit of the Quantum Communication Channel
+                    protocol_round.transfer_qubit_ownership(current_num_semi_quantum_entities, None)
+
+                # If the Quantum Circuits of the Rounds use the Expanded Layout
+                else:
+
+                    # Apply the Swap Gate, between the Qubits of the Distributor Party Entity and
+                    # the Qubits of the Quantum Communication Channel
+                    quantum_circuit.apply_swap(current_num_semi_quantum_entities,
+                                               (num_parties + current_num_semi_quantum_entities - 1))
 
                 # Apply Barriers to all the Qubits of the Quantum Circuit for
                 # the Round of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
@@ -598,10 +763,23 @@ class QiskitSQCKAProtocolPartyEntity:
             # Retrieve the Quantum Circuit of the Protocol Round
             quantum_circuit = protocol_round.get_qiskit_quantum_circuit()
 
-            # Apply the Swap Gate, between the Qubits of the Distributor and
-            # the Qubits of the Quantum Communication Channel
-            quantum_circuit.apply_swap((num_parties + self.party_entity_id - 1),
-                                       ((2 * num_parties) + self.party_entity_id - 2))
+            # If the Quantum Circuits of the Rounds use the Compact Layout
+            if self.get_quantum_circuit_layout_type() == COMPACT_LAYOUT:
+
+                # Check if the Qubit is in transit over the Quantum Communication Channel
+                self.check_qubit_holder_party_entity_id(protocol_round, self.party_entity_id, None)
+
+                # Transfer the ownership of the Qubit to the Semi-Quantum Party Entity,
+                # instead of swapping it from a Qubit of the Quantum Communication Channel
+                protocol_round.transfer_qubit_ownership(self.party_entity_id, self.party_entity_id)
+
+            # If the Quantum Circuits of the Rounds use the Expanded Layout
+            else:
+
+                # Apply the Swap Gate, between the Qubits of the Distributor and
+                # the Qubits of the Quantum Communication Channel
+                quantum_circuit.apply_swap((num_parties + self.party_entity_id - 1),
+                                           ((2 * num_parties) + self.party_entity_id - 2))
 
             # Apply Barriers to all the Qubits of the Quantum Circuit for
             # the Round of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
@@ -630,26 +808,37 @@ class QiskitSQCKAProtocolPartyEntity:
                 (self.get_resources_context().lower() == SEMI_QUANTUM_PARTY_ENTITY.lower()) and \
                 (not isinstance(self.bipartite_pre_shared_keys, list)):
 
-            # Retrieve the bipartite Pre-Shared Key, with the Distributor of the Protocol
-            pre_shared_key_bits = self.bipartite_pre_shared_keys.get_bipartite_pre_shared_key()
-
             # Retrieve the number of the Protocol Round
             num_round = protocol_round.get_num_round()
 
+            # Retrieve the Bit of the bipartite Pre-Shared Key, with the Distributor of the Protocol,
+            # corresponding to the current round
+            round_type_bit = self.bipartite_pre_shared_keys.get_bipartite_pre_shared_key_bit(num_round)
+
             # Retrieve the Quantum Circuit of the Protocol Round
             quantum_circuit = protocol_round.get_qiskit_quantum_circuit()
 
             # Compute the index of the Quantum Circuit,
             # according to the respective qubit and bit of the Semi-Quantum Party Entity
-            qubit_bit_index = ((2 * num_parties) + self.party_entity_id - 2)
+            qubit_bit_index = self.get_qubit_bit_index_of_semi_quantum_party_entity(num_parties,
+                                                                                    self.party_entity_id)
+
+            # If the Quantum Circuits of the Rounds use the Compact Layout
+            if self.get_quantum_circuit_layout_type() == COMPACT_LAYOUT:
+
+                # Check if the Qubit is held by the Semi-Quantum Party Entity
+                self.check_qubit_holder_party_entity_id(protocol_round, qubit_bit_index, self.party_entity_id)
 
             # It is a SIFT Round, thus, the Semi-Quantum Entity Party, will Measure and Resend the Qubit
             # back again to the Distributor of the Protocol (more probable)
-            if int(pre_shared_key_bits[num_round]) == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
+            if round_type_bit == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
 
-                # Print the information about the respective operation on the Qubit (Particle)
-                print("{} measured the Qubit (Particle) received, in the Z-Basis (Computational Basis)!!!"
-                      .format(self.get_party_user_client().get_user_client_name()))
+                # Emit the Event about the respective operation on the Qubit (Particle)
+                ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+                    .emit(QUBIT_MEASURED, num_round,
+                          "{party_name} measured the Qubit (Particle) received, "
+                          "in the Z-Basis (Computational Basis)!!!",
+                          party_name=self.get_party_user_client().get_user_client_name(), basis="Z")
 
                 # Prepare and Measure the Qubit in the Z-Basis (Computational Basis),
                 # according to the Party Entity's ID
@@ -658,19 +847,17 @@ class QiskitSQCKAProtocolPartyEntity:
 
             # It is a CTRL Round, thus, the Semi-Quantum Entity Party, will just Reflect the Qubit,
             # to the Distributor of the Protocol, without measure it (less probable)
-            elif int(pre_shared_key_bits[num_round]) == CTRL_REFLECT_ROUND_BIT:
+            elif round_type_bit == CTRL_REFLECT_ROUND_BIT:
 
-                # Print the information about the respective operation on the Qubit (Particle)
-                print("{} reflected the Qubit (Particle) received!!!"
-                      .format(self.get_party_user_client().get_user_client_name()))
+                # Emit the Event about the respective operation on the Qubit (Particle)
+                ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+                    .emit(QUBIT_REFLECTED, num_round, "{party_name} reflected the Qubit (Particle) received!!!",
+                          party_name=self.get_party_user_client().get_user_client_name())
 
                 # Apply the Pauli-I to the Qubit,
                 # according to the Party Entity's ID
                 quantum_circuit.apply_pauli_i(qubit_bit_index)
 
-            # Print a blank line
-            print("\n")
-
             # Update the Quantum Circuit of the Protocol Round
             protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
 
@@ -688,7 +875,10 @@ class QiskitSQCKAProtocolPartyEntity:
     # Execute the Quantum Circuit of the Protocol Round, if it is a SIFT (Measure and Resend) Round
     # NOTE: This function should be executed only once, and only, by the Distributor Party Entity,
     #       in order to ensure that its execution is unique
-    def execute_protocol_round_quantum_circuit_for_sift_rounds(self, num_parties, protocol_round):
+    # NOTE: If the Quantum Circuit is not meant to be executed right away (e.g., for a Batched Execution),
+    #       the Results of the Round should be saved, later, with the Measurement results of its Quantum Circuit
+    def execute_protocol_round_quantum_circuit_for_sift_rounds(self, num_parties, protocol_round,
+                                                               execute_quantum_circuit=True):
 
         # Only the Distributor Party Entity is allowed to check
         # if it is required to execute the Quantum Circuit of the Protocol Round,
@@ -712,40 +902,33 @@ class QiskitSQCKAProtocolPartyEntity:
             bipartite_pre_shared_keys = self.get_bipartite_pre_shared_keys()
 
             # Retrieve the bit of the Pre-Shared Key, corresponding to the current round
-            round_type_bit = bipartite_pre_shared_keys[0].get_bipartite_pre_shared_key()[num_round]  # TODO
+            round_type_bit = bipartite_pre_shared_keys[0].get_bipartite_pre_shared_key_bit(num_round)
 
             # Retrieve the Quantum Circuit of the Protocol Round
             quantum_circuit = protocol_round.get_qiskit_quantum_circuit()
 
             # It is a SIFT (Measure and Resend) Round, thus, the Semi-Quantum Party Entity,
             # will Measure and Resend the Qubit back again to the Distributor of the Protocol (more probable)
-            if int(round_type_bit) == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
+            if round_type_bit == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
 
                 # Prepare and Measure the Qubit in the Z-Basis (Computational Basis),
                 # according to the Distributor Party Entity's ID
                 # NOTE: This is necessary, since the Quantum Circuit will be executed only once;
                 quantum_circuit.prepare_measure_single_qubit_in_z_basis(0, 0, 0, 0, is_final_measurement=True)
 
-                # Getting the Backend for the QASM (Quantum ASseMbly) for the simulation of the Quantum Circuit
-                # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                qasm_backend = Aer.get_backend("qasm_simulator")
+                # If the Quantum Circuit of the SIFT (Measure and Resend) Round of the Protocol
+                # is meant to be executed right away
+                if execute_quantum_circuit:
 
-                # Execute the Quantum Circuit and store the Measurement results in a Dictionary Object,
-                # for a frequency counting
-                final_results_quantum_circuit_measurement = \
-                    execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1).result().get_counts()
+                    # Execute the Quantum Circuit and store the Measurement results in a Dictionary Object,
+                    # for a frequency counting
+                    final_results_quantum_circuit_measurement = \
+                        self.execute_quantum_circuits([quantum_circuit.quantum_circuit])[0]
 
-                # Retrieve the Bits from the Execution of the Quantum Circuit of
-                # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                # NOTE:
-                # - It is necessary to invert the order of the Bits from the Execution of
-                #   the Quantum Circuit of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                #   since the resulting Bits are presented and ordered,
-                #   from the most significant to the least significant one
-                circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                # Concatenate the Bits from the Distributor
-                protocol_sift_round_results = (circuit_bits[0] + circuit_bits[(2 * num_parties) - 1:])
+                    # Save the Results of the SIFT (Measure and Resend) Round of the Protocol
+                    protocol_round = \
+                        self.save_protocol_round_results_for_sift_rounds(num_parties, protocol_round,
+                                                                         final_results_quantum_circuit_measurement)
 
                 # Apply Barriers to all the Qubits of the Quantum Circuit for
                 # the Round of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
@@ -754,9 +937,6 @@ class QiskitSQCKAProtocolPartyEntity:
                 # Update the Quantum Circuit of the SIFT (Measure and Resend) Round of the Protocol
                 protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
 
-                # Save the Results of the SIFT (Measure and Resend) Round of the Protocol
-                protocol_round.save_round_results(protocol_sift_round_results)
-
                 # Return the Protocol Round updated
                 return protocol_round
 
@@ -780,6 +960,49 @@ class QiskitSQCKAProtocolPartyEntity:
                                "Quantum Circuits for the SIFT (Measure and Resend) Rounds of "
                                "the Semi-Quantum Conference Key Agreement (SQCKA) Protocol!!!")
 
+    # Save the Results of the SIFT (Measure and Resend) Round, from the Measurement results of its Quantum Circuit
+    def save_protocol_round_results_for_sift_rounds(self, num_parties, protocol_round,
+                                                    final_results_quantum_circuit_measurement):
+
+        # If the Party Entity is the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        if self.is_distributor() and (self.get_resources_context().lower() == QUANTUM_PARTY_ENTITY.lower()):
+
+            # Retrieve the Bits from the Execution of the Quantum Circuit of
+            # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # NOTE:
+            # - It is necessary to invert the order of the Bits from the Execution of
+            #   the Quantum Circuit of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            #   since the resulting Bits are presented and ordered,
+            #   from the most significant to the least significant one
+            circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
+
+            # If the Quantum Circuits of the Rounds use the Compact Layout
+            if self.get_quantum_circuit_layout_type() == COMPACT_LAYOUT:
+
+                # Retrieve the Bits from the Distributor and the Semi-Quantum Party Entities,
+                # which are the first ones, one for each Party Entity
+                protocol_sift_round_results = circuit_bits[:num_parties]
+
+            # If the Quantum Circuits of the Rounds use the Expanded Layout
+            else:
+
+                # Concatenate the Bits from the Distributor
+                protocol_sift_round_results = (circuit_bits[0] + circuit_bits[(2 * num_parties) - 1:])
+
+            # Save the Results of the SIFT (Measure and Resend) Round of the Protocol
+            protocol_round.save_round_results(protocol_sift_round_results)
+
+            # Return the Protocol Round updated
+            return protocol_round
+
+        # If the Party is not the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        else:
+
+            # Raise a Runtime Error
+            raise RuntimeError("Only the Distributor Party Entity can save the Results of "
+                               "the SIFT (Measure and Resend) Rounds of "
+                               "the Semi-Quantum Conference Key Agreement (SQCKA) Protocol!!!")
+
     # Reset the Qubits of the Quantum Circuit of the SIFT (Measure and Resend) Round
     # NOTE: This function should be executed only once, and only, by the Distributor Party Entity,
     #       in order to ensure that its execution is unique
@@ -805,27 +1028,26 @@ class QiskitSQCKAProtocolPartyEntity:
             bipartite_pre_shared_keys = self.get_bipartite_pre_shared_keys()
 
             # Retrieve the bit of the Pre-Shared Key, corresponding to the current round
-            round_type_bit = bipartite_pre_shared_keys[0].get_bipartite_pre_shared_key()[num_round]  # TODO
+            round_type_bit = bipartite_pre_shared_keys[0].get_bipartite_pre_shared_key_bit(num_round)
 
             # Retrieve the Quantum Circuit of the Protocol Round
             quantum_circuit = protocol_round.get_qiskit_quantum_circuit()
 
             # It is a SIFT (Measure and Resend) Round, thus, the Semi-Quantum Party Entity,
             # will Measure and Resend the Qubit back again to the Distributor of the Protocol (more probable)
-            if int(round_type_bit) == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
+            if round_type_bit == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
 
                 # Reset all the Qubits of the Quantum Circuit for
                 # the Round of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
                 quantum_circuit.reset_all()
 
-                # Print the information about resetting the Quantum Circuit,
+                # Emit the Event about resetting the Quantum Circuit,
                 # after the Z-Basis (Computational Basis) Measurement,
                 # for the current Measure and Resend (SIFT Operation) Round
-                print("Resetting the Qubits (Particles) of the Quantum Circuit,\n"
-                      "after the Z-Basis (Computational Basis) Measurement...")
-
-                # Print the blank line
-                print("\n")
+                ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+                    .emit(QUBITS_RESET, num_round,
+                          "Resetting the Qubits (Particles) of the Quantum Circuit,\n"
+                          "after the Z-Basis (Computational Basis) Measurement...")
 
                 # Update the Quantum Circuit of the Protocol, which was reset
                 protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
@@ -860,14 +1082,28 @@ class QiskitSQCKAProtocolPartyEntity:
             bipartite_pre_shared_keys = self.get_bipartite_pre_shared_keys()
 
             # Retrieve the bit of the Pre-Shared Key, corresponding to the current round
-            round_type_bit = bipartite_pre_shared_keys[0].get_bipartite_pre_shared_key()[num_round]  # TODO
+            round_type_bit = bipartite_pre_shared_keys[0].get_bipartite_pre_shared_key_bit(num_round)
 
             # Retrieve the Quantum Circuit of the Protocol Round
             quantum_circuit = protocol_round.get_qiskit_quantum_circuit()
 
             # It is a SIFT (Measure and Resend) Round, thus, the Semi-Quantum Party Entity,
             # will Measure and Resend the Qubit back again to the Distributor of the Protocol (more probable)
-            if int(round_type_bit) == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
+            if round_type_bit == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
+
+                # If the Rounds are executed as Dynamic Quantum Circuits
+                if self.get_dynamic_circuits_flag():
+
+                    # Apply the Pauli-X to the Qubit, classically conditioned on the Bit of its
+                    # Mid-Circuit Measurement, according to the Distributor Party Entity's ID
+                    # NOTE: The Results of the Protocol Round are not known yet, at this point
+                    quantum_circuit.apply_pauli_x_conditioned_on_bit(0, 0, 0)
+
+                    # Update the Quantum Circuit, ready to be just sent back
+                    protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
+
+                    # Return the Protocol Round updated
+                    return protocol_round
 
                 # Retrieve the Bits of the results of the Protocol Round
                 protocol_round_results = protocol_round.get_round_results()
@@ -899,22 +1135,44 @@ class QiskitSQCKAProtocolPartyEntity:
             # Retrieve the number of the Protocol Round
             num_round = protocol_round.get_num_round()
 
-            # Retrieve the bipartite Pre-Shared Key, with the Party Entity of the Protocol
-            pre_shared_key_bits = self.bipartite_pre_shared_keys.get_bipartite_pre_shared_key()
-
-            # Retrieve the Bit of the Pre-Shared Key, corresponding to the current round
-            round_type_bit = pre_shared_key_bits[num_round]  # TODO
+            # Retrieve the Bit of the bipartite Pre-Shared Key, with the Party Entity of the Protocol,
+            # corresponding to the current round
+            round_type_bit = self.bipartite_pre_shared_keys.get_bipartite_pre_shared_key_bit(num_round)
 
             # Retrieve the Quantum Circuit of the Protocol Round
             quantum_circuit = protocol_round.get_qiskit_quantum_circuit()
 
             # It is a SIFT (Measure and Resend) Round, thus, the Semi-Quantum Party Entity,
             # will Measure and Resend the Qubit back again to the Distributor of the Protocol (more probable)
-            if int(round_type_bit) == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
+            if round_type_bit == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
 
                 # Compute the index of the Quantum Circuit,
                 # according to the respective qubit and bit of the Semi-Quantum Party Entity
-                qubit_bit_index = ((2 * num_parties) + self.party_entity_id - 2)
+                qubit_bit_index = self.get_qubit_bit_index_of_semi_quantum_party_entity(num_parties,
+                                                                                        self.party_entity_id)
+
+                # If the Rounds are executed as Dynamic Quantum Circuits
+                if self.get_dynamic_circuits_flag():
+
+                    # Apply the Pauli-X to the Qubit, classically conditioned on the Bit of
+                    # its Mid-Circuit Measurement, according to the Party Entity's ID
+                    quantum_circuit.apply_pauli_x_conditioned_on_bit(0, qubit_bit_index, qubit_bit_index)
+
+                    # Emit the Event about flipping or not the state of
+                    # the Qubit (Particle) on the Quantum Circuit of the current Round,
+                    # according to the outcome of its Mid-Circuit Measurement, not known yet at this point,
+                    # for the current Measure and Resend (SIFT Operation) Round
+                    ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+                        .emit(QUBIT_RESENT, num_round,
+                              "{party_name} conditionally flips the Qubit (Particle), "
+                              "according to its Measurement, before resend it...",
+                              party_name=self.get_party_user_client().get_user_client_name(), qubit_state=None)
+
+                    # Update the Quantum Circuit, ready to be just sent back
+                    protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
+
+                    # Return the Protocol Round updated
+                    return protocol_round
 
                 # Retrieve the Bits of the results of the Protocol Round
                 protocol_round_results = protocol_round.get_round_results()
@@ -931,13 +1189,16 @@ class QiskitSQCKAProtocolPartyEntity:
                     # according to the Party Entity's ID
                     quantum_circuit.apply_pauli_i(qubit_bit_index)
 
-                    # Print the information about flipping or not the state of
+                    # Emit the Event about flipping or not the state of
                     # the Qubit (Particle) on the Quantum Circuit of the current Round,
                     # to introducing the Qubit (Particle) in the same state it was found,
                     # after the Z-Basis (Computational Basis) Measurement,
                     # for the current Measure and Resend (SIFT Operation) Round
-                    print("{} does not flipped the Qubit (Particle) (i.e., setting it to |0⟩), before resend it..."
-                          .format(self.get_party_user_client().get_user_client_name()))
+                    ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+                        .emit(QUBIT_RESENT, num_round,
+                              "{party_name} does not flipped the Qubit (Particle) (i.e., setting it to |0⟩), "
+                              "before resend it...",
+                              party_name=self.get_party_user_client().get_user_client_name(), qubit_state=0)
 
                 # If the Bit of the result of the Protocol Round,
                 # regarding the Distributor Party Entity, is 1
@@ -947,16 +1208,16 @@ class QiskitSQCKAProtocolPartyEntity:
                     # according to the Party Entity's ID
                     quantum_circuit.apply_pauli_x(qubit_bit_index)
 
-                    # Print the information about flipping or not the state of
+                    # Emit the Event about flipping or not the state of
                     # the Qubit (Particle) on the Quantum Circuit of the current Round,
                     # to introducing the Qubit (Particle) in the same state it was found,
                     # after the Z-Basis (Computational Basis) Measurement,
                     # for the current Measure and Resend (SIFT Operation) Round
-                    print("{} flipped the Qubit (Particle) (i.e., setting it to |1⟩), before resend it..."
-                          .format(self.get_party_user_client().get_user_client_name()))
-
-                # Print the blank line
-                print("\n")
+                    ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+                        .emit(QUBIT_RESENT, num_round,
+                              "{party_name} flipped the Qubit (Particle) (i.e., setting it to |1⟩), "
+                              "before resend it...",
+                              party_name=self.get_party_user_client().get_user_client_name(), qubit_state=1)
 
         # Update the Quantum Circuit, ready to be just sent back, CTRL (Reflect) Round of the Protocol
         protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
@@ -964,6 +1225,50 @@ class QiskitSQCKAProtocolPartyEntity:
         # Return the Protocol Round updated
         return protocol_round
 
+    # Execute the Quantum Circuit of the SIFT (Measure and Resend) Round, as a Dynamic Quantum Circuit,
+    # after the Qubits were resent back to the Distributor Party Entity, and save the Results of the Round
+    # NOTE: This function should be executed only once, and only, by the Distributor Party Entity,
+    #       in order to ensure that its execution is unique
+    # NOTE: The Mid-Circuit Measurements and the classically conditioned resending of the Qubits are all
+    #       performed in this single execution, instead of executing the Quantum Circuit up to the Measurements,
+    #       and resending the Qubits according to the Results retrieved to Python
+    def execute_protocol_round_dynamic_quantum_circuit_for_sift_rounds(self, num_parties, protocol_round):
+
+        # If the Party Entity is the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        if self.is_distributor() and (self.get_resources_context().lower() == QUANTUM_PARTY_ENTITY.lower()):
+
+            # Retrieve the number of the Protocol Round
+            num_round = protocol_round.get_num_round()
+
+            # Retrieve the bit of the Pre-Shared Key, corresponding to the current round
+            round_type_bit = self.get_bipartite_pre_shared_keys()[0].get_bipartite_pre_shared_key_bit(num_round)
+
+            # It is a SIFT (Measure and Resend) Round, thus, the Quantum Circuit is executed
+            if round_type_bit == SIFT_MEASURE_AND_RESEND_ROUND_BIT:
+
+                # Execute the Quantum Circuit and store the Measurement results in a Dictionary Object,
+                # for a frequency counting
+                final_results_quantum_circuit_measurement = \
+                    self.execute_quantum_circuits([protocol_round.get_qiskit_quantum_circuit().quantum_circuit])[0]
+
+                # Save the Results of the SIFT (Measure and Resend) Round of the Protocol
+                protocol_round = \
+                    self.save_protocol_round_results_for_sift_rounds(num_parties, protocol_round,
+                                                                     final_results_quantum_circuit_measurement)
+
+            # Return the Protocol Round updated
+            return protocol_round
+
+        # If it is not the Distributor Party Entity, then, it cannot execute
+        # the Quantum Circuit for the SIFT (Measure and Resend) Rounds of
+        # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        else:
+
+            # Raise a Runtime Error
+            raise RuntimeError("Only the Distributor Party Entity can execute the "
+                               "Dynamic Quantum Circuits for the SIFT (Measure and Resend) Rounds of "
+                               "the Semi-Quantum Conference Key Agreement (SQCKA) Protocol!!!")
+
     # Send back the Quantum Data/Information to the Distributor Party Entity,
     # over the Quantum Communication Channels
     def send_back_quantum_data_information_to_distributor_party_entity(self, num_parties, protocol_round):
@@ -975,18 +1280,31 @@ class QiskitSQCKAProtocolPartyEntity:
             # Retrieve the Quantum Circuit of the Protocol Round
             quantum_circuit = protocol_round.get_qiskit_quantum_circuit()
 
-            # Compute the index of the Quantum Circuit,
-            # according to the respective Qubit and Bit of the Semi-Quantum Party Entity
-            qubit_bit_index_semi_quantum_party_entity = ((2 * num_parties) + self.party_entity_id - 2)
+            # If the Quantum Circuits of the Rounds use the Compact Layout
+            if self.get_quantum_circuit_layout_type() == COMPACT_LAYOUT:
 
-            # Compute the index of the Quantum Circuit,
-            # according to the respective Qubit and Bit of the Semi-Quantum Party Entity
-            qubit_bit_index_fiber_optic = (num_parties + self.party_entity_id - 1)
+                # Check if the Qubit is held by the Semi-Quantum Party Entity
+                self.check_qubit_holder_party_entity_id(protocol_round, self.party_entity_id, self.party_entity_id)
 
-            # Apply the Swap Gate, between the Qubits of the Distributor Party Entity and
-            # the Qubits of the Quantum Communication Channel
-            quantum_circuit.apply_swap(qubit_bit_index_semi_quantum_party_entity,
-                                       qubit_bit_index_fiber_optic)
+                # Transfer the ownership of the Qubit to the Quantum Communication Channel,
+                # instead of swapping it to a Qubit of the Quantum Communication Channel
+                protocol_round.transfer_qubit_ownership(self.party_entity_id, None)
+
+            # If the Quantum Circuits of the Rounds use the Expanded Layout
+            else:
+
+                # Compute the index of the Quantum Circuit,
+                # according to the respective Qubit and Bit of the Semi-Quantum Party Entity
+                qubit_bit_index_semi_quantum_party_entity = ((2 * num_parties) + self.party_entity_id - 2)
+
+                # Compute the index of the Quantum Circuit,
+                # according to the respective Qubit and Bit of the Semi-Quantum Party Entity
+                qubit_bit_index_fiber_optic = (num_parties + self.party_entity_id - 1)
+
+                # Apply the Swap Gate, between the Qubits of the Distributor Party Entity and
+                # the Qubits of the Quantum Communication Channel
+                quantum_circuit.apply_swap(qubit_bit_index_semi_quantum_party_entity,
+                                           qubit_bit_index_fiber_optic)
 
             # Update the Quantum Circuit of the Protocol Round
             protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
@@ -1014,10 +1332,23 @@ class QiskitSQCKAProtocolPartyEntity:
             # For each Semi-Quantum Entity
             for current_num_semi_quantum_entity in range(1, num_parties):
 
-                # Apply the Swap Gate, between the Qubits of the Distributor Party Entity and
-                # the Qubits of the Quantum Communication Channel
-                quantum_circuit.apply_swap((num_parties + current_num_semi_quantum_entity - 1),
-                                           current_num_semi_quantum_entity)
+                # If the Quantum Circuits of the Rounds use the Compact Layout
+                if self.get_quantum_circuit_layout_type() == COMPACT_LAYOUT:
+
+                    # Check if the Qubit is in transit over the Quantum Communication Channel
+                    self.check_qubit_holder_party_entity_id(protocol_round, current_num_semi_quantum_entity, None)
+
+                    # Transfer the ownership of the Qubit back to the Distributor Party Entity,
+                    # instead of swapping it from a Qubit of the Quantum Communication Channel
+                    protocol_round.transfer_qubit_ownership(current_num_semi_quantum_entity, self.party_entity_id)
+
+                # If the Quantum Circuits of the Rounds use the Expanded Layout
+                else:
+
+                    # Apply the Swap Gate, between the Qubits of the Distributor Party Entity and
+                    # the Qubits of the Quantum Communication Channel
+                    quantum_circuit.apply_swap((num_parties + current_num_semi_quantum_entity - 1),
+                                               current_num_semi_quantum_entity)
 
                 # Apply Barriers to all the Qubits of the Quantum Circuit for
                 # the Round of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
@@ -1037,10 +1368,13 @@ class QiskitSQCKAProtocolPartyEntity:
                                "over the Quantum Communication Channels!!!")
 
     # Prepare to Measurement of a Bipartite or Multipartite Quantum Entanglement, by inverting Quantum Circuit
+    # NOTE: If the Quantum Circuit is not meant to be executed right away (e.g., for a Batched Execution),
+    #       the Results of the Round should be saved, later, with the Measurement results of its Quantum Circuit
     def measure_quantum_entanglement_by_inverting_quantum_circuit(self, quantum_entanglement_type,
                                                                   num_parties, protocol_round,
                                                                   bell_state_type=None,
-                                                                  qubits_edges_indexes_for_resource_state=None):
+                                                                  qubits_edges_indexes_for_resource_state=None,
+                                                                  execute_quantum_circuit=True):
 
         # If the current Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
         if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
@@ -1074,39 +1408,6 @@ class QiskitSQCKAProtocolPartyEntity:
                                                          quantum_circuit,
                                                          0, 1).measure_bipartite_entanglement()
 
-                                    # Getting the Backend for the QASM (Quantum ASseMbly) for
-                                    # the simulation of the Quantum Circuit
-                                    # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                                    qasm_backend = Aer.get_backend("qasm_simulator")
-
-                                    # Execute the Quantum Circuit and store the Measurement results
-                                    # in a Dictionary Object, for a frequency counting
-                                    final_results_quantum_circuit_measurement = \
-                                        execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1)\
-                                        .result().get_counts()
-
-                                    # Retrieve the Bits from the Execution of the Quantum Circuit of
-                                    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                                    # NOTE:
-                                    # - It is necessary to invert the order of the Bits from
-                                    #   the Execution of the Quantum Circuit of
-                                    #   the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                                    #   since the resulting Bits are presented and ordered,
-                                    #   from the most significant to the least significant one
-                                    circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                                    # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
-                                    protocol_sift_round_results = circuit_bits[:num_parties]
-
-                                    # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
-                                    protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
-
-                                    # Save the Results of the CTRL (Reflected) Round of the Protocol
-                                    protocol_round.save_round_results(protocol_sift_round_results)
-
-                                    # Return the Protocol Round updated
-                                    return protocol_round
-
                                 # If the Bipartite Entangled State is Bell State:
                                 # - |ϕ^-⟩ = 1/sqrt(2) x (|00⟩ - |11⟩)
                                 elif bell_state_type == BELL_STATE_PHI_MINUS:
@@ -1119,39 +1420,6 @@ class QiskitSQCKAProtocolPartyEntity:
                                                          quantum_circuit,
                                                          0, 1).measure_bipartite_entanglement()
 
-                                    # Getting the Backend for the QASM (Quantum ASseMbly) for
-                                    # the simulation of the Quantum Circuit
-                                    # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                                    qasm_backend = Aer.get_backend("qasm_simulator")
-
-                                    # Execute the Quantum Circuit and store the Measurement results
-                                    # in a Dictionary Object, for a frequency counting
-                                    final_results_quantum_circuit_measurement = \
-                                        execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1) \
-                                        .result().get_counts()
-
-                                    # Retrieve the Bits from the Execution of the Quantum Circuit of
-                                    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                                    # NOTE:
-                                    # - It is necessary to invert the order of the Bits from
-                                    #   the Execution of the Quantum Circuit of
-                                    #   the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                                    #   since the resulting Bits are presented and ordered,
-                                    #   from the most significant to the least significant one
-                                    circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                                    # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
-                                    protocol_sift_round_results = circuit_bits[:num_parties]
-
-                                    # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
-                                    protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
-
-                                    # Save the Results of the CTRL (Reflected) Round of the Protocol
-                                    protocol_round.save_round_results(protocol_sift_round_results)
-
-                                    # Return the Protocol Round updated
-                                    return protocol_round
-
                                 # If the Bipartite Entangled State is Bell State:
                                 # - |ψ^+⟩ = 1/sqrt(2) x (|01⟩ + |10⟩)
                                 elif bell_state_type == BELL_STATE_PSI_PLUS:
@@ -1164,39 +1432,6 @@ class QiskitSQCKAProtocolPartyEntity:
                                                          quantum_circuit,
                                                          0, 1).measure_bipartite_entanglement()
 
-                                    # Getting the Backend for the QASM (Quantum ASseMbly) for
-                                    # the simulation of the Quantum Circuit
-                                    # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                                    qasm_backend = Aer.get_backend("qasm_simulator")
-
-                                    # Execute the Quantum Circuit and store the Measurement results
-                                    # in a Dictionary Object, for a frequency counting
-                                    final_results_quantum_circuit_measurement = \
-                                        execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1) \
-                                        .result().get_counts()
-
-                                    # Retrieve the Bits from the Execution of the Quantum Circuit of
-                                    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                                    # NOTE:
-                                    # - It is necessary to invert the order of the Bits from
-                                    #   the Execution of the Quantum Circuit of
-                                    #   the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                                    #   since the resulting Bits are presented and ordered,
-                                    #   from the most significant to the least significant one
-                                    circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                                    # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
-                                    protocol_sift_round_results = circuit_bits[:num_parties]
-
-                                    # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
-                                    protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
-
-                                    # Save the Results of the CTRL (Reflected) Round of the Protocol
-                                    protocol_round.save_round_results(protocol_sift_round_results)
-
-                                    # Return the Protocol Round updated
-                                    return protocol_round
-
                                 # If the Bipartite Entangled State is Bell State:
                                 # - |ψ^-⟩ = 1/sqrt(2) x (|01⟩ - |10⟩)
                                 elif bell_state_type == BELL_STATE_PSI_MINUS:
@@ -1209,39 +1444,6 @@ class QiskitSQCKAProtocolPartyEntity:
                                                          quantum_circuit,
                                                          0, 1).measure_bipartite_entanglement()
 
-                                    # Getting the Backend for the QASM (Quantum ASseMbly) for
-                                    # the simulation of the Quantum Circuit
-                                    # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                                    qasm_backend = Aer.get_backend("qasm_simulator")
-
-                                    # Execute the Quantum Circuit and store the Measurement results
-                                    # in a Dictionary Object, for a frequency counting
-                                    final_results_quantum_circuit_measurement = \
-                                        execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1) \
-                                        .result().get_counts()
-
-                                    # Retrieve the Bits from the Execution of the Quantum Circuit of
-                                    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                                    # NOTE:
-                                    # - It is necessary to invert the order of the Bits from
-                                    #   the Execution of the Quantum Circuit of
-                                    #   the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                                    #   since the resulting Bits are presented and ordered,
-                                    #   from the most significant to the least significant one
-                                    circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                                    # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
-                                    protocol_sift_round_results = circuit_bits[:num_parties]
-
-                                    # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
-                                    protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
-
-                                    # Save the Results of the CTRL (Reflected) Round of the Protocol
-                                    protocol_round.save_round_results(protocol_sift_round_results)
-
-                                    # Return the Protocol Round updated
-                                    return protocol_round
-
                             # If the configuration of the Bell State is not possible
                             else:
 
@@ -1280,39 +1482,6 @@ class QiskitSQCKAProtocolPartyEntity:
                                             control_qubit_index, target_qubits_indexes) \
                             .measure_multipartite_entanglement()
 
-                        # Getting the Backend for the QASM (Quantum ASseMbly) for
-                        # the simulation of the Quantum Circuit
-                        # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                        qasm_backend = Aer.get_backend("qasm_simulator")
-
-                        # Execute the Quantum Circuit and store the Measurement results
-                        # in a Dictionary Object, for a frequency counting
-                        final_results_quantum_circuit_measurement = \
-                            execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1) \
-                            .result().get_counts()
-
-                        # Retrieve the Bits from the Execution of the Quantum Circuit of
-                        # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        # NOTE:
-                        # - It is necessary to invert the order of the Bits from
-                        #   the Execution of the Quantum Circuit of
-                        #   the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                        #   since the resulting Bits are presented and ordered,
-                        #   from the most significant to the least significant one
-                        circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                        # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
-                        protocol_sift_round_results = circuit_bits[:num_parties]
-
-                        # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
-                        protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
-
-                        # Save the Results of the CTRL (Reflected) Round of the Protocol
-                        protocol_round.save_round_results(protocol_sift_round_results)
-
-                        # Return the Protocol Round updated
-                        return protocol_round
-
                     # If the number of parties involved is equal or lower than 2
                     else:
 
@@ -1336,39 +1505,6 @@ class QiskitSQCKAProtocolPartyEntity:
                                           qubits_indexes) \
                             .measure_multipartite_entanglement()
 
-                        # Getting the Backend for the QASM (Quantum ASseMbly) for
-                        # the simulation of the Quantum Circuit
-                        # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                        qasm_backend = Aer.get_backend("qasm_simulator")
-
-                        # Execute the Quantum Circuit and store the Measurement results
-                        # in a Dictionary Object, for a frequency counting
-                        final_results_quantum_circuit_measurement = \
-                            execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1) \
-                            .result().get_counts()
-
-                        # Retrieve the Bits from the Execution of the Quantum Circuit of
-                        # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        # NOTE:
-                        # - It is necessary to invert the order of the Bits from
-                        #   the Execution of the Quantum Circuit of
-                        #   the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                        #   since the resulting Bits are presented and ordered,
-                        #   from the most significant to the least significant one
-                        circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                        # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
-                        protocol_sift_round_results = circuit_bits[:num_parties]
-
-                        # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
-                        protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
-
-                        # Save the Results of the CTRL (Reflected) Round of the Protocol
-                        protocol_round.save_round_results(protocol_sift_round_results)
-
-                        # Return the Protocol Round updated
-                        return protocol_round
-
                     # If the number of parties involved is equal or lower than 2
                     else:
 
@@ -1399,39 +1535,6 @@ class QiskitSQCKAProtocolPartyEntity:
                                               qubits_edges_indexes_for_resource_state) \
                             .measure_multipartite_entanglement()
 
-                        # Getting the Backend for the QASM (Quantum ASseMbly) for
-                        # the simulation of the Quantum Circuit
-                        # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                        qasm_backend = Aer.get_backend("qasm_simulator")
-
-                        # Execute the Quantum Circuit and store the Measurement results
-                        # in a Dictionary Object, for a frequency counting
-                        final_results_quantum_circuit_measurement = \
-                            execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1) \
-                            .result().get_counts()
-
-                        # Retrieve the Bits from the Execution of the Quantum Circuit of
-                        # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        # NOTE:
-                        # - It is necessary to invert the order of the Bits from
-                        #   the Execution of the Quantum Circuit of
-                        #   the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                        #   since the resulting Bits are presented and ordered,
-                        #   from the most significant to the least significant one
-                        circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                        # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
-                        protocol_sift_round_results = circuit_bits[:num_parties]
-
-                        # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
-                        protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
-
-                        # Save the Results of the CTRL (Reflected) Round of the Protocol
-                        protocol_round.save_round_results(protocol_sift_round_results)
-
-                        # Return the Protocol Round updated
-                        return protocol_round
-
                     # If the number of parties involved is equal or lower than 2
                     else:
 
@@ -1456,39 +1559,6 @@ class QiskitSQCKAProtocolPartyEntity:
                                               qubits_edges_indexes_for_resource_state) \
                             .measure_multipartite_entanglement()
 
-                        # Getting the Backend for the QASM (Quantum ASseMbly) for
-                        # the simulation of the Quantum Circuit
-                        # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                        qasm_backend = Aer.get_backend("qasm_simulator")
-
-                        # Execute the Quantum Circuit and store the Measurement results
-                        # in a Dictionary Object, for a frequency counting
-                        final_results_quantum_circuit_measurement = \
-                            execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1) \
-                            .result().get_counts()
-
-                        # Retrieve the Bits from the Execution of the Quantum Circuit of
-                        # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        # NOTE:
-                        # - It is necessary to invert the order of the Bits from
-                        #   the Execution of the Quantum Circuit of
-                        #   the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                        #   since the resulting Bits are presented and ordered,
-                        #   from the most significant to the least significant one
-                        circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                        # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
-                        protocol_sift_round_results = circuit_bits[:num_parties]
-
-                        # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
-                        protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
-
-                        # Save the Results of the CTRL (Reflected) Round of the Protocol
-                        protocol_round.save_round_results(protocol_sift_round_results)
-
-                        # Return the Protocol Round updated
-                        return protocol_round
-
                     # If the number of parties involved is equal or lower than 2
                     else:
 
@@ -1509,6 +1579,26 @@ class QiskitSQCKAProtocolPartyEntity:
                     # Raise a Value Error
                     raise ValueError("The Quantum Entanglement specified for the Protocol is not possible to use!!!")
 
+                # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
+                protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
+
+                # If the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
+                # is meant to be executed right away
+                if execute_quantum_circuit:
+
+                    # Execute the Quantum Circuit and store the Measurement results in a Dictionary Object,
+                    # for a frequency counting
+                    final_results_quantum_circuit_measurement = \
+                        self.execute_quantum_circuits([quantum_circuit.quantum_circuit])[0]
+
+                    # Save the Results of the CTRL (Reflected) Round of the Protocol
+                    protocol_round = \
+                        self.save_protocol_round_results_for_ctrl_rounds(num_parties, protocol_round,
+                                                                         final_results_quantum_circuit_measurement)
+
+                # Return the Protocol Round updated
+                return protocol_round
+
             # If the Party is not the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
             else:
 
@@ -1521,7 +1611,10 @@ class QiskitSQCKAProtocolPartyEntity:
     # Measure the Qubits of the Quantum Circuit of the CTRL (Reflect) Round,
     # which were reflected back from the Semi-Quantum Party Entities to the Distributor Party Entity,
     # over the Quantum Communication Channels
-    def measure_quantum_data_information_for_ctrl_rounds(self, num_parties, protocol_round):
+    # NOTE: If the Quantum Circuit is not meant to be executed right away (e.g., for a Batched Execution),
+    #       the Results of the Round should be saved, later, with the Measurement results of its Quantum Circuit
+    def measure_quantum_data_information_for_ctrl_rounds(self, num_parties, protocol_round,
+                                                         execute_quantum_circuit=True):
 
         # If the current Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
         if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
@@ -1538,32 +1631,22 @@ class QiskitSQCKAProtocolPartyEntity:
                 # Measure the Qubits on the Quantum Memory of the Distributor Party Entity
                 quantum_circuit.measure_qubits_interval(0, 0, num_qubits_bits_indexes, num_qubits_bits_indexes)
 
-                # Getting the Backend for the QASM (Quantum ASseMbly) for the simulation of the Quantum Circuit
-                # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-                qasm_backend = Aer.get_backend("qasm_simulator")
-
-                # Execute the Quantum Circuit and store the Measurement results in a Dictionary Object,
-                # for a frequency counting
-                final_results_quantum_circuit_measurement = \
-                    execute(quantum_circuit.quantum_circuit, qasm_backend, shots=1).result().get_counts()
-
-                # Retrieve the Bits from the Execution of the Quantum Circuit of
-                # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                # NOTE:
-                # - It is necessary to invert the order of the Bits from the Execution of
-                #   the Quantum Circuit of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                #   since the resulting Bits are presented and ordered,
-                #   from the most significant to the least significant one
-                circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
-
-                # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
-                protocol_sift_round_results = circuit_bits[:num_parties]
-
                 # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
                 protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
 
-                # Save the Results of the CTRL (Reflected) Round of the Protocol
-                protocol_round.save_round_results(protocol_sift_round_results)
+                # If the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
+                # is meant to be executed right away
+                if execute_quantum_circuit:
+
+                    # Execute the Quantum Circuit and store the Measurement results in a Dictionary Object,
+                    # for a frequency counting
+                    final_results_quantum_circuit_measurement = \
+                        self.execute_quantum_circuits([quantum_circuit.quantum_circuit])[0]
+
+                    # Save the Results of the CTRL (Reflected) Round of the Protocol
+                    protocol_round = \
+                        self.save_protocol_round_results_for_ctrl_rounds(num_parties, protocol_round,
+                                                                         final_results_quantum_circuit_measurement)
 
                 # Return the Protocol Round updated
                 return protocol_round
@@ -1578,3 +1661,145 @@ class QiskitSQCKAProtocolPartyEntity:
 
         # Return the Protocol Round updated
         return protocol_round
+
+    # Save the Results of the CTRL (Reflect) Round, from the Measurement results of its Quantum Circuit
+    def save_protocol_round_results_for_ctrl_rounds(self, num_parties, protocol_round,
+                                                    final_results_quantum_circuit_measurement):
+
+        # If the Party Entity is the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        if self.is_distributor() and (self.get_resources_context().lower() == QUANTUM_PARTY_ENTITY.lower()):
+
+            # Retrieve the Bits from the Execution of the Quantum Circuit of
+            # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # NOTE:
+            # - It is necessary to invert the order of the Bits from the Execution of
+            #   the Quantum Circuit of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            #   since the resulting Bits are presented and ordered,
+            #   from the most significant to the least significant one
+            circuit_bits = list(final_results_quantum_circuit_measurement.keys())[0][::-1]
+
+            # Retrieve the Bits for the Measurement of the Multipartite Entanglement State
+            protocol_ctrl_round_results = circuit_bits[:num_parties]
+
+            # Save the Results of the CTRL (Reflected) Round of the Protocol
+            protocol_round.save_round_results(protocol_ctrl_round_results)
+
+            # Return the Protocol Round updated
+            return protocol_round
+
+        # If the Party is not the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        else:
+
+            # Raise a Runtime Error
+            raise RuntimeError("Only the Distributor Party Entity can save the Results of "
+                               "the CTRL (Reflect) Rounds of "
+                               "the Semi-Quantum Conference Key Agreement (SQCKA) Protocol!!!")
+
+    # Prepare the SWAP Test of the Quantum Circuit of the CTRL (Reflect) Round, comparing the Qubits reflected back
+    # from the Semi-Quantum Party Entities to the Distributor Party Entity with a fresh copy of
+    # the Multipartite Entanglement, prepared on a Reference Register, without executing it
+    # NOTE: The Quantum Circuit of the CTRL (Reflect) Round should have (3n - 2) + (n + 1) Qubits and Bits
+    #       (or n + (n + 1), for the Compact Layout),
+    #       where the Reference Register uses the n Qubits after the usual Qubits of the Round,
+    #       and the Ancilla Qubit of the SWAP Test uses the last one
+    # NOTE: The Results of the Round should be saved, later, with the Measurement results of its Quantum Circuit,
+    #       since all the SWAP Tests are meant to be executed at once, with several Shots
+    def prepare_swap_test_for_ctrl_rounds(self, quantum_entanglement_type, num_parties, protocol_round,
+                                          bell_state_type=None, qubits_edges_indexes_for_resource_state=None):
+
+        # If the current Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
+
+            # If the Party Entity is the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            if self.is_distributor() and (self.get_resources_context().lower() == QUANTUM_PARTY_ENTITY.lower()):
+
+                # Retrieve the Quantum Circuit of the Protocol Round
+                quantum_circuit = protocol_round.get_qiskit_quantum_circuit()
+
+                # Retrieve the number of Qubits of the Registers of the Party Entities and
+                # the Quantum Communication Channels, after which, the Reference Register starts
+                num_qubits_for_party_registers = self.get_num_qubits_and_bits_for_party_registers(num_parties)
+
+                # Set the list of the indexes of the Qubits of the Reference Register
+                reference_qubits_indexes = list(range(num_qubits_for_party_registers,
+                                                      (num_qubits_for_party_registers + num_parties)))
+
+                # Set the index of the Ancilla Qubit (and Bit) of the SWAP Test
+                ancilla_qubit_index = (num_qubits_for_party_registers + num_parties)
+
+                # Create an auxiliary Round, only with the Qubits of the Reference Register,
+                # to prepare the fresh copy of the Multipartite Entanglement, as it is prepared for any Round
+                reference_protocol_round = \
+                    self.prepare_quantum_entanglement(quantum_entanglement_type, num_parties,
+                                                      self.create_protocol_round(protocol_round.get_num_round(),
+                                                                                 num_parties),
+                                                      bell_state_type=bell_state_type,
+                                                      qubits_edges_indexes_for_resource_state=(
+                                                          qubits_edges_indexes_for_resource_state
+                                                      ))
+
+                # Compose the fresh copy of the Multipartite Entanglement into the Reference Register of
+                # the Quantum Circuit of the Protocol Round
+                quantum_circuit.compose_quantum_circuit(reference_protocol_round.get_qiskit_quantum_circuit(),
+                                                        reference_qubits_indexes)
+
+                # Perform the SWAP Test, between the Qubits reflected back, on the Quantum Memory of
+                # the Distributor Party Entity, and the Qubits of the Reference Register
+                quantum_circuit = QiskitSWAPTest \
+                    .QiskitSWAPTest("swap_test_ctrl_round_{}".format(protocol_round.get_num_round()),
+                                    quantum_circuit, ancilla_qubit_index, ancilla_qubit_index,
+                                    list(range(0, num_parties)), reference_qubits_indexes) \
+                    .perform_test_to_compare_quantum_states()
+
+                # Update the Quantum Circuit of the CTRL (Reflected) Round of the Protocol
+                protocol_round.update_qiskit_quantum_circuit(quantum_circuit)
+
+                # Return the Protocol Round updated
+                return protocol_round
+
+            # If the Party is not the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            else:
+
+                # Raise a Runtime Error
+                raise RuntimeError("Only the Distributor Party Entity can perform the SWAP Test on the "
+                                   "reflected back Multipartite Entanglement!!!")
+
+        # Return the Protocol Round updated
+        return protocol_round
+
+    # Save the Results of the CTRL (Reflect) Round, from the Measurement results of the several Shots of
+    # its SWAP Test, as the estimation of the (squared) overlap between the Multipartite Entanglement reflected back
+    # and the fresh copy of it (i.e., |⟨ψ|φ⟩|^2 = 1 - 2 x P(Ancilla = 1), which is 1, for identical Quantum States)
+    def save_protocol_round_results_for_swap_test_ctrl_rounds(self, num_parties, protocol_round,
+                                                              final_results_quantum_circuit_measurement):
+
+        # If the Party Entity is the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        if self.is_distributor() and (self.get_resources_context().lower() == QUANTUM_PARTY_ENTITY.lower()):
+
+            # Set the index of the Ancilla Bit of the SWAP Test
+            ancilla_bit_index = (self.get_num_qubits_and_bits_for_party_registers(num_parties) + num_parties)
+
+            # Count the number of Shots, for which the Ancilla Bit was measured as 1
+            # NOTE: It is necessary to invert the order of the Bits from the Execution of the Quantum Circuit,
+            #       since the resulting Bits are ordered, from the most significant to the least significant one
+            num_shots_ancilla_bit_one = \
+                sum(counts for circuit_bits, counts in final_results_quantum_circuit_measurement.items()
+                    if circuit_bits[::-1][ancilla_bit_index] == "1")
+
+            # Retrieve the total number of Shots of the SWAP Test
+            num_shots = sum(final_results_quantum_circuit_measurement.values())
+
+            # Save the Results of the CTRL (Reflected) Round of the Protocol,
+            # as the estimation of the (squared) overlap of the SWAP Test
+            protocol_round.save_round_results(1 - ((2 * num_shots_ancilla_bit_one) / num_shots))
+
+            # Return the Protocol Round updated
+            return protocol_round
+
+        # If the Party is not the Distributor of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        else:
+
+            # Raise a Runtime Error
+            raise RuntimeError("Only the Distributor Party Entity can save the Results of "
+                               "the SWAP Tests of the CTRL (Reflect) Rounds of "
+                               "the Semi-Quantum Conference Key Agreement (SQCKA) Protocol!!!")
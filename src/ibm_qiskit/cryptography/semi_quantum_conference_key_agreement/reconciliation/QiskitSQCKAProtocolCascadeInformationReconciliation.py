@@ -0,0 +1,244 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the Ceiling function from Math
+from math import ceil
+
+# Import the Performance Counter from Time
+from time import perf_counter
+
+# Import some functions, the Unsigned Integer (8 bits) and the Integer (64 bits) from NumPy
+from numpy import arange, bincount, bitwise_xor, concatenate, count_nonzero, empty, flatnonzero, minimum, where, \
+    int64, uint8
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import BitStatistics from Common.Utils
+from src.common.utils.BitStatistics import BitStatistics
+
+# Import QiskitSQCKAProtocolInformationReconciliationStatistics from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Reconciliation
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.reconciliation \
+    import QiskitSQCKAProtocolInformationReconciliationStatistics
+
+
+# Constants
+
+# The default number of passes of the Cascade Information Reconciliation
+DEFAULT_NUM_PASSES = 4
+
+# The factor for the size of the blocks of the 1st pass, divided by the Quantum Bit Error Rate (QBER)
+# (i.e., as in the original Cascade Information Reconciliation, by Brassard and Salvail)
+INITIAL_BLOCK_SIZE_FACTOR = 0.73
+
+# The minimum Quantum Bit Error Rate (QBER) assumed, for the size of the blocks of the 1st pass
+# (i.e., to keep the blocks bounded, when no errors were estimated)
+MINIMUM_QUANTUM_BIT_ERROR_RATE = 0.001
+
+
+# Class for IBM Qiskit's Cascade Information Reconciliation of the Raw Conference Keys of
+# the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+# NOTE: All the blocks of a pass are handled at once, with arrays of prefix parities over the shuffled keys
+#       (i.e., the parity of any block is the XOR of two prefix parities), and all the blocks with different parities
+#       of a pass are bisected at once, instead of one by one, since they do not share any Bit;
+#       the errors found in a pass are then cascaded to the blocks of all the previous passes, which contain them
+class QiskitSQCKAProtocolCascadeInformationReconciliation:
+
+    # Constructor for IBM Qiskit's Cascade Information Reconciliation of the Raw Conference Keys of
+    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    def __init__(self, name, num_passes=DEFAULT_NUM_PASSES, seed=None):
+
+        # If the number of passes is not valid
+        if num_passes < 1:
+
+            # Raise a Value Error
+            raise ValueError("The Cascade Information Reconciliation must have, at least, 1 pass!!!")
+
+        # Set the name of the Cascade Information Reconciliation
+        self.name = name
+
+        # Set the number of passes of the Cascade Information Reconciliation
+        self.num_passes = num_passes
+
+        # Set the Random Generator, for the shuffles of the positions of the keys, in the passes after the 1st one
+        self.random_generator = default_rng(seed)
+
+    # Return the number of passes of the Cascade Information Reconciliation
+    def get_num_passes(self):
+        return self.num_passes
+
+    # Compute the size of the blocks of the 1st pass, for the given Quantum Bit Error Rate (QBER) and key length
+    @staticmethod
+    def compute_initial_block_size(quantum_bit_error_rate, key_length):
+        return max(1, min(key_length, ceil(INITIAL_BLOCK_SIZE_FACTOR /
+                                           max(quantum_bit_error_rate, MINIMUM_QUANTUM_BIT_ERROR_RATE))))
+
+    # Compute the prefix parities of the given bits (i.e., the parity of each prefix, starting with the empty one)
+    @staticmethod
+    def compute_prefix_parities(bits):
+        return concatenate(([0], bitwise_xor.accumulate(bits))).astype(uint8)
+
+    # Bisect, at once, the given blocks with different parities of a pass, returning the positions of
+    # the errors found (i.e., one per block) and the number of parities disclosed during the bisections
+    @staticmethod
+    def bisect_blocks(reference_prefix_parities, raw_prefix_parities, blocks_starts, blocks_ends):
+
+        # Copy the starts and the ends of the ranges of the blocks to bisect
+        (ranges_starts, ranges_ends) = (blocks_starts.copy(), blocks_ends.copy())
+
+        # Initialise the number of parities disclosed during the bisections
+        num_disclosed_parities = 0
+
+        # Compute the ranges still with more than one Bit
+        active_ranges = (ranges_ends - ranges_starts) > 1
+
+        # While there are ranges still with more than one Bit
+        while active_ranges.any():
+
+            # Compute the middles of the ranges
+            ranges_middles = (ranges_starts + ranges_ends) // 2
+
+            # Check which ranges have different parities on their 1st halves
+            # (i.e., the parities of the reference key are disclosed, for the active ranges)
+            different_first_halves = (reference_prefix_parities[ranges_middles] ^
+                                      reference_prefix_parities[ranges_starts] ^
+                                      raw_prefix_parities[ranges_middles] ^
+                                      raw_prefix_parities[ranges_starts]).astype(bool)
+
+            # Update the number of parities disclosed during the bisections
+            num_disclosed_parities += int(count_nonzero(active_ranges))
+
+            # Keep the 1st halves, if they have different parities, or the 2nd halves, otherwise
+            ranges_ends = where(active_ranges & different_first_halves, ranges_middles, ranges_ends)
+            ranges_starts = where(active_ranges & ~different_first_halves, ranges_middles, ranges_starts)
+
+            # Compute the ranges still with more than one Bit
+            active_ranges = (ranges_ends - ranges_starts) > 1
+
+        # Return the positions of the errors found (in the shuffled keys) and the number of parities disclosed
+        return ranges_starts, num_disclosed_parities
+
+    # Reconcile the given Raw Conference Key with the given reference one (i.e., the one of the Distributor),
+    # for the given Quantum Bit Error Rate (QBER), returning the reconciled key, as an array of bits,
+    # and the Statistics of the Information Reconciliation
+    def reconcile_key_bits(self, reference_key_bits, raw_key_bits, quantum_bit_error_rate):
+
+        # Start the measurement of the time elapsed during the Information Reconciliation
+        start_time = perf_counter()
+
+        # Convert both keys to arrays of bits
+        reference_key_bits = BitStatistics.convert_to_bits(reference_key_bits)
+        reconciled_key_bits = BitStatistics.convert_to_bits(raw_key_bits).copy()
+
+        # If the lengths of both keys are different
+        if len(reference_key_bits) != len(reconciled_key_bits):
+
+            # Raise a Value Error
+            raise ValueError("The Information Reconciliation can only be performed between keys "
+                             "of the same length!!!")
+
+        # Retrieve the length of the keys
+        key_length = len(reference_key_bits)
+
+        # Initialise the number of Bits leaked and the list of the passes already performed
+        # (i.e., the shuffled positions, the blocks of each position, the starts and the ends of the blocks,
+        #  the prefix parities of the shuffled reference key and the flags of the blocks with different parities)
+        (num_leaked_bits, passes) = (0, [])
+
+        # Compute the size of the blocks of the 1st pass
+        block_size = self.compute_initial_block_size(quantum_bit_error_rate, key_length) if key_length > 0 else 1
+
+        # For each pass of the Cascade Information Reconciliation, while the keys are not empty
+        for num_pass in range(self.num_passes if key_length > 0 else 0):
+
+            # Shuffle the positions of the keys (i.e., except for the 1st pass, which keeps their order)
+            shuffled_positions = arange(key_length) if num_pass == 0 else self.random_generator.permutation(key_length)
+
+            # Compute the number of blocks of the pass and their starts and ends, over the shuffled keys
+            num_blocks = ceil(key_length / block_size)
+            blocks_starts = arange(num_blocks, dtype=int64) * block_size
+            blocks_ends = minimum((blocks_starts + block_size), key_length)
+
+            # Compute the block of each position of the keys, in the pass
+            positions_blocks = empty(key_length, dtype=int64)
+            positions_blocks[shuffled_positions] = arange(key_length) // block_size
+
+            # Compute the prefix parities of the shuffled reference key
+            reference_prefix_parities = self.compute_prefix_parities(reference_key_bits[shuffled_positions])
+
+            # Compute the prefix parities of the shuffled key being reconciled
+            raw_prefix_parities = self.compute_prefix_parities(reconciled_key_bits[shuffled_positions])
+
+            # Compare the parities of all the blocks of the pass (i.e., the parities of the reference key are disclosed)
+            different_parities_blocks = (reference_prefix_parities[blocks_ends] ^
+                                         reference_prefix_parities[blocks_starts] ^
+                                         raw_prefix_parities[blocks_ends] ^ raw_prefix_parities[blocks_starts])
+            num_leaked_bits += num_blocks
+
+            # Append the current pass to the list of the passes already performed
+            passes.append((shuffled_positions, positions_blocks, blocks_starts, blocks_ends,
+                           reference_prefix_parities, different_parities_blocks))
+
+            # Cascade the errors, while there are blocks with different parities, in any of the passes performed
+            while True:
+
+                # Find the 1st pass with blocks with different parities (i.e., the one with the smallest blocks)
+                passes_with_different_parities = [num_pass_performed
+                                                  for (num_pass_performed, pass_performed) in enumerate(passes)
+                                                  if pass_performed[5].any()]
+
+                # If there are no blocks with different parities, in any of the passes performed
+                if len(passes_with_different_parities) == 0:
+
+                    # Stop cascading the errors
+                    break
+
+                # Retrieve the 1st pass with blocks with different parities
+                (shuffled_positions, _, blocks_starts, blocks_ends,
+                 reference_prefix_parities, different_parities_blocks) = passes[passes_with_different_parities[0]]
+
+                # Retrieve the blocks with different parities of that pass
+                blocks_to_bisect = flatnonzero(different_parities_blocks)
+
+                # Bisect all the blocks with different parities of that pass, at once
+                (shuffled_errors_positions, num_disclosed_parities) = \
+                    self.bisect_blocks(reference_prefix_parities,
+                                       self.compute_prefix_parities(reconciled_key_bits[shuffled_positions]),
+                                       blocks_starts[blocks_to_bisect], blocks_ends[blocks_to_bisect])
+                num_leaked_bits += num_disclosed_parities
+
+                # Correct the errors found, in the key being reconciled
+                errors_positions = shuffled_positions[shuffled_errors_positions]
+                reconciled_key_bits[errors_positions] ^= 1
+
+                # For each pass already performed
+                for pass_performed in passes:
+
+                    # Flip the parities of the blocks containing an odd number of the errors corrected
+                    pass_performed[5][:] ^= (bincount(pass_performed[1][errors_positions],
+                                                      minlength=len(pass_performed[5])) & 1).astype(uint8)
+
+            # Double the size of the blocks, for the next pass
+            block_size = min((block_size * 2), key_length)
+
+        # Return the reconciled key, as an array of bits, and the Statistics of the Information Reconciliation
+        return reconciled_key_bits, QiskitSQCKAProtocolInformationReconciliationStatistics\
+            .QiskitSQCKAProtocolInformationReconciliationStatistics(
+                "{}_statistics".format(self.name), key_length, num_leaked_bits,
+                int(count_nonzero(reconciled_key_bits != BitStatistics.convert_to_bits(raw_key_bits))),
+                int(count_nonzero(reconciled_key_bits != reference_key_bits)), (perf_counter() - start_time)
+            )
@@ -0,0 +1,105 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import BitStatistics from Common.Utils
+from src.common.utils.BitStatistics import BitStatistics
+
+
+# Class for IBM Qiskit's Statistics of the Information Reconciliation of a Raw Conference Key of
+# the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+# NOTE: The number of residual errors is only known since both Raw Conference Keys are available in the simulation,
+#       and it is kept here to evaluate the Information Reconciliation, without being disclosed to the Parties
+class QiskitSQCKAProtocolInformationReconciliationStatistics:
+
+    # Constructor for IBM Qiskit's Statistics of the Information Reconciliation of a Raw Conference Key of
+    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    def __init__(self, name, num_key_bits, num_leaked_bits, num_corrected_bits, num_residual_errors,
+                 elapsed_time, num_failed_frames=0):
+
+        # Set the name of the Statistics of the Information Reconciliation
+        self.name = name
+
+        # Set the number of Bits of the Raw Conference Key reconciled
+        self.num_key_bits = num_key_bits
+
+        # Set the number of Bits leaked (i.e., the parities or syndromes disclosed over the Public Channel)
+        self.num_leaked_bits = num_leaked_bits
+
+        # Set the number of Bits of the Raw Conference Key corrected (i.e., flipped)
+        self.num_corrected_bits = num_corrected_bits
+
+        # Set the number of errors remaining in the Raw Conference Key, after the Information Reconciliation
+        self.num_residual_errors = num_residual_errors
+
+        # Set the time elapsed (in seconds) during the Information Reconciliation
+        self.elapsed_time = elapsed_time
+
+        # Set the number of frames of the Raw Conference Key which could not be decoded
+        # (i.e., only for the one-way Information Reconciliations, since the Cascade never fails to converge)
+        self.num_failed_frames = num_failed_frames
+
+    # Return the number of Bits of the Raw Conference Key reconciled
+    def get_num_key_bits(self):
+        return self.num_key_bits
+
+    # Return the number of Bits leaked during the Information Reconciliation
+    def get_num_leaked_bits(self):
+        return self.num_leaked_bits
+
+    # Return the number of Bits of the Raw Conference Key corrected
+    def get_num_corrected_bits(self):
+        return self.num_corrected_bits
+
+    # Return the number of errors remaining in the Raw Conference Key, after the Information Reconciliation
+    def get_num_residual_errors(self):
+        return self.num_residual_errors
+
+    # Return the time elapsed (in seconds) during the Information Reconciliation
+    def get_elapsed_time(self):
+        return self.elapsed_time
+
+    # Return the number of frames of the Raw Conference Key which could not be decoded
+    def get_num_failed_frames(self):
+        return self.num_failed_frames
+
+    # Return the fraction of the Bits of the Raw Conference Key leaked during the Information Reconciliation
+    def get_leaked_bits_fraction(self):
+        return (self.num_leaked_bits / self.num_key_bits) if self.num_key_bits > 0 else 0.0
+
+    # Return the throughput of the Information Reconciliation (i.e., the number of Bits reconciled per second)
+    def get_throughput(self):
+        return (self.num_key_bits / self.elapsed_time) if self.elapsed_time > 0 else float("inf")
+
+    # Return the efficiency of the Information Reconciliation, for the given Quantum Bit Error Rate (QBER),
+    # as the ratio between the number of Bits leaked and its theoretical minimum (i.e., 1.0, for the Shannon limit)
+    def get_efficiency(self, quantum_bit_error_rate):
+
+        # Compute the theoretical minimum number of Bits to be leaked, given by the Binary Entropy
+        min_num_leaked_bits = self.num_key_bits * BitStatistics.compute_binary_entropy(quantum_bit_error_rate)
+
+        # Return the efficiency of the Information Reconciliation
+        return (self.num_leaked_bits / min_num_leaked_bits) if min_num_leaked_bits > 0 else float("inf")
+
+    # Print the information about the Statistics of the Information Reconciliation
+    def print_info(self):
+
+        # Print the information about the Statistics of the Information Reconciliation
+        print("Information Reconciliation of {} Bits, in {:.3f} seconds ({:.0f} Bits/second):"
+              .format(self.num_key_bits, self.elapsed_time, self.get_throughput()))
+        print(" - Leaked Bits: {} ({:.4f} per Bit)".format(self.num_leaked_bits, self.get_leaked_bits_fraction()))
+        print(" - Corrected Bits: {}".format(self.num_corrected_bits))
+        print(" - Residual Errors: {}".format(self.num_residual_errors))
+        print(" - Failed Frames: {}\n".format(self.num_failed_frames))
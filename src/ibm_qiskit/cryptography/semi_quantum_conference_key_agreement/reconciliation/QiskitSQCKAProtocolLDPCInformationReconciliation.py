@@ -0,0 +1,392 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the Ceiling function and the Natural Logarithm from Math
+from math import ceil, log
+
+# Import the Performance Counter from Time
+from time import perf_counter
+
+# Import some functions, the Unsigned Integer (8 bits), the Integer (64 bits) and the Float (32 bits) from NumPy
+from numpy import abs as absolute, arange, bincount, clip, concatenate, count_nonzero, flatnonzero, full, inf, \
+    log as log_array, minimum, ones, repeat, tanh, unique, where, zeros, float32, int64, uint8
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import the Compressed Sparse Row (CSR) Matrix from SciPy.Sparse
+from scipy.sparse import csr_matrix
+
+# Import BitStatistics from Common.Utils
+from src.common.utils.BitStatistics import BitStatistics
+
+# Import QiskitSQCKAProtocolInformationReconciliationStatistics from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Reconciliation
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.reconciliation \
+    import QiskitSQCKAProtocolInformationReconciliationStatistics
+
+
+# Constants
+
+# The default size of the frames of the keys, decoded with the same Parity-Check Matrix
+DEFAULT_FRAME_SIZE = 16384
+
+# The default weight of the columns of the Parity-Check Matrix (i.e., the number of checks of each Bit)
+DEFAULT_COLUMN_WEIGHT = 3
+
+# The default efficiency of the Parity-Check Matrix (i.e., the ratio between its number of checks and
+# the theoretical minimum, given by the Binary Entropy of the Quantum Bit Error Rate (QBER), per frame)
+DEFAULT_EFFICIENCY = 1.5
+
+# The default maximum number of attempts to decode each frame
+# (i.e., the frames not decoded are retried with new Parity-Check Matrices, with more checks)
+DEFAULT_MAX_NUM_ATTEMPTS = 4
+
+# The default increment of the efficiency of the Parity-Check Matrix, for each new attempt to decode the frames
+DEFAULT_EFFICIENCY_INCREMENT = 0.25
+
+# The default maximum number of iterations of the Belief Propagation
+DEFAULT_MAX_NUM_ITERATIONS = 60
+
+# The minimum and the maximum magnitudes of the messages of the Belief Propagation
+# (i.e., to keep the function φ(x) = -ln(tanh(x/2)) bounded)
+MINIMUM_MESSAGE_MAGNITUDE = 1e-9
+MAXIMUM_MESSAGE_MAGNITUDE = 40.0
+
+# The minimum Quantum Bit Error Rate (QBER) assumed, for the number of checks and the Log-Likelihood Ratios
+# (i.e., to keep them bounded, when no errors were estimated)
+MINIMUM_QUANTUM_BIT_ERROR_RATE = 0.001
+
+# The Log-Likelihood Ratio of the Bits padding the last frame (i.e., known by both Parties to have no errors)
+PADDING_BITS_LOG_LIKELIHOOD_RATIO = 1000.0
+
+
+# Class for IBM Qiskit's Low-Density Parity-Check (LDPC) Information Reconciliation of the Raw Conference Keys of
+# the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+# NOTE: The keys are split in frames (shortened to the length of the keys, if they are shorter than one frame),
+#       padded with 0s, whose syndromes (for the same sparse Parity-Check Matrix,
+#       with random columns of fixed weight) are disclosed by the Distributor; the errors of all the frames are then
+#       decoded at once, with the Sum-Product Belief Propagation (in the logarithmic domain, with 32 bits floats),
+#       over arrays with the shape (frames × checks × edges of each check);
+#       the frames not decoded are retried, with new Parity-Check Matrices with more checks (i.e., rate-adaptive),
+#       and all the syndromes disclosed, in all the attempts, are counted as leaked Bits
+#       (i.e., up to the number of Bits of the keys in each frame, since the padding Bits are known by both Parties)
+class QiskitSQCKAProtocolLDPCInformationReconciliation:
+
+    # Constructor for IBM Qiskit's Low-Density Parity-Check (LDPC) Information Reconciliation of
+    # the Raw Conference Keys of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    def __init__(self, name, frame_size=DEFAULT_FRAME_SIZE, column_weight=DEFAULT_COLUMN_WEIGHT,
+                 efficiency=DEFAULT_EFFICIENCY, max_num_attempts=DEFAULT_MAX_NUM_ATTEMPTS,
+                 efficiency_increment=DEFAULT_EFFICIENCY_INCREMENT, max_num_iterations=DEFAULT_MAX_NUM_ITERATIONS,
+                 seed=None):
+
+        # If the size of the frames or the weight of the columns are not valid
+        if (frame_size < 2) or not (1 <= column_weight < frame_size):
+
+            # Raise a Value Error
+            raise ValueError("The frames must have, at least, 2 Bits, and the weight of the columns must be, "
+                             "at least, 1, and lower than the size of the frames!!!")
+
+        # If the efficiency or its increment are not valid
+        if (efficiency < 1.0) or (efficiency_increment < 0.0):
+
+            # Raise a Value Error
+            raise ValueError("The efficiency must be, at least, 1, and its increment can not be negative!!!")
+
+        # If the maximum numbers of attempts or of iterations are not valid
+        if (max_num_attempts < 1) or (max_num_iterations < 1):
+
+            # Raise a Value Error
+            raise ValueError("The maximum numbers of attempts and of iterations must be, at least, 1!!!")
+
+        # Set the name of the Low-Density Parity-Check (LDPC) Information Reconciliation
+        self.name = name
+
+        # Set the size of the frames of the keys
+        self.frame_size = frame_size
+
+        # Set the weight of the columns of the Parity-Check Matrix
+        self.column_weight = column_weight
+
+        # Set the efficiency of the Parity-Check Matrix
+        self.efficiency = efficiency
+
+        # Set the maximum number of attempts to decode each frame
+        self.max_num_attempts = max_num_attempts
+
+        # Set the increment of the efficiency of the Parity-Check Matrix, for each new attempt to decode the frames
+        self.efficiency_increment = efficiency_increment
+
+        # Set the maximum number of iterations of the Belief Propagation
+        self.max_num_iterations = max_num_iterations
+
+        # Set the Random Generator, for the construction of the Parity-Check Matrix
+        self.random_generator = default_rng(seed)
+
+    # Return the size of the frames of the keys
+    def get_frame_size(self):
+        return self.frame_size
+
+    # Compute the number of checks of the Parity-Check Matrix, for the given Quantum Bit Error Rate (QBER)
+    # and the given efficiency, for frames of the given size (i.e., the size of the frames of the keys, by default)
+    def compute_num_checks(self, quantum_bit_error_rate, efficiency, frame_size=None):
+
+        # If the size of the frames is not given, use the size of the frames of the keys
+        frame_size = self.frame_size if frame_size is None else frame_size
+
+        # Return the number of checks of the Parity-Check Matrix
+        return min((frame_size - 1),
+                   max(self.column_weight,
+                       ceil(efficiency * frame_size *
+                            BitStatistics.compute_binary_entropy(max(quantum_bit_error_rate,
+                                                                     MINIMUM_QUANTUM_BIT_ERROR_RATE)))))
+
+    # Create the edges of a random sparse Parity-Check Matrix, with the given number of checks, for frames of
+    # the given size (i.e., the size of the frames of the keys, by default), returning the checks and the Bits of
+    # its edges, sorted by checks (i.e., each Bit is connected to, at most, the weight of the columns of checks,
+    # and the checks are connected to almost the same number of Bits)
+    def create_parity_check_matrix_edges(self, num_checks, frame_size=None):
+
+        # If the size of the frames is not given, use the size of the frames of the keys
+        frame_size = self.frame_size if frame_size is None else frame_size
+
+        # Shuffle the sockets of the Bits (i.e., each Bit repeated by the weight of the columns)
+        bits_sockets = self.random_generator.permutation(repeat(arange(frame_size, dtype=int64), self.column_weight))
+
+        # Connect the sockets of the Bits to the checks, in turns, keeping only the distinct edges
+        edges = unique((arange(len(bits_sockets), dtype=int64) % num_checks) * frame_size + bits_sockets)
+
+        # Return the checks and the Bits of the edges, sorted by checks
+        return edges // frame_size, edges % frame_size
+
+    # Transform the given magnitudes of the messages of the Belief Propagation,
+    # with the function φ(x) = -ln(tanh(x/2)), clipping them, to keep the function bounded
+    @staticmethod
+    def transform_message_magnitudes(message_magnitudes):
+        return -log_array(tanh(clip(message_magnitudes, MINIMUM_MESSAGE_MAGNITUDE, MAXIMUM_MESSAGE_MAGNITUDE) / 2))
+
+    # Compute the syndromes of the given frames (with the shape (frames × Bits)),
+    # for the given sparse Parity-Check Matrix, with the shape (frames × checks)
+    @staticmethod
+    def compute_syndromes(parity_check_matrix, frames_bits):
+        return ((parity_check_matrix @ frames_bits.T.astype(int64)).T & 1).astype(uint8)
+
+    # Decode the errors of the given frames, from the given differences of their syndromes, with
+    # the Sum-Product Belief Propagation, returning the errors and the flags of the frames decoded
+    # NOTE: The messages are kept in arrays with the shape (frames × checks × edges of each check), padded with
+    #       edges to a dummy Bit (i.e., the one after the last Bit), which always has an infinite posterior
+    #       Log-Likelihood Ratio, and thus, does not affect the sums or the signs of the other edges of its check
+    def decode_errors(self, parity_check_matrix, edges_checks, edges_bits, syndromes_differences,
+                      prior_log_likelihood_ratios):
+
+        # Retrieve the number of frames, of checks and of Bits of each frame
+        (num_frames, num_checks, frame_size) = (len(syndromes_differences), parity_check_matrix.shape[0],
+                                                parity_check_matrix.shape[1])
+
+        # Compute the number of edges of each check and the position of each edge within its check
+        checks_num_edges = bincount(edges_checks, minlength=num_checks)
+        edges_positions_in_checks = arange(len(edges_checks)) - \
+            concatenate(([0], checks_num_edges.cumsum()[:-1]))[edges_checks]
+
+        # Build the matrix of the Bits of the edges of each check, padded with the dummy Bit
+        checks_edges_bits = full((num_checks, int(checks_num_edges.max())), frame_size, dtype=int64)
+        checks_edges_bits[edges_checks, edges_positions_in_checks] = edges_bits
+
+        # Compute the flags of the edges padding the checks
+        padding_edges = checks_edges_bits == frame_size
+
+        # Compute the signs of the syndromes (i.e., -1 for the checks whose parity must be odd)
+        syndromes_signs = (1.0 - (2.0 * syndromes_differences.astype(float32)))[:, :, None]
+
+        # Append the dummy Bit to the prior Log-Likelihood Ratios of the Bits
+        prior_log_likelihood_ratios = concatenate((prior_log_likelihood_ratios, full((num_frames, 1), inf)),
+                                                  axis=1).astype(float32)
+
+        # Initialise the errors decoded and the flags of the frames decoded
+        (errors, decoded_frames) = (zeros((num_frames, frame_size), dtype=uint8), zeros(num_frames, dtype=bool))
+
+        # Initialise the frames still being decoded
+        # (i.e., the frames decoded are dropped from all the arrays, to only iterate over the remaining ones)
+        active_frames = arange(num_frames)
+
+        # Initialise the messages from the checks to the Bits
+        checks_to_bits_messages = zeros((num_frames, num_checks, checks_edges_bits.shape[1]), dtype=float32)
+
+        # For each iteration of the Belief Propagation
+        for _ in range(self.max_num_iterations + 1):
+
+            # Compute the offsets of the Bits of the edges of each frame still being decoded,
+            # for the sums of the messages over all of them at once
+            frames_bits_offsets = (arange(len(active_frames), dtype=int64) * (frame_size + 1))[:, None, None] + \
+                checks_edges_bits[None, :, :]
+
+            # Compute the posterior Log-Likelihood Ratios of the Bits (i.e., the priors with all the messages received)
+            posterior_log_likelihood_ratios = prior_log_likelihood_ratios[active_frames] + \
+                bincount(frames_bits_offsets.ravel(), weights=checks_to_bits_messages.ravel(),
+                         minlength=(len(active_frames) * (frame_size + 1)))\
+                .reshape(len(active_frames), (frame_size + 1)).astype(float32)
+
+            # Take the hard decisions about the errors (i.e., the Bits more likely to be flipped)
+            hard_decisions = (posterior_log_likelihood_ratios[:, :frame_size] < 0).astype(uint8)
+
+            # Check which frames have the hard decisions satisfying the differences of their syndromes
+            satisfied_frames = (self.compute_syndromes(parity_check_matrix, hard_decisions) ==
+                                syndromes_differences[active_frames]).all(axis=1)
+
+            # Keep the errors of the frames decoded in the current iteration
+            errors[active_frames[satisfied_frames]] = hard_decisions[satisfied_frames]
+            decoded_frames[active_frames[satisfied_frames]] = True
+
+            # Drop the frames decoded in the current iteration
+            (active_frames, posterior_log_likelihood_ratios, checks_to_bits_messages) = \
+                (active_frames[~satisfied_frames], posterior_log_likelihood_ratios[~satisfied_frames],
+                 checks_to_bits_messages[~satisfied_frames])
+
+            # If all the frames were decoded
+            if len(active_frames) == 0:
+
+                # Stop the Belief Propagation
+                break
+
+            # Compute the messages from the Bits to the checks (i.e., excluding the message received from each check)
+            bits_to_checks_messages = posterior_log_likelihood_ratios[:, checks_edges_bits] - checks_to_bits_messages
+
+            # Compute the transformed magnitudes of the messages from the Bits to the checks
+            # (i.e., with the function φ(x) = -ln(tanh(x/2)), which is its own inverse)
+            bits_to_checks_transformed_magnitudes = \
+                self.transform_message_magnitudes(absolute(bits_to_checks_messages))
+
+            # Compute the signs of the messages from the Bits to the checks (i.e., True, for the negative ones)
+            bits_to_checks_negative_signs = bits_to_checks_messages < 0
+
+            # Compute the messages from the checks to the Bits (i.e., each edge receives the sum of the transformed
+            # magnitudes of the other edges of its check, transformed back, and the product of their signs,
+            # with the sign of the syndrome), without any message to the dummy Bit
+            checks_to_bits_messages = \
+                where(((bits_to_checks_negative_signs.sum(axis=2, keepdims=True) & 1).astype(bool) ^
+                       bits_to_checks_negative_signs), float32(-1.0), float32(1.0)) * syndromes_signs[active_frames] * \
+                self.transform_message_magnitudes(bits_to_checks_transformed_magnitudes.sum(axis=2, keepdims=True) -
+                                                  bits_to_checks_transformed_magnitudes)
+            checks_to_bits_messages[:, padding_edges] = 0.0
+
+        # Return the errors decoded and the flags of the frames decoded
+        return errors, decoded_frames
+
+    # Reconcile the given Raw Conference Key with the given reference one (i.e., the one of the Distributor),
+    # for the given Quantum Bit Error Rate (QBER), returning the reconciled key, as an array of bits,
+    # and the Statistics of the Information Reconciliation
+    # NOTE: The frames which can not be decoded are kept unchanged, and counted in the Statistics
+    def reconcile_key_bits(self, reference_key_bits, raw_key_bits, quantum_bit_error_rate):
+
+        # Start the measurement of the time elapsed during the Information Reconciliation
+        start_time = perf_counter()
+
+        # Convert both keys to arrays of bits
+        reference_key_bits = BitStatistics.convert_to_bits(reference_key_bits)
+        raw_key_bits = BitStatistics.convert_to_bits(raw_key_bits)
+
+        # If the lengths of both keys are different
+        if len(reference_key_bits) != len(raw_key_bits):
+
+            # Raise a Value Error
+            raise ValueError("The Information Reconciliation can only be performed between keys "
+                             "of the same length!!!")
+
+        # Retrieve the length of the keys
+        key_length = len(reference_key_bits)
+
+        # Compute the size of the frames, shortened to the length of the keys, if they are shorter than one frame
+        # (i.e., keeping, at least, one Bit more than the weight of the columns of the Parity-Check Matrix)
+        frame_size = max(min(self.frame_size, key_length), (self.column_weight + 1))
+
+        # Compute the number of frames
+        num_frames = ceil(key_length / frame_size)
+
+        # Split both keys in frames, padding the last one with 0s
+        num_padding_bits = (num_frames * frame_size) - key_length
+        reference_frames_bits = concatenate((reference_key_bits, zeros(num_padding_bits, dtype=uint8)))\
+            .reshape(num_frames, frame_size)
+        raw_frames_bits = concatenate((raw_key_bits, zeros(num_padding_bits, dtype=uint8)))\
+            .reshape(num_frames, frame_size)
+
+        # Compute the number of Bits of the keys in each frame (i.e., excluding the padding Bits)
+        frames_num_key_bits = clip(key_length - (arange(num_frames, dtype=int64) * frame_size), 0, frame_size)
+
+        # Compute the prior Log-Likelihood Ratios of the errors of the Bits (i.e., the padding Bits have no errors)
+        prior_log_likelihood_ratios = full((num_frames, frame_size),
+                                           log((1.0 - max(quantum_bit_error_rate, MINIMUM_QUANTUM_BIT_ERROR_RATE)) /
+                                               max(quantum_bit_error_rate, MINIMUM_QUANTUM_BIT_ERROR_RATE)))
+        prior_log_likelihood_ratios.reshape(-1)[key_length:] = PADDING_BITS_LOG_LIKELIHOOD_RATIO
+
+        # Initialise the errors decoded, the flags of the frames decoded and the number of Bits leaked by each frame
+        (errors, decoded_frames, frames_num_leaked_bits) = (zeros((num_frames, frame_size), dtype=uint8),
+                                                            zeros(num_frames, dtype=bool),
+                                                            zeros(num_frames, dtype=int64))
+
+        # For each attempt to decode the frames, while there are frames not decoded
+        for num_attempt in range(self.max_num_attempts):
+
+            # Retrieve the frames not decoded yet
+            frames_to_decode = flatnonzero(~decoded_frames)
+
+            # If all the frames were decoded
+            if len(frames_to_decode) == 0:
+
+                # Stop the attempts to decode the frames
+                break
+
+            # Compute the number of checks, for the efficiency of the current attempt, and
+            # create the sparse Parity-Check Matrix, with the shape (checks × Bits)
+            num_checks = self.compute_num_checks(quantum_bit_error_rate,
+                                                 (self.efficiency + (num_attempt * self.efficiency_increment)),
+                                                 frame_size)
+            (edges_checks, edges_bits) = self.create_parity_check_matrix_edges(num_checks, frame_size)
+            parity_check_matrix = csr_matrix((ones(len(edges_checks), dtype=int64), (edges_checks, edges_bits)),
+                                             shape=(num_checks, frame_size))
+
+            # Compute the differences between the syndromes of the frames of both keys
+            # (i.e., the syndromes of the reference key are disclosed)
+            syndromes_differences = \
+                self.compute_syndromes(parity_check_matrix, reference_frames_bits[frames_to_decode]) ^ \
+                self.compute_syndromes(parity_check_matrix, raw_frames_bits[frames_to_decode])
+            frames_num_leaked_bits[frames_to_decode] += num_checks
+
+            # Decode the errors of all the frames not decoded yet, at once
+            (attempt_errors, attempt_decoded_frames) = \
+                self.decode_errors(parity_check_matrix, edges_checks, edges_bits, syndromes_differences,
+                                   prior_log_likelihood_ratios[frames_to_decode])
+
+            # Keep the errors of the frames decoded in the current attempt
+            errors[frames_to_decode[attempt_decoded_frames]] = attempt_errors[attempt_decoded_frames]
+            decoded_frames[frames_to_decode[attempt_decoded_frames]] = True
+
+        # Compute the number of Bits leaked, by all the syndromes disclosed, in all the attempts
+        # (i.e., each frame can not leak more Bits than the number of Bits of the keys in it,
+        #  since the syndromes only depend on those Bits, being the padding Bits known by both Parties)
+        num_leaked_bits = int(minimum(frames_num_leaked_bits, frames_num_key_bits).sum())
+
+        # Correct the errors of the frames decoded, keeping the frames not decoded unchanged
+        reconciled_key_bits = (raw_frames_bits ^ (errors * decoded_frames[:, None].astype(uint8)))\
+            .reshape(-1)[:key_length]
+
+        # Return the reconciled key, as an array of bits, and the Statistics of the Information Reconciliation
+        return reconciled_key_bits, QiskitSQCKAProtocolInformationReconciliationStatistics\
+            .QiskitSQCKAProtocolInformationReconciliationStatistics(
+                "{}_statistics".format(self.name), key_length, num_leaked_bits,
+                int(count_nonzero(reconciled_key_bits != raw_key_bits)),
+                int(count_nonzero(reconciled_key_bits != reference_key_bits)), (perf_counter() - start_time),
+                num_failed_frames=int(count_nonzero(~decoded_frames))
+            )
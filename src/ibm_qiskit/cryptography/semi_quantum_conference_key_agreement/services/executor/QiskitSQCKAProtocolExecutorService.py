@@ -12,10 +12,31 @@ Acknowledgments:
 - Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
 """
 
-# Import Enumerations and Constants
-from qiskit import Aer, execute
+# Import the Process Pool Executor from Concurrent.Futures
+from concurrent.futures import ProcessPoolExecutor
+
+# Import the retrieval of the Contexts of the Processes from Multiprocessing
+from multiprocessing import get_context
+
+# Import the number of CPU Cores from OS
+from os import cpu_count
+
+# Import the Ceil and Square Root functions from Math
+from math import ceil, sqrt
 
+# Import the Seed Sequence from NumPy.Random
+from numpy.random import SeedSequence
+
+# Import the Quantum Circuit from IBM Qiskit
+from qiskit import QuantumCircuit
+
+# Import Enumerations and Constants
 from src.common.enumerations import StrategiesForEavesdroppingDetection
+from src.common.enumerations import SemiQuantumCryptographyProtocolExecutionModeTypes
+from src.common.enumerations import QuantumSimulatorTypes
+from src.common.enumerations import SemiQuantumCryptographyProtocolDiagnosticsLevelTypes
+from src.common.enumerations import InformationReconciliationTypes
+from src.common.enumerations import QuantumCircuitLayoutTypes
 from src.common.enumerations.SemiQuantumCryptographyProtocolPartyEntityTypes \
     import QUANTUM_PARTY_ENTITY, SEMI_QUANTUM_PARTY_ENTITY
 
@@ -25,6 +46,17 @@ from src.common.enumerations.SemiQuantumCryptographyProtocolPartyEntityTypes \
 # Import TODO
 from src.common.enumerations.SemiQuantumCryptographyProtocolRoundTypes \
     import SIFT_MEASURE_AND_RESEND_ROUND_3, CTRL_REFLECT_ROUND_3
+from src.common.enumerations.QuantumEntanglementTypes import GHZ_STATE, W_STATE
+from src.common.enumerations.SemiQuantumCryptographyProtocolEventTypes \
+    import ROUND_STARTED, ENTANGLEMENT_PREPARED, QUBITS_SENT, QUBIT_RECEIVED, QUBIT_SENT_BACK, \
+    ROUND_RESULT_OBTAINED, ENTANGLEMENT_MEASURED, EAVESDROPPING_ALERT, ROUND_FINISHED, ROUNDS_SUMMARY, \
+    PROTOCOL_ABORTED, SWAP_TESTS_PERFORMED
+
+# Import ProtocolEventLog from Common.Events
+from src.common.events import ProtocolEventLog
+
+# Import NullProtocolEventSink from Common.Events.Sinks
+from src.common.events.sinks import NullProtocolEventSink
 
 # Import QiskitSQCKAProtocol from IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement
 from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement \
@@ -38,10 +70,104 @@ from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.common \
 from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.common \
     import QiskitSQCKAProtocolPreSharedKeyPair
 
+# Import QiskitSQCKAProtocolRoundQuantumCircuitTemplatesCache from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Common
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.common \
+    import QiskitSQCKAProtocolRoundQuantumCircuitTemplatesCache
+
+# Import QiskitSQCKAProtocolQuantumBitErrorRateEstimator from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Common
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.common \
+    import QiskitSQCKAProtocolQuantumBitErrorRateEstimator
+
+# Import QiskitSQCKAProtocolCascadeInformationReconciliation and QiskitSQCKAProtocolLDPCInformationReconciliation
+# from IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Reconciliation
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.reconciliation \
+    import QiskitSQCKAProtocolCascadeInformationReconciliation, QiskitSQCKAProtocolLDPCInformationReconciliation
+
+# Import QiskitSQCKAProtocolToeplitzPrivacyAmplification
+# from IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Amplification
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.amplification \
+    import QiskitSQCKAProtocolToeplitzPrivacyAmplification
+
 # Import QiskitSQCKAProtocolParty from IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Entities
 from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.entities \
     import QiskitSQCKAProtocolPartyEntity
 
+# Import QiskitSQCKAProtocolAnalyticSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSQCKAProtocolAnalyticSimulator
+
+# Import QiskitSimulatorSession from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSimulatorSession
+
+# Import ClassicalPseudoRandomBinaryStringGenerator from IBM_Qiskit.Utils.Random_Generator.Binary.Classical
+from src.ibm_qiskit.utils.random_generator.binary.classical import ClassicalPseudoRandomBinaryStringGenerator
+
+
+# Constants
+
+# The maximum number of Rounds of the Protocol, whose Quantum Circuits are submitted,
+# as one single Job, to the Simulator, for the Batched Execution of the Rounds
+MAX_NUM_ROUNDS_PER_BATCHED_EXECUTION = 1024
+
+# The number of Rounds of the Protocol, in each shard executed by a Parallel Worker,
+# for the Parallel Execution of the Rounds
+NUM_ROUNDS_PER_PARALLEL_EXECUTION_SHARD = 256
+
+# The maximum number of Rounds of the Protocol, whose Quantum Circuits are chained in one single Quantum Circuit,
+# executed, as one single Job, with one single Shot, for the Chained Execution of the Rounds
+MAX_NUM_ROUNDS_PER_CHAINED_EXECUTION = 256
+
+
+# The Executor Service of the Protocol, received by the current Parallel Worker (i.e., a different Process),
+# only once, when it is initialised, and shared by all the shards of Rounds it executes
+parallel_worker_qiskit_sqcka_protocol_executor_service = None
+
+
+# Initialise a Parallel Worker (i.e., a different Process), for the Parallel Execution of the Rounds of the Protocol,
+# with the given Executor Service of the Protocol, which is serialized only once, for each Parallel Worker
+def initialise_parallel_worker(qiskit_sqcka_protocol_executor_service):
+
+    # Keep the Executor Service of the Protocol, for all the shards of Rounds executed by the Parallel Worker
+    global parallel_worker_qiskit_sqcka_protocol_executor_service
+    parallel_worker_qiskit_sqcka_protocol_executor_service = qiskit_sqcka_protocol_executor_service
+
+    # Discard the Events of the Rounds of the shards, since they would be interleaved with the other shards
+    # (i.e., the main Process emits them again, in order, from the Rounds of the shards)
+    ProtocolEventLog.ProtocolEventLog.configure_default_protocol_event_log(
+        [NullProtocolEventSink.NullProtocolEventSink("null_protocol_event_sink")]
+    )
+
+
+# Execute a shard of Rounds of the Protocol, in batch, on a Parallel Worker (i.e., on a different Process),
+# with a given Seed, returning the Rounds of the shard, without their Quantum Circuits
+# NOTE: The Rounds executed are the ones from the first number of Round given (inclusive),
+#       to the last number of Round given (exclusive), by the Executor Service of the Protocol,
+#       received by the Parallel Worker, when it was initialised
+def execute_protocol_rounds_shard_in_parallel_worker(first_num_round, last_num_round, seed):
+
+    # Retrieve the Executor Service of the Protocol, received by the Parallel Worker
+    qiskit_sqcka_protocol_executor_service = parallel_worker_qiskit_sqcka_protocol_executor_service
+
+    # Configure the default Simulator Session of the Parallel Worker, with the Seed of the shard
+    QiskitSimulatorSession.QiskitSimulatorSession.configure_default_qiskit_simulator_session(seed=seed)
+
+    # Execute the Rounds of the shard, in batch
+    sqcka_protocol_rounds = \
+        qiskit_sqcka_protocol_executor_service.execute_protocol_rounds_in_batch(first_num_round, last_num_round)
+
+    # Execute the pending SWAP Tests of the CTRL (Reflect) Rounds of the shard, at once
+    qiskit_sqcka_protocol_executor_service.execute_protocol_pending_swap_tests()
+
+    # For each Round of the shard
+    for sqcka_protocol_round in sqcka_protocol_rounds:
+
+        # Discard the Quantum Circuit of the current Round, since it is not sent back to the main Process
+        sqcka_protocol_round.update_qiskit_quantum_circuit(None)
+
+    # Return the Rounds of the shard
+    return sqcka_protocol_rounds
+
 
 # Class for the Executor Service of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
 class QiskitSQCKAProtocolExecutorService:
@@ -83,6 +209,26 @@ class QiskitSQCKAProtocolExecutorService:
         # Initialise the boolean flag for the start status of the process of the Protocol
         self.qiskit_sqcka_protocol_started = False
 
+        # Initialise the Cache of the Templates of the Quantum Circuits of the Rounds of the Protocol
+        self.qiskit_sqcka_protocol_round_quantum_circuit_templates_cache = \
+            QiskitSQCKAProtocolRoundQuantumCircuitTemplatesCache \
+            .QiskitSQCKAProtocolRoundQuantumCircuitTemplatesCache("sqcka_protocol_round_quantum_circuit_"
+                                                                  "templates_cache")
+
+        # Initialise the Cache of the String representations of the Ket Notation of the Quantum States for
+        # the prepared Multipartite Entanglements of the Rounds of the Protocol, indexed by
+        # their type of Quantum Entanglement and number of Parties
+        self.prepared_quantum_entanglement_string_representations = {}
+
+        # Initialise the list of the CTRL (Reflect) Rounds of the Protocol, whose SWAP Tests are still pending,
+        # with the (transpiled) Quantum Circuits to be executed for them, all at once, with several Shots
+        self.qiskit_sqcka_protocol_pending_swap_tests = []
+
+    # Return the Cache of the Templates of the Quantum Circuits of the Rounds of
+    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    def get_qiskit_sqcka_protocol_round_quantum_circuit_templates_cache(self):
+        return self.qiskit_sqcka_protocol_round_quantum_circuit_templates_cache
+
     # Return the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
     def get_qiskit_sqcka_protocol(self):
 
@@ -138,6 +284,21 @@ class QiskitSQCKAProtocolExecutorService:
                                      "(Conference Key) between the parties involved is not present in "
                                      "the list of Parties' Names involved on the Protocol!!!")
 
+                # Retrieve the type of the Quantum Simulator, used to execute the Quantum Circuits of the Rounds
+                quantum_simulator_type = self.qiskit_sqcka_protocol_parameters.get_quantum_simulator_type()
+
+                # Retrieve the Layout Type of the Quantum Circuits of the Rounds
+                quantum_circuit_layout_type = self.qiskit_sqcka_protocol_parameters.get_quantum_circuit_layout_type()
+
+                # Retrieve the boolean flag about if the Barriers are recorded in the Quantum Circuits of the Rounds,
+                # only for their visualization or export
+                barriers_for_visualization_flag = \
+                    self.qiskit_sqcka_protocol_parameters.get_barriers_for_visualization_flag()
+
+                # Retrieve the boolean flag about if the Rounds are executed as Dynamic Quantum Circuits,
+                # in a single job of the Quantum Simulator
+                dynamic_circuits_flag = self.qiskit_sqcka_protocol_parameters.get_dynamic_circuits_flag()
+
                 # Redefine the list of the Party Entities involved in the Protocol,
                 # according to the number of them
                 self.qiskit_sqcka_protocol_party_entities = ([None] * num_parties)
@@ -173,7 +334,9 @@ class QiskitSQCKAProtocolExecutorService:
                         self.qiskit_sqcka_protocol_party_entities[current_party_entity_id] = \
                             QiskitSQCKAProtocolPartyEntity \
                             .QiskitSQCKAProtocolPartyEntity(current_party_entity_id, current_party_entity_user_client,
-                                                            QUANTUM_PARTY_ENTITY, True, bipartite_pre_shared_keys)
+                                                            QUANTUM_PARTY_ENTITY, True, bipartite_pre_shared_keys,
+                                                            quantum_simulator_type, quantum_circuit_layout_type,
+                                                            barriers_for_visualization_flag, dynamic_circuits_flag)
 
                         # Set the Distributor Party Entity of the Protocol
                         self.set_protocol_distributor_party_entity(self.qiskit_sqcka_protocol_party_entities[current_party_entity_id])
@@ -202,7 +365,9 @@ class QiskitSQCKAProtocolExecutorService:
                         self.qiskit_sqcka_protocol_party_entities[current_party_entity_id] = \
                             QiskitSQCKAProtocolPartyEntity \
                             .QiskitSQCKAProtocolPartyEntity(current_party_entity_id, current_party_entity_user_client,
-                                                            SEMI_QUANTUM_PARTY_ENTITY, False, bipartite_pre_shared_key)
+                                                            SEMI_QUANTUM_PARTY_ENTITY, False, bipartite_pre_shared_key,
+                                                            quantum_simulator_type, quantum_circuit_layout_type,
+                                                            barriers_for_visualization_flag, dynamic_circuits_flag)
 
                 # Set the boolean flag for the initialisation of the Party Entities of the Protocol, as True
                 self.qiskit_sqcka_protocol_party_entities_initialised = True
@@ -321,6 +486,42 @@ class QiskitSQCKAProtocolExecutorService:
             raise ValueError("The Parameters of the Protocol need to "
                              "be configured before add any Bipartite Pre-Shared Key!!!")
 
+    # Generate a Bipartite Pre-Shared Key, in binary, for the Protocol, with one bit per Round,
+    # where the bits set to 1 mark the CTRL (Reflect) Rounds, whose number is the one expected from
+    # the probability of all the receiving Parties reflect their destined Qubits
+    # NOTE: The Bipartite Pre-Shared Key is drawn directly with the required Hamming Weight, in O(n) time,
+    #       instead of repeating the generation of whole Binary Strings until their Hamming Weight matches;
+    #       If no Seed (i.e., entropy) is given, the Seed of the Parameters of the Protocol is used
+    def generate_protocol_bipartite_pre_shared_key(self, seed=None):
+
+        # If the Parameters of the Protocol were not configured yet
+        if not self.qiskit_sqcka_protocol_parameters_initialised:
+
+            # Raise a Value Error
+            raise ValueError("The Parameters of the Protocol need to "
+                             "be configured before generate any Bipartite Pre-Shared Key!!!")
+
+        # If no Seed was given
+        if seed is None:
+
+            # Use the Seed of the Parameters of the Protocol
+            seed = self.qiskit_sqcka_protocol_parameters.get_seed()
+
+        # Retrieve the number of Rounds of the Protocol
+        num_rounds = self.qiskit_sqcka_protocol_parameters.get_num_rounds()
+
+        # Compute the number of Rounds that each Party will reflect the Qubits, without performing Z-Basis Measurement
+        num_reflect_rounds = ceil(self.qiskit_sqcka_protocol_parameters.get_probability_reflect_round() * num_rounds)
+
+        # Create the Classical Pseudo Random Binary String Generator, with the given Seed
+        classical_pseudo_random_binary_string_generator = ClassicalPseudoRandomBinaryStringGenerator \
+            .ClassicalPseudoRandomBinaryStringGenerator("classical_pseudo_random_binary_string_generator", seed=seed)
+
+        # Generate and return the Bipartite Pre-Shared Key, in binary,
+        # with a Hamming Weight equal to the number of Rounds that each Party will reflect the Qubits
+        return classical_pseudo_random_binary_string_generator\
+            .generate_fixed_hamming_weight_binary_string(num_rounds, num_reflect_rounds)
+
     # Return all the Bipartite Pre-Shared Key of the Protocol
     def get_protocol_bipartite_pre_shared_keys(self):
 
@@ -348,7 +549,22 @@ class QiskitSQCKAProtocolExecutorService:
                                       preparing_bases, quantum_entanglement_type,
                                       strategy_for_eavesdropping_detection,
                                       communication_path_edges_between_parties_names=None,
-                                      communication_path_distances_between_parties_names=None):
+                                      communication_path_distances_between_parties_names=None,
+                                      execution_mode_type=SemiQuantumCryptographyProtocolExecutionModeTypes
+                                      .SEQUENTIAL_EXECUTION,
+                                      quantum_simulator_type=QuantumSimulatorTypes.AER_QASM_SIMULATOR,
+                                      num_parallel_workers=None, seed=None,
+                                      diagnostics_level_type=SemiQuantumCryptographyProtocolDiagnosticsLevelTypes
+                                      .BASIC_DIAGNOSTICS,
+                                      quantum_bit_error_rate_estimation_block_size=QiskitSQCKAProtocolParameters
+                                      .DEFAULT_QUANTUM_BIT_ERROR_RATE_ESTIMATION_BLOCK_SIZE,
+                                      quantum_bit_error_rate_confidence_level=QiskitSQCKAProtocolParameters
+                                      .DEFAULT_QUANTUM_BIT_ERROR_RATE_CONFIDENCE_LEVEL,
+                                      quantum_bit_error_rate_abort_threshold=None,
+                                      num_shots_for_swap_test=QiskitSQCKAProtocolParameters
+                                      .DEFAULT_NUM_SHOTS_FOR_SWAP_TEST,
+                                      quantum_circuit_layout_type=QuantumCircuitLayoutTypes.EXPANDED_LAYOUT,
+                                      barriers_for_visualization_flag=False, dynamic_circuits_flag=False):
 
         # Initialise the Parameters of the Protocol
         self.qiskit_sqcka_protocol_parameters = \
@@ -361,7 +577,14 @@ class QiskitSQCKAProtocolExecutorService:
                                            preparing_bases, quantum_entanglement_type,
                                            strategy_for_eavesdropping_detection,
                                            communication_path_edges_between_parties_names,
-                                           communication_path_distances_between_parties_names)
+                                           communication_path_distances_between_parties_names,
+                                           execution_mode_type, quantum_simulator_type,
+                                           num_parallel_workers, seed, diagnostics_level_type,
+                                           quantum_bit_error_rate_estimation_block_size,
+                                           quantum_bit_error_rate_confidence_level,
+                                           quantum_bit_error_rate_abort_threshold,
+                                           num_shots_for_swap_test, quantum_circuit_layout_type,
+                                           barriers_for_visualization_flag, dynamic_circuits_flag)
 
         # Set the boolean flag for the initialisation of Parameters of the Protocol, as True
         self.qiskit_sqcka_protocol_parameters_initialised = True
@@ -414,7 +637,9 @@ class QiskitSQCKAProtocolExecutorService:
                 # IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
                 # given its respective arguments
                 self.qiskit_sqcka_protocol = QiskitSQCKAProtocol \
-                    .QiskitSQCKAProtocol(party_entities, distributor_party_entity, bipartite_pre_shared_keys, parameters)
+                    .QiskitSQCKAProtocol(party_entities, distributor_party_entity, bipartite_pre_shared_keys,
+                                         parameters, quantum_bit_error_rate_estimator=self
+                                         .create_quantum_bit_error_rate_estimator(parameters))
 
                 # Delete obsolete attributes of the Class
                 self.delete_obsolete_attributes()
@@ -435,6 +660,51 @@ class QiskitSQCKAProtocolExecutorService:
             # Raise a Value Error
             raise ValueError("The Protocol was already initialised!!!")
 
+    # Create the Estimator of the Quantum Bit Error Rate (QBER) of the Protocol, from the Results of
+    # its CTRL (Reflect) Rounds, according to the Strategy for Eavesdropping Detection
+    # (i.e., None, if the expected Results of the CTRL (Reflect) Rounds are not known)
+    def create_quantum_bit_error_rate_estimator(self, parameters):
+
+        # Retrieve the Strategy for Eavesdropping Detection of the Protocol
+        strategy_for_eavesdropping_detection = parameters.get_strategy_for_eavesdropping_detection()
+
+        # If the Strategy for Eavesdropping Detection is a Measurement by Inverting Quantum Circuit
+        if strategy_for_eavesdropping_detection == \
+                StrategiesForEavesdroppingDetection.MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT:
+
+            # The Multipartite Entanglement reflected back is expected to be measured as |00...0⟩
+            expected_ctrl_round_results_binary = [("0" * parameters.get_num_parties())]
+
+        # If the Strategy for Eavesdropping Detection is a Statistical Test
+        elif strategy_for_eavesdropping_detection == StrategiesForEavesdroppingDetection.STATISTICAL_TEST:
+
+            # The Multipartite Entanglement reflected back is expected to be measured as one of its valid Quantum States
+            expected_ctrl_round_results_binary = \
+                self.compute_known_quantum_entanglement_valid_quantum_states_binary(
+                    parameters.get_quantum_entanglement_type(), parameters.get_num_parties()
+                )
+
+        # If it is other Strategy for Eavesdropping Detection
+        else:
+
+            # The expected Results of the CTRL (Reflect) Rounds are not known
+            expected_ctrl_round_results_binary = None
+
+        # If the expected Results of the CTRL (Reflect) Rounds are not known
+        if expected_ctrl_round_results_binary is None:
+
+            # Return None, since the Quantum Bit Error Rate (QBER) can not be estimated
+            return None
+
+        # Create and return the Estimator of the Quantum Bit Error Rate (QBER)
+        return QiskitSQCKAProtocolQuantumBitErrorRateEstimator\
+            .QiskitSQCKAProtocolQuantumBitErrorRateEstimator(
+                "quantum_bit_error_rate_estimator", parameters.get_num_parties(), expected_ctrl_round_results_binary,
+                parameters.get_quantum_bit_error_rate_estimation_block_size(),
+                parameters.get_quantum_bit_error_rate_confidence_level(),
+                parameters.get_quantum_bit_error_rate_abort_threshold()
+            )
+
     # Delete obsolete attributes of the Class, after the Protocol be initialised
     def delete_obsolete_attributes(self):
 
@@ -465,464 +735,1901 @@ class QiskitSQCKAProtocolExecutorService:
         # If the Semi-Quantum Conference Key Agreement (SQCKA) Protocol was not started yet
         if not self.qiskit_sqcka_protocol_started:
 
+            # Set the Semi-Quantum Conference Key Agreement (SQCKA) Protocol as started,
+            # putting the respective boolean flag as True
+            self.qiskit_sqcka_protocol_started = True
+
             # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
             qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
 
-            # Retrieve the number of Parties involved in
-            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-            qiskit_sqcka_protocol_num_parties = qiskit_sqcka_protocol.get_parameters().get_num_parties()
-
             # Retrieve the number of Rounds for
             # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
             qiskit_sqcka_protocol_num_rounds = qiskit_sqcka_protocol.get_parameters().get_num_rounds()
 
-            # Retrieve the type of the Quantum Entanglement intended for
+            # Retrieve the type of the Execution Mode for the Rounds of
             # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-            qiskit_sqcka_protocol_entanglement_type = \
-                qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()
+            qiskit_sqcka_protocol_execution_mode_type = \
+                qiskit_sqcka_protocol.get_parameters().get_execution_mode_type()
+
+            # Set the Seed of the Session, on the default Simulator Session, from which the Seeds of
+            # the Jobs of each Round are derived (i.e., the Parallel Workers derive their own ones, from it),
+            # even if it is None, to not reuse the Seed left by a previous reproducible Session, in the same process
+            QiskitSimulatorSession.QiskitSimulatorSession.get_default_qiskit_simulator_session() \
+                .set_seed(qiskit_sqcka_protocol.get_parameters().get_seed())
+
+            # If the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # are meant to be executed in batches (i.e., or multiplexed in the Shots of the same Quantum Circuits)
+            if qiskit_sqcka_protocol_execution_mode_type in \
+                    [SemiQuantumCryptographyProtocolExecutionModeTypes.BATCHED_EXECUTION,
+                     SemiQuantumCryptographyProtocolExecutionModeTypes.MULTIPLEXED_EXECUTION]:
+
+                # For each batch of Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                for first_num_round_batch in range(0, qiskit_sqcka_protocol_num_rounds,
+                                                   MAX_NUM_ROUNDS_PER_BATCHED_EXECUTION):
+
+                    # Compute the (exclusive) last number of the Round of the current batch
+                    last_num_round_batch = min((first_num_round_batch + MAX_NUM_ROUNDS_PER_BATCHED_EXECUTION),
+                                               qiskit_sqcka_protocol_num_rounds)
+
+                    # Execute the current batch of Rounds of
+                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                    self.execute_protocol_rounds_in_batch(first_num_round_batch, last_num_round_batch)
 
-            # Set the number of Qubits required for the Quantum Circuits,
-            # for the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-            num_qubits_and_bits_for_protocol_round_quantum_circuit = \
-                ((3 * qiskit_sqcka_protocol_num_parties) - 2)
+                    # If the Protocol should be aborted, since the Quantum Bit Error Rate (QBER) crossed the threshold
+                    if self.abort_protocol_if_quantum_bit_error_rate_threshold_crossed(last_num_round_batch):
 
-            # Retrieve the Distributor Party Entity of
-            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-            qiskit_sqcka_protocol_distributor_party_entity = \
-                self.qiskit_sqcka_protocol \
-                .get_distributor_party_entity()
+                        # Stop the execution of the remaining batches of Rounds
+                        break
 
-            # For each Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-            for current_qiskit_sqcka_protocol_num_round in range(qiskit_sqcka_protocol_num_rounds):
+                # Execute the pending SWAP Tests of the CTRL (Reflect) Rounds of all the batches, at once
+                self.execute_protocol_pending_swap_tests()
 
-                # Print the header of the current round of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                print("---------------------------- ROUND #{} ----------------------------"
-                      .format(current_qiskit_sqcka_protocol_num_round))
-                print("\n")
+            # If the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # are meant to be chained in long Quantum Circuits, separated by Resets
+            elif qiskit_sqcka_protocol_execution_mode_type == \
+                    SemiQuantumCryptographyProtocolExecutionModeTypes.CHAINED_EXECUTION:
 
-                # Create the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                sqcka_protocol_round = \
-                    qiskit_sqcka_protocol_distributor_party_entity \
-                    .create_protocol_round(current_qiskit_sqcka_protocol_num_round,
-                                           num_qubits_and_bits_for_protocol_round_quantum_circuit)
+                # For each chunk of Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                for first_num_round_chunk in range(0, qiskit_sqcka_protocol_num_rounds,
+                                                   MAX_NUM_ROUNDS_PER_CHAINED_EXECUTION):
+
+                    # Compute the (exclusive) last number of the Round of the current chunk
+                    last_num_round_chunk = min((first_num_round_chunk + MAX_NUM_ROUNDS_PER_CHAINED_EXECUTION),
+                                               qiskit_sqcka_protocol_num_rounds)
+
+                    # Execute the current chunk of Rounds of
+                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                    # as one single chained Quantum Circuit
+                    self.execute_protocol_rounds_in_batch(first_num_round_chunk, last_num_round_chunk)
+
+                    # If the Protocol should be aborted, since the Quantum Bit Error Rate (QBER) crossed the threshold
+                    if self.abort_protocol_if_quantum_bit_error_rate_threshold_crossed(last_num_round_chunk):
 
-                # Print the type of the current Round of
+                        # Stop the execution of the remaining chunks of Rounds
+                        break
+
+                # Execute the pending SWAP Tests of the CTRL (Reflect) Rounds of all the chunks, at once
+                self.execute_protocol_pending_swap_tests()
+
+            # If the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # are meant to be executed in parallel
+            elif qiskit_sqcka_protocol_execution_mode_type == \
+                    SemiQuantumCryptographyProtocolExecutionModeTypes.PARALLEL_EXECUTION:
+
+                # Execute the Rounds of
+                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, in parallel,
+                # until the Quantum Bit Error Rate (QBER) crosses the threshold, if it is configured
+                self.execute_protocol_rounds_in_parallel()
+
+                # Check if the Protocol should be aborted, since the Quantum Bit Error Rate (QBER) crossed the threshold
+                # NOTE: The Rounds of the shards are added in order, and the ones after the threshold are discarded
+                self.abort_protocol_if_quantum_bit_error_rate_threshold_crossed(
+                    len(qiskit_sqcka_protocol.get_protocol_rounds())
+                )
+
+            # If the Results of the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # are meant to be sampled analytically, without building or executing any Quantum Circuit
+            elif qiskit_sqcka_protocol_execution_mode_type == \
+                    SemiQuantumCryptographyProtocolExecutionModeTypes.ANALYTIC_EXECUTION:
+
+                # Sample the Results of all the Rounds of
                 # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                print("This Round is a {}...".format(sqcka_protocol_round.get_type_round()))
-                print("\n")
+                self.execute_protocol_rounds_analytically()
+
+                # Check if the Protocol should be aborted, since the Quantum Bit Error Rate (QBER) crossed the threshold
+                # NOTE: The Rounds are all sampled at once, and thus, this can only be checked after their sampling
+                self.abort_protocol_if_quantum_bit_error_rate_threshold_crossed(qiskit_sqcka_protocol_num_rounds)
+
+            # If the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # are meant to be executed sequentially
+            else:
+
+                # For each Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                for current_qiskit_sqcka_protocol_num_round in range(qiskit_sqcka_protocol_num_rounds):
+
+                    # Execute the current Round of
+                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                    self.execute_protocol_round(current_qiskit_sqcka_protocol_num_round)
+
+                    # If the Protocol should be aborted, since the Quantum Bit Error Rate (QBER) crossed the threshold
+                    if self.abort_protocol_if_quantum_bit_error_rate_threshold_crossed(
+                            (current_qiskit_sqcka_protocol_num_round + 1)):
+
+                        # Stop the execution of the remaining Rounds
+                        break
+
+                # Execute the pending SWAP Tests of the CTRL (Reflect) Rounds, at once
+                self.execute_protocol_pending_swap_tests()
+
+        # If the Semi-Quantum Conference Key Agreement (SQCKA) Protocol was already started
+        else:
+
+            # Raise a Runtime Error
+            raise RuntimeError("The Protocol was already started!!!")
+
+    # Check if the Protocol should be aborted, since the Quantum Bit Error Rate (QBER) crossed the threshold,
+    # emitting the respective Event, after the given number of Rounds executed
+    def abort_protocol_if_quantum_bit_error_rate_threshold_crossed(self, num_rounds_executed):
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # If the Protocol should not be aborted
+        if not qiskit_sqcka_protocol.is_aborted():
+
+            # Return False, since the Protocol should not be aborted
+            return False
+
+        # Retrieve the Estimator of the Quantum Bit Error Rate (QBER) of the Protocol
+        quantum_bit_error_rate_estimator = qiskit_sqcka_protocol.get_quantum_bit_error_rate_estimator()
+
+        # Emit the Event about the early abort of the Protocol
+        ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+            .emit(PROTOCOL_ABORTED, None,
+                  "ALERT: The Protocol was aborted after {num_rounds_executed} Rounds, since the QBER "
+                  "({quantum_bit_error_rate:.4f}) crossed the threshold of {abort_threshold}!!!",
+                  num_rounds_executed=num_rounds_executed,
+                  quantum_bit_error_rate=quantum_bit_error_rate_estimator.get_quantum_bit_error_rate(),
+                  abort_threshold=qiskit_sqcka_protocol.get_parameters().get_quantum_bit_error_rate_abort_threshold())
+
+        # Return True, since the Protocol should be aborted
+        return True
+
+    # Reconcile the Raw Conference Keys of the Semi-Quantum Parties with the Raw Conference Key of the Distributor,
+    # after the Protocol be started, with the given type of Information Reconciliation, returning
+    # the Reconciled Conference Keys, as a Dictionary of Bit-Packed Binary Strings, indexed by the names of the Parties
+    # NOTE: If no Seed is given, the Seed of the Protocol's Parameters is used (i.e., for the shuffles of the Cascade
+    #       Information Reconciliation and for the Parity-Check Matrices of the LDPC Information Reconciliation)
+    def reconcile_protocol_raw_conference_keys(self, information_reconciliation_type=InformationReconciliationTypes
+                                               .CASCADE_RECONCILIATION, quantum_bit_error_rate=None, seed=None):
+
+        # If the Semi-Quantum Conference Key Agreement (SQCKA) Protocol was not started yet
+        if not self.qiskit_sqcka_protocol_started:
+
+            # Raise a Runtime Error
+            raise RuntimeError("The Raw Conference Keys can only be reconciled after the Protocol be started!!!")
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # If no Seed is given, use the Seed of the Protocol's Parameters
+        seed = seed if seed is not None else qiskit_sqcka_protocol.get_parameters().get_seed()
+
+        # If the type of Information Reconciliation is the Cascade Information Reconciliation
+        if information_reconciliation_type == InformationReconciliationTypes.CASCADE_RECONCILIATION:
+
+            # Create the Cascade Information Reconciliation
+            information_reconciliation = QiskitSQCKAProtocolCascadeInformationReconciliation\
+                .QiskitSQCKAProtocolCascadeInformationReconciliation("cascade_information_reconciliation", seed=seed)
+
+        # If the type of Information Reconciliation is the Low-Density Parity-Check (LDPC) Information Reconciliation
+        elif information_reconciliation_type == InformationReconciliationTypes.LDPC_RECONCILIATION:
+
+            # Create the Low-Density Parity-Check (LDPC) Information Reconciliation
+            information_reconciliation = QiskitSQCKAProtocolLDPCInformationReconciliation\
+                .QiskitSQCKAProtocolLDPCInformationReconciliation("ldpc_information_reconciliation", seed=seed)
 
-                # Prepare the Multipartite Entanglement of the Round for
+        # If it is other type of Information Reconciliation
+        else:
+
+            # Raise a Value Error
+            raise ValueError("The type of Information Reconciliation must be one of the following: {}!!!"
+                             .format(InformationReconciliationTypes.POSSIBLE_INFORMATION_RECONCILIATION_TYPES))
+
+        # Reconcile the Raw Conference Keys of the Semi-Quantum Parties and return the Reconciled Conference Keys
+        return qiskit_sqcka_protocol.reconcile_raw_conference_keys(information_reconciliation, quantum_bit_error_rate)
+
+    # Amplify the privacy of the Reconciled Conference Keys of the Parties, after their Information Reconciliation,
+    # with Toeplitz hashing, for the given security parameter, returning the Final Conference Keys,
+    # as a Dictionary of Bit-Packed Binary Strings, indexed by the names of the Parties
+    # NOTE: If no Seed is given, the Seed of the Protocol's Parameters is used (i.e., for the Toeplitz Matrices)
+    def amplify_privacy_of_protocol_conference_keys(self, quantum_bit_error_rate=None,
+                                                    security_parameter=QiskitSQCKAProtocolToeplitzPrivacyAmplification
+                                                    .DEFAULT_SECURITY_PARAMETER, seed=None):
+
+        # If the Semi-Quantum Conference Key Agreement (SQCKA) Protocol was not started yet
+        if not self.qiskit_sqcka_protocol_started:
+
+            # Raise a Runtime Error
+            raise RuntimeError("The privacy of the Conference Keys can only be amplified "
+                               "after the Protocol be started!!!")
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # Create the Privacy Amplification, with Toeplitz hashing
+        # (i.e., if no Seed is given, with the Seed of the Protocol's Parameters)
+        privacy_amplification = QiskitSQCKAProtocolToeplitzPrivacyAmplification\
+            .QiskitSQCKAProtocolToeplitzPrivacyAmplification(
+                "toeplitz_privacy_amplification", security_parameter=security_parameter,
+                seed=(seed if seed is not None else qiskit_sqcka_protocol.get_parameters().get_seed())
+            )
+
+        # Amplify the privacy of the Reconciled Conference Keys and return the Final Conference Keys
+        return qiskit_sqcka_protocol.amplify_privacy_of_reconciled_conference_keys(privacy_amplification,
+                                                                                   quantum_bit_error_rate)
+
+    # Return the number of Qubits and Bits required for the Quantum Circuit of a Round of the Protocol
+    # (i.e., (3n - 2) Qubits for the Distributor, Channel and Party Registers, or only n Qubits for
+    # the Compact Layout, plus the n Qubits of the Reference Register and the Ancilla Qubit,
+    # for the CTRL (Reflect) Rounds with a SWAP Test)
+    def get_num_qubits_and_bits_for_protocol_round_quantum_circuit(self, num_round):
+
+        # Retrieve the Parameters of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_parameters = self.get_qiskit_sqcka_protocol().get_parameters()
+
+        # Retrieve the number of Parties involved in
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_num_parties = qiskit_sqcka_protocol_parameters.get_num_parties()
+
+        # Retrieve the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_entity = self.get_qiskit_sqcka_protocol().get_distributor_party_entity()
+
+        # Retrieve the number of Qubits and Bits of the Registers of the Party Entities and
+        # the Quantum Communication Channels, according to the Layout Type of the Quantum Circuits of the Rounds
+        num_qubits_and_bits_for_party_registers = qiskit_sqcka_protocol_distributor_party_entity \
+            .get_num_qubits_and_bits_for_party_registers(qiskit_sqcka_protocol_num_parties)
+
+        # If the Strategy for Eavesdropping Detection is a SWAP Test and the Round is a CTRL (Reflect) Round
+        if (qiskit_sqcka_protocol_parameters.get_strategy_for_eavesdropping_detection() ==
+                StrategiesForEavesdroppingDetection.SWAP_TEST) and \
+                (qiskit_sqcka_protocol_distributor_party_entity
+                 .get_protocol_round_type_id(num_round) == CTRL_REFLECT_ROUND_3):
+
+            # Return the number of Qubits and Bits, with the Reference Register and the Ancilla Qubit
+            return (num_qubits_and_bits_for_party_registers + qiskit_sqcka_protocol_num_parties + 1)
+
+        # Return the number of Qubits and Bits of the Registers of the Party Entities and
+        # the Quantum Communication Channels
+        return num_qubits_and_bits_for_party_registers
+
+    # Execute a single Round of the Protocol, building and executing its Quantum Circuit on the Simulator
+    # NOTE: For the SWAP Test, the Quantum Circuit of a CTRL (Reflect) Round is only built, since
+    #       all the SWAP Tests are executed at once, with several Shots, after all the Rounds
+    def execute_protocol_round(self, num_round):
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # Derive the Seeds of the Jobs of the current Round, from the Seed of the default Simulator Session
+        QiskitSimulatorSession.QiskitSimulatorSession.get_default_qiskit_simulator_session() \
+            .derive_seeds_simulator_for_round(num_round)
+
+        # Retrieve the number of Parties involved in
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_num_parties = qiskit_sqcka_protocol.get_parameters().get_num_parties()
+
+        # Retrieve the type of the Quantum Entanglement intended for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_entanglement_type = \
+            qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()
+
+        # Set the number of Qubits required for the Quantum Circuit,
+        # for the current Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        num_qubits_and_bits_for_protocol_round_quantum_circuit = \
+            self.get_num_qubits_and_bits_for_protocol_round_quantum_circuit(num_round)
+
+        # Retrieve the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_entity = \
+            self.qiskit_sqcka_protocol \
+            .get_distributor_party_entity()
+
+        # Retrieve the name of the User/Client of the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_name = \
+            qiskit_sqcka_protocol_distributor_party_entity.get_party_user_client().get_user_client_name()
+
+        # Retrieve the default Event Log, to which the Events of the current Round are emitted
+        protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # Create the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .create_protocol_round(num_round,
+                                   num_qubits_and_bits_for_protocol_round_quantum_circuit)
+
+        # Emit the Event about the start and the type of the current Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        self.emit_protocol_round_started_event(sqcka_protocol_round)
+
+        # Prepare the Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .prepare_quantum_entanglement(qiskit_sqcka_protocol_entanglement_type,
+                                          qiskit_sqcka_protocol_num_parties, sqcka_protocol_round)
+
+        # If the Event Log is enabled (i.e., if the Events of the current Round are not discarded)
+        if protocol_event_log.is_enabled():
+
+            # Retrieve the String representation of the Ket Notation of
+            # the Quantum State for the previously prepared Multipartite Entanglement of
+            # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            # according to the Diagnostics Level (i.e., None, if it is not available)
+            prepared_quantum_entanglement_string_representation = \
+                self.get_prepared_quantum_entanglement_string_representation(sqcka_protocol_round)
+
+            # If the String representation of the prepared Multipartite Entanglement is available
+            if prepared_quantum_entanglement_string_representation is not None:
+
+                # Emit the Event about the previously prepared
+                # Multipartite Entanglement, by the Distributor Party Entity,
+                # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                protocol_event_log.emit(ENTANGLEMENT_PREPARED, num_round,
+                                        "{party_name} (Distributor Party Entity) prepared "
+                                        "the Multipartite Entanglement State ({quantum_entanglement_type}):\n"
+                                        "- {quantum_entanglement_string_representation}",
+                                        party_name=qiskit_sqcka_protocol_distributor_party_name,
+                                        quantum_entanglement_type=qiskit_sqcka_protocol_entanglement_type,
+                                        quantum_entanglement_string_representation=(
+                                            prepared_quantum_entanglement_string_representation
+                                        ))
+
+            # If the String representation of the prepared Multipartite Entanglement is not available
+            else:
+
+                # Emit the Event about the previously prepared
+                # Multipartite Entanglement, by the Distributor Party Entity,
+                # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                protocol_event_log.emit(ENTANGLEMENT_PREPARED, num_round,
+                                        "{party_name} (Distributor Party Entity) prepared "
+                                        "the Multipartite Entanglement State ({quantum_entanglement_type})...",
+                                        party_name=qiskit_sqcka_protocol_distributor_party_name,
+                                        quantum_entanglement_type=qiskit_sqcka_protocol_entanglement_type)
+
+        # Retrieve the list of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_party_entities = self.get_protocol_party_entities()
+
+        # Retrieve the number of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        num_protocol_party_entities = len(protocol_party_entities)
+
+        # Prepare the Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .send_quantum_data_information_to_semi_quantum_party_entities(qiskit_sqcka_protocol_num_parties,
+                                                                          sqcka_protocol_round)
+
+        # Emit the Event about the sending of the previously prepared
+        # Multipartite Entanglement, by the Distributor Party Entity,
+        # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_event_log.emit(QUBITS_SENT, num_round,
+                                "{party_name} (Distributor Party Entity) send "
+                                "the Multipartite Entanglement State ({quantum_entanglement_type}),\n"
+                                "to the respective Semi-Quantum Party Entities...",
+                                party_name=qiskit_sqcka_protocol_distributor_party_name,
+                                quantum_entanglement_type=qiskit_sqcka_protocol_entanglement_type)
+
+        # For each Party Entity of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_num_protocol_party_entity in range(num_protocol_party_entities):
+
+            # Retrieve the current Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            current_protocol_party_entity = protocol_party_entities[current_num_protocol_party_entity]
+
+            # If the current Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # is not the Distributor Party Entity
+            if not current_protocol_party_entity.is_distributor():
+
+                # Receive the Quantum Data/Information from the current Party Entity of
                 # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
                 sqcka_protocol_round = \
-                    qiskit_sqcka_protocol_distributor_party_entity \
-                    .prepare_quantum_entanglement(qiskit_sqcka_protocol_entanglement_type,
-                                                  qiskit_sqcka_protocol_num_parties, sqcka_protocol_round)
+                    current_protocol_party_entity\
+                    .receive_quantum_data_information_from_distributor(num_protocol_party_entities,
+                                                                       sqcka_protocol_round)
 
-                # Retrieve the Quantum Circuit for the previously
-                # prepared Multipartite Entanglement of the Round for
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                quantum_entanglement_quantum_circuit = \
-                    sqcka_protocol_round.get_qiskit_quantum_circuit()
+                # Emit the Event about the reception of the Qubit (Particle) of the previously prepared
+                # Multipartite Entanglement, by the current Semi-Quantum Party Entity,
+                # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                protocol_event_log.emit(QUBIT_RECEIVED, num_round,
+                                        "{party_name} (Semi-Quantum Party Entity) received its Qubit (Particle) "
+                                        "from\nthe Multipartite Entanglement State ({quantum_entanglement_type}), "
+                                        "from the Distributor Party Entity...",
+                                        party_name=current_protocol_party_entity
+                                        .get_party_user_client().get_user_client_name(),
+                                        quantum_entanglement_type=qiskit_sqcka_protocol_entanglement_type)
+
+        # For each Party Entity of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_num_protocol_party_entity in range(num_protocol_party_entities):
+
+            # Retrieve the current Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            current_protocol_party_entity = protocol_party_entities[current_num_protocol_party_entity]
 
-                # Getting the Backend for the State Vector Representation
-                # (i.e., the Quantum State represented as State Vector)
-                state_vector_backend = Aer.get_backend('statevector_simulator')
+            # If the current Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # is not the Distributor Party Entity
+            if not current_protocol_party_entity.is_distributor():
 
-                # Execute the Quantum Circuit and store the Quantum State in a final state vector
-                final_state_vector = execute(quantum_entanglement_quantum_circuit.quantum_circuit,
-                                             state_vector_backend).result().get_statevector()
+                # The current Party Entity Measure and Resend (SIFT Operation)
+                # or just Reflect (CTRL Operation) the Particle (Qubit),
+                # accordingly to the respective Bit of the Pre-Shared Key
+                sqcka_protocol_round = \
+                    current_protocol_party_entity\
+                    .measure_and_resend_or_reflect_qubit(num_protocol_party_entities,
+                                                         sqcka_protocol_round)
+
+        # Retrieve the boolean flag about if the Rounds are executed as Dynamic Quantum Circuits,
+        # in a single job of the Quantum Simulator
+        dynamic_circuits_flag = qiskit_sqcka_protocol.get_parameters().get_dynamic_circuits_flag()
+
+        # Execute the Quantum Circuit of the current Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # for the case of it, being a Measure and Resend (SIFT Operation) Round
+        # NOTE: For the Dynamic Quantum Circuits, it is only executed, after the Qubits were resent back
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity\
+            .execute_protocol_round_quantum_circuit_for_sift_rounds(num_protocol_party_entities,
+                                                                    sqcka_protocol_round,
+                                                                    execute_quantum_circuit=(
+                                                                        not dynamic_circuits_flag
+                                                                    ))
+
+        # Retrieve the Results of the execution of the Quantum Circuit of the current Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # for the the case of it, being a Measure and Resend (SIFT Operation) Round
+        sqcka_protocol_round_results = sqcka_protocol_round.get_round_results()
+
+        # If the results of the current Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol are not None,
+        # and the current Round is a Measure and Resend (SIFT Operation) Round
+        if (sqcka_protocol_round_results is not None) and \
+                (sqcka_protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3):
+
+            # Emit the Event about the obtained correlated state of
+            # the Measurement on the Multipartite Entanglement used
+            self.emit_protocol_round_measurement_events(sqcka_protocol_round)
+
+        # Reset the Qubits (Particles) on the Quantum Circuit of the current Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # for the the case of it, being a Measure and Resend (SIFT Operation) Round
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity\
+            .reset_qubits_to_resend_for_sift_rounds(sqcka_protocol_round)
+
+        # For each Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_num_protocol_party_entity in range(num_protocol_party_entities):
+
+            # Retrieve the current Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            current_protocol_party_entity = protocol_party_entities[current_num_protocol_party_entity]
+
+            # Prepare the Qubits (Particles) on the Quantum Circuit of the current Round of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            # for the the case of it, being a Measure and Resend (SIFT Operation) Round,
+            # in order to be sent back in the same state it were found, after the Measurement
+            sqcka_protocol_round = \
+                current_protocol_party_entity\
+                .prepare_qubits_to_be_sent_back_for_sift_rounds(num_protocol_party_entities,
+                                                                sqcka_protocol_round)
+
+        # For each Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_num_protocol_party_entity in range(num_protocol_party_entities):
+
+            # Retrieve the current Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            current_protocol_party_entity = protocol_party_entities[current_num_protocol_party_entity]
 
-                # Initialise the list for the valid Quantum States of
-                # the previously prepared Multipartite Entanglement of the Round for
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                valid_quantum_states_binary_prepared_quantum_entanglement = []
+            # If the current Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # is not the Distributor Party Entity
+            if not current_protocol_party_entity.is_distributor():
 
-                # Retrieve the list of the Party Entities of
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                protocol_party_entities = self.get_protocol_party_entities()
+                # The current Party Entity of
+                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # not being the Distributor Party Entity, send back the Qubits (Particles),
+                # to the Distributor Party Entity
+                sqcka_protocol_round = \
+                    current_protocol_party_entity\
+                    .send_back_quantum_data_information_to_distributor_party_entity(
+                        num_protocol_party_entities, sqcka_protocol_round)
 
-                # Retrieve the number of the Party Entities of
+                # If the current Round of
                 # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                num_protocol_party_entities = len(protocol_party_entities)
-
-                # Build the required Binary format for the possible valid Quantum States of
-                # the previously prepared Multipartite Entanglement of the Round for
+                # is a Measure and Resend (SIFT Operation) Round
+                if sqcka_protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3:
+
+                    # Emit the Event about the sending back of the recreated measured Qubit (Particle),
+                    # by the current Semi-Quantum Party Entity, to the Distributor Party Entity,
+                    # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                    protocol_event_log.emit(QUBIT_SENT_BACK, num_round,
+                                            "{party_name} (Semi-Quantum Party Entity) sent back its recreated "
+                                            "measured Qubit (Particle) of\nthe Multipartite Entanglement State "
+                                            "({quantum_entanglement_type}), to the respective Distributor Party "
+                                            "Entity...",
+                                            party_name=current_protocol_party_entity
+                                            .get_party_user_client().get_user_client_name(),
+                                            quantum_entanglement_type=qiskit_sqcka_protocol_entanglement_type,
+                                            is_measured=True)
+
+                # If the current Round of
                 # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                binary_format = "{0:0"
-                binary_format += "{}".format(num_protocol_party_entities)
-                binary_format += "b}"
+                # is a Reflect (CTRL Operation) Round
+                elif sqcka_protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
+
+                    # Emit the Event about the sending back of the unmeasured Qubit (Particle),
+                    # by the current Semi-Quantum Party Entity, to the Distributor Party Entity,
+                    # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                    protocol_event_log.emit(QUBIT_SENT_BACK, num_round,
+                                            "{party_name} (Semi-Quantum Party Entity) sent back its unmeasured "
+                                            "Qubit (Particle) of\nthe Multipartite Entanglement State "
+                                            "({quantum_entanglement_type}), to the Distributor Party Entity...",
+                                            party_name=current_protocol_party_entity
+                                            .get_party_user_client().get_user_client_name(),
+                                            quantum_entanglement_type=qiskit_sqcka_protocol_entanglement_type,
+                                            is_measured=False)
+
+        # The Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        # receives back the Quantum Data/Information sent from the other Semi-Quantum Party Entities
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .receive_back_quantum_data_information_from_semi_quantum_party_entities(
+                num_protocol_party_entities, sqcka_protocol_round)
+
+        # If the Rounds are executed as Dynamic Quantum Circuits, and
+        # the current Round is a Measure and Resend (SIFT Operation) Round
+        if dynamic_circuits_flag and (sqcka_protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3):
+
+            # Execute the whole Quantum Circuit of the current Round, in a single job,
+            # with the Mid-Circuit Measurements and the classically conditioned resending of the Qubits
+            sqcka_protocol_round = \
+                qiskit_sqcka_protocol_distributor_party_entity \
+                .execute_protocol_round_dynamic_quantum_circuit_for_sift_rounds(num_protocol_party_entities,
+                                                                                sqcka_protocol_round)
+
+            # Emit the Event about the obtained correlated state of
+            # the Measurement on the Multipartite Entanglement used
+            self.emit_protocol_round_measurement_events(sqcka_protocol_round)
+
+        # If the Strategy for Eavesdropping Detection is a Measurement by Inverting Quantum Circuit
+        if qiskit_sqcka_protocol.get_parameters().get_strategy_for_eavesdropping_detection() == \
+                StrategiesForEavesdroppingDetection.MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT:
+
+            # The Distributor Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # invert and measure the Quantum Circuit containing the Quantum Data/Information reflected back
+            # from the other Semi-Quantum Party Entities, for the case of the Reflect (CTRL) Rounds
+            sqcka_protocol_round = \
+                qiskit_sqcka_protocol_distributor_party_entity \
+                .measure_quantum_entanglement_by_inverting_quantum_circuit(
+                    qiskit_sqcka_protocol_entanglement_type,
+                    num_protocol_party_entities, sqcka_protocol_round)
+
+        # If the Strategy for Eavesdropping Detection is a SWAP Test
+        elif qiskit_sqcka_protocol.get_parameters().get_strategy_for_eavesdropping_detection() == \
+                StrategiesForEavesdroppingDetection.SWAP_TEST:
+
+            # The Distributor Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # prepares the SWAP Test between the Quantum Data/Information reflected back from
+            # the other Semi-Quantum Party Entities and a fresh copy of the Multipartite Entanglement,
+            # for the case of the Reflect (CTRL) Rounds
+            sqcka_protocol_round = \
+                qiskit_sqcka_protocol_distributor_party_entity \
+                .prepare_swap_test_for_ctrl_rounds(qiskit_sqcka_protocol_entanglement_type,
+                                                   num_protocol_party_entities, sqcka_protocol_round)
+
+            # If the current Round of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # is a Reflect (CTRL) Round
+            if sqcka_protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
+
+                # Add the SWAP Test of the current Round to the pending ones, transpiling its Quantum Circuit,
+                # in order to be executed with all the other ones, after all the Rounds
+                self.qiskit_sqcka_protocol_pending_swap_tests\
+                    .append((sqcka_protocol_round,
+                             QiskitSimulatorSession.QiskitSimulatorSession.get_default_qiskit_simulator_session()
+                             .transpile_quantum_circuit(sqcka_protocol_round.get_qiskit_quantum_circuit()
+                                                        .quantum_circuit)))
+
+        # If the Strategy for Eavesdropping Detection is a Statistical Test
+        elif qiskit_sqcka_protocol.get_parameters().get_strategy_for_eavesdropping_detection() == \
+            StrategiesForEavesdroppingDetection.STATISTICAL_TEST:
+
+            # The Distributor Party Entity of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            # measure the Quantum Data/Information reflected back from the other Semi-Quantum Party Entities,
+            # for the case of the Reflect (CTRL) Rounds
+            sqcka_protocol_round = \
+                qiskit_sqcka_protocol_distributor_party_entity \
+                .measure_quantum_data_information_for_ctrl_rounds(
+                    num_protocol_party_entities, sqcka_protocol_round)
+
+        # If the current Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        # is a Reflect (CTRL) Round
+        if sqcka_protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
+
+            # Emit the Events about the Measurement of the Multipartite Entanglement State reflected back,
+            # sent back from the Semi-Quantum Party Entities to the Distributor Party Entity
+            # NOTE: For the SWAP Test, the Events are only emitted after the execution of the pending SWAP Tests
+            self.emit_protocol_round_measurement_events(sqcka_protocol_round)
+
+        # Emit the Event about the end of the current Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        self.emit_protocol_round_finished_event(sqcka_protocol_round)
+
+        # Add the current Round to the list of the Rounds of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol.add_protocol_round(sqcka_protocol_round)
+
+        # Return the current Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        return sqcka_protocol_round
+
+    # Emit the Event about the start and the type of a Round of the Protocol,
+    # to the default Event Log, for every Execution Mode of the Rounds
+    @staticmethod
+    def emit_protocol_round_started_event(sqcka_protocol_round):
+
+        # Emit the Event about the start and the type of the given Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+            .emit(ROUND_STARTED, sqcka_protocol_round.get_num_round(),
+                  "---------------------------- ROUND #{num_round} ----------------------------"
+                  "\n\nThis Round is a {type_round}...",
+                  type_round=sqcka_protocol_round.get_type_round())
+
+    # Emit the Events about the Measurement of a Round of the Protocol, already executed,
+    # to the default Event Log, for every Execution Mode of the Rounds
+    # (i.e., the Result obtained, for the SIFT Rounds, and the Measurement of the Multipartite Entanglement
+    # reflected back, with the possible Detection of Eavesdropping, for the CTRL Rounds)
+    # NOTE: For the SWAP Test, the Events of the CTRL Rounds are only emitted,
+    #       after the execution of the pending SWAP Tests
+    def emit_protocol_round_measurement_events(self, sqcka_protocol_round):
+
+        # Retrieve the Parameters of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_parameters = self.get_qiskit_sqcka_protocol().get_parameters()
+
+        # Retrieve the type of the Quantum Entanglement intended for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_entanglement_type = qiskit_sqcka_protocol_parameters.get_quantum_entanglement_type()
+
+        # Retrieve the Strategy for Eavesdropping Detection intended for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_strategy_for_eavesdropping_detection = \
+            qiskit_sqcka_protocol_parameters.get_strategy_for_eavesdropping_detection()
+
+        # Retrieve the name of the User/Client of the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_name = \
+            self.get_qiskit_sqcka_protocol().get_distributor_party_entity()\
+            .get_party_user_client().get_user_client_name()
+
+        # Retrieve the default Event Log, to which the Events of the given Round are emitted
+        protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # Retrieve the number of the given Round
+        num_round = sqcka_protocol_round.get_num_round()
+
+        # If the given Round is a Measure and Resend (SIFT Operation) Round
+        if sqcka_protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3:
+
+            # Emit the Event about the obtained correlated state of
+            # the Measurement on the Multipartite Entanglement used
+            protocol_event_log.emit(ROUND_RESULT_OBTAINED, num_round,
+                                    "It was obtained the result: |{round_results}⟩...",
+                                    round_results=sqcka_protocol_round.get_round_results())
+
+        # If the given Round is a Reflect (CTRL) Round and
+        # the Strategy for Eavesdropping Detection is a Measurement by Inverting Quantum Circuit
+        elif qiskit_sqcka_protocol_strategy_for_eavesdropping_detection == \
+                StrategiesForEavesdroppingDetection.MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT:
+
+            # It was received the expected results for
+            # the Measurement performed on the Quantum Entanglement
+            if sqcka_protocol_round.get_round_results() == ("0" * len(self.get_protocol_party_entities())):
+
+                # Emit the Event about the measured reflected Multipartite Entanglement State,
+                # sent back from the Semi-Quantum Party Entities to the Distributor Party Entity
+                protocol_event_log.emit(ENTANGLEMENT_MEASURED, num_round,
+                                        "{party_name} (Distributor Party Entity) measured "
+                                        "the Multipartite Entanglement State ({quantum_entanglement_type}) "
+                                        "reflected back,\ninverting the Quantum Circuit and it obtained "
+                                        "the following state:\n- |{round_results}⟩ (OK, as expected)",
+                                        party_name=qiskit_sqcka_protocol_distributor_party_name,
+                                        quantum_entanglement_type=qiskit_sqcka_protocol_entanglement_type,
+                                        round_results=sqcka_protocol_round.get_round_results(),
+                                        is_expected=True)
+
+            # It was not received the expected results for
+            # the Measurement performed on the Quantum Entanglement
+            else:
+
+                # Emit the Event about the measured reflected Multipartite Entanglement State,
+                # sent back from the Semi-Quantum Party Entities to the Distributor Party Entity
+                protocol_event_log.emit(ENTANGLEMENT_MEASURED, num_round,
+                                        "{party_name} (Distributor Party Entity) measured "
+                                        "the Multipartite Entanglement State ({quantum_entanglement_type}) "
+                                        "reflected back,\ninverting the Quantum Circuit and it obtained "
+                                        "the following state:\n- |{round_results}⟩ (NOT OK, not expected)",
+                                        party_name=qiskit_sqcka_protocol_distributor_party_name,
+                                        quantum_entanglement_type=qiskit_sqcka_protocol_entanglement_type,
+                                        round_results=sqcka_protocol_round.get_round_results(),
+                                        is_expected=False)
+
+                # Emit the Event about the Detection of Eavesdropping
+                protocol_event_log.emit(EAVESDROPPING_ALERT, num_round, "ALERT: Eavesdropping detected!!!",
+                                        round_results=sqcka_protocol_round.get_round_results())
+
+        # If the given Round is a Reflect (CTRL) Round and
+        # the Strategy for Eavesdropping Detection is a Statistical Test
+        elif qiskit_sqcka_protocol_strategy_for_eavesdropping_detection == \
+                StrategiesForEavesdroppingDetection.STATISTICAL_TEST:
+
+            # Emit the Event about the measured reflected Multipartite Entanglement State,
+            # sent back from the Semi-Quantum Party Entities to the Distributor Party Entity
+            protocol_event_log.emit(ENTANGLEMENT_MEASURED, num_round,
+                                    "{party_name} (Distributor Party Entity) measured "
+                                    "the Multipartite Entanglement State ({quantum_entanglement_type}) "
+                                    "reflected back...",
+                                    party_name=qiskit_sqcka_protocol_distributor_party_name,
+                                    quantum_entanglement_type=qiskit_sqcka_protocol_entanglement_type,
+                                    round_results=sqcka_protocol_round.get_round_results())
+
+    # Emit the Event about the end of a Round of the Protocol,
+    # to the default Event Log, for every Execution Mode of the Rounds
+    @staticmethod
+    def emit_protocol_round_finished_event(sqcka_protocol_round):
+
+        # Emit the Event about the end of the given Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+            .emit(ROUND_FINISHED, sqcka_protocol_round.get_num_round(),
+                  "-------------------------------------------------------------------")
+
+    # Emit the Events about the start, the Measurement and the end of a Round of the Protocol, already executed,
+    # to the default Event Log, for the Execution Modes of the Rounds, where they are executed all at once
+    # NOTE: For the SWAP Test, the Events of the CTRL Rounds are only emitted,
+    #       after the execution of the pending SWAP Tests
+    def emit_protocol_round_events(self, sqcka_protocol_round):
+
+        # Emit the Event about the start and the type of the given Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        self.emit_protocol_round_started_event(sqcka_protocol_round)
+
+        # Emit the Events about the Measurement of the given Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        self.emit_protocol_round_measurement_events(sqcka_protocol_round)
+
+        # Emit the Event about the end of the given Round of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        self.emit_protocol_round_finished_event(sqcka_protocol_round)
+
+    # Emit the Events about the SWAP Test of a CTRL (Reflect) Round of the Protocol, already executed,
+    # to the default Event Log (i.e., the estimation of the overlap between the Multipartite Entanglement
+    # reflected back and a fresh copy of it, with the possible Detection of Eavesdropping)
+    def emit_protocol_round_swap_test_events(self, sqcka_protocol_ctrl_round):
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # Retrieve the default Event Log, to which the Events of the SWAP Test are emitted
+        protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # Retrieve the estimation of the (squared) overlap of the SWAP Test of the given CTRL (Reflect) Round
+        swap_test_overlap = sqcka_protocol_ctrl_round.get_round_results()
+
+        # Set the boolean flag about if the Multipartite Entanglement reflected back is identical to
+        # the fresh copy of it (i.e., if the Ancilla Qubit was never measured as 1, in all the Shots)
+        is_expected = (swap_test_overlap == 1)
+
+        # Emit the Event about the SWAP Test of the Multipartite Entanglement State reflected back,
+        # sent back from the Semi-Quantum Party Entities to the Distributor Party Entity
+        protocol_event_log.emit(ENTANGLEMENT_MEASURED, sqcka_protocol_ctrl_round.get_num_round(),
+                                "{party_name} (Distributor Party Entity) compared "
+                                "the Multipartite Entanglement State ({quantum_entanglement_type}) "
+                                "reflected back,\nwith a fresh copy of it, by a SWAP Test, and it estimated "
+                                "the overlap:\n- {round_results:.4f} ({expected_description})",
+                                party_name=qiskit_sqcka_protocol.get_distributor_party_entity()
+                                .get_party_user_client().get_user_client_name(),
+                                quantum_entanglement_type=qiskit_sqcka_protocol.get_parameters()
+                                .get_quantum_entanglement_type(),
+                                round_results=swap_test_overlap,
+                                expected_description=("OK, as expected" if is_expected else "NOT OK, not expected"),
+                                is_expected=is_expected)
+
+        # If the Multipartite Entanglement reflected back is not identical to the fresh copy of it
+        if not is_expected:
+
+            # Emit the Event about the Detection of Eavesdropping
+            protocol_event_log.emit(EAVESDROPPING_ALERT, sqcka_protocol_ctrl_round.get_num_round(),
+                                    "ALERT: Eavesdropping detected!!!", round_results=swap_test_overlap)
+
+    # Retrieve the String representation of the Ket Notation of the Quantum State for
+    # a prepared Multipartite Entanglement of a Round of the Protocol, according to the Diagnostics Level
+    # (i.e., None, if the Diagnostics are disabled or the String representation is not available)
+    # NOTE: The Multipartite Entanglement prepared is the same for every Round, and thus, for the Basic Diagnostics,
+    #       its String representation is computed only once, for each type of Quantum Entanglement and
+    #       number of Parties, from its known structure, avoiding the simulation of the State Vector of
+    #       all the (3n - 2) Qubits of the Quantum Circuit, on every Round
+    def get_prepared_quantum_entanglement_string_representation(self, sqcka_protocol_round):
+
+        # Retrieve the Parameters of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_parameters = self.get_qiskit_sqcka_protocol().get_parameters()
+
+        # Retrieve the type of the Diagnostics Level for the Rounds of the Protocol
+        diagnostics_level_type = qiskit_sqcka_protocol_parameters.get_diagnostics_level_type()
+
+        # Retrieve the boolean flag about if the Quantum Circuits are executed on
+        # the QASM Simulator of the IBM Qiskit's Aer (i.e., if the State Vectors are available)
+        is_state_vector_available = (qiskit_sqcka_protocol_parameters.get_quantum_simulator_type() ==
+                                     QuantumSimulatorTypes.AER_QASM_SIMULATOR)
+
+        # If the Diagnostics are disabled
+        if diagnostics_level_type == SemiQuantumCryptographyProtocolDiagnosticsLevelTypes.NO_DIAGNOSTICS:
+
+            # Return None, since the String representation is not required
+            return None
+
+        # If the State Vector Diagnostics are enabled and the State Vectors are available
+        if (diagnostics_level_type == SemiQuantumCryptographyProtocolDiagnosticsLevelTypes
+                .STATE_VECTOR_DIAGNOSTICS) and is_state_vector_available:
+
+            # Compute and return the String representation, from the State Vector of the current Round
+            return self.compute_prepared_quantum_entanglement_string_representation(sqcka_protocol_round)
 
-                # For each coefficient of the State Vector of
+        # Retrieve the type of the Quantum Entanglement intended for the Protocol
+        quantum_entanglement_type = qiskit_sqcka_protocol_parameters.get_quantum_entanglement_type()
+
+        # Retrieve the number of Parties involved in the Protocol
+        num_parties = qiskit_sqcka_protocol_parameters.get_num_parties()
+
+        # Build the key of the String representation in the Cache,
+        # from the type of Quantum Entanglement and the number of Parties
+        prepared_quantum_entanglement_string_representation_key = (quantum_entanglement_type, num_parties)
+
+        # If the String representation was not computed yet, for the given key
+        if prepared_quantum_entanglement_string_representation_key not in \
+                self.prepared_quantum_entanglement_string_representations:
+
+            # Compute the valid Quantum States in a Binary format, from the known structure of
+            # the Multipartite Entanglement (i.e., None, if its structure is not known)
+            valid_quantum_states_binary_prepared_quantum_entanglement = \
+                self.compute_known_quantum_entanglement_valid_quantum_states_binary(quantum_entanglement_type,
+                                                                                   num_parties)
+
+            # If the structure of the Multipartite Entanglement is known
+            if valid_quantum_states_binary_prepared_quantum_entanglement is not None:
+
+                # Build the String representation, from the known valid Quantum States in a Binary format
+                prepared_quantum_entanglement_string_representation = \
+                    self.build_quantum_entanglement_string_representation(
+                        valid_quantum_states_binary_prepared_quantum_entanglement
+                    )
+
+            # If the structure of the Multipartite Entanglement is not known, but the State Vectors are available
+            elif is_state_vector_available:
+
+                # Compute the String representation, only once, from the State Vector of the current Round
+                prepared_quantum_entanglement_string_representation = \
+                    self.compute_prepared_quantum_entanglement_string_representation(sqcka_protocol_round)
+
+            # If the structure of the Multipartite Entanglement is not known and the State Vectors are not available
+            else:
+
+                # The String representation is not available
+                prepared_quantum_entanglement_string_representation = None
+
+            # Store the String representation in the Cache, for the given key
+            self.prepared_quantum_entanglement_string_representations[
+                prepared_quantum_entanglement_string_representation_key
+            ] = prepared_quantum_entanglement_string_representation
+
+        # Return the String representation, from the Cache, for the given key
+        return self.prepared_quantum_entanglement_string_representations[
+            prepared_quantum_entanglement_string_representation_key
+        ]
+
+    # Compute the valid Quantum States in a Binary format, for a Multipartite Entanglement,
+    # from its known structure, for a given number of Parties (i.e., None, if its structure is not known)
+    # NOTE: The Qubit #0 is the rightmost bit of each valid Quantum State, as in the State Vectors of IBM Qiskit
+    @staticmethod
+    def compute_known_quantum_entanglement_valid_quantum_states_binary(quantum_entanglement_type, num_parties):
+
+        # If the Multipartite Entanglement is a GHZ State
+        # (i.e., |Ψ⟩ = 1/sqrt(2) × (|00...0⟩ + |11...1⟩))
+        if quantum_entanglement_type.upper() == GHZ_STATE:
+
+            # Return the only two valid Quantum States of the GHZ State
+            return [("0" * num_parties), ("1" * num_parties)]
+
+        # If the Multipartite Entanglement is a W State
+        # (i.e., |Ψ⟩ = 1/sqrt(n) × (|00...1⟩ + |00...10⟩ + ... + |10...0⟩))
+        if quantum_entanglement_type.upper() == W_STATE:
+
+            # Return the valid Quantum States of the W State, with only one Qubit in the state |1⟩,
+            # sorted by the index of their coefficient in the State Vector
+            return [(("0" * (num_parties - num_qubit - 1)) + "1" + ("0" * num_qubit))
+                    for num_qubit in range(num_parties)]
+
+        # Return None, since the structure of the Multipartite Entanglement is not known
+        return None
+
+    # Compute the String representation of the Ket Notation of the Quantum State for
+    # a prepared Multipartite Entanglement of a Round of the Protocol, from its State Vector
+    def compute_prepared_quantum_entanglement_string_representation(self, sqcka_protocol_round):
+
+        # Retrieve the Quantum Circuit for the previously
+        # prepared Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        quantum_entanglement_quantum_circuit = \
+            sqcka_protocol_round.get_qiskit_quantum_circuit()
+
+        # Execute the Quantum Circuit on the State Vector Simulator of the default Simulator Session
+        # and store the Quantum State in a final state vector
+        final_state_vector = QiskitSimulatorSession.QiskitSimulatorSession \
+            .get_default_qiskit_simulator_session() \
+            .compute_state_vector(quantum_entanglement_quantum_circuit.quantum_circuit)
+
+        # Initialise the list for the valid Quantum States of
+        # the previously prepared Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        valid_quantum_states_binary_prepared_quantum_entanglement = []
+
+        # Retrieve the list of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_party_entities = self.get_protocol_party_entities()
+
+        # Retrieve the number of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        num_protocol_party_entities = len(protocol_party_entities)
+
+        # Build the required Binary format for the possible valid Quantum States of
+        # the previously prepared Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        binary_format = "{0:0"
+        binary_format += "{}".format(num_protocol_party_entities)
+        binary_format += "b}"
+
+        # For each coefficient of the State Vector of
+        # the previously prepared Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_coefficient_state_vector_index in range(len(final_state_vector)):
+
+            # If the current coefficient of the State Vector of
+            # the previously prepared Multipartite Entanglement of the Round for
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, is a valid one
+            if final_state_vector[current_coefficient_state_vector_index] != (0 + 0.0j):
+
+                # Convert the current valid Quantum State of
                 # the previously prepared Multipartite Entanglement of the Round for
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                for current_coefficient_state_vector_index in range(len(final_state_vector)):
-
-                    # If the current coefficient of the State Vector of
-                    # the previously prepared Multipartite Entanglement of the Round for
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, is a valid one
-                    if final_state_vector[current_coefficient_state_vector_index] != (0 + 0.0j):
-
-                        # Convert the current valid Quantum State of
-                        # the previously prepared Multipartite Entanglement of the Round for
-                        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                        # to a Binary format
-                        current_valid_quantum_state_prepared_quantum_entanglement_binary = \
-                            binary_format.format(current_coefficient_state_vector_index)
-
-                        # Append the current valid Quantum State of
-                        # the previously prepared Multipartite Entanglement of the Round for
-                        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                        # in a Binary format, to the list of valid ones
-                        valid_quantum_states_binary_prepared_quantum_entanglement\
-                            .append(current_valid_quantum_state_prepared_quantum_entanglement_binary)
-
-                # Initialise the String representation of the Ket Notation of
-                # the Quantum State for the previously prepared Multipartite Entanglement of
-                # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                prepared_quantum_entanglement_string_representation = "|Ψ⟩ = "
-
-                # Retrieve the number of the valid Quantum States of
+                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # to a Binary format
+                current_valid_quantum_state_prepared_quantum_entanglement_binary = \
+                    binary_format.format(current_coefficient_state_vector_index)
+
+                # Append the current valid Quantum State of
                 # the previously prepared Multipartite Entanglement of the Round for
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                num_valid_quantum_states_prepared_quantum_entanglement = \
-                    len(valid_quantum_states_binary_prepared_quantum_entanglement)
+                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # in a Binary format, to the list of valid ones
+                valid_quantum_states_binary_prepared_quantum_entanglement\
+                    .append(current_valid_quantum_state_prepared_quantum_entanglement_binary)
+
+        # Build and return the String representation of the Ket Notation of
+        # the Quantum State for the previously prepared Multipartite Entanglement of
+        # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # from its valid Quantum States in a Binary format
+        return self.build_quantum_entanglement_string_representation(
+            valid_quantum_states_binary_prepared_quantum_entanglement
+        )
+
+    # Build the String representation of the Ket Notation of the Quantum State for
+    # a prepared Multipartite Entanglement, from its valid Quantum States in a Binary format
+    @staticmethod
+    def build_quantum_entanglement_string_representation(valid_quantum_states_binary_prepared_quantum_entanglement):
+
+        # Initialise the String representation of the Ket Notation of
+        # the Quantum State for the previously prepared Multipartite Entanglement of
+        # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        prepared_quantum_entanglement_string_representation = "|Ψ⟩ = "
+
+        # Retrieve the number of the valid Quantum States of
+        # the previously prepared Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        num_valid_quantum_states_prepared_quantum_entanglement = \
+            len(valid_quantum_states_binary_prepared_quantum_entanglement)
+
+        # If there is only one valid Quantum States of
+        # the previously prepared Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        if num_valid_quantum_states_prepared_quantum_entanglement > 1:
+
+            # Append the coefficient of the Multipartite Entanglement to
+            # the String representation of the Ket Notation of
+            # the Quantum State for the previously prepared Multipartite Entanglement of
+            # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            prepared_quantum_entanglement_string_representation += \
+                "1/sqrt({}) × (".format(num_valid_quantum_states_prepared_quantum_entanglement)
+
+        # For each valid Quantum State in a Binary format of
+        # the previously prepared Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_num_valid_quantum_state_binary_prepared_quantum_entanglement in \
+                range(num_valid_quantum_states_prepared_quantum_entanglement):
+
+            # Append the current valid Quantum State in a Binary format to
+            # the String representation of the Ket Notation of
+            # the Quantum State for the previously prepared Multipartite Entanglement of
+            # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            prepared_quantum_entanglement_string_representation += \
+                "|{}⟩".format(valid_quantum_states_binary_prepared_quantum_entanglement[
+                                 current_num_valid_quantum_state_binary_prepared_quantum_entanglement])
+
+            # If there is more than one valid Quantum State in a Binary format of
+            # the previously prepared Multipartite Entanglement of the Round for
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            if num_valid_quantum_states_prepared_quantum_entanglement > 1:
 
-                # If there is only one valid Quantum States of
+                # If it is the last valid Quantum State in a Binary format of
                 # the previously prepared Multipartite Entanglement of the Round for
                 # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                if num_valid_quantum_states_prepared_quantum_entanglement > 1:
+                if (current_num_valid_quantum_state_binary_prepared_quantum_entanglement ==
+                   (num_valid_quantum_states_prepared_quantum_entanglement - 1)):
 
-                    # Append the coefficient of the Multipartite Entanglement to
-                    # the String representation of the Ket Notation of
+                    # Append the last right parenthesis to the String representation of the Ket Notation of
                     # the Quantum State for the previously prepared Multipartite Entanglement of
                     # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    prepared_quantum_entanglement_string_representation += \
-                        "1/sqrt({}) × (".format(num_valid_quantum_states_prepared_quantum_entanglement)
+                    prepared_quantum_entanglement_string_representation += ")"
 
-                # For each valid Quantum State in a Binary format of
+                # If it is not the last valid Quantum State in a Binary format of
                 # the previously prepared Multipartite Entanglement of the Round for
                 # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                for current_num_valid_quantum_state_binary_prepared_quantum_entanglement in \
-                        range(num_valid_quantum_states_prepared_quantum_entanglement):
+                else:
 
-                    # Append the current valid Quantum State in a Binary format to
-                    # the String representation of the Ket Notation of
+                    # Append the sum symbol to the String representation of the Ket Notation of
                     # the Quantum State for the previously prepared Multipartite Entanglement of
                     # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    prepared_quantum_entanglement_string_representation += \
-                        "|{}⟩".format(valid_quantum_states_binary_prepared_quantum_entanglement[
-                                         current_num_valid_quantum_state_binary_prepared_quantum_entanglement])
-
-                    # If there is more than one valid Quantum State in a Binary format of
-                    # the previously prepared Multipartite Entanglement of the Round for
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    if num_valid_quantum_states_prepared_quantum_entanglement > 1:
-
-                        # If it is the last valid Quantum State in a Binary format of
-                        # the previously prepared Multipartite Entanglement of the Round for
-                        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        if (current_num_valid_quantum_state_binary_prepared_quantum_entanglement ==
-                           (num_valid_quantum_states_prepared_quantum_entanglement - 1)):
-
-                            # Append the last right parenthesis to the String representation of the Ket Notation of
-                            # the Quantum State for the previously prepared Multipartite Entanglement of
-                            # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                            prepared_quantum_entanglement_string_representation += ")"
-
-                        # If it is not the last valid Quantum State in a Binary format of
-                        # the previously prepared Multipartite Entanglement of the Round for
-                        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        else:
-
-                            # Append the sum symbol to the String representation of the Ket Notation of
-                            # the Quantum State for the previously prepared Multipartite Entanglement of
-                            # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                            prepared_quantum_entanglement_string_representation += " + "
-
-                # Print the information about the previously prepared
-                # Multipartite Entanglement, by the Distributor Party Entity,
-                # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                print("{} (Distributor Party Entity) prepared the Multipartite Entanglement State ({}):\n- {}"
-                      .format(qiskit_sqcka_protocol_distributor_party_entity
-                              .get_party_user_client().get_user_client_name(),
-                              qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type(),
-                              prepared_quantum_entanglement_string_representation))
-
-                # Prepare the Multipartite Entanglement of the Round for
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+                    prepared_quantum_entanglement_string_representation += " + "
+
+        # Return the String representation of the Ket Notation of
+        # the Quantum State for the previously prepared Multipartite Entanglement of
+        # the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        return prepared_quantum_entanglement_string_representation
+
+    # Execute a batch of Rounds of the Protocol, building all their Quantum Circuits first and,
+    # then, submitting all of them to the Simulator, as one single Job
+    # NOTE: The Rounds executed are the ones from the first number of Round given (inclusive),
+    #       to the last number of Round given (exclusive)
+    def execute_protocol_rounds_in_batch(self, first_num_round, last_num_round):
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # Derive the Seeds of the Jobs of the current batch of Rounds, from its first Round
+        QiskitSimulatorSession.QiskitSimulatorSession.get_default_qiskit_simulator_session() \
+            .derive_seeds_simulator_for_round(first_num_round)
+
+        # Retrieve the number of Parties involved in
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_num_parties = qiskit_sqcka_protocol.get_parameters().get_num_parties()
+
+        # Retrieve the type of the Quantum Entanglement intended for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_entanglement_type = \
+            qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()
+
+        # Retrieve the Strategy for Eavesdropping Detection intended for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_strategy_for_eavesdropping_detection = \
+            qiskit_sqcka_protocol.get_parameters().get_strategy_for_eavesdropping_detection()
+
+        # Retrieve the type of the Quantum Simulator intended for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_quantum_simulator_type = \
+            qiskit_sqcka_protocol.get_parameters().get_quantum_simulator_type()
+
+        # Retrieve the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_entity = \
+            qiskit_sqcka_protocol.get_distributor_party_entity()
+
+        # Retrieve the Cache of the Templates of the Quantum Circuits of the Rounds
+        qiskit_sqcka_protocol_round_quantum_circuit_templates_cache = \
+            self.get_qiskit_sqcka_protocol_round_quantum_circuit_templates_cache()
+
+        # Initialise the list of the Rounds of the current batch
+        sqcka_protocol_rounds = []
+
+        # Initialise the list of the Quantum Circuits of the Rounds of the current batch,
+        # to be executed, as one single Job, on the Simulator
+        quantum_circuits_to_execute = []
+
+        # Initialise the list of the Rounds of the current batch, whose Quantum Circuits are executed in that Job
+        # (i.e., all the Rounds, except the CTRL (Reflect) Rounds with a SWAP Test, which are executed later)
+        sqcka_protocol_rounds_to_execute = []
+
+        # Initialise the list of the SIFT (Measure and Resend) Rounds of the current batch,
+        # which were built from scratch, and thus, whose Quantum Circuits need to be completed after the Job
+        sqcka_protocol_sift_rounds_to_complete = []
+
+        # For each Round of the current batch
+        for num_round in range(first_num_round, last_num_round):
+
+            # Build the key of the Template of the Quantum Circuit of the current Round
+            quantum_circuit_template_key = qiskit_sqcka_protocol_round_quantum_circuit_templates_cache \
+                .build_quantum_circuit_template_key(qiskit_sqcka_protocol_num_parties,
+                                                    qiskit_sqcka_protocol_entanglement_type,
+                                                    qiskit_sqcka_protocol_distributor_party_entity
+                                                    .get_protocol_round_type_id(num_round),
+                                                    qiskit_sqcka_protocol_strategy_for_eavesdropping_detection,
+                                                    qiskit_sqcka_protocol_quantum_simulator_type)
+
+            # If the Template of the Quantum Circuit of the current Round is already cached
+            if qiskit_sqcka_protocol_round_quantum_circuit_templates_cache \
+                    .has_quantum_circuit_template(quantum_circuit_template_key):
+
+                # Retrieve the cached Template of the Quantum Circuit of the current Round
+                qiskit_quantum_circuit_template = qiskit_sqcka_protocol_round_quantum_circuit_templates_cache \
+                    .get_qiskit_quantum_circuit_template(quantum_circuit_template_key)
+
+                # Create the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # with the cached Template of the Quantum Circuit, instead of building it again
                 sqcka_protocol_round = \
                     qiskit_sqcka_protocol_distributor_party_entity \
-                    .send_quantum_data_information_to_semi_quantum_party_entities(qiskit_sqcka_protocol_num_parties,
-                                                                                  sqcka_protocol_round)
+                    .create_protocol_round(num_round,
+                                           self.get_num_qubits_and_bits_for_protocol_round_quantum_circuit(num_round),
+                                           qiskit_quantum_circuit=qiskit_quantum_circuit_template)
 
-                # Print a blank line
-                print("\n")
+            # If the Template of the Quantum Circuit of the current Round is not cached yet
+            else:
 
-                # Print the information about the previously prepared
-                # Multipartite Entanglement, by the Distributor Party Entity,
-                # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                print("{} (Distributor Party Entity) send the Multipartite Entanglement State ({}),"
-                      "\nto the respective Semi-Quantum Party Entities..."
-                      .format(qiskit_sqcka_protocol_distributor_party_entity
-                              .get_party_user_client().get_user_client_name(),
-                              qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()))
+                # Build the Quantum Circuit of the current Round, up to its Measurement
+                sqcka_protocol_round = self.build_protocol_round_quantum_circuit_in_batch(num_round)
 
-                # For each Party Entity of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                for current_num_protocol_party_entity in range(num_protocol_party_entities):
+                # Add the Template of the Quantum Circuit of the current Round, to the Cache
+                qiskit_sqcka_protocol_round_quantum_circuit_templates_cache \
+                    .add_quantum_circuit_template(quantum_circuit_template_key,
+                                                  sqcka_protocol_round.get_qiskit_quantum_circuit())
 
-                    # Retrieve the current Party Entity of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    current_protocol_party_entity = protocol_party_entities[current_num_protocol_party_entity]
+                # If the current Round is a Measure and Resend (SIFT Operation) Round,
+                # not executed as a Dynamic Quantum Circuit (i.e., already completed, otherwise)
+                if (sqcka_protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3) and \
+                        (not qiskit_sqcka_protocol.get_parameters().get_dynamic_circuits_flag()):
 
-                    # If the current Party Entity of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    # is not the Distributor Party Entity
-                    if not current_protocol_party_entity.is_distributor():
-
-                        # Receive the Quantum Data/Information from the current Party Entity of
-                        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        sqcka_protocol_round = \
-                            current_protocol_party_entity\
-                            .receive_quantum_data_information_from_distributor(num_protocol_party_entities,
-                                                                               sqcka_protocol_round)
-
-                        # Print a blank line
-                        print("\n")
-
-                        # Print the information about the previously prepared
-                        # Multipartite Entanglement, by the Distributor Party Entity,
-                        # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        print("{} (Semi-Quantum Party Entity) received its Qubit (Particle) from"
-                              "\nthe Multipartite Entanglement State ({}), from the Distributor Party Entity..."
-                              .format(current_protocol_party_entity
-                                      .get_party_user_client().get_user_client_name(),
-                                      qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()))
-
-                # Print a blank line
-                print("\n")
-
-                # For each Party Entity of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                for current_num_protocol_party_entity in range(num_protocol_party_entities):
-
-                    # Retrieve the current Party Entity of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    current_protocol_party_entity = protocol_party_entities[current_num_protocol_party_entity]
+                    # Append the current Round to the list of the SIFT (Measure and Resend) Rounds to complete
+                    sqcka_protocol_sift_rounds_to_complete.append(sqcka_protocol_round)
 
-                    # If the current Party Entity of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    # is not the Distributor Party Entity
-                    if not current_protocol_party_entity.is_distributor():
-
-                        # The current Party Entity Measure and Resend (SIFT Operation)
-                        # or just Reflect (CTRL Operation) the Particle (Qubit),
-                        # accordingly to the respective Bit of the Pre-Shared Key
-                        sqcka_protocol_round = \
-                            current_protocol_party_entity\
-                            .measure_and_resend_or_reflect_qubit(num_protocol_party_entities,
-                                                                 sqcka_protocol_round)
-
-                # Execute the Quantum Circuit of the current Round of
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                # for the case of it, being a Measure and Resend (SIFT Operation) Round
-                sqcka_protocol_round = \
-                    qiskit_sqcka_protocol_distributor_party_entity\
-                    .execute_protocol_round_quantum_circuit_for_sift_rounds(num_protocol_party_entities,
-                                                                            sqcka_protocol_round)
+            # Retrieve the Template of the Quantum Circuit of the current Round, ready to be executed
+            quantum_circuit_template_to_execute = qiskit_sqcka_protocol_round_quantum_circuit_templates_cache \
+                .get_quantum_circuit_template_to_execute(quantum_circuit_template_key)
 
-                # Retrieve the Results of the execution of the Quantum Circuit of the current Round of
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                # for the the case of it, being a Measure and Resend (SIFT Operation) Round
-                sqcka_protocol_round_results = sqcka_protocol_round.get_round_results()
+            # If the current Round is a Reflect (CTRL) Round and
+            # the Strategy for Eavesdropping Detection is a SWAP Test
+            if (sqcka_protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3) and \
+                    (qiskit_sqcka_protocol_strategy_for_eavesdropping_detection ==
+                     StrategiesForEavesdroppingDetection.SWAP_TEST):
 
-                # If the results of the current Round of
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol are not None,
-                # and the current Round is a Measure and Resend (SIFT Operation) Round
-                if (sqcka_protocol_round_results is not None) and \
-                        (sqcka_protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3):
+                # Add the SWAP Test of the current Round to the pending ones,
+                # in order to be executed with all the other ones, after all the Rounds
+                self.qiskit_sqcka_protocol_pending_swap_tests.append((sqcka_protocol_round,
+                                                                      quantum_circuit_template_to_execute))
 
-                    # Print the Information about the obtained correlated state of
-                    # the Measurement on the Multipartite Entanglement used
-                    print("It was obtained the result: |{}⟩...".format(sqcka_protocol_round_results))
+            # If the current Round is not a Reflect (CTRL) Round with a SWAP Test
+            else:
 
-                    # Print a blank line
-                    print("\n")
+                # Append the Template of the Quantum Circuit of the current Round, ready to be executed
+                quantum_circuits_to_execute.append(quantum_circuit_template_to_execute)
 
-                # Reset the Qubits (Particles) on the Quantum Circuit of the current Round of
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                # for the the case of it, being a Measure and Resend (SIFT Operation) Round
-                sqcka_protocol_round = \
-                    qiskit_sqcka_protocol_distributor_party_entity\
-                    .reset_qubits_to_resend_for_sift_rounds(sqcka_protocol_round)
+                # Append the current Round to the list of the Rounds of the current batch, to be executed
+                sqcka_protocol_rounds_to_execute.append(sqcka_protocol_round)
 
-                # For each Party Entity of
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                for current_num_protocol_party_entity in range(num_protocol_party_entities):
+            # Append the current Round to the list of the Rounds of the current batch
+            sqcka_protocol_rounds.append(sqcka_protocol_round)
 
-                    # Retrieve the current Party Entity of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    current_protocol_party_entity = protocol_party_entities[current_num_protocol_party_entity]
+        # If the Rounds are meant to be chained in one single Quantum Circuit, separated by Resets
+        if qiskit_sqcka_protocol.get_parameters().get_execution_mode_type() == \
+                SemiQuantumCryptographyProtocolExecutionModeTypes.CHAINED_EXECUTION:
 
-                    # Prepare the Qubits (Particles) on the Quantum Circuit of the current Round of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                    # for the the case of it, being a Measure and Resend (SIFT Operation) Round,
-                    # in order to be sent back in the same state it were found, after the Measurement
-                    sqcka_protocol_round = \
-                        current_protocol_party_entity\
-                        .prepare_qubits_to_be_sent_back_for_sift_rounds(num_protocol_party_entities,
-                                                                        sqcka_protocol_round)
-
-                # For each Party Entity of
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                for current_num_protocol_party_entity in range(num_protocol_party_entities):
+            # Execute all the Quantum Circuits of the Rounds of the current batch,
+            # chained in one single Quantum Circuit, as one single Job, with one single Shot, and save their Results
+            self.execute_protocol_rounds_quantum_circuits_chained(quantum_circuits_to_execute,
+                                                                  sqcka_protocol_rounds_to_execute,
+                                                                  is_transpiled=True)
 
-                    # Retrieve the current Party Entity of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    current_protocol_party_entity = protocol_party_entities[current_num_protocol_party_entity]
+        # If the Rounds sharing the same Quantum Circuit are meant to be multiplexed in its Shots
+        elif qiskit_sqcka_protocol.get_parameters().get_execution_mode_type() == \
+                SemiQuantumCryptographyProtocolExecutionModeTypes.MULTIPLEXED_EXECUTION:
 
-                    # If the current Party Entity of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    # is not the Distributor Party Entity
-                    if not current_protocol_party_entity.is_distributor():
-
-                        # The current Party Entity of
-                        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
-                        # not being the Distributor Party Entity, send back the Qubits (Particles),
-                        # to the Distributor Party Entity
-                        sqcka_protocol_round = \
-                            current_protocol_party_entity\
-                            .send_back_quantum_data_information_to_distributor_party_entity(
-                                num_protocol_party_entities, sqcka_protocol_round)
-
-                        # If the current Round of
-                        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        # is a Measure and Resend (SIFT Operation) Round
-                        if sqcka_protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3:
-
-                            # Print the information about the previously prepared
-                            # Multipartite Entanglement, by the Distributor Party Entity,
-                            # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                            print("{} (Semi-Quantum Party Entity) sent back its recreated measured Qubit (Particle) of\n"
-                                  "the Multipartite Entanglement State ({}), to the respective Distributor Party Entity..."
-                                  .format(current_protocol_party_entity.get_party_user_client().get_user_client_name(),
-                                          qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()))
-
-                        # If the current Round of
-                        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        # is a Reflect (CTRL Operation) Round
-                        elif sqcka_protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
-
-                            # Print the information about the previously prepared
-                            # Multipartite Entanglement, by the Distributor Party Entity,
-                            # of the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                            print("{} (Semi-Quantum Party Entity) sent back its unmeasured Qubit (Particle) of\n"
-                                  "the Multipartite Entanglement State ({}), to the Distributor Party Entity..."
-                                  .format(current_protocol_party_entity.get_party_user_client().get_user_client_name(),
-                                          qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()))
-
-                        # Print a blank line
-                        print("\n")
-
-                # The Distributor Party Entity of
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                # receives back the Quantum Data/Information sent from the other Semi-Quantum Party Entities
+            # Execute each distinct Quantum Circuit of the Rounds of the current batch, only once,
+            # with one Shot for each Round sharing it, and save their Results
+            self.execute_protocol_rounds_quantum_circuits_multiplexed(quantum_circuits_to_execute,
+                                                                      sqcka_protocol_rounds_to_execute,
+                                                                      is_transpiled=True)
+
+        # If the Quantum Circuits of the Rounds are meant to be executed, as a batch of Quantum Circuits
+        else:
+
+            # Execute all the Quantum Circuits of the Rounds of the current batch,
+            # as one single Job, and save their Results
+            self.execute_protocol_rounds_quantum_circuits_in_batch(quantum_circuits_to_execute,
+                                                                   sqcka_protocol_rounds_to_execute,
+                                                                   is_transpiled=True)
+
+        # For each SIFT (Measure and Resend) Round of the current batch, which was built from scratch
+        for sqcka_protocol_round in sqcka_protocol_sift_rounds_to_complete:
+
+            # Complete the Quantum Circuit of the current Round, resending the Qubits (Particles) measured
+            # NOTE: This does not change the Results of the Round, since they were already measured
+            self.complete_protocol_round_quantum_circuit_in_batch(sqcka_protocol_round)
+
+        # For each Round of the current batch
+        for sqcka_protocol_round in sqcka_protocol_rounds:
+
+            # Emit the Events about the start, the Measurement and the end of the current Round of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            self.emit_protocol_round_events(sqcka_protocol_round)
+
+            # Add the current Round to the list of the Rounds of
+            # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            qiskit_sqcka_protocol.add_protocol_round(sqcka_protocol_round)
+
+        # Return the list of the Rounds of the current batch
+        return sqcka_protocol_rounds
+
+    # Build the Quantum Circuit of a Round of the Protocol, for a Batched Execution, up to its Measurement,
+    # without executing it (i.e., the Measurement in the Z-Basis (Computational Basis), for the SIFT Rounds,
+    # and the Measurement of the Qubits reflected back, for the CTRL Rounds)
+    def build_protocol_round_quantum_circuit_in_batch(self, num_round):
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # Retrieve the number of Parties involved in
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_num_parties = qiskit_sqcka_protocol.get_parameters().get_num_parties()
+
+        # Retrieve the type of the Quantum Entanglement intended for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_entanglement_type = \
+            qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()
+
+        # Set the number of Qubits required for the Quantum Circuit,
+        # for the current Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        num_qubits_and_bits_for_protocol_round_quantum_circuit = \
+            self.get_num_qubits_and_bits_for_protocol_round_quantum_circuit(num_round)
+
+        # Retrieve the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_entity = \
+            qiskit_sqcka_protocol.get_distributor_party_entity()
+
+        # Retrieve the list of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_party_entities = self.get_protocol_party_entities()
+
+        # Retrieve the number of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        num_protocol_party_entities = len(protocol_party_entities)
+
+        # Create the Round for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .create_protocol_round(num_round, num_qubits_and_bits_for_protocol_round_quantum_circuit)
+
+        # Prepare the Multipartite Entanglement of the Round for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .prepare_quantum_entanglement(qiskit_sqcka_protocol_entanglement_type,
+                                          qiskit_sqcka_protocol_num_parties, sqcka_protocol_round)
+
+        # Send the Multipartite Entanglement of the Round to the Semi-Quantum Party Entities
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .send_quantum_data_information_to_semi_quantum_party_entities(qiskit_sqcka_protocol_num_parties,
+                                                                          sqcka_protocol_round)
+
+        # For each Party Entity of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_protocol_party_entity in protocol_party_entities:
+
+            # If the current Party Entity is not the Distributor Party Entity
+            if not current_protocol_party_entity.is_distributor():
+
+                # Receive the Quantum Data/Information from the Distributor Party Entity
                 sqcka_protocol_round = \
-                    qiskit_sqcka_protocol_distributor_party_entity \
-                    .receive_back_quantum_data_information_from_semi_quantum_party_entities(
+                    current_protocol_party_entity \
+                    .receive_quantum_data_information_from_distributor(num_protocol_party_entities,
+                                                                       sqcka_protocol_round)
+
+        # For each Party Entity of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_protocol_party_entity in protocol_party_entities:
+
+            # If the current Party Entity is not the Distributor Party Entity
+            if not current_protocol_party_entity.is_distributor():
+
+                # The current Party Entity Measure and Resend (SIFT Operation)
+                # or just Reflect (CTRL Operation) the Particle (Qubit),
+                # accordingly to the respective Bit of the Pre-Shared Key
+                sqcka_protocol_round = \
+                    current_protocol_party_entity \
+                    .measure_and_resend_or_reflect_qubit(num_protocol_party_entities, sqcka_protocol_round)
+
+        # Prepare the final Measurement of the Quantum Circuit of the current Round,
+        # for the case of it, being a Measure and Resend (SIFT Operation) Round, without executing it
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .execute_protocol_round_quantum_circuit_for_sift_rounds(num_protocol_party_entities,
+                                                                    sqcka_protocol_round,
+                                                                    execute_quantum_circuit=False)
+
+        # If the current Round is a Reflect (CTRL Operation) Round, or the Rounds are executed as
+        # Dynamic Quantum Circuits (i.e., the resending of the Qubits is classically conditioned on their Measurement)
+        if (sqcka_protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3) or \
+                qiskit_sqcka_protocol.get_parameters().get_dynamic_circuits_flag():
+
+            # Complete the Quantum Circuit of the current Round, up to the Measurement of the Qubits reflected back,
+            # since it does not depend on the Results of any previous Measurement
+            sqcka_protocol_round = self.complete_protocol_round_quantum_circuit_in_batch(sqcka_protocol_round)
+
+        # Return the Round, with its Quantum Circuit built up to its Measurement
+        return sqcka_protocol_round
+
+    # Complete the Quantum Circuit of a Round of the Protocol, for a Batched Execution, without executing it
+    # (i.e., resending or reflecting the Qubits (Particles) back to the Distributor Party Entity and,
+    # for the CTRL Rounds, preparing the Measurement of the Qubits reflected back)
+    def complete_protocol_round_quantum_circuit_in_batch(self, sqcka_protocol_round):
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # Retrieve the type of the Quantum Entanglement intended for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_entanglement_type = \
+            qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()
+
+        # Retrieve the Strategy for Eavesdropping Detection intended for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_strategy_for_eavesdropping_detection = \
+            qiskit_sqcka_protocol.get_parameters().get_strategy_for_eavesdropping_detection()
+
+        # Retrieve the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_entity = \
+            qiskit_sqcka_protocol.get_distributor_party_entity()
+
+        # Retrieve the list of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_party_entities = self.get_protocol_party_entities()
+
+        # Retrieve the number of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        num_protocol_party_entities = len(protocol_party_entities)
+
+        # Reset the Qubits (Particles) on the Quantum Circuit of the current Round,
+        # for the the case of it, being a Measure and Resend (SIFT Operation) Round
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .reset_qubits_to_resend_for_sift_rounds(sqcka_protocol_round)
+
+        # For each Party Entity of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_protocol_party_entity in protocol_party_entities:
+
+            # Prepare the Qubits (Particles) on the Quantum Circuit of the current Round,
+            # in order to be sent back in the same state it were found, after the Measurement
+            sqcka_protocol_round = \
+                current_protocol_party_entity \
+                .prepare_qubits_to_be_sent_back_for_sift_rounds(num_protocol_party_entities,
+                                                                sqcka_protocol_round)
+
+        # For each Party Entity of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for current_protocol_party_entity in protocol_party_entities:
+
+            # If the current Party Entity is not the Distributor Party Entity
+            if not current_protocol_party_entity.is_distributor():
+
+                # Send back the Qubits (Particles), to the Distributor Party Entity
+                sqcka_protocol_round = \
+                    current_protocol_party_entity \
+                    .send_back_quantum_data_information_to_distributor_party_entity(
                         num_protocol_party_entities, sqcka_protocol_round)
 
-                # If the Strategy for Eavesdropping Detection is a Measurement by Inverting Quantum Circuit
-                if qiskit_sqcka_protocol.get_parameters().get_strategy_for_eavesdropping_detection() == \
-                        StrategiesForEavesdroppingDetection.MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT:
+        # The Distributor Party Entity receives back the Quantum Data/Information
+        # sent from the other Semi-Quantum Party Entities
+        sqcka_protocol_round = \
+            qiskit_sqcka_protocol_distributor_party_entity \
+            .receive_back_quantum_data_information_from_semi_quantum_party_entities(
+                num_protocol_party_entities, sqcka_protocol_round)
+
+        # If the Strategy for Eavesdropping Detection is a Measurement by Inverting Quantum Circuit
+        if qiskit_sqcka_protocol_strategy_for_eavesdropping_detection == \
+                StrategiesForEavesdroppingDetection.MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT:
+
+            # Prepare the inversion and the Measurement of the Quantum Circuit of the current Round,
+            # for the case of it, being a Reflect (CTRL) Round, without executing it
+            sqcka_protocol_round = \
+                qiskit_sqcka_protocol_distributor_party_entity \
+                .measure_quantum_entanglement_by_inverting_quantum_circuit(
+                    qiskit_sqcka_protocol_entanglement_type,
+                    num_protocol_party_entities, sqcka_protocol_round,
+                    execute_quantum_circuit=False)
+
+        # If the Strategy for Eavesdropping Detection is a Statistical Test
+        elif qiskit_sqcka_protocol_strategy_for_eavesdropping_detection == \
+                StrategiesForEavesdroppingDetection.STATISTICAL_TEST:
+
+            # Prepare the Measurement of the Quantum Circuit of the current Round,
+            # for the case of it, being a Reflect (CTRL) Round, without executing it
+            sqcka_protocol_round = \
+                qiskit_sqcka_protocol_distributor_party_entity \
+                .measure_quantum_data_information_for_ctrl_rounds(num_protocol_party_entities,
+                                                                  sqcka_protocol_round,
+                                                                  execute_quantum_circuit=False)
+
+        # If the Strategy for Eavesdropping Detection is a SWAP Test
+        elif qiskit_sqcka_protocol_strategy_for_eavesdropping_detection == \
+                StrategiesForEavesdroppingDetection.SWAP_TEST:
+
+            # Prepare the SWAP Test of the Quantum Circuit of the current Round,
+            # for the case of it, being a Reflect (CTRL) Round, without executing it
+            sqcka_protocol_round = \
+                qiskit_sqcka_protocol_distributor_party_entity \
+                .prepare_swap_test_for_ctrl_rounds(qiskit_sqcka_protocol_entanglement_type,
+                                                   num_protocol_party_entities, sqcka_protocol_round)
+
+        # Return the Round, with its Quantum Circuit completed
+        return sqcka_protocol_round
+
+    # Execute the given Quantum Circuits of Rounds of the Protocol, as one single Job, on the Simulator,
+    # and save the Results of the respective Rounds
+    # NOTE: The Quantum Circuits given are in the same order of the Rounds given
+    # NOTE: If the Quantum Circuits given were already transpiled, their transpilation is not repeated
+    def execute_protocol_rounds_quantum_circuits_in_batch(self, quantum_circuits_to_execute, sqcka_protocol_rounds,
+                                                          is_transpiled=False):
+
+        # If there are no Quantum Circuits to be executed
+        if len(quantum_circuits_to_execute) == 0:
+
+            # Return the Rounds, as they are
+            return sqcka_protocol_rounds
+
+        # Retrieve the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_entity = \
+            self.get_qiskit_sqcka_protocol().get_distributor_party_entity()
+
+        # Execute all the Quantum Circuits given, as one single Job, on the configured Quantum Simulator
+        batch_results = qiskit_sqcka_protocol_distributor_party_entity \
+            .execute_quantum_circuits(quantum_circuits_to_execute, is_transpiled=is_transpiled)
+
+        # Save the Results of the Rounds given, from the Measurement results of their Quantum Circuits
+        return self.save_protocol_rounds_results_in_batch(sqcka_protocol_rounds, batch_results)
+
+    # Execute the given Quantum Circuits of Rounds of the Protocol, chained in one single Quantum Circuit,
+    # on the same Qubits, separated by Resets, as one single Job, with one single Shot, on the Simulator,
+    # and save the Results of the respective Rounds, decoded from the Bits of that single Shot
+    # NOTE: The Quantum Circuits given are in the same order of the Rounds given, and they can not depend on
+    #       the Results of any previous Measurement (i.e., they should be Dynamic Quantum Circuits)
+    # NOTE: If the Quantum Circuits given were already transpiled, the chained Quantum Circuit is not transpiled again
+    def execute_protocol_rounds_quantum_circuits_chained(self, quantum_circuits_to_execute, sqcka_protocol_rounds,
+                                                         is_transpiled=False):
+
+        # If there are no Quantum Circuits to be executed
+        if len(quantum_circuits_to_execute) == 0:
+
+            # Return the Rounds, as they are
+            return sqcka_protocol_rounds
+
+        # Compute the (inclusive) indexes of the first Bits of the Quantum Circuits given, in the chained one,
+        # and the total number of Bits of the chained Quantum Circuit
+        first_bits_indexes = [0]
+        for quantum_circuit_to_execute in quantum_circuits_to_execute:
+            first_bits_indexes.append(first_bits_indexes[-1] + quantum_circuit_to_execute.num_clbits)
+
+        # Create the chained Quantum Circuit, for all the Qubits of the Quantum Circuits given,
+        # and for all the Bits of each one of them, one after the other
+        chained_quantum_circuit = \
+            QuantumCircuit(max(quantum_circuit_to_execute.num_qubits
+                               for quantum_circuit_to_execute in quantum_circuits_to_execute),
+                           first_bits_indexes[-1],
+                           name="qc_chained_rounds_{}_{}".format(sqcka_protocol_rounds[0].get_num_round(),
+                                                                 sqcka_protocol_rounds[-1].get_num_round()))
+
+        # For each Quantum Circuit given
+        for num_round_in_chain, quantum_circuit_to_execute in enumerate(quantum_circuits_to_execute):
+
+            # If it is not the Quantum Circuit of the first Round in the chain
+            if num_round_in_chain > 0:
+
+                # Reset all the Qubits, left by the Quantum Circuit of the previous Round in the chain
+                chained_quantum_circuit.reset(range(chained_quantum_circuit.num_qubits))
+
+            # Append the Quantum Circuit of the current Round, on the same Qubits, and on its own Bits
+            chained_quantum_circuit.compose(quantum_circuit_to_execute,
+                                            qubits=range(quantum_circuit_to_execute.num_qubits),
+                                            clbits=range(first_bits_indexes[num_round_in_chain],
+                                                         first_bits_indexes[num_round_in_chain + 1]),
+                                            inplace=True)
+
+        # Execute the chained Quantum Circuit, as one single Job, with one single Shot,
+        # on the configured Quantum Simulator, retrieving the Bits of that single Shot
+        # NOTE: It is necessary to invert the order of the Bits of the single Shot,
+        #       since the resulting Bits are presented and ordered,
+        #       from the most significant to the least significant one
+        chained_circuit_bits = list(self.get_qiskit_sqcka_protocol().get_distributor_party_entity()
+                                    .execute_quantum_circuits([chained_quantum_circuit],
+                                                              is_transpiled=is_transpiled)[0].keys())[0][::-1]
+
+        # Decode the Measurement results of the Quantum Circuit of each Round, from its own Bits of the single Shot,
+        # ordered again from the most significant to the least significant one, as of a single Shot of its own
+        chain_results = [{chained_circuit_bits[first_bits_indexes[num_round_in_chain]:
+                                               first_bits_indexes[num_round_in_chain + 1]][::-1]: 1}
+                         for num_round_in_chain in range(len(quantum_circuits_to_execute))]
+
+        # Save the Results of the Rounds given, from the Measurement results decoded
+        return self.save_protocol_rounds_results_in_batch(sqcka_protocol_rounds, chain_results)
+
+    # Execute the given Quantum Circuits of Rounds of the Protocol, executing each distinct one, only once,
+    # as one single Job, with one Shot for each Round sharing it, on the Simulator,
+    # and save the Results of the respective Rounds, from the Measurement result of the Shot assigned to each one
+    # NOTE: The Quantum Circuits given are in the same order of the Rounds given, and the Rounds built from
+    #       the same Template share the same Quantum Circuit (i.e., the same object), ready to be executed
+    # NOTE: If the Quantum Circuits given were already transpiled, their transpilation is not repeated
+    def execute_protocol_rounds_quantum_circuits_multiplexed(self, quantum_circuits_to_execute, sqcka_protocol_rounds,
+                                                             is_transpiled=False):
+
+        # Retrieve the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_entity = \
+            self.get_qiskit_sqcka_protocol().get_distributor_party_entity()
+
+        # Initialise the Dictionary Object of the indexes of the Rounds given, sharing each distinct Quantum Circuit
+        # (i.e., keyed by the identity of the Quantum Circuit, in the order of its first Round)
+        num_rounds_in_batch_per_quantum_circuit = {}
+
+        # For each Quantum Circuit given
+        for num_round_in_batch, quantum_circuit_to_execute in enumerate(quantum_circuits_to_execute):
+
+            # Append the index of the current Round to the ones sharing the same Quantum Circuit
+            num_rounds_in_batch_per_quantum_circuit.setdefault(id(quantum_circuit_to_execute), []) \
+                .append(num_round_in_batch)
+
+        # Initialise the list of the Measurement results of the Quantum Circuits of the Rounds given
+        batch_results = [None] * len(quantum_circuits_to_execute)
+
+        # For each distinct Quantum Circuit given, and the indexes of the Rounds sharing it
+        for num_rounds_in_batch in num_rounds_in_batch_per_quantum_circuit.values():
+
+            # Execute the distinct Quantum Circuit, as one single Job, with one Shot for each Round sharing it,
+            # retrieving the Measurement result of each Shot, in order
+            quantum_circuit_memory = qiskit_sqcka_protocol_distributor_party_entity \
+                .execute_quantum_circuits([quantum_circuits_to_execute[num_rounds_in_batch[0]]],
+                                          num_shots=len(num_rounds_in_batch), is_transpiled=is_transpiled,
+                                          memory=True)[0]
+
+            # For each Round sharing the distinct Quantum Circuit, and the Measurement result of its Shot
+            for num_round_in_batch, measurement_result in zip(num_rounds_in_batch, quantum_circuit_memory):
+
+                # Assign the Measurement result of the Shot to the Round, as of a single Shot of its own
+                batch_results[num_round_in_batch] = {measurement_result: 1}
+
+        # Save the Results of the Rounds given, from the Measurement results assigned to them
+        return self.save_protocol_rounds_results_in_batch(sqcka_protocol_rounds, batch_results)
+
+    # Save the Results of the given Rounds of the Protocol, from the Measurement results of their Quantum Circuits
+    # NOTE: The Measurement results given are in the same order of the Rounds given
+    def save_protocol_rounds_results_in_batch(self, sqcka_protocol_rounds, batch_results):
+
+        # Retrieve the number of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        num_protocol_party_entities = len(self.get_protocol_party_entities())
+
+        # Retrieve the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_entity = \
+            self.get_qiskit_sqcka_protocol().get_distributor_party_entity()
+
+        # For each Round given
+        for num_round_in_batch in range(len(sqcka_protocol_rounds)):
+
+            # Retrieve the current Round given
+            sqcka_protocol_round = sqcka_protocol_rounds[num_round_in_batch]
+
+            # Retrieve the Measurement results of the Quantum Circuit of the current Round
+            final_results_quantum_circuit_measurement = batch_results[num_round_in_batch]
+
+            # If the current Round is a Measure and Resend (SIFT Operation) Round
+            if sqcka_protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3:
+
+                # Save the Results of the SIFT (Measure and Resend) Round of the Protocol
+                qiskit_sqcka_protocol_distributor_party_entity \
+                    .save_protocol_round_results_for_sift_rounds(num_protocol_party_entities,
+                                                                 sqcka_protocol_round,
+                                                                 final_results_quantum_circuit_measurement)
+
+            # If the current Round is a Reflect (CTRL) Round
+            else:
 
-                    # The Distributor Party Entity of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    # invert and measure the Quantum Circuit containing the Quantum Data/Information reflected back
-                    # from the other Semi-Quantum Party Entities, for the case of the Reflect (CTRL) Rounds
-                    sqcka_protocol_round = \
-                        qiskit_sqcka_protocol_distributor_party_entity \
-                        .measure_quantum_entanglement_by_inverting_quantum_circuit(
-                            qiskit_sqcka_protocol_entanglement_type,
-                            num_protocol_party_entities, sqcka_protocol_round)
-
-                    # If the current Round of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    # is a Reflect (CTRL) Round
-                    if sqcka_protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
-
-                        # It was received the expected results for
-                        # the Measurement performed on the Quantum Entanglement
-                        if sqcka_protocol_round.get_round_results() == ("0" * num_protocol_party_entities):
-
-                            # Print the information about the measured reflected Multipartite Entanglement State,
-                            # sent back from the Semi-Quantum Party Entities to the Distributor Party Entity, for the case of,
-                            # the current Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                            # be a Reflect (CTRL) Round
-                            print("{} (Distributor Party Entity) measured "
-                                  "the Multipartite Entanglement State ({}) reflected back,\n"
-                                  "inverting the Quantum Circuit and it obtained the following state:\n- |{}⟩ (OK, as expected)\n"
-                                  .format(qiskit_sqcka_protocol_distributor_party_entity
-                                          .get_party_user_client().get_user_client_name(),
-                                          qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type(),
-                                          sqcka_protocol_round.get_round_results()))
-
-                        # It was not received the expected results for
-                        # the Measurement performed on the Quantum Entanglement
-                        else:
-
-                            # Print the information about the measured reflected Multipartite Entanglement State,
-                            # sent back from the Semi-Quantum Party Entities to the Distributor Party Entity, for the case of,
-                            # the current Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                            # be a Reflect (CTRL) Round
-                            print("{} (Distributor Party Entity) measured "
-                                  "the Multipartite Entanglement State ({}) reflected back,\n"
-                                  "inverting the Quantum Circuit and it obtained the following state:\n- |{}⟩ (NOT OK, not expected)\n"
-                                  .format(qiskit_sqcka_protocol_distributor_party_entity
-                                          .get_party_user_client().get_user_client_name(),
-                                          qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type(),
-                                          sqcka_protocol_round.get_round_results()))
-
-                            # Print the information about the Detection of Eavesdropping
-                            print("ALERT: Eavesdropping detected!!!")
+                # Save the Results of the CTRL (Reflect) Round of the Protocol
+                qiskit_sqcka_protocol_distributor_party_entity \
+                    .save_protocol_round_results_for_ctrl_rounds(num_protocol_party_entities,
+                                                                 sqcka_protocol_round,
+                                                                 final_results_quantum_circuit_measurement)
 
-                # If the Strategy for Eavesdropping Detection is a SWAP Test
-                elif qiskit_sqcka_protocol.get_parameters().get_strategy_for_eavesdropping_detection() == \
-                    StrategiesForEavesdroppingDetection.SWAP_TEST:
+        # Return the Rounds given, with their Results saved
+        return sqcka_protocol_rounds
 
-                    # TODO - SWAP Test not done yet
-                    return
+    # Execute the pending SWAP Tests of the CTRL (Reflect) Rounds of the Protocol, all at once, as one single Job,
+    # with several Shots for each of them, saving the estimation of the (squared) overlap between
+    # the Multipartite Entanglement reflected back and a fresh copy of it, as the Results of the respective Rounds
+    # NOTE: Executing each SWAP Test with a single Shot, on its own Job, would not allow to estimate the overlap,
+    #       and executing each one with several Shots, on its own Job, would pay the overhead of a Job per Round
+    def execute_protocol_pending_swap_tests(self):
 
-                # If the Strategy for Eavesdropping Detection is a Statistical Test
-                elif qiskit_sqcka_protocol.get_parameters().get_strategy_for_eavesdropping_detection() == \
-                    StrategiesForEavesdroppingDetection.STATISTICAL_TEST:
+        # Retrieve the list of the CTRL (Reflect) Rounds, whose SWAP Tests are still pending,
+        # with the (transpiled) Quantum Circuits to be executed for them
+        pending_swap_tests = self.qiskit_sqcka_protocol_pending_swap_tests
 
-                    # The Distributor Party Entity of
-                    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    # measure the Quantum Data/Information reflected back from the other Semi-Quantum Party Entities,
-                    # for the case of the Reflect (CTRL) Rounds
-                    sqcka_protocol_round = \
-                        qiskit_sqcka_protocol_distributor_party_entity \
-                        .measure_quantum_data_information_for_ctrl_rounds(
-                            num_protocol_party_entities, sqcka_protocol_round)
-
-                    # If the current Round of
+        # If there are no pending SWAP Tests
+        if len(pending_swap_tests) == 0:
+
+            # Return an empty list, since no Round was updated
+            return []
+
+        # Clear the list of the pending SWAP Tests, since all of them will be executed now
+        self.qiskit_sqcka_protocol_pending_swap_tests = []
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # Derive the Seeds of the Jobs of the pending SWAP Tests, from the first Round after the last one
+        # (i.e., a key which is never used by any Round of the Protocol)
+        QiskitSimulatorSession.QiskitSimulatorSession.get_default_qiskit_simulator_session() \
+            .derive_seeds_simulator_for_round(qiskit_sqcka_protocol.get_parameters().get_num_rounds())
+
+        # Retrieve the number of Shots of each SWAP Test
+        num_shots_for_swap_test = qiskit_sqcka_protocol.get_parameters().get_num_shots_for_swap_test()
+
+        # Retrieve the number of the Party Entities of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        num_protocol_party_entities = len(self.get_protocol_party_entities())
+
+        # Retrieve the Distributor Party Entity of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_distributor_party_entity = qiskit_sqcka_protocol.get_distributor_party_entity()
+
+        # Retrieve the list of the CTRL (Reflect) Rounds, whose SWAP Tests are pending
+        sqcka_protocol_ctrl_rounds = [sqcka_protocol_ctrl_round for sqcka_protocol_ctrl_round, _ in pending_swap_tests]
+
+        # Execute the (transpiled) Quantum Circuits of all the pending SWAP Tests, as one single Job,
+        # with several Shots for each of them, on the configured Quantum Simulator
+        swap_tests_results = qiskit_sqcka_protocol_distributor_party_entity\
+            .execute_quantum_circuits([quantum_circuit for _, quantum_circuit in pending_swap_tests],
+                                      num_shots=num_shots_for_swap_test, is_transpiled=True)
+
+        # Retrieve the default Event Log, to which the Events of the SWAP Tests are emitted
+        protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # For each CTRL (Reflect) Round, whose SWAP Test was executed, and the Measurement results of its Shots
+        for sqcka_protocol_ctrl_round, swap_test_results in zip(sqcka_protocol_ctrl_rounds, swap_tests_results):
+
+            # Save the Results of the CTRL (Reflect) Round, as the estimation of the (squared) overlap of its SWAP Test
+            qiskit_sqcka_protocol_distributor_party_entity\
+                .save_protocol_round_results_for_swap_test_ctrl_rounds(num_protocol_party_entities,
+                                                                       sqcka_protocol_ctrl_round, swap_test_results)
+
+            # Emit the Events about the SWAP Test of the current CTRL (Reflect) Round
+            self.emit_protocol_round_swap_test_events(sqcka_protocol_ctrl_round)
+
+        # Compute the estimation of the (squared) overlap of all the SWAP Tests executed,
+        # which were all executed with the same number of Shots
+        swap_tests_overlap = (sum(sqcka_protocol_ctrl_round.get_round_results()
+                                  for sqcka_protocol_ctrl_round in sqcka_protocol_ctrl_rounds) /
+                              len(sqcka_protocol_ctrl_rounds))
+
+        # Compute the probability of the Ancilla Qubit being measured as 1, in all the SWAP Tests executed
+        probability_ancilla_bit_one = max(0.0, min(1.0, ((1 - swap_tests_overlap) / 2)))
+
+        # Compute the standard error of the estimation of the (squared) overlap of all the SWAP Tests executed
+        swap_tests_overlap_standard_error = \
+            2 * sqrt((probability_ancilla_bit_one * (1 - probability_ancilla_bit_one)) /
+                     (len(sqcka_protocol_ctrl_rounds) * num_shots_for_swap_test))
+
+        # Emit the Event about the SWAP Tests of all the CTRL (Reflect) Rounds, executed at once
+        protocol_event_log.emit(SWAP_TESTS_PERFORMED, None,
+                                "It were performed {num_swap_tests} SWAP Tests, with {num_shots} Shots each, "
+                                "as one single Job, estimating the overlap {overlap:.4f} (± {standard_error:.4f})...",
+                                num_swap_tests=len(sqcka_protocol_ctrl_rounds), num_shots=num_shots_for_swap_test,
+                                overlap=swap_tests_overlap, standard_error=swap_tests_overlap_standard_error)
+
+        # Return the CTRL (Reflect) Rounds, whose SWAP Tests were executed, with their Results saved
+        return sqcka_protocol_ctrl_rounds
+
+    # Execute all the Rounds of the Protocol in parallel, splitting them in shards, executed in batch,
+    # by several Parallel Workers (i.e., different Processes), and merging their Rounds, in order
+    # NOTE: Each shard uses a Seed derived from the Seed of the Session, and thus,
+    #       the Results are reproducible, regardless of the number of Parallel Workers
+    def execute_protocol_rounds_in_parallel(self):
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # Retrieve the Parameters of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_parameters = qiskit_sqcka_protocol.get_parameters()
+
+        # Retrieve the number of Rounds for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_num_rounds = qiskit_sqcka_protocol_parameters.get_num_rounds()
+
+        # Retrieve the number of Parallel Workers, using all the available CPU Cores, if it is not configured
+        num_parallel_workers = qiskit_sqcka_protocol_parameters.get_num_parallel_workers() or cpu_count()
+
+        # Compute the first numbers of Round (inclusive) of each shard of Rounds
+        first_num_rounds_shards = list(range(0, qiskit_sqcka_protocol_num_rounds,
+                                             NUM_ROUNDS_PER_PARALLEL_EXECUTION_SHARD))
+
+        # Compute the last numbers of Round (exclusive) of each shard of Rounds
+        last_num_rounds_shards = [min((first_num_round_shard + NUM_ROUNDS_PER_PARALLEL_EXECUTION_SHARD),
+                                      qiskit_sqcka_protocol_num_rounds)
+                                  for first_num_round_shard in first_num_rounds_shards]
+
+        # Derive the Seeds of each shard of Rounds, from the Seed of the Session
+        seeds_shards = [int(seed_sequence_shard.generate_state(1)[0])
+                        for seed_sequence_shard in SeedSequence(qiskit_sqcka_protocol_parameters.get_seed())
+                        .spawn(len(first_num_rounds_shards))]
+
+        # Create the Pool of Parallel Workers, spawning new Processes, instead of forking the current one,
+        # since forking a Process with the running Threads of the Simulators can lead to deadlocks,
+        # sending this Executor Service (i.e., with the full Pre-Shared Keys), only once, to each Parallel Worker
+        with ProcessPoolExecutor(max_workers=num_parallel_workers, mp_context=get_context("spawn"),
+                                 initializer=initialise_parallel_worker,
+                                 initargs=(self,)) as parallel_workers_pool:
+
+            # Submit all the shards of Rounds to the Parallel Workers, retrieving the Futures of their Rounds, in order
+            # (i.e., sending only the interval of Rounds and the Seed of each shard)
+            futures_sqcka_protocol_rounds_shards = \
+                [parallel_workers_pool.submit(execute_protocol_rounds_shard_in_parallel_worker,
+                                              first_num_round_shard, last_num_round_shard, seed_shard)
+                 for (first_num_round_shard, last_num_round_shard, seed_shard)
+                 in zip(first_num_rounds_shards, last_num_rounds_shards, seeds_shards)]
+
+            # Initialise the number of shards of Rounds executed, whose Rounds were added to the Protocol
+            num_shards_executed = 0
+
+            # For the Future of each shard of Rounds, in order
+            for future_sqcka_protocol_rounds_shard in futures_sqcka_protocol_rounds_shards:
+
+                # Wait for the Rounds of the current shard, executed by one of the Parallel Workers
+                sqcka_protocol_rounds_shard = future_sqcka_protocol_rounds_shard.result()
+
+                # Increment the number of shards of Rounds executed
+                num_shards_executed += 1
+
+                # For each Round of the current shard
+                for sqcka_protocol_round in sqcka_protocol_rounds_shard:
+
+                    # Emit again the Events about the start, the Measurement and the end of the current Round,
+                    # discarded by the Parallel Worker (i.e., including the Detection of Eavesdropping), in order
+                    self.emit_protocol_round_events(sqcka_protocol_round)
+
+                    # Add the current Round to the list of the Rounds of
                     # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                    # is a Reflect (CTRL) Round
-                    if sqcka_protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
-
-                        # Print the information about the measured reflected Multipartite Entanglement State,
-                        # sent back from the Semi-Quantum Party Entities to the Distributor Party Entity, for the case of,
-                        # the current Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                        # be a Reflect (CTRL) Round
-                        print("{} (Distributor Party Entity) measured "
-                              "the Multipartite Entanglement State ({}) reflected back..."
-                              .format(qiskit_sqcka_protocol_distributor_party_entity
-                                      .get_party_user_client().get_user_client_name(),
-                                      qiskit_sqcka_protocol.get_parameters().get_quantum_entanglement_type()))
-
-                # Print the the separator for the current Round of
-                # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
-                print("-------------------------------------------------------------------")
-                print("\n")
+                    qiskit_sqcka_protocol.add_protocol_round(sqcka_protocol_round)
 
-            # Print multiple blank lines
-            print("\n\n\n\n\n\n")
+                # If the Strategy for Eavesdropping Detection is a SWAP Test
+                if qiskit_sqcka_protocol_parameters.get_strategy_for_eavesdropping_detection() == \
+                        StrategiesForEavesdroppingDetection.SWAP_TEST:
+
+                    # For each CTRL (Reflect) Round of the current shard
+                    for sqcka_protocol_ctrl_round in [sqcka_protocol_round
+                                                      for sqcka_protocol_round in sqcka_protocol_rounds_shard
+                                                      if sqcka_protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3]:
+
+                        # Emit again the Events about the SWAP Test of the current CTRL (Reflect) Round,
+                        # discarded by the Parallel Worker (i.e., including the Detection of Eavesdropping), in order
+                        self.emit_protocol_round_swap_test_events(sqcka_protocol_ctrl_round)
+
+                # If the Protocol should be aborted, since the Quantum Bit Error Rate (QBER) crossed the threshold
+                if qiskit_sqcka_protocol.is_aborted():
+
+                    # For the Future of each shard of Rounds
+                    for future_sqcka_protocol_rounds_pending_shard in futures_sqcka_protocol_rounds_shards:
+
+                        # Cancel the current shard of Rounds, if it is still pending
+                        # (i.e., the shards already being executed by the Parallel Workers are just discarded)
+                        future_sqcka_protocol_rounds_pending_shard.cancel()
+
+                    # Stop the addition of the Rounds of the remaining shards
+                    break
+
+        # Emit the Event about the summary of the Rounds of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, executed in parallel
+        ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+            .emit(ROUNDS_SUMMARY, None,
+                  "It were executed in parallel {num_rounds} Rounds, in {num_shards} shards, "
+                  "by {num_parallel_workers} Parallel Workers...",
+                  num_rounds=len(qiskit_sqcka_protocol.get_protocol_rounds()),
+                  num_shards=num_shards_executed, num_parallel_workers=num_parallel_workers)
+
+        # Return the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        return qiskit_sqcka_protocol.get_protocol_rounds()
+
+    # Execute all the Rounds of the Protocol analytically, sampling their Results at once,
+    # as arrays with the shape (rounds × parties), without building or executing any Quantum Circuit
+    def execute_protocol_rounds_analytically(self):
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = self.get_qiskit_sqcka_protocol()
+
+        # Retrieve the Parameters of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_parameters = qiskit_sqcka_protocol.get_parameters()
+
+        # Retrieve the number of Parties involved in
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_num_parties = qiskit_sqcka_protocol_parameters.get_num_parties()
+
+        # Retrieve the number of Rounds for
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_num_rounds = qiskit_sqcka_protocol_parameters.get_num_rounds()
+
+        # Create the Analytic Simulator of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_analytic_simulator = \
+            QiskitSQCKAProtocolAnalyticSimulator \
+            .QiskitSQCKAProtocolAnalyticSimulator("sqcka_protocol_analytic_simulator",
+                                                  qiskit_sqcka_protocol_parameters.get_quantum_entanglement_type(),
+                                                  qiskit_sqcka_protocol_parameters
+                                                  .get_strategy_for_eavesdropping_detection(),
+                                                  seed=qiskit_sqcka_protocol_parameters.get_seed())
+
+        # Retrieve the Types of the Rounds, from the Bipartite Pre-Shared Key of the Distributor Party Entity
+        qiskit_sqcka_protocol_rounds_type_bits = \
+            qiskit_sqcka_protocol_analytic_simulator.convert_bipartite_pre_shared_key_to_rounds_type_bits(
+                qiskit_sqcka_protocol.get_distributor_party_entity().get_bipartite_pre_shared_keys()[0]
+                .get_bipartite_pre_shared_key()[:qiskit_sqcka_protocol_num_rounds]
+            )
+
+        # Sample the Results of all the Rounds of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_rounds_results_bits = \
+            qiskit_sqcka_protocol_analytic_simulator.sample_protocol_rounds_results(
+                qiskit_sqcka_protocol_rounds_type_bits, qiskit_sqcka_protocol_num_parties
+            )
+
+        # Set the Types and the Results of all the Rounds of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol.set_protocol_rounds_results_bits(qiskit_sqcka_protocol_rounds_type_bits,
+                                                               qiskit_sqcka_protocol_rounds_results_bits)
+
+        # Retrieve the number of CTRL (Reflect) Rounds
+        num_ctrl_rounds = int(qiskit_sqcka_protocol_rounds_type_bits.sum())
+
+        # Emit the Event about the summary of the Rounds of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, sampled analytically
+        ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()\
+            .emit(ROUNDS_SUMMARY, None,
+                  "It were sampled analytically {num_rounds} Rounds ({num_sift_rounds} SIFT (Measure and Resend) "
+                  "Rounds and {num_ctrl_rounds} CTRL (Reflect) Rounds)...",
+                  num_rounds=qiskit_sqcka_protocol_num_rounds,
+                  num_sift_rounds=(qiskit_sqcka_protocol_num_rounds - num_ctrl_rounds),
+                  num_ctrl_rounds=num_ctrl_rounds)
+
+        # Return the Results of all the Rounds of
+        # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        return qiskit_sqcka_protocol_rounds_results_bits
@@ -109,7 +109,7 @@ class QiskitGraphState:
 
             # Measure the Qubits, representing the vertices of the Graph, of the Quantum Circuit,
             # for the Graph State (Resource State)
-            self.quantum_circuit.measure_qubits_interval(self.qubits_vertices_indexes,
+            self.quantum_circuit.measure_qubits_interval(0, 0, self.qubits_vertices_indexes,
                                                          bits_vertices_indexes)
 
         # Return the IBM Qiskit's Graph State (Resource State), as a multipartite entanglement
@@ -0,0 +1,229 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import the Classical Bit from Qiskit.Circuit
+from qiskit.circuit import Clbit
+
+
+# Class for the Base of the IBM Qiskit's Simulators, implemented in this Library (e.g., the Stabilizer Simulator)
+# NOTE: This Base drives the execution of the Quantum Circuits, applying the Instructions before the first
+#       Measurement, Reset or classically conditioned Gate, only once, for all the shots, and the remaining ones,
+#       for each shot, on a copy of the resulting state, which is the one specific to each Simulator
+#       (i.e., with the hooks to create the initial state and to apply the Gates to it overridden by each Simulator,
+#       and the state providing the copy, the Measurement in the Z-Basis and the Pauli-X Gate, for the Resets)
+class QiskitBaseSimulator:
+
+    # The names of the Gates (and other Instructions) supported by the Simulator
+    supported_instructions = []
+
+    # The error message of the Quantum Circuits not supported by the Simulator
+    unsupported_quantum_circuit_error_message = "The Quantum Circuit is not supported by the Simulator!!!"
+
+    # Constructor for the Base of the IBM Qiskit's Simulators
+    def __init__(self, name, seed=None):
+
+        # Set the name of the Simulator
+        self.name = name
+
+        # Set the Random Generator of the Simulator, for the random outcomes of the Measurements
+        self.random_generator = default_rng(seed)
+
+    # Check if a given Operation of an IBM Qiskit's Quantum Circuit is supported by the Simulator
+    def is_operation_supported(self, operation):
+        return operation.name in self.supported_instructions
+
+    # Check if a given IBM Qiskit's Quantum Circuit is supported by the Simulator
+    def is_quantum_circuit_supported(self, quantum_circuit):
+
+        # For each Instruction of the given Quantum Circuit
+        for circuit_instruction in quantum_circuit.data:
+
+            # Retrieve the classical condition of the current Instruction (i.e., None, if it is unconditioned)
+            condition = getattr(circuit_instruction.operation, "condition", None)
+
+            # If the current Instruction is not supported, or it is conditioned on a whole Classical Register
+            if (not self.is_operation_supported(circuit_instruction.operation)) or \
+                    ((condition is not None) and (not isinstance(condition[0], Clbit))):
+
+                # Return False, since the Quantum Circuit is not supported
+                return False
+
+        # Return True, since all the Instructions of the Quantum Circuit are supported
+        return True
+
+    # Execute several given IBM Qiskit's Quantum Circuits, returning the list of
+    # the Measurement results of each of them, as Dictionary Objects, for a frequency counting
+    # (i.e., or as lists of the Measurement results of each Shot, in order, if the memory is requested)
+    def execute_quantum_circuits(self, quantum_circuits, num_shots=1, memory=False):
+
+        # Return the list of the Measurement results of each given Quantum Circuit
+        return [self.execute_quantum_circuit(quantum_circuit, num_shots, memory)
+                for quantum_circuit in quantum_circuits]
+
+    # Execute a given IBM Qiskit's Quantum Circuit, returning the Measurement results,
+    # as a Dictionary Object, for a frequency counting, in the same format of the QASM Simulator
+    # (i.e., or as a list of the Measurement results of each Shot, in order, if the memory is requested)
+    def execute_quantum_circuit(self, quantum_circuit, num_shots=1, memory=False):
+
+        # If the given Quantum Circuit is not supported by the Simulator
+        if not self.is_quantum_circuit_supported(quantum_circuit):
+
+            # Raise a Value Error
+            raise ValueError(self.unsupported_quantum_circuit_error_message)
+
+        # Retrieve the list of Instructions of the given Quantum Circuit,
+        # with the indexes of the Qubits and Bits they act on, their parameters, and their classical conditions
+        # (i.e., the index and the value of the Bit they are conditioned on, or None, if they are unconditioned)
+        circuit_instructions = [(circuit_instruction.operation.name,
+                                 [quantum_circuit.find_bit(qubit).index
+                                  for qubit in circuit_instruction.qubits],
+                                 [quantum_circuit.find_bit(bit).index
+                                  for bit in circuit_instruction.clbits],
+                                 self.get_gate_params(circuit_instruction.operation),
+                                 (None if getattr(circuit_instruction.operation, "condition", None) is None
+                                  else (quantum_circuit.find_bit(circuit_instruction.operation.condition[0]).index,
+                                        int(circuit_instruction.operation.condition[1]))))
+                                for circuit_instruction in quantum_circuit.data]
+
+        # Retrieve the index of the first Instruction which is not unitary
+        # (i.e., a Measurement, a Reset or a classically conditioned Gate, which depend on the outcomes of each shot)
+        first_non_unitary_instruction_index = next((instruction_index for instruction_index, circuit_instruction
+                                                    in enumerate(circuit_instructions)
+                                                    if (circuit_instruction[0] in ["measure", "reset"]) or
+                                                    (circuit_instruction[4] is not None)),
+                                                   len(circuit_instructions))
+
+        # Create the initial state, for all the Qubits in the state |0...0⟩,
+        # and apply all the Gates before the first Measurement or Reset, only once, for all the shots
+        initial_state = self.create_initial_state(quantum_circuit.num_qubits)
+        self.apply_circuit_instructions(initial_state, circuit_instructions[:first_non_unitary_instruction_index],
+                                        None)
+
+        # Apply the remaining Instructions, for all the shots, retrieving the Measurement results of each Shot
+        final_results_quantum_circuit_memory = \
+            self.execute_shots(quantum_circuit, initial_state,
+                               circuit_instructions[first_non_unitary_instruction_index:], num_shots)
+
+        # If the Measurement results of each Shot are requested
+        if memory:
+
+            # Return the list of the Measurement results of each Shot, in order
+            return final_results_quantum_circuit_memory
+
+        # Initialise the Dictionary Object of the Measurement results, for a frequency counting
+        final_results_quantum_circuit_measurement = {}
+
+        # For each Measurement result of each shot
+        for measurement_result in final_results_quantum_circuit_memory:
+
+            # Increment the frequency counting of the Measurement result
+            final_results_quantum_circuit_measurement[measurement_result] = \
+                final_results_quantum_circuit_measurement.get(measurement_result, 0) + 1
+
+        # Return the Dictionary Object of the Measurement results, for a frequency counting
+        return final_results_quantum_circuit_measurement
+
+    # Apply the given Instructions, for each shot, to a copy of the given initial state,
+    # returning the list of the Measurement results of each Shot, in order
+    def execute_shots(self, quantum_circuit, initial_state, circuit_instructions, num_shots):
+
+        # Initialise the list of the Measurement results of each Shot, in order
+        final_results_quantum_circuit_memory = []
+
+        # For each shot of the execution of the given Quantum Circuit
+        for _ in range(num_shots):
+
+            # Initialise the Bits of the Classical Registers of the given Quantum Circuit, all as zero
+            bits = [0] * quantum_circuit.num_clbits
+
+            # Apply the given Instructions to a copy of the initial state
+            self.apply_circuit_instructions(initial_state.copy(), circuit_instructions, bits)
+
+            # Keep the Measurement result of the current Shot, with the Bits ordered
+            # from the most significant to the least significant one, as in the QASM Simulator
+            final_results_quantum_circuit_memory.append(self.format_bits(quantum_circuit, bits))
+
+        # Return the list of the Measurement results of each Shot, in order
+        return final_results_quantum_circuit_memory
+
+    # Apply a given list of Instructions to a state, storing the Measurement results in the given Bits
+    def apply_circuit_instructions(self, state, circuit_instructions, bits):
+
+        # For each Instruction given
+        for instruction_name, qubits_indexes, bits_indexes, gate_params, condition in circuit_instructions:
+
+            # If the Instruction is classically conditioned on a Bit, whose value does not match the condition
+            if (condition is not None) and (bits[condition[0]] != condition[1]):
+
+                # Skip the Instruction, since it is not applied
+                continue
+
+            # If the Instruction is a Measurement
+            if instruction_name == "measure":
+
+                # Measure the Qubit in the Z-Basis and store the outcome in the respective Bit
+                bits[bits_indexes[0]] = state.measure(qubits_indexes[0], self.random_generator)
+
+            # If the Instruction is a Reset
+            elif instruction_name == "reset":
+
+                # If the Qubit is measured as |1⟩, in the Z-Basis
+                if state.measure(qubits_indexes[0], self.random_generator) == 1:
+
+                    # Apply the Pauli-X Gate to the Qubit, to reset it to |0⟩
+                    state.apply_pauli_x(qubits_indexes[0])
+
+            # If the Instruction is a Gate (or a Barrier)
+            else:
+
+                # Apply the respective Gate to the state
+                self.apply_gate(state, instruction_name, qubits_indexes, gate_params)
+
+    # Return the parameters of a given Operation of an IBM Qiskit's Quantum Circuit, as needed to apply it
+    # (i.e., its real parameters, by default, such as the angles of the Rotation Gates)
+    def get_gate_params(self, operation):
+        return [float(gate_param) for gate_param in operation.params]
+
+    # Create the initial state of the Simulator, for a given number of Qubits, all in the state |0...0⟩
+    # (i.e., to be overridden by each Simulator)
+    def create_initial_state(self, num_qubits):
+        raise NotImplementedError("The {} does not create any initial state!!!".format(self.name))
+
+    # Apply a Gate, given its name and parameters, to the given Qubits' indexes of a state
+    # (i.e., to be overridden by each Simulator)
+    def apply_gate(self, state, gate_name, qubits_indexes, gate_params):
+        raise NotImplementedError("The {} does not apply any Gate!!!".format(self.name))
+
+    # Format the given Bits, as a key of the Measurement results of the QASM Simulator
+    # (i.e., from the most significant to the least significant Bit, with the Classical Registers separated)
+    @staticmethod
+    def format_bits(quantum_circuit, bits):
+
+        # Initialise the list of the Bits of each Classical Register, in a String format
+        classical_registers_bits = []
+
+        # For each Classical Register of the given Quantum Circuit
+        for classical_register in quantum_circuit.cregs:
+
+            # Append the Bits of the current Classical Register, in a String format, reversed
+            classical_registers_bits.append("".join(str(bits[quantum_circuit.find_bit(bit).index])
+                                                    for bit in classical_register)[::-1])
+
+        # Return the Bits of all the Classical Registers, from the last to the first one
+        return " ".join(classical_registers_bits[::-1])
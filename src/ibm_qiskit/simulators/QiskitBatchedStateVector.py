@@ -0,0 +1,129 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import NumPy
+import numpy as np
+
+
+# Constants
+
+# The tolerance, under which the probabilities of the outcomes of the Measurements are considered, as null
+BATCHED_STATE_VECTOR_PROBABILITY_TOLERANCE = 1e-12
+
+
+# Class for the Batched State Vector of the IBM Qiskit's Batched State Vector Simulator
+# NOTE: A stack of State Vectors (i.e., one for each row of the batch, as one Round or one Shot) is kept,
+#       as one single NumPy Tensor, with the shape (num_rows, 2, 2, ..., 2), where the axis (1 + q) is the one of
+#       the Qubit q, in such a way that each Gate is applied, only once, along the axis of the batch,
+#       through a Tensor contraction, while the Measurements are sampled independently, for each row of the batch
+class QiskitBatchedStateVector:
+
+    # Constructor for the Batched State Vector of the IBM Qiskit's Batched State Vector Simulator
+    def __init__(self, num_qubits, num_rows=1, state_vectors=None):
+
+        # Set the number of Qubits of each State Vector of the Batched State Vector
+        self.num_qubits = num_qubits
+
+        # If no State Vectors are given
+        if state_vectors is None:
+
+            # Create the State Vectors, for all the Qubits in the state |0...0⟩, in every row of the batch
+            state_vectors = np.zeros(((num_rows,) + ((2,) * num_qubits)), dtype=complex)
+            state_vectors[(slice(None),) + ((0,) * num_qubits)] = 1
+
+        # Set the stack of State Vectors of the Batched State Vector
+        self.state_vectors = state_vectors
+
+    # Return the number of rows of the batch (i.e., the number of State Vectors) of the Batched State Vector
+    def get_num_rows(self):
+        return self.state_vectors.shape[0]
+
+    # Return a new Batched State Vector, with a given number of copies of each row of the batch
+    # (i.e., broadcasting the State Vectors computed only once, to the rows which will diverge afterwards)
+    def repeat(self, num_copies):
+        return QiskitBatchedStateVector(self.num_qubits,
+                                        state_vectors=np.repeat(self.state_vectors, num_copies, axis=0))
+
+    # Apply a Gate, given by its unitary Matrix, in the IBM Qiskit's (little-endian) ordering, to the given Qubits'
+    # indexes, in the given rows of the batch (i.e., in all of them, if no Boolean mask of the rows is given)
+    def apply_gate(self, gate_matrix, qubits_indexes, rows_mask=None):
+
+        # Compute the number of Qubits the Gate acts on
+        num_gate_qubits = len(qubits_indexes)
+
+        # Compute the axes of the given Qubits, in the Tensor of the State Vectors, ordered as the axes of
+        # the Gate's Matrix, reshaped as a Tensor (i.e., from the last to the first Qubit, by the little-endian)
+        qubits_axes = [(1 + qubit_index) for qubit_index in reversed(qubits_indexes)]
+
+        # Retrieve the State Vectors of the rows of the batch where the Gate is applied
+        state_vectors = (self.state_vectors if rows_mask is None else self.state_vectors[rows_mask])
+
+        # Contract the Gate's Matrix, reshaped as a Tensor, with the axes of the given Qubits,
+        # for all the rows of the batch at once, moving the resulting axes back to their original positions
+        state_vectors = np.moveaxis(np.tensordot(gate_matrix.reshape((2,) * (2 * num_gate_qubits)), state_vectors,
+                                                 axes=(list(range(num_gate_qubits, (2 * num_gate_qubits))),
+                                                       qubits_axes)),
+                                    list(range(num_gate_qubits)), qubits_axes)
+
+        # If the Gate is applied to all the rows of the batch
+        if rows_mask is None:
+
+            # Set the new State Vectors of the Batched State Vector
+            self.state_vectors = state_vectors
+
+        # If the Gate is applied only to some of the rows of the batch
+        else:
+
+            # Set the new State Vectors, only in the given rows of the batch
+            self.state_vectors[rows_mask] = state_vectors
+
+    # Apply the Pauli-X Gate to a given Qubit's index, in the given rows of the batch
+    def apply_pauli_x(self, qubit_index, rows_mask):
+        self.apply_gate(np.array([[0, 1], [1, 0]], dtype=complex), [qubit_index], rows_mask)
+
+    # Measure a given Qubit's index in the Z-Basis (Computational Basis), independently, in each row of the batch,
+    # returning the outcomes (0 or 1), as a NumPy Array, with one outcome for each row of the batch
+    def measure(self, qubit_index, random_generator):
+
+        # Retrieve the Probabilities of the Basis States, in each row of the batch
+        probabilities = (np.abs(self.state_vectors) ** 2)
+
+        # Compute the probability of the outcome 1, in each row of the batch, from the Probabilities of
+        # the Basis States, where the given Qubit is in the state |1⟩
+        probabilities_outcome_1 = np.take(probabilities, 1, axis=(1 + qubit_index)) \
+            .reshape(self.get_num_rows(), -1).sum(axis=1)
+
+        # Sample the random outcomes of the Measurement, according to their probabilities, in each row of the batch
+        # (i.e., with the deterministic outcomes fixed, regardless of the numerical errors)
+        outcomes = (random_generator.random(self.get_num_rows()) < probabilities_outcome_1).astype(int)
+        outcomes[probabilities_outcome_1 <= BATCHED_STATE_VECTOR_PROBABILITY_TOLERANCE] = 0
+        outcomes[probabilities_outcome_1 >= (1 - BATCHED_STATE_VECTOR_PROBABILITY_TOLERANCE)] = 1
+
+        # Compute the normalization factors, of the Amplitudes compatible with the outcomes, in each row of the batch
+        normalization_factors = (np.where(outcomes == 1, probabilities_outcome_1,
+                                          (1 - probabilities_outcome_1)) ** -0.5)
+
+        # Collapse the State Vectors, discarding the Amplitudes not compatible with the outcomes, in each row
+        # (i.e., through a view of the State Vectors, with the axis of the given Qubit right after the one of the batch)
+        state_vectors_view = np.moveaxis(self.state_vectors, (1 + qubit_index), 1)
+        state_vectors_view[(outcomes == 0), 1] = 0
+        state_vectors_view[(outcomes == 1), 0] = 0
+
+        # Renormalize the State Vectors, in each row of the batch
+        self.state_vectors *= normalization_factors.reshape((-1,) + ((1,) * self.num_qubits))
+
+        # Return the outcomes of the Measurement, in each row of the batch
+        return outcomes
@@ -0,0 +1,128 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import NumPy
+import numpy as np
+
+# Import QiskitBaseSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitBaseSimulator
+
+# Import QiskitBatchedStateVector from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitBatchedStateVector
+
+
+# Constants
+
+# The names of the non-unitary Instructions (or without any effect) supported by the Batched State Vector Simulator
+# (i.e., besides all the Gates with a known unitary Matrix)
+BATCHED_STATE_VECTOR_SIMULATOR_SUPPORTED_NON_UNITARY_INSTRUCTIONS = ["measure", "reset", "barrier"]
+
+# The maximum number of Amplitudes held, at once, by the Batched State Vector Simulator
+# (i.e., the number of rows of the batch, multiplied by the number of Amplitudes of each State Vector)
+BATCHED_STATE_VECTOR_SIMULATOR_MAX_NUM_AMPLITUDES = (2 ** 26)
+
+
+# Class for the IBM Qiskit's Batched State Vector Simulator
+# NOTE: This Simulator executes all the Shots of a Quantum Circuit (e.g., one for each one of the Rounds sharing it),
+#       at once, as a stack of dense State Vectors, where the Gates before the first Measurement, Reset or classically
+#       conditioned Gate are applied only once, for all of them, and the remaining ones are applied along the axis of
+#       the batch, with the outcomes of the Measurements sampled independently, for each row of the batch
+class QiskitBatchedStateVectorSimulator(QiskitBaseSimulator.QiskitBaseSimulator):
+
+    # The error message of the Quantum Circuits not supported by the Batched State Vector Simulator
+    unsupported_quantum_circuit_error_message = ("The Batched State Vector Simulator only supports Quantum Circuits "
+                                                 "with Gates of known unitary Matrices (unconditioned or conditioned "
+                                                 "on a single Bit), Measurements and Resets!!!")
+
+    # Check if a given Operation of an IBM Qiskit's Quantum Circuit is supported by the Batched State Vector Simulator
+    # (i.e., if it is a supported non-unitary Instruction, or a Gate with a known unitary Matrix)
+    def is_operation_supported(self, operation):
+        return (operation.name in BATCHED_STATE_VECTOR_SIMULATOR_SUPPORTED_NON_UNITARY_INSTRUCTIONS) or \
+            hasattr(operation, "__array__")
+
+    # Return the unitary Matrix of a given Operation of an IBM Qiskit's Quantum Circuit
+    # (i.e., None, if it is not a Gate)
+    def get_gate_params(self, operation):
+        return (None if operation.name in BATCHED_STATE_VECTOR_SIMULATOR_SUPPORTED_NON_UNITARY_INSTRUCTIONS
+                else np.asarray(operation, dtype=complex))
+
+    # Create the initial Batched State Vector, with one single row, for a given number of Qubits,
+    # all in the state |0...0⟩ (i.e., to which the Gates before the first Measurement or Reset are applied only once)
+    def create_initial_state(self, num_qubits):
+        return QiskitBatchedStateVector.QiskitBatchedStateVector(num_qubits)
+
+    # Apply a Gate, given by its unitary Matrix, to the given Qubits' indexes of a Batched State Vector,
+    # in the given rows of the batch (i.e., in all of them, if no Boolean mask of the rows is given)
+    def apply_gate(self, batched_state_vector, gate_name, qubits_indexes, gate_matrix, rows_mask=None):
+
+        # If the Instruction is a Gate (i.e., not a Barrier)
+        if gate_matrix is not None:
+
+            # Apply the Gate, given by its unitary Matrix, to the Batched State Vector
+            batched_state_vector.apply_gate(gate_matrix, qubits_indexes, rows_mask)
+
+    # Apply the given Instructions, for all the shots at once, to a stack of copies of the given initial
+    # Batched State Vector, one per shot, returning the list of the Measurement results of each Shot, in order
+    def execute_shots(self, quantum_circuit, initial_batched_state_vector, circuit_instructions, num_shots):
+
+        # If the stack of State Vectors, for all the Shots, would exceed the maximum number of Amplitudes
+        if (num_shots * (2 ** quantum_circuit.num_qubits)) > BATCHED_STATE_VECTOR_SIMULATOR_MAX_NUM_AMPLITUDES:
+
+            # Raise a Value Error
+            raise ValueError("The Batched State Vector Simulator can not hold {} State Vectors of {} Qubits!!!"
+                             .format(num_shots, quantum_circuit.num_qubits))
+
+        # Initialise the Bits of the Classical Registers of the given Quantum Circuit, all as zero, for each shot
+        bits = np.zeros((num_shots, quantum_circuit.num_clbits), dtype=int)
+
+        # Apply the given Instructions to a stack of copies of the initial Batched State Vector, one per shot
+        self.apply_circuit_instructions(initial_batched_state_vector.repeat(num_shots), circuit_instructions, bits)
+
+        # Return the list of the Measurement results of each Shot, in order, with the Bits ordered
+        # from the most significant to the least significant one, as in the QASM Simulator
+        return [self.format_bits(quantum_circuit, bits[num_shot]) for num_shot in range(num_shots)]
+
+    # Apply a given list of Instructions to a Batched State Vector,
+    # storing the Measurement results in the given Bits, with one row for each row of the batch
+    def apply_circuit_instructions(self, batched_state_vector, circuit_instructions, bits):
+
+        # For each Instruction given
+        for instruction_name, qubits_indexes, bits_indexes, gate_matrix, condition in circuit_instructions:
+
+            # Retrieve the rows of the batch where the Instruction is applied (i.e., all of them, if it is
+            # unconditioned, or the ones whose Bit matches the classical condition, otherwise)
+            rows_mask = (None if condition is None else (bits[:, condition[0]] == condition[1]))
+
+            # If the Instruction is a Measurement
+            if instruction_name == "measure":
+
+                # Measure the Qubit in the Z-Basis and store the outcomes in the respective Bit, for each row
+                bits[:, bits_indexes[0]] = batched_state_vector.measure(qubits_indexes[0], self.random_generator)
+
+            # If the Instruction is a Reset
+            elif instruction_name == "reset":
+
+                # Measure the Qubit in the Z-Basis and apply the Pauli-X Gate to it, to reset it to |0⟩,
+                # in the rows of the batch where it was measured as |1⟩
+                batched_state_vector.apply_pauli_x(qubits_indexes[0],
+                                                   (batched_state_vector.measure(qubits_indexes[0],
+                                                                                 self.random_generator) == 1))
+
+            # If the Instruction is applied to, at least, one row of the batch
+            elif (rows_mask is None) or rows_mask.any():
+
+                # Apply the respective Gate to the Batched State Vector
+                self.apply_gate(batched_state_vector, instruction_name, qubits_indexes, gate_matrix, rows_mask)
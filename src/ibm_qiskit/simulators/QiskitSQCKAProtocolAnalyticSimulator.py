@@ -0,0 +1,133 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Ranges, Repetitions and Zeros from NumPy
+from numpy import arange, repeat, uint8, zeros
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import BitPackedBinaryString from Common.Utils
+from src.common.utils import BitPackedBinaryString
+
+# Import the String IDs of the Quantum Entanglements supported by the Analytic Simulator
+from src.common.enumerations.QuantumEntanglementTypes import GHZ_STATE, W_STATE, RESOURCE_STATE, GRAPH_STATE
+
+# Import the String IDs of the Strategies for Eavesdropping Detection supported by the Analytic Simulator
+from src.common.enumerations.StrategiesForEavesdroppingDetection import \
+    MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT, STATISTICAL_TEST
+
+
+# Constants
+
+# The possible types of Multipartite Quantum Entanglements supported by the Analytic Simulator
+POSSIBLE_QUANTUM_ENTANGLEMENT_TYPES_FOR_ANALYTIC_SIMULATOR = [GHZ_STATE, W_STATE, RESOURCE_STATE, GRAPH_STATE]
+
+# The possible Strategies for Eavesdropping Detection supported by the Analytic Simulator
+POSSIBLE_STRATEGIES_FOR_EAVESDROPPING_DETECTION_FOR_ANALYTIC_SIMULATOR = [MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT,
+                                                                          STATISTICAL_TEST]
+
+
+# Class for the IBM Qiskit's Analytic Simulator of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+# NOTE: This Simulator samples the Results of all the Rounds of the Protocol at once, for the ideal case
+#       (i.e., noiseless and without any Eavesdropper), directly from the known outcome distributions of
+#       the Multipartite Entanglements, without building or executing any Quantum Circuit:
+#       - GHZ States: a uniformly random |00...0⟩ or |11...1⟩, for the Z-Basis Measurements;
+#       - W States: a uniformly random state with a single |1⟩, for the Z-Basis Measurements;
+#       - Graph (Resource) States: a uniformly random state, for the Z-Basis Measurements;
+#       - The inversion of any of them is always measured as |00...0⟩;
+class QiskitSQCKAProtocolAnalyticSimulator:
+
+    # Constructor for IBM Qiskit's Analytic Simulator of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    def __init__(self, name, quantum_entanglement_type, strategy_for_eavesdropping_detection, seed=None):
+
+        # If the Quantum Entanglement is not supported by the Analytic Simulator
+        if quantum_entanglement_type.upper() not in POSSIBLE_QUANTUM_ENTANGLEMENT_TYPES_FOR_ANALYTIC_SIMULATOR:
+
+            # Raise a Value Error
+            raise ValueError("The Analytic Simulator does not support the given Type of Quantum Entanglement!!!")
+
+        # If the Strategy for Eavesdropping Detection is not supported by the Analytic Simulator
+        if strategy_for_eavesdropping_detection not in \
+                POSSIBLE_STRATEGIES_FOR_EAVESDROPPING_DETECTION_FOR_ANALYTIC_SIMULATOR:
+
+            # Raise a Value Error
+            raise ValueError("The Analytic Simulator does not support "
+                             "the given Strategy for Eavesdropping Detection!!!")
+
+        # Set the name of the Analytic Simulator
+        self.name = name
+
+        # Set the Quantum Entanglement Type to be used
+        self.quantum_entanglement_type = quantum_entanglement_type.upper()
+
+        # Set the Strategy for Eavesdropping Detection
+        self.strategy_for_eavesdropping_detection = strategy_for_eavesdropping_detection
+
+        # Set the Random Generator of the Analytic Simulator
+        self.random_generator = default_rng(seed)
+
+    # Convert a Bipartite Pre-Shared Key, in binary, to an array of the Types of the Rounds
+    # (i.e., 0 for the SIFT (Measure and Resend) Rounds and 1 for the CTRL (Reflect) Rounds)
+    # NOTE: The Bipartite Pre-Shared Key can be given as a Binary String or as a Bit-Packed Binary String
+    @staticmethod
+    def convert_bipartite_pre_shared_key_to_rounds_type_bits(bipartite_pre_shared_key):
+        return BitPackedBinaryString.BitPackedBinaryString.from_binary_string(bipartite_pre_shared_key).to_bits()
+
+    # Sample the Z-Basis Measurements of the Multipartite Entanglement, for a given number of Rounds and Parties
+    def sample_quantum_entanglement_measurements(self, num_rounds, num_parties):
+
+        # If the Quantum Entanglement is a GHZ State
+        if self.quantum_entanglement_type == GHZ_STATE:
+
+            # Sample the same random Bit for all the Parties, in each Round
+            return repeat(self.random_generator.integers(0, 2, size=(num_rounds, 1), dtype=uint8),
+                          num_parties, axis=1)
+
+        # If the Quantum Entanglement is a W State
+        elif self.quantum_entanglement_type == W_STATE:
+
+            # Initialise the Measurements, all as zero
+            quantum_entanglement_measurements = zeros((num_rounds, num_parties), dtype=uint8)
+
+            # Set a single random Party with the Bit 1, in each Round
+            quantum_entanglement_measurements[arange(num_rounds),
+                                              self.random_generator.integers(0, num_parties, size=num_rounds)] = 1
+
+            # Return the Measurements
+            return quantum_entanglement_measurements
+
+        # If the Quantum Entanglement is a Graph (Resource) State
+        else:
+
+            # Sample independent random Bits for all the Parties, in each Round
+            return self.random_generator.integers(0, 2, size=(num_rounds, num_parties), dtype=uint8)
+
+    # Sample the Results of all the Rounds of the Protocol, as an array with the shape (rounds × parties),
+    # given the Types of the Rounds (i.e., the Bits of the Pre-Shared Key)
+    def sample_protocol_rounds_results(self, rounds_type_bits, num_parties):
+
+        # Sample the Z-Basis Measurements of the Multipartite Entanglement, for all the Rounds
+        protocol_rounds_results = self.sample_quantum_entanglement_measurements(len(rounds_type_bits), num_parties)
+
+        # If the Strategy for Eavesdropping Detection is a Measurement by Inverting Quantum Circuit
+        if self.strategy_for_eavesdropping_detection == MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT:
+
+            # The CTRL (Reflect) Rounds are always measured as |00...0⟩, after the inversion
+            protocol_rounds_results[rounds_type_bits.astype(bool)] = 0
+
+        # Return the Results of all the Rounds of the Protocol
+        return protocol_rounds_results
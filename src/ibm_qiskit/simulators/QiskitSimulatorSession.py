@@ -0,0 +1,321 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Aer, execute and transpile from Qiskit
+from qiskit import Aer, execute, transpile
+
+# Import the Default Random Generator and the Seed Sequence from NumPy.Random
+from numpy.random import default_rng, SeedSequence
+
+# Import QiskitStabilizerSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitStabilizerSimulator
+
+# Import QiskitSparseStateVectorSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSparseStateVectorSimulator
+
+# Import QiskitBatchedStateVectorSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitBatchedStateVectorSimulator
+
+# Import some important constant values, regarding some parameters of the IBM's Qiskit
+
+# Import the names of the Backends, the default Simulation Method and the default maximum number of Threads
+# of the Simulators of the IBM's Qiskit Aer Library
+from src.ibm_qiskit.common.QiskitLibraryParameters import \
+    QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME, QISKIT_AER_STATE_VECTOR_SIMULATOR_BACKEND_NAME, \
+    QISKIT_AER_DEFAULT_SIMULATION_METHOD, QISKIT_AER_DEFAULT_MAX_PARALLEL_THREADS
+
+
+# Constants
+
+# The maximum value (exclusive) for the Seeds derived for each Job submitted to the Simulators
+MAX_SEED_SIMULATOR = 2 ** 31 - 1
+
+
+# Class for the IBM Qiskit's Simulator Session
+# NOTE: This Session keeps a registry of the Backends of the Simulators, already instantiated and configured,
+#       in order to resolve them only once per process, allowing their options (e.g., the Simulation Method,
+#       the maximum number of Threads and the Seed) to be tuned centrally, for all the Quantum Circuits executed
+class QiskitSimulatorSession:
+
+    # The default IBM Qiskit's Simulator Session, shared by the whole process
+    default_qiskit_simulator_session = None
+
+    # Constructor for IBM Qiskit's Simulator Session
+    def __init__(self, name, simulation_method=QISKIT_AER_DEFAULT_SIMULATION_METHOD,
+                 max_parallel_threads=QISKIT_AER_DEFAULT_MAX_PARALLEL_THREADS, seed=None):
+
+        # Set the name of the Simulator Session
+        self.name = name
+
+        # Set the Simulation Method of the QASM Simulator
+        self.simulation_method = simulation_method
+
+        # Set the maximum number of Threads of the Simulators
+        self.max_parallel_threads = max_parallel_threads
+
+        # Set the Seed of the Simulator Session
+        self.seed = seed
+
+        # Set the Random Generator of the Simulator Session, from which the Seeds of each Job are derived
+        self.random_generator = default_rng(seed)
+
+        # Initialise the registry of the Backends of the Simulators, already instantiated and configured
+        self.backends = {}
+
+        # Initialise the Stabilizer Simulator of the Simulator Session, as None, since it is created on demand
+        self.stabilizer_simulator = None
+
+        # Initialise the Sparse State Vector Simulator of the Simulator Session, as None, since it is created on demand
+        self.sparse_state_vector_simulator = None
+
+        # Initialise the Batched State Vector Simulator of the Simulator Session, as None, since it is created on demand
+        self.batched_state_vector_simulator = None
+
+    # Retrieve the default IBM Qiskit's Simulator Session, shared by the whole process
+    @staticmethod
+    def get_default_qiskit_simulator_session():
+
+        # If the default Simulator Session was not created yet
+        if QiskitSimulatorSession.default_qiskit_simulator_session is None:
+
+            # Create the default Simulator Session, with the default options
+            QiskitSimulatorSession.default_qiskit_simulator_session = \
+                QiskitSimulatorSession("default_qiskit_simulator_session")
+
+        # Return the default Simulator Session
+        return QiskitSimulatorSession.default_qiskit_simulator_session
+
+    # Configure the default IBM Qiskit's Simulator Session, shared by the whole process, with the given options
+    @staticmethod
+    def configure_default_qiskit_simulator_session(simulation_method=QISKIT_AER_DEFAULT_SIMULATION_METHOD,
+                                                   max_parallel_threads=QISKIT_AER_DEFAULT_MAX_PARALLEL_THREADS,
+                                                   seed=None):
+
+        # Replace the default Simulator Session, by a new one, with the given options
+        QiskitSimulatorSession.default_qiskit_simulator_session = \
+            QiskitSimulatorSession("default_qiskit_simulator_session", simulation_method=simulation_method,
+                                   max_parallel_threads=max_parallel_threads, seed=seed)
+
+        # Return the new default Simulator Session
+        return QiskitSimulatorSession.default_qiskit_simulator_session
+
+    # Return the Simulation Method of the QASM Simulator
+    def get_simulation_method(self):
+        return self.simulation_method
+
+    # Return the maximum number of Threads of the Simulators
+    def get_max_parallel_threads(self):
+        return self.max_parallel_threads
+
+    # Return the Seed of the Simulator Session
+    def get_seed(self):
+        return self.seed
+
+    # Set the Seed of the Simulator Session, restarting the Random Generator from which the Seeds of each Job are
+    # derived, and the Stabilizer, Sparse and Batched State Vector Simulators, which are created again on demand,
+    # with Seeds derived from the new one
+    def set_seed(self, seed):
+
+        # Set the Seed of the Simulator Session
+        self.seed = seed
+
+        # Restart the Random Generator of the Simulator Session, from the new Seed
+        self.random_generator = default_rng(seed)
+
+        # Discard the Stabilizer Simulator, since its Random Generator was seeded from the previous Seed
+        self.stabilizer_simulator = None
+
+        # Discard the Sparse State Vector Simulator, since its Random Generator was seeded from the previous Seed
+        self.sparse_state_vector_simulator = None
+
+        # Discard the Batched State Vector Simulator, since its Random Generator was seeded from the previous Seed
+        self.batched_state_vector_simulator = None
+
+    # Derive the Seeds of the Jobs of a given Round from the Seed of the Simulator Session and the number of the Round
+    # (i.e., the Jobs of a Round get always the same Seeds, regardless of the Rounds executed before it,
+    # allowing a Round, or a batch of Rounds starting on it, to be replayed bit-exactly)
+    def derive_seeds_simulator_for_round(self, num_round):
+
+        # If the Simulator Session has no Seed
+        if self.seed is None:
+
+            # Return, letting the Simulators choose random Seeds
+            return
+
+        # Restart the Random Generator of the Simulator Session, from the child Seed Sequence of the given Round
+        self.random_generator = default_rng(SeedSequence(self.seed, spawn_key=(num_round,)))
+
+        # Discard the Stabilizer Simulator, to be created again on demand, with a Seed derived for the given Round
+        self.stabilizer_simulator = None
+
+        # Discard the Sparse State Vector Simulator, to be created again on demand,
+        # with a Seed derived for the given Round
+        self.sparse_state_vector_simulator = None
+
+        # Discard the Batched State Vector Simulator, to be created again on demand,
+        # with a Seed derived for the given Round
+        self.batched_state_vector_simulator = None
+
+    # Retrieve the Backend of a Simulator of the IBM's Qiskit Aer Library, given its name,
+    # instantiating and configuring it, only the first time it is requested
+    def get_backend(self, backend_name):
+
+        # If the Backend was not instantiated yet
+        if backend_name not in self.backends:
+
+            # Instantiate the Backend of the Simulator
+            backend = Aer.get_backend(backend_name)
+
+            # Configure the maximum number of Threads of the Backend
+            backend.set_options(max_parallel_threads=self.max_parallel_threads)
+
+            # If the Backend is the one of the QASM Simulator
+            if backend_name == QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME:
+
+                # Configure the Simulation Method of the Backend
+                backend.set_options(method=self.simulation_method)
+
+            # Register the Backend, already instantiated and configured
+            self.backends[backend_name] = backend
+
+        # Return the Backend of the Simulator
+        return self.backends[backend_name]
+
+    # Retrieve the Stabilizer Simulator of the Simulator Session, creating it, only the first time it is requested
+    def get_stabilizer_simulator(self):
+
+        # If the Stabilizer Simulator was not created yet
+        if self.stabilizer_simulator is None:
+
+            # Create the Stabilizer Simulator, with a Seed derived from the Simulator Session
+            self.stabilizer_simulator = QiskitStabilizerSimulator \
+                .QiskitStabilizerSimulator("stabilizer_simulator", seed=self.generate_seed_simulator())
+
+        # Return the Stabilizer Simulator
+        return self.stabilizer_simulator
+
+    # Retrieve the Sparse State Vector Simulator of the Simulator Session,
+    # creating it, only the first time it is requested
+    def get_sparse_state_vector_simulator(self):
+
+        # If the Sparse State Vector Simulator was not created yet
+        if self.sparse_state_vector_simulator is None:
+
+            # Create the Sparse State Vector Simulator, with a Seed derived from the Simulator Session
+            self.sparse_state_vector_simulator = QiskitSparseStateVectorSimulator \
+                .QiskitSparseStateVectorSimulator("sparse_state_vector_simulator", seed=self.generate_seed_simulator())
+
+        # Return the Sparse State Vector Simulator
+        return self.sparse_state_vector_simulator
+
+    # Retrieve the Batched State Vector Simulator of the Simulator Session,
+    # creating it, only the first time it is requested
+    def get_batched_state_vector_simulator(self):
+
+        # If the Batched State Vector Simulator was not created yet
+        if self.batched_state_vector_simulator is None:
+
+            # Create the Batched State Vector Simulator, with a Seed derived from the Simulator Session
+            self.batched_state_vector_simulator = QiskitBatchedStateVectorSimulator \
+                .QiskitBatchedStateVectorSimulator("batched_state_vector_simulator",
+                                                   seed=self.generate_seed_simulator())
+
+        # Return the Batched State Vector Simulator
+        return self.batched_state_vector_simulator
+
+    # Generate the Seed for a Job submitted to the Simulators, derived from the Seed of the Simulator Session
+    # (i.e., None, if the Simulator Session has no Seed, letting the Simulators choose a random one)
+    def generate_seed_simulator(self):
+
+        # If the Simulator Session has no Seed
+        if self.seed is None:
+
+            # Return None, letting the Simulators choose a random Seed
+            return None
+
+        # Return a new Seed, derived from the Random Generator of the Simulator Session
+        return int(self.random_generator.integers(0, MAX_SEED_SIMULATOR))
+
+    # Execute the given IBM Qiskit's Quantum Circuits, as one single Job, on the Backend with the given name,
+    # returning the Result of the Job (i.e., with the Measurement result of each Shot, if the memory is requested)
+    # NOTE: If no Seed is given for the Job, it is derived from the Simulator Session
+    def execute_quantum_circuits(self, quantum_circuits, backend_name=QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME,
+                                 num_shots=1, seed_simulator=None, memory=False):
+
+        # Execute the Quantum Circuits, as one single Job,
+        # with the given Seed or with a Seed derived from the Simulator Session
+        return execute(quantum_circuits, self.get_backend(backend_name), shots=num_shots, memory=memory,
+                       seed_simulator=(seed_simulator if seed_simulator is not None
+                                       else self.generate_seed_simulator())).result()
+
+    # Transpile a given IBM Qiskit's Quantum Circuit, for the Backend with the given name,
+    # in order to be executed several times, without repeating its transpilation
+    def transpile_quantum_circuit(self, quantum_circuit, backend_name=QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME):
+        return transpile(quantum_circuit, self.get_backend(backend_name))
+
+    # Run the given IBM Qiskit's Quantum Circuits, already transpiled, as one single Job,
+    # on the Backend with the given name, returning the Result of the Job
+    # (i.e., with the Measurement result of each Shot, if the memory is requested)
+    def run_transpiled_quantum_circuits(self, transpiled_quantum_circuits,
+                                        backend_name=QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME, num_shots=1,
+                                        memory=False):
+
+        # Run the Quantum Circuits, as one single Job, with a Seed derived from the Simulator Session
+        return self.get_backend(backend_name).run(transpiled_quantum_circuits, shots=num_shots, memory=memory,
+                                                  seed_simulator=self.generate_seed_simulator()).result()
+
+    # Execute the given IBM Qiskit's Quantum Circuits, as one single Job, on the QASM Simulator,
+    # returning the list of the Measurement results of each of them, as Dictionary Objects, for a frequency counting
+    # (i.e., or as lists of the Measurement results of each Shot, in order, if the memory is requested)
+    # NOTE: If the Quantum Circuits given were already transpiled, their transpilation is not repeated
+    def execute_quantum_circuits_on_qasm_simulator(self, quantum_circuits, num_shots=1, is_transpiled=False,
+                                                   memory=False):
+
+        # If the Quantum Circuits given were already transpiled
+        if is_transpiled:
+
+            # Run the Quantum Circuits, as one single Job, on the QASM Simulator
+            quantum_circuits_results = \
+                self.run_transpiled_quantum_circuits(quantum_circuits, QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME,
+                                                     num_shots, memory)
+
+        # If the Quantum Circuits given were not transpiled yet
+        else:
+
+            # Execute the Quantum Circuits, as one single Job, on the QASM Simulator
+            quantum_circuits_results = \
+                self.execute_quantum_circuits(quantum_circuits, QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME, num_shots,
+                                              memory=memory)
+
+        # If the Measurement results of each Shot are requested
+        if memory:
+
+            # Return the list of the Measurement results of each Shot, of each Quantum Circuit
+            return [quantum_circuits_results.get_memory(num_quantum_circuit)
+                    for num_quantum_circuit in range(len(quantum_circuits))]
+
+        # Return the list of the Measurement results of each Quantum Circuit
+        return [quantum_circuits_results.get_counts(num_quantum_circuit)
+                for num_quantum_circuit in range(len(quantum_circuits))]
+
+    # Compute the final State Vector of the given IBM Qiskit's Quantum Circuit, on the State Vector Simulator
+    def compute_state_vector(self, quantum_circuit):
+
+        # Execute the Quantum Circuit on the State Vector Simulator and return its final State Vector
+        # NOTE: The final State Vector is deterministic, and thus, a fixed Seed is given for the Job,
+        #       to not draw a Seed from the Simulator Session, which would shift the Seeds of the next Jobs
+        return self.execute_quantum_circuits(quantum_circuit, QISKIT_AER_STATE_VECTOR_SIMULATOR_BACKEND_NAME,
+                                             seed_simulator=0).get_statevector()
@@ -0,0 +1,241 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import the Cosine, the Sine, the Complex Exponential and the Pi constant from CMath
+from cmath import cos, sin, exp, pi
+
+
+# Constants
+
+# The tolerance, under which the Amplitudes of the Sparse State Vector are discarded, as null
+SPARSE_STATE_VECTOR_AMPLITUDE_TOLERANCE = 1e-12
+
+
+# Class for the Sparse State Vector of the IBM Qiskit's Sparse State Vector Simulator
+# NOTE: Only the non-null Amplitudes of the State Vector are kept, in a Dictionary Object,
+#       keyed by the index of the respective Basis State (i.e., with the Qubit 0 as the least significant Bit,
+#       as in the IBM Qiskit), and thus, its size grows with the number of non-null Amplitudes,
+#       instead of the number of Qubits (e.g., 2 Amplitudes for a GHZ State and n Amplitudes for a W State)
+class QiskitSparseStateVector:
+
+    # Constructor for the Sparse State Vector of the IBM Qiskit's Sparse State Vector Simulator
+    def __init__(self, num_qubits, amplitudes=None):
+
+        # Set the number of Qubits of the Sparse State Vector
+        self.num_qubits = num_qubits
+
+        # Set the non-null Amplitudes of the Sparse State Vector (i.e., all the Qubits in the state |0...0⟩)
+        self.amplitudes = (amplitudes if amplitudes is not None else {0: 1 + 0j})
+
+    # Return a copy of the Sparse State Vector
+    def copy(self):
+        return QiskitSparseStateVector(self.num_qubits, dict(self.amplitudes))
+
+    # Return the number of non-null Amplitudes of the Sparse State Vector
+    def get_num_amplitudes(self):
+        return len(self.amplitudes)
+
+    # Apply a Gate, given its name and parameters, to the given Qubits' indexes
+    def apply_gate(self, gate_name, qubits_indexes, gate_params):
+
+        # If the Gate is an Identity or a Barrier, nothing is done
+        if gate_name in ["id", "barrier"]:
+            return
+
+        # If the Gate is a Pauli-X Gate
+        elif gate_name == "x":
+            self.apply_pauli_x(qubits_indexes[0])
+
+        # If the Gate is a Pauli-Y Gate (i.e., |0⟩ -> i|1⟩ and |1⟩ -> -i|0⟩)
+        elif gate_name == "y":
+            self.apply_single_qubit_gate(qubits_indexes[0], 0, -1j, 1j, 0)
+
+        # If the Gate is a Pauli-Z Gate
+        elif gate_name == "z":
+            self.apply_phase(qubits_indexes[0], -1)
+
+        # If the Gate is a Hadamard Gate
+        elif gate_name == "h":
+            self.apply_single_qubit_gate(qubits_indexes[0], (2 ** -0.5), (2 ** -0.5), (2 ** -0.5), -(2 ** -0.5))
+
+        # If the Gate is a Phase S Gate
+        elif gate_name == "s":
+            self.apply_phase(qubits_indexes[0], 1j)
+
+        # If the Gate is an Adjoint of the Phase S Gate
+        elif gate_name == "sdg":
+            self.apply_phase(qubits_indexes[0], -1j)
+
+        # If the Gate is a Phase T Gate
+        elif gate_name == "t":
+            self.apply_phase(qubits_indexes[0], exp(0.25j * pi))
+
+        # If the Gate is an Adjoint of the Phase T Gate
+        elif gate_name == "tdg":
+            self.apply_phase(qubits_indexes[0], exp(-0.25j * pi))
+
+        # If the Gate is a Rotation around the X-Axis
+        elif gate_name == "rx":
+            self.apply_single_qubit_gate(qubits_indexes[0], cos(gate_params[0] / 2), -1j * sin(gate_params[0] / 2),
+                                         -1j * sin(gate_params[0] / 2), cos(gate_params[0] / 2))
+
+        # If the Gate is a Rotation around the Y-Axis
+        elif gate_name == "ry":
+            self.apply_single_qubit_gate(qubits_indexes[0], cos(gate_params[0] / 2), -sin(gate_params[0] / 2),
+                                         sin(gate_params[0] / 2), cos(gate_params[0] / 2))
+
+        # If the Gate is a Rotation around the Z-Axis
+        elif gate_name == "rz":
+            self.apply_single_qubit_gate(qubits_indexes[0], exp(-0.5j * gate_params[0]), 0,
+                                         0, exp(0.5j * gate_params[0]))
+
+        # If the Gate is a Controlled-X (CNOT) Gate
+        elif gate_name == "cx":
+            self.apply_controlled_x(qubits_indexes[0], qubits_indexes[1])
+
+        # If the Gate is a Controlled-Z Gate
+        elif gate_name == "cz":
+            self.apply_controlled_z(qubits_indexes[0], qubits_indexes[1])
+
+        # If the Gate is a SWAP Gate
+        elif gate_name == "swap":
+            self.apply_swap(qubits_indexes[0], qubits_indexes[1])
+
+        # If the Gate is a Controlled-SWAP (Fredkin) Gate
+        elif gate_name == "cswap":
+            self.apply_swap(qubits_indexes[1], qubits_indexes[2], control_qubit_index=qubits_indexes[0])
+
+        # If the Gate is not supported
+        else:
+
+            # Raise a Value Error
+            raise ValueError("The Gate {} is not supported by the Sparse State Vector Simulator!!!".format(gate_name))
+
+    # Apply a generic single Qubit Gate, given by the entries of its (2 x 2) Matrix, to a given Qubit's index
+    # (i.e., [[matrix_00, matrix_01], [matrix_10, matrix_11]], acting on the Basis States |0⟩ and |1⟩)
+    def apply_single_qubit_gate(self, qubit_index, matrix_00, matrix_01, matrix_10, matrix_11):
+
+        # Compute the mask of the given Qubit's index
+        qubit_mask = (1 << qubit_index)
+
+        # Initialise the new non-null Amplitudes of the Sparse State Vector
+        new_amplitudes = {}
+
+        # For each non-null Amplitude of the Sparse State Vector, and the index of its Basis State
+        for basis_state_index, amplitude in self.amplitudes.items():
+
+            # Compute the indexes of the Basis States, with the given Qubit in the states |0⟩ and |1⟩
+            basis_state_index_0 = (basis_state_index & ~qubit_mask)
+            basis_state_index_1 = (basis_state_index | qubit_mask)
+
+            # If the given Qubit is in the state |1⟩, on the current Basis State
+            if basis_state_index & qubit_mask:
+
+                # Add the contributions of the Amplitude, from the 2nd column of the Matrix of the Gate
+                new_amplitudes[basis_state_index_0] = new_amplitudes.get(basis_state_index_0, 0) + \
+                    (matrix_01 * amplitude)
+                new_amplitudes[basis_state_index_1] = new_amplitudes.get(basis_state_index_1, 0) + \
+                    (matrix_11 * amplitude)
+
+            # If the given Qubit is in the state |0⟩, on the current Basis State
+            else:
+
+                # Add the contributions of the Amplitude, from the 1st column of the Matrix of the Gate
+                new_amplitudes[basis_state_index_0] = new_amplitudes.get(basis_state_index_0, 0) + \
+                    (matrix_00 * amplitude)
+                new_amplitudes[basis_state_index_1] = new_amplitudes.get(basis_state_index_1, 0) + \
+                    (matrix_10 * amplitude)
+
+        # Keep only the non-null Amplitudes (i.e., discarding the ones which interfered destructively)
+        self.amplitudes = {basis_state_index: amplitude for basis_state_index, amplitude in new_amplitudes.items()
+                           if abs(amplitude) > SPARSE_STATE_VECTOR_AMPLITUDE_TOLERANCE}
+
+    # Apply the Pauli-X Gate to a given Qubit's index
+    def apply_pauli_x(self, qubit_index):
+        self.amplitudes = {(basis_state_index ^ (1 << qubit_index)): amplitude
+                           for basis_state_index, amplitude in self.amplitudes.items()}
+
+    # Apply a given Phase to the Basis States, where a given Qubit's index is in the state |1⟩
+    def apply_phase(self, qubit_index, phase):
+        self.amplitudes = {basis_state_index: ((amplitude * phase) if (basis_state_index >> qubit_index) & 1
+                                               else amplitude)
+                           for basis_state_index, amplitude in self.amplitudes.items()}
+
+    # Apply the Controlled-X (CNOT) Gate to given Control-Qubit's and Target-Qubit's indexes
+    def apply_controlled_x(self, control_qubit_index, target_qubit_index):
+        self.amplitudes = {((basis_state_index ^ (1 << target_qubit_index))
+                            if (basis_state_index >> control_qubit_index) & 1 else basis_state_index): amplitude
+                           for basis_state_index, amplitude in self.amplitudes.items()}
+
+    # Apply the Controlled-Z Gate to given Control-Qubit's and Target-Qubit's indexes
+    def apply_controlled_z(self, control_qubit_index, target_qubit_index):
+        self.amplitudes = {basis_state_index: (-amplitude if ((basis_state_index >> control_qubit_index) & 1) and
+                                               ((basis_state_index >> target_qubit_index) & 1) else amplitude)
+                           for basis_state_index, amplitude in self.amplitudes.items()}
+
+    # Apply the SWAP Gate to two given Qubits' indexes, optionally controlled by a given Control-Qubit's index
+    # (i.e., as a Controlled-SWAP (Fredkin) Gate)
+    def apply_swap(self, qubit_index_1, qubit_index_2, control_qubit_index=None):
+
+        # Compute the mask of both the given Qubits' indexes
+        qubits_mask = ((1 << qubit_index_1) | (1 << qubit_index_2))
+
+        # Initialise the new non-null Amplitudes of the Sparse State Vector
+        new_amplitudes = {}
+
+        # For each non-null Amplitude of the Sparse State Vector, and the index of its Basis State
+        for basis_state_index, amplitude in self.amplitudes.items():
+
+            # If the given Qubits are in different states, on the current Basis State,
+            # and the Control-Qubit, if any, is in the state |1⟩
+            if (((basis_state_index >> qubit_index_1) & 1) != ((basis_state_index >> qubit_index_2) & 1)) and \
+                    ((control_qubit_index is None) or ((basis_state_index >> control_qubit_index) & 1)):
+
+                # Swap the states of the given Qubits, on the current Basis State
+                basis_state_index ^= qubits_mask
+
+            # Keep the Amplitude, for the (possibly swapped) Basis State
+            new_amplitudes[basis_state_index] = amplitude
+
+        # Set the new non-null Amplitudes of the Sparse State Vector
+        self.amplitudes = new_amplitudes
+
+    # Measure a given Qubit's index in the Z-Basis (Computational Basis), returning the outcome (0 or 1)
+    def measure(self, qubit_index, random_generator):
+
+        # Compute the probability of the outcome 1, from the Amplitudes where the given Qubit is in the state |1⟩
+        probability_outcome_1 = sum((abs(amplitude) ** 2) for basis_state_index, amplitude in self.amplitudes.items()
+                                    if (basis_state_index >> qubit_index) & 1)
+
+        # Sample the random outcome of the Measurement, according to its probability
+        # (i.e., without consuming the Random Generator, if the outcome is deterministic)
+        if probability_outcome_1 <= SPARSE_STATE_VECTOR_AMPLITUDE_TOLERANCE:
+            outcome = 0
+        elif probability_outcome_1 >= (1 - SPARSE_STATE_VECTOR_AMPLITUDE_TOLERANCE):
+            outcome = 1
+        else:
+            outcome = int(random_generator.random() < probability_outcome_1)
+
+        # Compute the normalization factor, of the Amplitudes compatible with the outcome
+        normalization_factor = ((probability_outcome_1 if outcome == 1 else (1 - probability_outcome_1)) ** -0.5)
+
+        # Collapse the Sparse State Vector, keeping only the Amplitudes compatible with the outcome, renormalized
+        self.amplitudes = {basis_state_index: (amplitude * normalization_factor)
+                           for basis_state_index, amplitude in self.amplitudes.items()
+                           if ((basis_state_index >> qubit_index) & 1) == outcome}
+
+        # Return the outcome of the Measurement
+        return outcome
@@ -0,0 +1,55 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import QiskitBaseSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitBaseSimulator
+
+# Import QiskitSparseStateVector from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSparseStateVector
+
+
+# Constants
+
+# The names of the Gates (and other Instructions) supported by the Sparse State Vector Simulator
+# (i.e., the ones used to prepare and measure the Multipartite Entanglements and by the Party Entities)
+SPARSE_STATE_VECTOR_SIMULATOR_SUPPORTED_INSTRUCTIONS = ["id", "x", "y", "z", "h", "s", "sdg", "t", "tdg",
+                                                        "rx", "ry", "rz",
+                                                        "cx", "cz", "swap", "cswap", "measure", "reset", "barrier"]
+
+
+# Class for the IBM Qiskit's Sparse State Vector Simulator
+# NOTE: This Simulator keeps only the non-null Amplitudes of the State Vector, and thus, its cost grows with
+#       the number of non-null Amplitudes, instead of exponentially with the number of Qubits, supporting also
+#       non-Clifford Gates (e.g., the RY Gates used to prepare the W States), Measurements in the Z-Basis
+#       (Computational Basis), Resets and Gates classically conditioned on a single Bit
+class QiskitSparseStateVectorSimulator(QiskitBaseSimulator.QiskitBaseSimulator):
+
+    # The names of the Gates (and other Instructions) supported by the Sparse State Vector Simulator
+    supported_instructions = SPARSE_STATE_VECTOR_SIMULATOR_SUPPORTED_INSTRUCTIONS
+
+    # The error message of the Quantum Circuits not supported by the Sparse State Vector Simulator
+    unsupported_quantum_circuit_error_message = \
+        ("The Sparse State Vector Simulator only supports Quantum Circuits with the Gates {} "
+         "(unconditioned or conditioned on a single Bit)!!!"
+         .format(", ".join(SPARSE_STATE_VECTOR_SIMULATOR_SUPPORTED_INSTRUCTIONS)))
+
+    # Create the initial Sparse State Vector, for a given number of Qubits, all in the state |0...0⟩
+    def create_initial_state(self, num_qubits):
+        return QiskitSparseStateVector.QiskitSparseStateVector(num_qubits)
+
+    # Apply a Gate, given its name and parameters, to the given Qubits' indexes of a Sparse State Vector
+    def apply_gate(self, sparse_state_vector, gate_name, qubits_indexes, gate_params):
+        sparse_state_vector.apply_gate(gate_name, qubits_indexes, gate_params)
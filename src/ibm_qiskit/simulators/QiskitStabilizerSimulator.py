@@ -0,0 +1,52 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import QiskitBaseSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitBaseSimulator
+
+# Import QiskitStabilizerTableau from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitStabilizerTableau
+
+
+# Constants
+
+# The names of the Clifford Gates (and other Instructions) supported by the Stabilizer Simulator
+STABILIZER_SIMULATOR_SUPPORTED_INSTRUCTIONS = ["id", "x", "y", "z", "h", "s", "sdg",
+                                               "cx", "cz", "swap", "measure", "reset", "barrier"]
+
+
+# Class for the IBM Qiskit's Stabilizer Simulator
+# NOTE: This Simulator follows the Tableau representation of the Stabilizer Formalism
+#       (i.e., Aaronson-Gottesman's CHP algorithm), and thus, it only supports Clifford Gates,
+#       Measurements in the Z-Basis (Computational Basis) and Resets, running in polynomial time
+#       (as well as Clifford Gates classically conditioned on a single Bit, for the dynamic Quantum Circuits)
+class QiskitStabilizerSimulator(QiskitBaseSimulator.QiskitBaseSimulator):
+
+    # The names of the Clifford Gates (and other Instructions) supported by the Stabilizer Simulator
+    supported_instructions = STABILIZER_SIMULATOR_SUPPORTED_INSTRUCTIONS
+
+    # The error message of the Quantum Circuits not supported by the Stabilizer Simulator
+    unsupported_quantum_circuit_error_message = ("The Stabilizer Simulator only supports Quantum Circuits with "
+                                                 "Clifford Gates (unconditioned or conditioned on a single Bit), "
+                                                 "Measurements and Resets!!!")
+
+    # Create the initial Tableau, for a given number of Qubits, all in the state |0...0⟩
+    def create_initial_state(self, num_qubits):
+        return QiskitStabilizerTableau.QiskitStabilizerTableau(num_qubits)
+
+    # Apply a Clifford Gate, given its name, to the given Qubits' indexes of a Tableau
+    def apply_gate(self, tableau, gate_name, qubits_indexes, gate_params):
+        tableau.apply_gate(gate_name, qubits_indexes)
@@ -0,0 +1,216 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import N-Dimensional Arrays, Zeros, Identity Matrices, Non-Zeros and Sums from NumPy
+from numpy import array, zeros, eye, flatnonzero, sum as numpy_sum
+
+
+# Class for the Tableau of the IBM Qiskit's Stabilizer Simulator
+# NOTE: The first n rows are the Destabilizers and the last n rows are the Stabilizers,
+#       and the extra last row is a scratch row, used for the deterministic Measurements
+class QiskitStabilizerTableau:
+
+    # Constructor for the Tableau of the IBM Qiskit's Stabilizer Simulator
+    def __init__(self, num_qubits, x_bits=None, z_bits=None, phase_bits=None):
+
+        # Set the number of Qubits of the Tableau
+        self.num_qubits = num_qubits
+
+        # If the X and Z Bits and the Phases of the Tableau are not given
+        if x_bits is None:
+
+            # Initialise the X Bits of the Tableau (i.e., Destabilizers as X_i)
+            x_bits = zeros(((2 * num_qubits) + 1, num_qubits), dtype=bool)
+            x_bits[:num_qubits] = eye(num_qubits, dtype=bool)
+
+            # Initialise the Z Bits of the Tableau (i.e., Stabilizers as Z_i)
+            z_bits = zeros(((2 * num_qubits) + 1, num_qubits), dtype=bool)
+            z_bits[num_qubits:(2 * num_qubits)] = eye(num_qubits, dtype=bool)
+
+            # Initialise the Phase Bits of the Tableau
+            phase_bits = zeros(((2 * num_qubits) + 1,), dtype=bool)
+
+        # Set the X Bits, the Z Bits and the Phase Bits of the Tableau
+        self.x_bits = x_bits
+        self.z_bits = z_bits
+        self.phase_bits = phase_bits
+
+    # Return a copy of the Tableau
+    def copy(self):
+        return QiskitStabilizerTableau(self.num_qubits, self.x_bits.copy(), self.z_bits.copy(),
+                                       self.phase_bits.copy())
+
+    # Apply a Clifford Gate, given its name, to the given Qubits' indexes
+    def apply_gate(self, gate_name, qubits_indexes):
+
+        # If the Gate is an Identity or a Barrier, nothing is done
+        if gate_name in ["id", "barrier"]:
+            return
+
+        # If the Gate is a Pauli-X Gate
+        elif gate_name == "x":
+            self.apply_pauli_x(qubits_indexes[0])
+
+        # If the Gate is a Pauli-Y Gate
+        elif gate_name == "y":
+            self.phase_bits ^= (self.x_bits[:, qubits_indexes[0]] ^ self.z_bits[:, qubits_indexes[0]])
+
+        # If the Gate is a Pauli-Z Gate
+        elif gate_name == "z":
+            self.phase_bits ^= self.x_bits[:, qubits_indexes[0]]
+
+        # If the Gate is a Hadamard Gate
+        elif gate_name == "h":
+            self.apply_hadamard(qubits_indexes[0])
+
+        # If the Gate is a Phase S Gate
+        elif gate_name == "s":
+            self.apply_phase_s(qubits_indexes[0])
+
+        # If the Gate is an Adjoint of the Phase S Gate (i.e., S^3)
+        elif gate_name == "sdg":
+            for _ in range(3):
+                self.apply_phase_s(qubits_indexes[0])
+
+        # If the Gate is a Controlled-X (CNOT) Gate
+        elif gate_name == "cx":
+            self.apply_controlled_x(qubits_indexes[0], qubits_indexes[1])
+
+        # If the Gate is a Controlled-Z Gate (i.e., H_t x CNOT x H_t)
+        elif gate_name == "cz":
+            self.apply_hadamard(qubits_indexes[1])
+            self.apply_controlled_x(qubits_indexes[0], qubits_indexes[1])
+            self.apply_hadamard(qubits_indexes[1])
+
+        # If the Gate is a SWAP Gate
+        elif gate_name == "swap":
+            self.x_bits[:, qubits_indexes] = self.x_bits[:, qubits_indexes[::-1]]
+            self.z_bits[:, qubits_indexes] = self.z_bits[:, qubits_indexes[::-1]]
+
+        # If the Gate is not a supported Clifford Gate
+        else:
+
+            # Raise a Value Error
+            raise ValueError("The Gate {} is not supported by the Stabilizer Simulator!!!".format(gate_name))
+
+    # Apply the Pauli-X Gate to a given Qubit's index
+    def apply_pauli_x(self, qubit_index):
+        self.phase_bits ^= self.z_bits[:, qubit_index]
+
+    # Apply the Hadamard Gate to a given Qubit's index
+    def apply_hadamard(self, qubit_index):
+        self.phase_bits ^= (self.x_bits[:, qubit_index] & self.z_bits[:, qubit_index])
+        self.x_bits[:, qubit_index], self.z_bits[:, qubit_index] = \
+            self.z_bits[:, qubit_index].copy(), self.x_bits[:, qubit_index].copy()
+
+    # Apply the Phase S Gate to a given Qubit's index
+    def apply_phase_s(self, qubit_index):
+        self.phase_bits ^= (self.x_bits[:, qubit_index] & self.z_bits[:, qubit_index])
+        self.z_bits[:, qubit_index] ^= self.x_bits[:, qubit_index]
+
+    # Apply the Controlled-X (CNOT) Gate to given Control-Qubit's and Target-Qubit's indexes
+    def apply_controlled_x(self, control_qubit_index, target_qubit_index):
+        self.phase_bits ^= (self.x_bits[:, control_qubit_index] & self.z_bits[:, target_qubit_index] &
+                            ~(self.x_bits[:, target_qubit_index] ^ self.z_bits[:, control_qubit_index]))
+        self.x_bits[:, target_qubit_index] ^= self.x_bits[:, control_qubit_index]
+        self.z_bits[:, control_qubit_index] ^= self.z_bits[:, target_qubit_index]
+
+    # Multiply the given target rows of the Tableau by a given source row of the Tableau,
+    # keeping track of the resulting Phases
+    def multiply_rows(self, target_rows_indexes, source_row_index):
+
+        # Retrieve the X and Z Bits of the source row, as integers
+        x_bits_source = self.x_bits[source_row_index].astype(int)
+        z_bits_source = self.z_bits[source_row_index].astype(int)
+
+        # Retrieve the X and Z Bits of the target rows, as integers
+        x_bits_targets = self.x_bits[target_rows_indexes].astype(int)
+        z_bits_targets = self.z_bits[target_rows_indexes].astype(int)
+
+        # Compute the exponent of the i factor, resulting from the product of each pair of single Pauli Operators
+        i_exponents = ((x_bits_source & z_bits_source) * (z_bits_targets - x_bits_targets) +
+                       (x_bits_source & (1 - z_bits_source)) * (z_bits_targets * ((2 * x_bits_targets) - 1)) +
+                       ((1 - x_bits_source) & z_bits_source) * (x_bits_targets * (1 - (2 * z_bits_targets))))
+
+        # Compute the total exponent of the i factor, for each target row
+        total_i_exponents = ((2 * self.phase_bits[target_rows_indexes].astype(int)) +
+                             (2 * int(self.phase_bits[source_row_index])) +
+                             numpy_sum(i_exponents, axis=-1)) % 4
+
+        # Update the Phases and the X and Z Bits of the target rows
+        self.phase_bits[target_rows_indexes] = (total_i_exponents == 2)
+        self.x_bits[target_rows_indexes] ^= self.x_bits[source_row_index]
+        self.z_bits[target_rows_indexes] ^= self.z_bits[source_row_index]
+
+    # Measure a given Qubit's index in the Z-Basis (Computational Basis), returning the outcome (0 or 1)
+    def measure(self, qubit_index, random_generator):
+
+        # Retrieve the number of Qubits of the Tableau
+        num_qubits = self.num_qubits
+
+        # Retrieve the Stabilizers which anti-commute with the Pauli-Z Operator on the given Qubit
+        anti_commuting_stabilizers_indexes = flatnonzero(self.x_bits[num_qubits:(2 * num_qubits), qubit_index])
+
+        # If some Stabilizer anti-commutes with the Pauli-Z Operator on the given Qubit,
+        # the outcome of the Measurement is random
+        if len(anti_commuting_stabilizers_indexes) > 0:
+
+            # Retrieve the first Stabilizer which anti-commutes with the Pauli-Z Operator on the given Qubit
+            pivot_row_index = num_qubits + anti_commuting_stabilizers_indexes[0]
+
+            # Retrieve all the other rows (except the scratch one) which also anti-commute with
+            # the Pauli-Z Operator on the given Qubit
+            rows_indexes = flatnonzero(self.x_bits[:(2 * num_qubits), qubit_index])
+            rows_indexes = rows_indexes[rows_indexes != pivot_row_index]
+
+            # Multiply all the other anti-commuting rows by the pivot row
+            if len(rows_indexes) > 0:
+                self.multiply_rows(rows_indexes, pivot_row_index)
+
+            # The respective Destabilizer becomes the previous pivot Stabilizer
+            self.x_bits[pivot_row_index - num_qubits] = self.x_bits[pivot_row_index]
+            self.z_bits[pivot_row_index - num_qubits] = self.z_bits[pivot_row_index]
+            self.phase_bits[pivot_row_index - num_qubits] = self.phase_bits[pivot_row_index]
+
+            # Sample the random outcome of the Measurement
+            outcome = int(random_generator.integers(2))
+
+            # The pivot Stabilizer becomes the Pauli-Z Operator on the given Qubit, with the sampled sign
+            self.x_bits[pivot_row_index] = False
+            self.z_bits[pivot_row_index] = False
+            self.z_bits[pivot_row_index, qubit_index] = True
+            self.phase_bits[pivot_row_index] = bool(outcome)
+
+            # Return the outcome of the Measurement
+            return outcome
+
+        # If no Stabilizer anti-commutes with the Pauli-Z Operator on the given Qubit,
+        # the outcome of the Measurement is deterministic
+        scratch_row_index = 2 * num_qubits
+
+        # Clear the scratch row of the Tableau
+        self.x_bits[scratch_row_index] = False
+        self.z_bits[scratch_row_index] = False
+        self.phase_bits[scratch_row_index] = False
+
+        # For each Destabilizer which anti-commutes with the Pauli-Z Operator on the given Qubit
+        for destabilizer_row_index in flatnonzero(self.x_bits[:num_qubits, qubit_index]):
+
+            # Multiply the scratch row by the respective Stabilizer
+            self.multiply_rows(array([scratch_row_index]), num_qubits + destabilizer_row_index)
+
+        # Return the outcome of the Measurement, given by the Phase of the scratch row
+        return int(self.phase_bits[scratch_row_index])
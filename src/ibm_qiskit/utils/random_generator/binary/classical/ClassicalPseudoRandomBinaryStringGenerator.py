@@ -0,0 +1,73 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Packages and Libraries
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import Zeros and Unsigned Integer (8 bits) from NumPy
+from numpy import zeros, uint8
+
+
+# Constants
+
+# The ASCII code of the character '0', used to convert arrays of bits to Binary Strings
+ASCII_CODE_CHARACTER_ZERO = ord("0")
+
+
+# Class for Classical Pseudo Random Binary String Generator
+# NOTE: The Random Generator is seeded from the given entropy (e.g., an integer, a Seed Sequence, or even,
+#       an integer obtained from a Quantum True Random Binary String), or from the Operating System, if it is None
+class ClassicalPseudoRandomBinaryStringGenerator:
+
+    # Constructor for Classical Pseudo Random Binary String Generator
+    def __init__(self, name, seed=None):
+
+        # Set the name of the Classical Pseudo Random Binary String Generator
+        self.name = name
+
+        # Set the Seed (i.e., the entropy) of the Classical Pseudo Random Binary String Generator
+        self.seed = seed
+
+        # Set the Random Generator of the Classical Pseudo Random Binary String Generator
+        self.random_generator = default_rng(seed)
+
+    # Return the Seed of the Classical Pseudo Random Binary String Generator
+    def get_seed(self):
+        return self.seed
+
+    # Generate a Pseudo Random Binary String, with the given length and exactly the given Hamming Weight,
+    # in O(n) time, choosing uniformly at random the positions of its bits set to 1
+    # (i.e., without any rejection sampling over whole Binary Strings)
+    def generate_fixed_hamming_weight_binary_string(self, binary_string_length, hamming_weight):
+
+        # If the Hamming Weight is not valid, for the given length of the Binary String
+        if (hamming_weight < 0) or (hamming_weight > binary_string_length):
+
+            # Raise a Value Error
+            raise ValueError("The Hamming Weight must be between 0 and the length of the Binary String!!!")
+
+        # Choose the positions of the bits set to 1, uniformly at random and without repetitions
+        positions_bits_set_to_one = self.random_generator.choice(binary_string_length, size=hamming_weight,
+                                                                 replace=False)
+
+        # Initialise the array of the bits of the Binary String, all set to 0
+        binary_string_bits = zeros(binary_string_length, dtype=uint8)
+
+        # Set to 1 the bits in the chosen positions
+        binary_string_bits[positions_bits_set_to_one] = 1
+
+        # Convert the array of the bits to a Binary String and return it
+        return (binary_string_bits + ASCII_CODE_CHARACTER_ZERO).tobytes().decode("ascii")
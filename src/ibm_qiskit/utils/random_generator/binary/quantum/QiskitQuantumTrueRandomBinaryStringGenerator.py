@@ -14,11 +14,11 @@ Acknowledgments:
 
 # Import Packages and Libraries
 
-# Import shuffle from Random Library
-from random import shuffle
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
 
-# Import Aer and execute from Qiskit
-from qiskit import Aer, execute, QiskitError
+# Import QiskitError from Qiskit
+from qiskit import QiskitError
 
 # Import QiskitQuantumCircuit from IBM_Qiskit.Circuit
 from src.ibm_qiskit.circuit import QiskitQuantumCircuit
@@ -32,6 +32,12 @@ from src.ibm_qiskit.circuit.registers.quantum import QiskitQuantumRegister
 # Import QiskitQuantumHadamardTransform from IBM_Qiskit.Utils.Transforms
 from src.ibm_qiskit.utils.transforms import QiskitQuantumHadamardTransform
 
+# Import QiskitSimulatorSession from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSimulatorSession
+
+# Import the maximum Seed for the Jobs submitted to the Simulators from IBM_Qiskit.Simulators.QiskitSimulatorSession
+from src.ibm_qiskit.simulators.QiskitSimulatorSession import MAX_SEED_SIMULATOR
+
 # Import some important constant values, regarding some parameters of the IBM's Qiskit
 
 # Import the maximum number of Qubits and the default number of Counts for
@@ -44,12 +50,24 @@ from src.ibm_qiskit.common.QiskitLibraryParameters import \
 class QiskitQuantumTrueRandomBinaryStringGenerator:
 
     # Constructor for IBM Qiskit's Quantum True Random Binary String Generator (QTRBSG)
+    # NOTE: If a Seed is given, both the Jobs submitted to the Simulators and the tie-breaking shuffles
+    #       are derived from it, making the generated Binary Strings reproducible (i.e., for simulations only)
     def __init__(self, name, binary_string_length=QISKIT_LIBRARY_QASM_SIMULATOR_MAX_NUM_QUBITS,
-                 num_counts=QISKIT_DEFAULT_NUM_COUNTS):
+                 num_counts=QISKIT_DEFAULT_NUM_COUNTS, seed=None):
         self.name = name
         self.binary_string_length = binary_string_length
         self.num_counts = num_counts
 
+        # Set the Seed of the Quantum True Random Binary String Generator (QTRBSG)
+        self.seed = seed
+
+        # Set the Random Generator of the Quantum True Random Binary String Generator (QTRBSG)
+        self.random_generator = default_rng(seed)
+
+    # Return the Seed of the Quantum True Random Binary String Generator (QTRBSG)
+    def get_seed(self):
+        return self.seed
+
     # Generate a True Random Binary String
     def generate_true_random_binary_string(self, quantum_register_index, classical_register_index):
 
@@ -82,15 +100,15 @@ class QiskitQuantumTrueRandomBinaryStringGenerator:
         qiskit_quantum_hadamard_transform_circuit_true_random_binary_string\
             .measure_all_qubits(quantum_register_index, classical_register_index)
 
-        # Getting the Backend for the QASM (Quantum ASseMbly) for the simulation of the Quantum Circuit
-        # (i.e., the Measurement Results as a Dictionary Object, for a frequency counting)
-        qasm_backend = Aer.get_backend("qasm_simulator")
-
-        # Execute the Quantum Circuit and store the Measurement results in a Dictionary Object,
-        # for a frequency counting
-        final_results_frequency_counting = \
-            execute(qiskit_quantum_hadamard_transform_circuit_true_random_binary_string.quantum_circuit,
-                    qasm_backend, shots=self.num_counts).result().get_counts()
+        # Execute the Quantum Circuit on the QASM (Quantum ASseMbly) Simulator of the default Simulator Session
+        # and store the Measurement results in a Dictionary Object, for a frequency counting
+        final_results_frequency_counting = QiskitSimulatorSession.QiskitSimulatorSession \
+            .get_default_qiskit_simulator_session() \
+            .execute_quantum_circuits(qiskit_quantum_hadamard_transform_circuit_true_random_binary_string
+                                      .quantum_circuit, num_shots=self.num_counts,
+                                      seed_simulator=(None if self.seed is None else
+                                                      int(self.random_generator.integers(0, MAX_SEED_SIMULATOR))))\
+            .get_counts()
 
         # Try to retrieve one unique Quantum True Random Binary String (QTRBS) from
         # the most frequent (maximum) value of all the keys of the Dictionary for the frequency counting
@@ -113,7 +131,7 @@ class QiskitQuantumTrueRandomBinaryStringGenerator:
 
             # Shuffle the list of the several most frequent (maximum) values of all the keys of
             # the Dictionary for the frequency counting
-            shuffle(final_quantum_true_random_binary_string_list_shuffled)
+            self.random_generator.shuffle(final_quantum_true_random_binary_string_list_shuffled)
 
             # Pop the first element of shuffled list of the several most frequent (maximum) values of all the keys of
             # the Dictionary for the frequency counting
@@ -0,0 +1,96 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import the String IDs for some types of the Events of the Protocol
+from src.common.enumerations.SemiQuantumCryptographyProtocolEventTypes import ROUND_STARTED, ROUND_FINISHED
+
+# Import the String ID for the Measurement by Inverting Quantum Circuit
+# from Common.Enumerations.StrategiesForEavesdroppingDetection
+from src.common.enumerations.StrategiesForEavesdroppingDetection import MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT
+
+# Import GHZ_STATE and W_STATE IDs from Common.QuantumEntanglementTypes
+from src.common.enumerations.QuantumEntanglementTypes import GHZ_STATE, W_STATE
+
+# Import ProtocolEventLog from Common.Events
+from src.common.events import ProtocolEventLog
+
+# Import the Benchmark of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+from benchmark import BenchmarkQiskitSQCKAProtocolExecutorService
+
+
+# Test Cases for the Benchmark of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class BenchmarkQiskitSQCKAProtocolExecutorServiceTests(unittest.TestCase):
+
+    # Keep the default Event Log, since the Benchmark replaces it, to measure the latencies of the phases
+    def setUp(self):
+        self.default_protocol_event_log = ProtocolEventLog.ProtocolEventLog.default_protocol_event_log
+
+    # Restore the default Event Log, to not affect the other Tests
+    def tearDown(self):
+        ProtocolEventLog.ProtocolEventLog.default_protocol_event_log = self.default_protocol_event_log
+
+    # Test #1 for the Benchmark of the Protocol
+    # Description of the Test Case:
+    # 1) The configurations of the Benchmark are the Cartesian product of the given values, smallest ones first;
+    def test_build_benchmark_configurations(self):
+
+        # Build the configurations of the Benchmark, for 2 numbers of Parties and Rounds and 2 Quantum Entanglements
+        benchmark_configurations = BenchmarkQiskitSQCKAProtocolExecutorService \
+            .build_benchmark_configurations([3, 4], [16, 32], [GHZ_STATE, W_STATE],
+                                            [MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT])
+
+        # Assert that all the configurations were built, from the smallest number of Rounds to the largest one
+        self.assertEqual(len(benchmark_configurations), 8)
+        self.assertEqual([benchmark_configuration["num_rounds"] for benchmark_configuration
+                          in benchmark_configurations], ([16] * 4) + ([32] * 4))
+
+    # Test #2 for the Benchmark of the Protocol
+    # Description of the Test Case:
+    # 1) Run the Benchmark for 16 Rounds, with 3 Parties and a GHZ State, measuring the throughput of Rounds,
+    #    the peak Resident Set Size (RSS) and the latencies of the phases of the Protocol;
+    # 2) Run the Benchmark for 2 Parties and a GHZ State, which is an invalid configuration;
+    def test_run_benchmark_configuration_16_rounds_ghz_state(self):
+
+        # Build the configurations of the Benchmark, for 2 and 3 Parties, with 16 Rounds and a GHZ State
+        benchmark_configuration_2_parties, benchmark_configuration_3_parties = \
+            BenchmarkQiskitSQCKAProtocolExecutorService \
+            .build_benchmark_configurations([2, 3], [16], [GHZ_STATE], [MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT])
+
+        # Run the Benchmark, for 3 Parties, in the current Process
+        benchmark_results = BenchmarkQiskitSQCKAProtocolExecutorService \
+            .run_benchmark_configuration(benchmark_configuration_3_parties)
+
+        # Assert that all the Rounds were executed, with a positive throughput
+        self.assertEqual(benchmark_results["status"], BenchmarkQiskitSQCKAProtocolExecutorService
+                         .BENCHMARK_STATUS_OK)
+        self.assertEqual(benchmark_results["num_rounds_executed"], 16)
+        self.assertGreater(benchmark_results["rounds_per_second"], 0)
+
+        # Assert that the latencies of the start and end of the Rounds were measured, once per Round
+        self.assertEqual(benchmark_results["phases_latencies"][ROUND_STARTED]["count"], 16)
+        self.assertEqual(benchmark_results["phases_latencies"][ROUND_FINISHED]["count"], 16)
+
+        # Assert that the configuration for 2 Parties is invalid, since GHZ States require, at least, 3 Parties
+        self.assertEqual(BenchmarkQiskitSQCKAProtocolExecutorService
+                         .run_benchmark_configuration(benchmark_configuration_2_parties)["status"],
+                         BenchmarkQiskitSQCKAProtocolExecutorService.BENCHMARK_STATUS_INVALID_CONFIGURATION)
+
+
+if __name__ == '__main__':
+    unittest.main()
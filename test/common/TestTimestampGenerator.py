@@ -212,6 +212,38 @@ class TimestampPseudoRandomGeneratorTests(unittest.TestCase):
         # Dummy Assert Equal for Unittest
         self.assertEqual(True, True)
 
+    # Test #8 for Generation of Timestamps
+    # Description of the Test Case:
+    # - Generate 10 Pseudo Random Timestamps, twice, with Timestamp's Generators with the same Seed,
+    #   checking that the same Pseudo Random Timestamps are generated;
+    def test_generate_10_pseudo_random_timestamps_with_seed_reproducible(self):
+
+        # Print the Heading Logging for the Test #8
+        print("--- Test #8 for Generation of Timestamps ---")
+
+        # Create two Timestamp's Generators, with the same Seed
+        timestamp_generators = [TimestampGenerator.TimestampGenerator("timestamp_generator_{}".format(num), seed=42)
+                                for num in range(2)]
+
+        # Generate a list of 10 Pseudo Random Timestamps, for each Timestamp's Generator
+        pseudo_random_timestamps_lists = [list(timestamp_generator
+                                               .generate_random_timestamps(10, weeks_delta=0, days_delta=0,
+                                                                           hours_delta=0, minutes_delta=2,
+                                                                           seconds_delta=60, milliseconds_delta=0,
+                                                                           microseconds_delta=999))
+                                          for timestamp_generator in timestamp_generators]
+
+        # Compute the offsets of the Pseudo Random Timestamps from the current Timestamp of each Generator
+        # (i.e., since the Generators may have been created at slightly different instants)
+        pseudo_random_timestamps_offsets_lists = \
+            [[pseudo_random_timestamp - timestamp_generator.get_now_customised_format()
+              for pseudo_random_timestamp in pseudo_random_timestamps]
+             for timestamp_generator, pseudo_random_timestamps in zip(timestamp_generators,
+                                                                      pseudo_random_timestamps_lists)]
+
+        # Assert that the same Pseudo Random Timestamps were generated, with the same Seed
+        self.assertEqual(pseudo_random_timestamps_offsets_lists[0], pseudo_random_timestamps_offsets_lists[1])
+
 
 if __name__ == '__main__':
 
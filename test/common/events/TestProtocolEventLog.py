@@ -0,0 +1,160 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import Loads from the JSON Library
+from json import loads
+
+# Import the Temporary Directory from the TempFile Library
+from tempfile import TemporaryDirectory
+
+# Import Join from the OS.Path Library
+from os.path import join
+
+# Import the String IDs for some types of the Events of the Protocol
+from src.common.enumerations.SemiQuantumCryptographyProtocolEventTypes import ROUND_STARTED, EAVESDROPPING_ALERT, \
+    ROUND_FINISHED
+
+# Import ProtocolEventLog from Common.Events
+from src.common.events import ProtocolEventLog
+
+# Import the Sinks for the Events of the Protocol from Common.Events.Sinks
+from src.common.events.sinks import NullProtocolEventSink, RingBufferProtocolEventSink, \
+    JSONLinesFileProtocolEventSink, LatencyProtocolEventSink
+
+
+# Test Cases for the Event Log of the Protocol
+class ProtocolEventLogTests(unittest.TestCase):
+
+    # Test #1 for the Event Log of the Protocol
+    # Description of the Test Case:
+    # 1) An Event Log only with Null Sinks is disabled, and does not create any Event;
+    def test_null_sinks_disable_the_event_log(self):
+
+        # Create an Event Log, only with a Null Sink
+        protocol_event_log = ProtocolEventLog \
+            .ProtocolEventLog("protocol_event_log", [NullProtocolEventSink.NullProtocolEventSink("null_sink")])
+
+        # Assert that the Event Log is disabled, without any Sink to write the Events
+        self.assertFalse(protocol_event_log.is_enabled())
+        self.assertEqual(protocol_event_log.get_protocol_event_sinks(), [])
+
+        # Assert that emitting an Event, with an invalid format, does not fail, since it is never formatted
+        protocol_event_log.emit(ROUND_STARTED, 0, "{missing_field}")
+
+    # Test #2 for the Event Log of the Protocol
+    # Description of the Test Case:
+    # 1) The Ring Buffer Sink keeps only the most recent Events, without formatting their messages;
+    # 2) The messages of the Events are formatted on demand, from their fields;
+    def test_ring_buffer_sink_keeps_most_recent_events(self):
+
+        # Create a Ring Buffer Sink, with a capacity of 3 Events
+        ring_buffer_protocol_event_sink = RingBufferProtocolEventSink \
+            .RingBufferProtocolEventSink("ring_buffer_sink", 3)
+
+        # Create an Event Log, with the Ring Buffer Sink
+        protocol_event_log = ProtocolEventLog.ProtocolEventLog("protocol_event_log",
+                                                               [ring_buffer_protocol_event_sink])
+
+        # Emit 5 Events, one for each Round
+        for num_round in range(5):
+            protocol_event_log.emit(ROUND_STARTED, num_round, "ROUND #{num_round} is a {type_round}...",
+                                    type_round="SIFT")
+
+        # Retrieve the Events kept in the Ring Buffer
+        protocol_events = ring_buffer_protocol_event_sink.get_protocol_events()
+
+        # Assert that only the 3 most recent Events were kept, in order
+        self.assertEqual([protocol_event.get_num_round() for protocol_event in protocol_events], [2, 3, 4])
+
+        # Assert that the message of an Event is formatted from its fields
+        self.assertEqual(protocol_events[-1].get_message(), "ROUND #4 is a SIFT...")
+
+        # Assert that a Ring Buffer Sink can not have an invalid capacity
+        with self.assertRaises(ValueError):
+            RingBufferProtocolEventSink.RingBufferProtocolEventSink("ring_buffer_sink", 0)
+
+    # Test #3 for the Event Log of the Protocol
+    # Description of the Test Case:
+    # 1) The JSON Lines File Sink writes one JSON Object per Event, with its structured fields;
+    def test_json_lines_file_sink_writes_structured_events(self):
+
+        # Create a Temporary Directory for the JSON Lines File
+        with TemporaryDirectory() as temporary_directory:
+
+            # Build the path of the JSON Lines File
+            json_lines_file_path = join(temporary_directory, "protocol_events.jsonl")
+
+            # Create an Event Log, with a JSON Lines File Sink
+            protocol_event_log = ProtocolEventLog.ProtocolEventLog(
+                "protocol_event_log",
+                [JSONLinesFileProtocolEventSink.JSONLinesFileProtocolEventSink("json_lines_file_sink",
+                                                                               json_lines_file_path)]
+            )
+
+            # Emit 2 Events and close the Event Log
+            protocol_event_log.emit(ROUND_STARTED, 7, "ROUND #{num_round}", type_round="CTRL")
+            protocol_event_log.emit(EAVESDROPPING_ALERT, 7, "ALERT!!!", round_results="010")
+            protocol_event_log.close()
+
+            # Read the JSON Objects written to the JSON Lines File
+            with open(json_lines_file_path, encoding="utf-8") as json_lines_file:
+                protocol_events_dictionaries = [loads(json_line) for json_line in json_lines_file]
+
+        # Assert that both Events were written, with their structured fields
+        self.assertEqual([(protocol_event_dictionary["event_type"], protocol_event_dictionary["num_round"])
+                          for protocol_event_dictionary in protocol_events_dictionaries],
+                         [(ROUND_STARTED, 7), (EAVESDROPPING_ALERT, 7)])
+        self.assertEqual(protocol_events_dictionaries[0]["type_round"], "CTRL")
+        self.assertEqual(protocol_events_dictionaries[1]["round_results"], "010")
+
+    # Test #4 for the Event Log of the Protocol
+    # Description of the Test Case:
+    # 1) The Latency Sink accounts the elapsed time before each Event, grouped by the type of the Event;
+    # 2) The Latency Sink can be reset, discarding the latencies already measured;
+    def test_latency_sink_measures_latencies_of_phases(self):
+
+        # Create a Latency Sink
+        latency_protocol_event_sink = LatencyProtocolEventSink.LatencyProtocolEventSink("latency_sink")
+
+        # Create an Event Log, with the Latency Sink
+        protocol_event_log = ProtocolEventLog.ProtocolEventLog("protocol_event_log", [latency_protocol_event_sink])
+
+        # Emit one Event, which is discarded by the reset of the Latency Sink
+        protocol_event_log.emit(EAVESDROPPING_ALERT, None, "ALERT!!!")
+        latency_protocol_event_sink.reset()
+
+        # Emit the start and the end of 4 Rounds
+        for num_round in range(4):
+            protocol_event_log.emit(ROUND_STARTED, num_round, "ROUND #{num_round}")
+            protocol_event_log.emit(ROUND_FINISHED, num_round, "ROUND #{num_round}")
+
+        # Retrieve the summary of the latencies of the phases
+        phases_latencies_summary = latency_protocol_event_sink.get_phases_latencies_summary()
+
+        # Assert that only the phases ended after the reset were accounted, once per Round
+        self.assertEqual(sorted(phases_latencies_summary.keys()), sorted([ROUND_STARTED, ROUND_FINISHED]))
+        self.assertEqual(phases_latencies_summary[ROUND_FINISHED]["count"], 4)
+
+        # Assert that the latencies are consistent (i.e., non-negative and bounded by their maximum)
+        self.assertTrue(all(0 <= latency <= phases_latencies_summary[ROUND_STARTED]["max_seconds"]
+                            for latency in latency_protocol_event_sink.get_phases_latencies()[ROUND_STARTED]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import required Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import BitPackedBinaryString from Common.Utils
+from src.common.utils import BitPackedBinaryString
+
+
+# Test Cases for the Bit-Packed Binary String
+class BitPackedBinaryStringTests(unittest.TestCase):
+
+    # Test that a Bit-Packed Binary String keeps the bits of the Binary String it was created from
+    def test_bit_packed_binary_string_from_binary_string(self):
+
+        # For several Binary Strings, with lengths multiple of 8 and not
+        for binary_string in ["", "1", "0110", "10000001", "1011001110001"]:
+
+            # Create the Bit-Packed Binary String, from the Binary String
+            bit_packed_binary_string = BitPackedBinaryString.BitPackedBinaryString.from_binary_string(binary_string)
+
+            # Assert the length, the bits (as integers), the Binary String and the Hamming Weight
+            self.assertEqual(len(bit_packed_binary_string), len(binary_string))
+            self.assertEqual([bit_packed_binary_string[index] for index in range(len(binary_string))],
+                             [int(bit) for bit in binary_string])
+            self.assertEqual(list(bit_packed_binary_string), [int(bit) for bit in binary_string])
+            self.assertEqual(str(bit_packed_binary_string), binary_string)
+            self.assertEqual(bit_packed_binary_string, binary_string)
+            self.assertEqual(bit_packed_binary_string.compute_hamming_weight(), binary_string.count("1"))
+
+            # Assert the number of packed bytes (i.e., 8 bits per byte)
+            self.assertEqual(len(bit_packed_binary_string.get_packed_bits()), ((len(binary_string) + 7) // 8))
+
+    # Test the slicing, the negative indexes and the indexes of the bits of a Bit-Packed Binary String
+    def test_bit_packed_binary_string_slices_and_indexes(self):
+
+        # Create the Bit-Packed Binary String, from a Binary String
+        bit_packed_binary_string = BitPackedBinaryString.BitPackedBinaryString.from_binary_string("1011001110001")
+
+        # Assert the slices and the negative indexes
+        self.assertEqual(bit_packed_binary_string[2:9], "1100111")
+        self.assertEqual(bit_packed_binary_string[::4], "1011")
+        self.assertEqual(bit_packed_binary_string[-1], 1)
+        self.assertEqual(bit_packed_binary_string[-2], 0)
+
+        # Assert the indexes of the bits set to 1 and to 0
+        self.assertEqual(bit_packed_binary_string.get_indexes_of_bits(1).tolist(), [0, 2, 3, 6, 7, 8, 12])
+        self.assertEqual(bit_packed_binary_string.get_indexes_of_bits(0).tolist(), [1, 4, 5, 9, 10, 11])
+
+        # Assert that an index out of the range is rejected
+        with self.assertRaises(IndexError):
+            bit_packed_binary_string[13]
+
+    # Test that a Binary String with characters other than '0' and '1' is rejected
+    def test_invalid_binary_string(self):
+
+        # Assert that a Value Error is raised
+        with self.assertRaises(ValueError):
+            BitPackedBinaryString.BitPackedBinaryString.from_binary_string("01a0")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import required Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import Array from NumPy
+from numpy import array
+
+# Import BitPackedBinaryString from Common.Utils
+from src.common.utils import BitPackedBinaryString
+
+# Import BitStatistics from Common.Utils
+from src.common.utils import BitStatistics
+
+# Import Utilities from Common.Utils.Utilities
+from src.common.utils.Utilities import Utilities
+
+
+# Test Cases for the Statistics of Bits
+class BitStatisticsTests(unittest.TestCase):
+
+    # Test the Hamming Weight, for all the representations of the bits
+    def test_hamming_weight(self):
+
+        # The Binary String of the bits
+        binary_string = "1011001110001"
+
+        # For each representation of the bits
+        for bits in [binary_string, BitPackedBinaryString.BitPackedBinaryString.from_binary_string(binary_string),
+                     array([int(bit) for bit in binary_string])]:
+
+            # Assert the Hamming Weight of the bits
+            self.assertEqual(BitStatistics.BitStatistics.compute_hamming_weight(bits), 7)
+            self.assertEqual(Utilities.compute_hamming_weight(bits), 7)
+
+    # Test the Quantum Bit Error Rate (QBER) between two keys, for all the representations of the keys
+    def test_quantum_bit_error_rate(self):
+
+        # The Binary Strings of both keys, with 3 different bits in 12
+        binary_string_1, binary_string_2 = "101100111000", "100100101001"
+
+        # The Bit-Packed Binary Strings of both keys
+        bit_packed_binary_string_1, bit_packed_binary_string_2 = \
+            [BitPackedBinaryString.BitPackedBinaryString.from_binary_string(binary_string)
+             for binary_string in [binary_string_1, binary_string_2]]
+
+        # Assert the Quantum Bit Error Rate (QBER), for all the combinations of representations of the keys
+        self.assertEqual(BitStatistics.BitStatistics
+                         .compute_quantum_bit_error_rate(binary_string_1, binary_string_2), 0.25)
+        self.assertEqual(BitStatistics.BitStatistics
+                         .compute_quantum_bit_error_rate(bit_packed_binary_string_1, bit_packed_binary_string_2), 0.25)
+        self.assertEqual(BitStatistics.BitStatistics
+                         .compute_quantum_bit_error_rate(bit_packed_binary_string_1, binary_string_2), 0.25)
+
+        # Assert that keys with different lengths are rejected
+        with self.assertRaises(ValueError):
+            BitStatistics.BitStatistics.compute_quantum_bit_error_rate(binary_string_1, binary_string_2[1:])
+
+        # Assert the Binary Entropy of some Quantum Bit Error Rates (QBERs)
+        self.assertEqual(BitStatistics.BitStatistics.compute_binary_entropy(0.0), 0.0)
+        self.assertEqual(BitStatistics.BitStatistics.compute_binary_entropy(0.5), 1.0)
+        self.assertAlmostEqual(BitStatistics.BitStatistics.compute_binary_entropy(0.11), 0.4999, places=4)
+
+    # Test the bias, the lengths of the runs and the windowed Hamming Weights of the bits
+    def test_bias_runs_and_windowed_hamming_weights(self):
+
+        # The Binary String of the bits
+        binary_string = "11100100"
+
+        # Assert the bias, the lengths of the runs and the windowed Hamming Weights of the bits
+        self.assertEqual(BitStatistics.BitStatistics.compute_bias(binary_string), 0.0)
+        self.assertEqual(BitStatistics.BitStatistics.compute_runs_lengths(binary_string).tolist(), [3, 2, 1, 2])
+        self.assertEqual(BitStatistics.BitStatistics.compute_runs_lengths("").tolist(), [])
+        self.assertEqual(BitStatistics.BitStatistics
+                         .compute_windowed_hamming_weights(binary_string, 3).tolist(), [3, 2, 1, 1, 1, 1])
+        self.assertEqual(BitStatistics.BitStatistics
+                         .compute_windowed_hamming_weights(binary_string, 4, 4).tolist(), [3, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
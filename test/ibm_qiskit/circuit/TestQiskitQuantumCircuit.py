@@ -1219,6 +1219,78 @@ class HadamardGateTests(unittest.TestCase):
         self.assertEqual(True, True)
 
 
+# Test Cases for the Barriers
+class BarriersTests(unittest.TestCase):
+
+    # Test #1 for the Barriers
+    # Description of the Test Case:
+    # 1) The Quantum Circuit is created with a Quantum Register,
+    #    with 2 Qubits initialized in the state |00⟩, recording the Barriers (by default);
+    # 2) The Barriers are applied to a single Qubit, to an interval of Qubits and to all the Qubits;
+    # 3) The Barriers are recorded in the Quantum Circuit;
+    def test_barriers_1(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively
+        num_qubits = num_bits = 2
+
+        # Creation of the IBM Qiskit's Quantum and Classical Registers
+        qiskit_quantum_register_barriers_1 = QiskitQuantumRegister.QiskitQuantumRegister("qrbarriers1", num_qubits)
+        qiskit_classical_register_barriers_1 = QiskitClassicalRegister.QiskitClassicalRegister("crbarriers1", num_bits)
+
+        # Creation of the IBM Qiskit's Quantum Circuit with one Quantum and Classical Registers
+        qiskit_quantum_circuit_barriers_1 = \
+            QiskitQuantumCircuit.QiskitQuantumCircuit("qcbarriers1",
+                                                      qiskit_quantum_register_barriers_1,
+                                                      qiskit_classical_register_barriers_1,
+                                                      global_phase=0)
+
+        # Apply the Barriers to a single Qubit, to an interval of Qubits and to all the Qubits
+        qiskit_quantum_circuit_barriers_1.apply_barrier(0)
+        qiskit_quantum_circuit_barriers_1.apply_barriers_interval([0, 1])
+        qiskit_quantum_circuit_barriers_1.apply_barriers_to_all()
+
+        # Assert that all the Barriers were recorded in the Quantum Circuit
+        self.assertEqual(qiskit_quantum_circuit_barriers_1.quantum_circuit.count_ops().get("barrier", 0), 5)
+
+    # Test #2 for the Barriers
+    # Description of the Test Case:
+    # 1) The Quantum Circuit is created with a Quantum Register,
+    #    with 2 Qubits initialized in the state |00⟩, without recording the Barriers;
+    # 2) The Barriers are applied to a single Qubit, to an interval of Qubits and to all the Qubits,
+    #    as well as the Hadamard Gates, before and after them;
+    # 3) No Barrier is recorded in the Quantum Circuit, but the indexes of the Qubits are still validated;
+    def test_barriers_2(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively
+        num_qubits = num_bits = 2
+
+        # Creation of the IBM Qiskit's Quantum and Classical Registers
+        qiskit_quantum_register_barriers_2 = QiskitQuantumRegister.QiskitQuantumRegister("qrbarriers2", num_qubits)
+        qiskit_classical_register_barriers_2 = QiskitClassicalRegister.QiskitClassicalRegister("crbarriers2", num_bits)
+
+        # Creation of the IBM Qiskit's Quantum Circuit with one Quantum and Classical Registers,
+        # without recording the Barriers
+        qiskit_quantum_circuit_barriers_2 = \
+            QiskitQuantumCircuit.QiskitQuantumCircuit("qcbarriers2",
+                                                      qiskit_quantum_register_barriers_2,
+                                                      qiskit_classical_register_barriers_2,
+                                                      global_phase=0, barriers_flag=False)
+
+        # Apply the Hadamard Gates and the Barriers, between them
+        qiskit_quantum_circuit_barriers_2.apply_hadamard(0)
+        qiskit_quantum_circuit_barriers_2.apply_barrier(0)
+        qiskit_quantum_circuit_barriers_2.apply_barriers_interval([0, 1])
+        qiskit_quantum_circuit_barriers_2.apply_barriers_to_all()
+        qiskit_quantum_circuit_barriers_2.apply_hadamard(0)
+
+        # Assert that only the Hadamard Gates were recorded in the Quantum Circuit
+        self.assertEqual(dict(qiskit_quantum_circuit_barriers_2.quantum_circuit.count_ops()), {"h": 2})
+
+        # Assert that the indexes of the Qubits are still validated
+        with self.assertRaises(ValueError):
+            qiskit_quantum_circuit_barriers_2.apply_barrier(2)
+
+
 # Configuration of the Test Suites
 if __name__ == '__main__':
 
@@ -1236,10 +1308,13 @@ if __name__ == '__main__':
     # Test Cases for the Hadamard Gates
     hadamard_gate_tests_suite = unittest.TestLoader().loadTestsFromTestCase(HadamardGateTests)
 
+    # Test Cases for the Barriers
+    barriers_tests_suite = unittest.TestLoader().loadTestsFromTestCase(BarriersTests)
+
     # Create a Global for all the Test Cases established
     all_test_cases = unittest.TestSuite([prepare_measure_x_basis_tests_suite,
                                          prepare_measure_y_basis_tests_suite,
                                          prepare_measure_z_basis_tests_suite,
                                          pauli_i_gate_tests_suite, pauli_x_gate_tests_suite,
                                          pauli_y_gate_tests_suite, pauli_z_gate_tests_suite,
-                                         hadamard_gate_tests_suite])
+                                         hadamard_gate_tests_suite, barriers_tests_suite])
@@ -0,0 +1,89 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import required Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import the Array and the Unsigned Integer (8 bits) from NumPy
+from numpy import array, uint8
+
+# Import QiskitSQCKAProtocolToeplitzPrivacyAmplification from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Amplification
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.amplification \
+    import QiskitSQCKAProtocolToeplitzPrivacyAmplification
+
+
+# Test Cases for the IBM Qiskit's Privacy Amplification, with Toeplitz hashing, of the Reconciled Conference Keys of
+# the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolToeplitzPrivacyAmplificationTests(unittest.TestCase):
+
+    # Test that the Toeplitz hashes computed with the Fast Fourier Transform (FFT) and with the matrix multiplication
+    # over GF(2) are the same as the ones computed with the explicit Toeplitz Matrix
+    def test_toeplitz_hashes(self):
+
+        # Create 3 random keys with 2000 Bits and a random seed for a Toeplitz Matrix with 700 rows
+        random_generator = default_rng(2023)
+        keys_bits = random_generator.integers(0, 2, (3, 2000), dtype=uint8)
+        toeplitz_seed_bits = random_generator.integers(0, 2, (700 + 2000 - 1), dtype=uint8)
+
+        # Build the explicit Toeplitz Matrix (i.e., constant along its diagonals) and compute the expected hashes
+        toeplitz_matrix = array([toeplitz_seed_bits[(num_row + 2000 - 1)::-1][:2000] for num_row in range(700)])
+        expected_toeplitz_hashes = ((keys_bits.astype(int) @ toeplitz_matrix.T.astype(int)) & 1).tolist()
+
+        # Assert that both ways of computing the Toeplitz hashes give the expected hashes
+        self.assertEqual(QiskitSQCKAProtocolToeplitzPrivacyAmplification.QiskitSQCKAProtocolToeplitzPrivacyAmplification
+                         .compute_toeplitz_hashes_with_fast_fourier_transform(keys_bits, toeplitz_seed_bits, 700)
+                         .tolist(), expected_toeplitz_hashes)
+        self.assertEqual(QiskitSQCKAProtocolToeplitzPrivacyAmplification.QiskitSQCKAProtocolToeplitzPrivacyAmplification
+                         .compute_toeplitz_hashes_with_matrix_multiplication(keys_bits, toeplitz_seed_bits, 700)
+                         .tolist(), expected_toeplitz_hashes)
+
+    # Test the Privacy Amplification of 3 equal keys with 1000000 Bits,
+    # with a Quantum Bit Error Rate (QBER) of 2% and 200000 Bits leaked
+    def test_privacy_amplification_1000000_bits(self):
+
+        # Create the Privacy Amplification, with Toeplitz hashing
+        toeplitz_privacy_amplification = QiskitSQCKAProtocolToeplitzPrivacyAmplification\
+            .QiskitSQCKAProtocolToeplitzPrivacyAmplification("toeplitz_privacy_amplification", seed=2023)
+
+        # Create a random key with 1000000 Bits
+        key_bits = default_rng(2023).integers(0, 2, 1000000, dtype=uint8)
+
+        # Amplify the privacy of 3 copies of the key
+        (final_keys_bits, elapsed_time) = toeplitz_privacy_amplification.amplify_privacy([key_bits] * 3, 200000, 0.02)
+
+        # Assert that the final keys are equal and have the expected length (i.e., the Bits not known by
+        # an Eavesdropper, minus the Bits leaked and the Bits sacrificed for the security parameter)
+        self.assertEqual(final_keys_bits.shape, (3, 658493))
+        self.assertEqual(final_keys_bits.shape[1],
+                         toeplitz_privacy_amplification.compute_final_key_length(1000000, 200000, 0.02))
+        self.assertTrue((final_keys_bits == final_keys_bits[0]).all())
+
+        # Assert that the privacy of the keys was amplified in seconds
+        self.assertLess(elapsed_time, 10.0)
+
+        # Assert that no final key can be produced if all the Bits were leaked,
+        # and that keys with different lengths are rejected
+        self.assertEqual(toeplitz_privacy_amplification.amplify_privacy([key_bits], 1000000, 0.02)[0].shape, (1, 0))
+        with self.assertRaises(ValueError):
+            toeplitz_privacy_amplification.amplify_privacy([key_bits, key_bits[1:]], 0, 0.02)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import required Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import Array and the Unsigned Integer (8 bits) from NumPy
+from numpy import array, uint8
+
+# Import QiskitSQCKAProtocolQuantumBitErrorRateEstimator from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Common
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.common \
+    import QiskitSQCKAProtocolQuantumBitErrorRateEstimator
+
+
+# Test Cases for the IBM Qiskit's Estimator of the Quantum Bit Error Rate (QBER) of
+# the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolQuantumBitErrorRateEstimatorTests(unittest.TestCase):
+
+    # Test the estimation of the Quantum Bit Error Rate (QBER), globally, per Party and per block,
+    # for the CTRL (Reflect) Rounds of a GHZ State with 3 Parties, measured without inverting the Quantum Circuit
+    def test_quantum_bit_error_rate_estimation_ghz_state(self):
+
+        # Create the Estimator of the Quantum Bit Error Rate (QBER), with blocks of 4 CTRL (Reflect) Rounds
+        quantum_bit_error_rate_estimator = QiskitSQCKAProtocolQuantumBitErrorRateEstimator \
+            .QiskitSQCKAProtocolQuantumBitErrorRateEstimator("quantum_bit_error_rate_estimator", 3,
+                                                             ["000", "111"], 4, 0.95)
+
+        # Fold 3 CTRL (Reflect) Rounds, one by one, without completing any block
+        for ctrl_round_results in ["000", "111", "001"]:
+            self.assertEqual(quantum_bit_error_rate_estimator.add_ctrl_round_results(ctrl_round_results), [])
+
+        # Fold 5 CTRL (Reflect) Rounds, at once, completing the 1st and the 2nd blocks
+        blocks_quantum_bit_error_rates_estimations = quantum_bit_error_rate_estimator.add_ctrl_rounds_results_bits(
+            array([[1, 1, 1], [0, 1, 0], [0, 0, 0], [1, 1, 1], [1, 0, 1]], dtype=uint8)
+        )
+
+        # Assert that both blocks were completed, with 1 and 2 erroneous CTRL (Reflect) Rounds in 4, respectively
+        self.assertEqual(len(blocks_quantum_bit_error_rates_estimations), 2)
+        self.assertEqual(blocks_quantum_bit_error_rates_estimations[0][:2], (1, 0.25))
+        self.assertEqual(blocks_quantum_bit_error_rates_estimations[1][:2], (2, 0.5))
+
+        # Assert the confidence interval of the 1st block contains its Quantum Bit Error Rate (QBER)
+        self.assertLess(blocks_quantum_bit_error_rates_estimations[0][2], 0.25)
+        self.assertGreater(blocks_quantum_bit_error_rates_estimations[0][3], 0.25)
+
+        # Assert the global Quantum Bit Error Rate (QBER), with 3 erroneous CTRL (Reflect) Rounds in 8
+        self.assertEqual(quantum_bit_error_rate_estimator.get_num_ctrl_rounds(), 8)
+        self.assertEqual(quantum_bit_error_rate_estimator.get_quantum_bit_error_rate(), 0.375)
+
+        # Assert the Quantum Bit Error Rate (QBER) of each Party, as the Bits differing from the nearest GHZ State
+        self.assertEqual(quantum_bit_error_rate_estimator.get_parties_quantum_bit_error_rates().tolist(),
+                         [0.0, 0.25, 0.125])
+
+        # Assert that the Protocol should not be aborted, since there is no threshold to abort it
+        self.assertFalse(quantum_bit_error_rate_estimator.is_abort_threshold_crossed())
+
+    # Test that the threshold to abort the Protocol is crossed, only when the lower bound of
+    # the confidence interval of the global Quantum Bit Error Rate (QBER) crosses it
+    def test_quantum_bit_error_rate_abort_threshold(self):
+
+        # Create the Estimator of the Quantum Bit Error Rate (QBER), with blocks of 8 CTRL (Reflect) Rounds,
+        # for a Multipartite Entanglement measured by inverting the Quantum Circuit, with a threshold of 11%
+        quantum_bit_error_rate_estimator = QiskitSQCKAProtocolQuantumBitErrorRateEstimator \
+            .QiskitSQCKAProtocolQuantumBitErrorRateEstimator("quantum_bit_error_rate_estimator", 3,
+                                                             ["000"], 8, 0.95, abort_threshold=0.11)
+
+        # Fold a block of CTRL (Reflect) Rounds, with 2 erroneous CTRL (Reflect) Rounds in 8,
+        # whose confidence interval still contains the threshold
+        quantum_bit_error_rate_estimator.add_ctrl_rounds_results_bits(array([[0, 0, 0]] * 6 + [[0, 1, 0]] * 2,
+                                                                            dtype=uint8))
+        self.assertFalse(quantum_bit_error_rate_estimator.is_abort_threshold_crossed())
+
+        # Fold a block of CTRL (Reflect) Rounds, with 8 erroneous CTRL (Reflect) Rounds in 8
+        quantum_bit_error_rate_estimator.add_ctrl_rounds_results_bits(array([[1, 0, 0]] * 8, dtype=uint8))
+        self.assertTrue(quantum_bit_error_rate_estimator.is_abort_threshold_crossed())
+
+    # Test the Wilson score confidence interval, for the extreme cases
+    def test_confidence_interval(self):
+
+        # Compute the confidence intervals, without any error and only with errors, for 100 samples
+        (lower_bound_no_errors, upper_bound_no_errors) = QiskitSQCKAProtocolQuantumBitErrorRateEstimator \
+            .QiskitSQCKAProtocolQuantumBitErrorRateEstimator.compute_confidence_interval(0, 100, 0.95)
+        (lower_bound_all_errors, upper_bound_all_errors) = QiskitSQCKAProtocolQuantumBitErrorRateEstimator \
+            .QiskitSQCKAProtocolQuantumBitErrorRateEstimator.compute_confidence_interval(100, 100, 0.95)
+
+        # Assert that the confidence intervals are within [0, 1] and have the expected widths
+        self.assertEqual(lower_bound_no_errors, 0.0)
+        self.assertAlmostEqual(upper_bound_no_errors, 0.037, places=3)
+        self.assertAlmostEqual(lower_bound_all_errors, 0.963, places=3)
+        self.assertEqual(upper_bound_all_errors, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import required Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import the Unsigned Integer (8 bits) from NumPy
+from numpy import uint8
+
+# Import QiskitSQCKAProtocolCascadeInformationReconciliation from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Reconciliation
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.reconciliation \
+    import QiskitSQCKAProtocolCascadeInformationReconciliation
+
+
+# Test Cases for the IBM Qiskit's Cascade Information Reconciliation of the Raw Conference Keys of
+# the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolCascadeInformationReconciliationTests(unittest.TestCase):
+
+    # Test the Cascade Information Reconciliation of keys with 1000000 Bits, with a Quantum Bit Error Rate (QBER) of 2%
+    def test_cascade_information_reconciliation_1000000_bits(self):
+
+        # Create a random reference key and a copy of it, with 2% of its Bits flipped
+        random_generator = default_rng(2023)
+        reference_key_bits = random_generator.integers(0, 2, 1000000, dtype=uint8)
+        raw_key_bits = reference_key_bits ^ (random_generator.random(1000000) < 0.02).astype(uint8)
+
+        # Reconcile the keys, with the Cascade Information Reconciliation
+        (reconciled_key_bits, information_reconciliation_statistics) = \
+            QiskitSQCKAProtocolCascadeInformationReconciliation\
+            .QiskitSQCKAProtocolCascadeInformationReconciliation("cascade_information_reconciliation", seed=2023)\
+            .reconcile_key_bits(reference_key_bits, raw_key_bits, 0.02)
+
+        # Assert that all the errors were corrected, without changing the raw key
+        self.assertEqual(information_reconciliation_statistics.get_num_residual_errors(), 0)
+        self.assertTrue((reconciled_key_bits == reference_key_bits).all())
+        self.assertEqual(information_reconciliation_statistics.get_num_corrected_bits(),
+                         int((raw_key_bits != reference_key_bits).sum()))
+
+        # Assert that the Bits leaked are close to the theoretical minimum and that the keys were reconciled in seconds
+        self.assertLess(information_reconciliation_statistics.get_efficiency(0.02), 1.3)
+        self.assertLess(information_reconciliation_statistics.get_elapsed_time(), 10.0)
+
+    # Test the Cascade Information Reconciliation of keys without errors and of keys with different lengths
+    def test_cascade_information_reconciliation_edge_cases(self):
+
+        # Create the Cascade Information Reconciliation
+        cascade_information_reconciliation = QiskitSQCKAProtocolCascadeInformationReconciliation\
+            .QiskitSQCKAProtocolCascadeInformationReconciliation("cascade_information_reconciliation", seed=2023)
+
+        # Reconcile keys without errors, only leaking the parities of the blocks of all the passes
+        (reconciled_key_bits, information_reconciliation_statistics) = \
+            cascade_information_reconciliation.reconcile_key_bits("0110100110", "0110100110", 0.2)
+        self.assertEqual(reconciled_key_bits.tolist(), [0, 1, 1, 0, 1, 0, 0, 1, 1, 0])
+        self.assertEqual(information_reconciliation_statistics.get_num_corrected_bits(), 0)
+        self.assertEqual(information_reconciliation_statistics.get_num_leaked_bits(), (3 + 2 + 1 + 1))
+
+        # Assert that keys with different lengths can not be reconciled
+        with self.assertRaises(ValueError):
+            cascade_information_reconciliation.reconcile_key_bits("0110", "011", 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import required Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import the Unsigned Integer (8 bits) from NumPy
+from numpy import uint8
+
+# Import QiskitSQCKAProtocolLDPCInformationReconciliation from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Reconciliation
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.reconciliation \
+    import QiskitSQCKAProtocolLDPCInformationReconciliation
+
+
+# Test Cases for the IBM Qiskit's Low-Density Parity-Check (LDPC) Information Reconciliation of
+# the Raw Conference Keys of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolLDPCInformationReconciliationTests(unittest.TestCase):
+
+    # Test the Low-Density Parity-Check (LDPC) Information Reconciliation of keys with 1000000 Bits,
+    # with a Quantum Bit Error Rate (QBER) of 5%
+    def test_ldpc_information_reconciliation_1000000_bits(self):
+
+        # Create a random reference key and a copy of it, with 5% of its Bits flipped
+        random_generator = default_rng(2023)
+        reference_key_bits = random_generator.integers(0, 2, 1000000, dtype=uint8)
+        raw_key_bits = reference_key_bits ^ (random_generator.random(1000000) < 0.05).astype(uint8)
+
+        # Reconcile the keys, with the Low-Density Parity-Check (LDPC) Information Reconciliation
+        (reconciled_key_bits, information_reconciliation_statistics) = \
+            QiskitSQCKAProtocolLDPCInformationReconciliation\
+            .QiskitSQCKAProtocolLDPCInformationReconciliation("ldpc_information_reconciliation", seed=2023)\
+            .reconcile_key_bits(reference_key_bits, raw_key_bits, 0.05)
+
+        # Assert that all the frames were decoded and all the errors were corrected
+        self.assertEqual(information_reconciliation_statistics.get_num_failed_frames(), 0)
+        self.assertEqual(information_reconciliation_statistics.get_num_residual_errors(), 0)
+        self.assertTrue((reconciled_key_bits == reference_key_bits).all())
+
+        # Assert that the syndromes of all the frames were leaked (i.e., limited to the 576 Bits of the keys,
+        # in the last frame, padded with 0s) and that the keys were reconciled in seconds
+        self.assertGreaterEqual(information_reconciliation_statistics.get_num_leaked_bits(),
+                                ((61 * QiskitSQCKAProtocolLDPCInformationReconciliation
+                                  .QiskitSQCKAProtocolLDPCInformationReconciliation("ldpc_information_reconciliation")
+                                  .compute_num_checks(0.05, QiskitSQCKAProtocolLDPCInformationReconciliation
+                                                      .DEFAULT_EFFICIENCY)) + 576))
+        self.assertLess(information_reconciliation_statistics.get_elapsed_time(), 20.0)
+
+    # Test that the frames which can not be decoded are kept unchanged and counted
+    def test_ldpc_information_reconciliation_failed_frames(self):
+
+        # Create a random reference key and a copy of it, with 25% of its Bits flipped
+        random_generator = default_rng(2023)
+        reference_key_bits = random_generator.integers(0, 2, 4096, dtype=uint8)
+        raw_key_bits = reference_key_bits ^ (random_generator.random(4096) < 0.25).astype(uint8)
+
+        # Reconcile the keys, with a single attempt, for a largely underestimated Quantum Bit Error Rate (QBER)
+        (reconciled_key_bits, information_reconciliation_statistics) = \
+            QiskitSQCKAProtocolLDPCInformationReconciliation\
+            .QiskitSQCKAProtocolLDPCInformationReconciliation("ldpc_information_reconciliation", frame_size=1024,
+                                                              max_num_attempts=1, seed=2023)\
+            .reconcile_key_bits(reference_key_bits, raw_key_bits, 0.01)
+
+        # Assert that no frame was decoded and that the raw key was kept unchanged
+        self.assertEqual(information_reconciliation_statistics.get_num_failed_frames(), 4)
+        self.assertEqual(information_reconciliation_statistics.get_num_corrected_bits(), 0)
+        self.assertTrue((reconciled_key_bits == raw_key_bits).all())
+
+    # Test that the Low-Density Parity-Check (LDPC) Information Reconciliation of keys shorter than one frame,
+    # with a Quantum Bit Error Rate (QBER) of 5%, shortens the frame, leaking fewer Bits than the length of the keys
+    def test_ldpc_information_reconciliation_key_shorter_than_one_frame(self):
+
+        # For each length of the keys, shorter than one frame
+        for key_length in [3, 200, 1000]:
+
+            # Create a random reference key and a copy of it, with 5% of its Bits flipped
+            random_generator = default_rng(2023)
+            reference_key_bits = random_generator.integers(0, 2, key_length, dtype=uint8)
+            raw_key_bits = reference_key_bits ^ (random_generator.random(key_length) < 0.05).astype(uint8)
+
+            # Reconcile the keys, with the Low-Density Parity-Check (LDPC) Information Reconciliation
+            (reconciled_key_bits, information_reconciliation_statistics) = \
+                QiskitSQCKAProtocolLDPCInformationReconciliation\
+                .QiskitSQCKAProtocolLDPCInformationReconciliation("ldpc_information_reconciliation", seed=2023)\
+                .reconcile_key_bits(reference_key_bits, raw_key_bits, 0.05)
+
+            # Assert that all the errors were corrected, leaking fewer Bits than the length of the keys
+            self.assertTrue((reconciled_key_bits == reference_key_bits).all())
+            self.assertLessEqual(information_reconciliation_statistics.get_num_leaked_bits(), key_length)
+
+    # Test that the Bits leaked by the last frame, mostly padded with 0s, are limited to the Bits of the keys in it
+    def test_ldpc_information_reconciliation_leaked_bits_of_padded_frame(self):
+
+        # Create a random reference key, with 1100 Bits, and a copy of it, with 20% of its Bits flipped
+        random_generator = default_rng(2023)
+        reference_key_bits = random_generator.integers(0, 2, 1100, dtype=uint8)
+        raw_key_bits = reference_key_bits ^ (random_generator.random(1100) < 0.2).astype(uint8)
+
+        # Reconcile the keys, in frames of 1024 Bits (i.e., the last frame only has 76 Bits of the keys)
+        (_, information_reconciliation_statistics) = \
+            QiskitSQCKAProtocolLDPCInformationReconciliation\
+            .QiskitSQCKAProtocolLDPCInformationReconciliation("ldpc_information_reconciliation", frame_size=1024,
+                                                              seed=2023)\
+            .reconcile_key_bits(reference_key_bits, raw_key_bits, 0.2)
+
+        # Assert that the last frame leaked, at most, its 76 Bits of the keys, and thus,
+        # fewer Bits than the length of the keys
+        self.assertLessEqual(information_reconciliation_statistics.get_num_leaked_bits(), 1100)
+
+
+if __name__ == '__main__':
+    unittest.main()
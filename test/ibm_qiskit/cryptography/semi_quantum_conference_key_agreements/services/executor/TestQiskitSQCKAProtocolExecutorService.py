@@ -23,6 +23,9 @@ from itertools import combinations
 # Import Ceil from Math Python's Library
 from math import ceil
 
+# Import Patch from Unittest.Mock Python's Library
+from unittest.mock import patch
+
 # Import the String ID for the Fiber Optic from Common.Enumerations.CommunicationPhysicalMediumTypes
 from src.common.enumerations.CommunicationPhysicalMediumTypes import FIBER_OPTIC
 
@@ -45,20 +48,74 @@ from src.common.enumerations.StrategiesForEavesdroppingDetection import SWAP_TES
 from src.common.enumerations.StrategiesForEavesdroppingDetection import \
     STATISTICAL_TEST
 
+# Import the String ID for the Batched Execution
+# from Common.Enumerations.SemiQuantumCryptographyProtocolExecutionModeTypes
+from src.common.enumerations.SemiQuantumCryptographyProtocolExecutionModeTypes import \
+    SEQUENTIAL_EXECUTION, BATCHED_EXECUTION, ANALYTIC_EXECUTION, PARALLEL_EXECUTION, CHAINED_EXECUTION, \
+    MULTIPLEXED_EXECUTION
+
+# Import the String IDs for the No Diagnostics
+# from Common.Enumerations.SemiQuantumCryptographyProtocolDiagnosticsLevelTypes
+from src.common.enumerations.SemiQuantumCryptographyProtocolDiagnosticsLevelTypes import NO_DIAGNOSTICS
+
+# Import the String IDs for some types of the Events
+# from Common.Enumerations.SemiQuantumCryptographyProtocolEventTypes
+from src.common.enumerations.SemiQuantumCryptographyProtocolEventTypes import \
+    ROUND_STARTED, QUBIT_MEASURED, QUBIT_REFLECTED, ROUND_RESULT_OBTAINED, ENTANGLEMENT_MEASURED, ROUND_FINISHED, \
+    QUANTUM_BIT_ERROR_RATE_ESTIMATED, PROTOCOL_ABORTED, EAVESDROPPING_ALERT, SWAP_TESTS_PERFORMED
+
+# Import ProtocolEventLog from Common.Events
+from src.common.events import ProtocolEventLog
+
+# Import RingBufferProtocolEventSink from Common.Events.Sinks
+from src.common.events.sinks import RingBufferProtocolEventSink
+
+# Import the String IDs for the SIFT (Measure and Resend) and CTRL (Reflect) Rounds
+# from Common.Enumerations.SemiQuantumCryptographyProtocolRoundTypes
+from src.common.enumerations.SemiQuantumCryptographyProtocolRoundTypes import \
+    SIFT_MEASURE_AND_RESEND_ROUND_3, CTRL_REFLECT_ROUND_3
+
 # Import QiskitSQCKAProtocolExecutorService from IBM_Qiskit.Cryptography.SemiQuantumConferenceKeyAgreement
 from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement\
     .services.executor.QiskitSQCKAProtocolExecutorService import \
     QiskitSQCKAProtocolExecutorService
 
-# Import QiskitQuantumTrueRandomBinaryStringGenerator from IBM_Qiskit.Utils.Random_Generator.Binary.Quantum
-from src.ibm_qiskit.utils.random_generator.binary.quantum import \
-    QiskitQuantumTrueRandomBinaryStringGenerator
+# Import QiskitSQCKAProtocolPartyEntity from IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Entities
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.entities \
+    import QiskitSQCKAProtocolPartyEntity
+
+# Import QiskitSQCKAProtocolQuantumBitErrorRateEstimator from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Common
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.common \
+    import QiskitSQCKAProtocolQuantumBitErrorRateEstimator
+
+# Import QiskitSQCKAProtocolLDPCInformationReconciliation from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Reconciliation
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.reconciliation \
+    import QiskitSQCKAProtocolLDPCInformationReconciliation
 
-# Import Qiskit_Default_Num_Counts from IBM_Qiskit.Common.QiskitLibraryParameters
-from src.ibm_qiskit.common.QiskitLibraryParameters import QISKIT_DEFAULT_NUM_COUNTS
+# Import QiskitSQCKAProtocolToeplitzPrivacyAmplification from
+# IBM_Qiskit.Cryptography.Semi_Quantum_Conference_Key_Agreement.Amplification
+from src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.amplification \
+    import QiskitSQCKAProtocolToeplitzPrivacyAmplification
 
-# Import GHZ_STATE ID from Common.QuantumEntanglementTypes
-from src.common.enumerations.QuantumEntanglementTypes import GHZ_STATE
+# Import the String IDs for the Cascade and the LDPC Information Reconciliations
+# from Common.Enumerations.InformationReconciliationTypes
+from src.common.enumerations.InformationReconciliationTypes import CASCADE_RECONCILIATION, LDPC_RECONCILIATION
+
+# Import GHZ_STATE, W_STATE and RESOURCE_STATE IDs from Common.QuantumEntanglementTypes
+from src.common.enumerations.QuantumEntanglementTypes import GHZ_STATE, W_STATE, RESOURCE_STATE
+
+# Import AER_QASM_SIMULATOR, STABILIZER_SIMULATOR, SPARSE_STATE_VECTOR_SIMULATOR and
+# BATCHED_STATE_VECTOR_SIMULATOR IDs from Common.QuantumSimulatorTypes
+from src.common.enumerations.QuantumSimulatorTypes import AER_QASM_SIMULATOR, STABILIZER_SIMULATOR, \
+    SPARSE_STATE_VECTOR_SIMULATOR, BATCHED_STATE_VECTOR_SIMULATOR
+
+# Import COMPACT_LAYOUT ID from Common.QuantumCircuitLayoutTypes
+from src.common.enumerations.QuantumCircuitLayoutTypes import COMPACT_LAYOUT
+
+# Import QiskitSimulatorSession from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSimulatorSession
 
 # Import the User/Client from Common.Communication
 from src.common.user_client import UserClient
@@ -239,37 +296,16 @@ class MyTestCase(unittest.TestCase):
             # If all the names of the Parties owners of the Bipartite Pre-Shared Key Pairs were fulfilled
             if len(bipartite_party_pairs_names) == (qiskit_sqcka_protocol_num_parties - 1):
 
-                # Create the IBM Qiskit's Quantum True Random Binary String Generator
-                qiskit_quantum_true_random_binary_string_generator = \
-                    QiskitQuantumTrueRandomBinaryStringGenerator \
-                    .QiskitQuantumTrueRandomBinaryStringGenerator(
-                        "qiskit_quantum_true_random_binary_string_generator",
-                        num_rounds, QISKIT_DEFAULT_NUM_COUNTS
-                    )
-
-                # Forever loop, to be broken when the Hamming Weight is equal to
-                # the number of Rounds that each Party will reflect the Qubits,
-                # without performing Z-Basis Measurement
-                while True:
-
-                    # Create the Bipartite Pre-Shared Key, in binary,
-                    # from the IBM Qiskit's Quantum True Random Binary String Generator
-                    bipartite_pre_shared_key = \
-                        qiskit_quantum_true_random_binary_string_generator.generate_true_random_binary_string(0, 0)
-
-                    # Compute the Hamming Weight of the previously created Bipartite Pre-Shared Key, in binary,
-                    # from the IBM Qiskit's Quantum True Random Binary String Generator
-                    bipartite_pre_shared_key_hamming_weight = \
-                        Utilities.compute_hamming_weight(bipartite_pre_shared_key)
-
-                    # If the Hamming Weight of the previously created Bipartite Pre-Shared Key, in binary,
-                    # from the IBM Qiskit's Quantum True Random Binary String Generator, is equal to
-                    # the number of Rounds that each Party will reflect the Qubits,
-                    # without performing Z-Basis Measurement
-                    if bipartite_pre_shared_key_hamming_weight == qiskit_sqcka_protocol_num_reflect_rounds:
+                # Generate the Bipartite Pre-Shared Key, in binary, directly with a Hamming Weight equal to
+                # the number of Rounds that each Party will reflect the Qubits, without performing Z-Basis Measurement
+                bipartite_pre_shared_key = \
+                    qiskit_sqcka_protocol_executor_service_16_rounds_3_parties_2_bases_2_channels_ghz_state \
+                    .generate_protocol_bipartite_pre_shared_key()
 
-                        # Break the forever loop
-                        break
+                # Assert that the Hamming Weight of the Bipartite Pre-Shared Key is equal to
+                # the number of Rounds that each Party will reflect the Qubits
+                self.assertEqual(Utilities.compute_hamming_weight(bipartite_pre_shared_key),
+                                 qiskit_sqcka_protocol_num_reflect_rounds)
 
                 # For each Pair of names of the Party owners of the Bipartite Pre-Shared Key Pair
                 for bipartite_party_pair_names in bipartite_party_pairs_names:
@@ -439,5 +475,1694 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(True, True)
 
 
+# Create and initialise an IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+# for a given number of Parties and a GHZ State, with a fixed Bipartite Pre-Shared Key, shared by all the Parties
+def create_qiskit_sqcka_protocol_executor_service_ghz_state(num_parties, bipartite_pre_shared_key,
+                                                            strategy_for_eavesdropping_detection=(
+                                                                MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT
+                                                            ), quantum_entanglement_type=GHZ_STATE, **kwargs):
+
+    # The name of the Parties involved in the Protocol (i.e., Alice, as the Distributor, and the Bobs)
+    parties_names = ["Alice"] + ["Bob_{}".format(num_bob) for num_bob in range(1, num_parties)]
+
+    # The Communication Path's Edges between the Parties' Names (i.e., from and to the Distributor)
+    communication_path_edges_between_parties_names = []
+
+    # For each Semi-Quantum Party involved in the Protocol
+    for party_name in parties_names[1:]:
+
+        # Append the Communication Path's Edges from and to the Distributor
+        communication_path_edges_between_parties_names += [["Alice", party_name], [party_name, "Alice"]]
+
+    # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service
+    qiskit_sqcka_protocol_executor_service = QiskitSQCKAProtocolExecutorService()
+
+    # Initialise the Protocol's Parameters for
+    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service
+    qiskit_sqcka_protocol_executor_service\
+        .configure_protocol_parameters(len(parties_names), len(bipartite_pre_shared_key),
+                                       (len(parties_names) - 1), (len(parties_names) - 1),
+                                       DISCRETE_VARIABLES, FIBER_OPTIC, ["X", "Z"], quantum_entanglement_type,
+                                       strategy_for_eavesdropping_detection,
+                                       communication_path_edges_between_parties_names,
+                                       ([50] * (num_parties - 1)), **kwargs)
+
+    # Create the Users/Clients of the Parties involved in the Protocol
+    users_clients = [UserClient.UserClient(party_name) for party_name in parties_names]
+
+    # For each Semi-Quantum Party involved in the Protocol
+    for user_client in users_clients[1:]:
+
+        # Add the fixed Bipartite Pre-Shared Key, between the Distributor Party Entity and
+        # the current Semi-Quantum Party, to the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service\
+            .add_protocol_bipartite_pre_shared_key(users_clients[0], user_client, bipartite_pre_shared_key)
+
+    # Set the Bipartite Pre-Shared Keys of
+    # the Semi-Quantum Conference Key Agreement (SQCKA) Protocol, as initialised
+    qiskit_sqcka_protocol_executor_service.set_protocol_bipartite_pre_shared_keys_initialised()
+
+    # Set the Parties (including the Distributor Party Entity) of
+    # the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    qiskit_sqcka_protocol_executor_service\
+        .set_protocol_party_entities(users_clients, parties_names, "Alice",
+                                     qiskit_sqcka_protocol_executor_service.get_protocol_bipartite_pre_shared_keys())
+
+    # Initialise the final object for the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+    qiskit_sqcka_protocol_executor_service.initialise_protocol()
+
+    # Return the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service
+    return qiskit_sqcka_protocol_executor_service
+
+
+# Class for the Tests of the Batched Execution of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceBatchedExecutionTests(unittest.TestCase):
+
+    # Test the Batched Execution of 16 Rounds, with 3 Parties and a GHZ State,
+    # with no Eavesdropping, where all the SIFT Rounds are correlated and all the CTRL Rounds return |000⟩
+    def test_batched_execution_16_rounds_3_parties_ghz_state(self):
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "0100000100100001"
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Batched Execution of the Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, bipartite_pre_shared_key, execution_mode_type=BATCHED_EXECUTION
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_rounds = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()
+
+        # Assert that all the Rounds were executed, in order
+        self.assertEqual([protocol_round.get_num_round() for protocol_round in protocol_rounds],
+                         list(range(len(bipartite_pre_shared_key))))
+
+        # For each Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for protocol_round in protocol_rounds:
+
+            # Retrieve the Results of the current Round
+            protocol_round_results = protocol_round.get_round_results()
+
+            # If the current Round is a CTRL (Reflect) Round
+            if bipartite_pre_shared_key[protocol_round.get_num_round()] == "1":
+
+                # Assert that the inverted GHZ State was measured as |000⟩
+                self.assertEqual(protocol_round.get_type_round(), CTRL_REFLECT_ROUND_3)
+                self.assertEqual(protocol_round_results, "000")
+
+            # If the current Round is a SIFT (Measure and Resend) Round
+            else:
+
+                # Assert that the measured GHZ State is correlated between all the Parties
+                self.assertEqual(protocol_round.get_type_round(), SIFT_MEASURE_AND_RESEND_ROUND_3)
+                self.assertIn(protocol_round_results, ["000", "111"])
+
+    # Test that the Batched Execution builds the Quantum Circuits of the Rounds only once,
+    # for each type of Round, reusing the cached Templates of the Quantum Circuits for all the other Rounds
+    def test_batched_execution_reuses_quantum_circuit_templates(self):
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "0100000100100001" * 4
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Batched Execution of the Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, bipartite_pre_shared_key, execution_mode_type=BATCHED_EXECUTION
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_rounds = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()
+
+        # Assert that only one Template of the Quantum Circuit was cached, for each type of Round
+        self.assertEqual(qiskit_sqcka_protocol_executor_service
+                         .get_qiskit_sqcka_protocol_round_quantum_circuit_templates_cache()
+                         .get_num_quantum_circuit_templates(), 2)
+
+        # Assert that all the Rounds, but the first ones of each type, share the same Quantum Circuit
+        self.assertEqual(len(set(id(protocol_round.get_qiskit_quantum_circuit())
+                                 for protocol_round in protocol_rounds)), 4)
+
+        # Assert that the Results of all the Rounds are the expected ones
+        self.assertTrue(all(protocol_round.get_round_results() == "000"
+                            for protocol_round in protocol_rounds
+                            if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3))
+        self.assertEqual(len(set(protocol_round.get_round_results()
+                                 for protocol_round in protocol_rounds
+                                 if protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3)), 2)
+
+    # Test that the Protocol can not be started twice
+    def test_protocol_cannot_be_started_twice(self):
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Batched Execution of the Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, "0110", execution_mode_type=BATCHED_EXECUTION
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Assert that starting it again raises a Runtime Error
+        with self.assertRaises(RuntimeError):
+            qiskit_sqcka_protocol_executor_service.start_protocol()
+
+
+# Class for the Tests of the execution of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, on the Stabilizer Simulator
+class QiskitSQCKAProtocolExecutorServiceStabilizerSimulatorTests(unittest.TestCase):
+
+    # Test the Batched Execution of 5 Rounds, with 50 Parties and a GHZ State, on the Stabilizer Simulator
+    # (i.e., 148 Qubits per Round, which would not be feasible with the State Vector of the QASM Simulator)
+    def test_batched_execution_5_rounds_50_parties_ghz_state(self):
+
+        # The number of Parties
+        num_parties = 50
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "01001"
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Batched Execution of the Rounds, on the Stabilizer Simulator
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                num_parties, bipartite_pre_shared_key,
+                execution_mode_type=BATCHED_EXECUTION, quantum_simulator_type=STABILIZER_SIMULATOR
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # For each Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for protocol_round in qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()\
+                .get_protocol_rounds():
+
+            # If the current Round is a CTRL (Reflect) Round
+            if bipartite_pre_shared_key[protocol_round.get_num_round()] == "1":
+
+                # Assert that the inverted GHZ State was measured as |00...0⟩
+                self.assertEqual(protocol_round.get_round_results(), ("0" * num_parties))
+
+            # If the current Round is a SIFT (Measure and Resend) Round
+            else:
+
+                # Assert that the measured GHZ State is correlated between all the Parties
+                self.assertIn(protocol_round.get_round_results(), [("0" * num_parties), ("1" * num_parties)])
+
+    # Test the Sequential Execution of 4 Rounds, with 3 Parties and a GHZ State, on the Stabilizer Simulator
+    def test_sequential_execution_4_rounds_3_parties_ghz_state(self):
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Sequential Execution of the Rounds, on the Stabilizer Simulator
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, "0110", quantum_simulator_type=STABILIZER_SIMULATOR
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the Results of the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_rounds_results = [protocol_round.get_round_results() for protocol_round in
+                                   qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+                                   .get_protocol_rounds()]
+
+        # Assert that the CTRL (Reflect) Rounds were measured as |000⟩
+        self.assertEqual(protocol_rounds_results[1:3], ["000", "000"])
+
+        # Assert that the SIFT (Measure and Resend) Rounds are correlated between all the Parties
+        self.assertIn(protocol_rounds_results[0], ["000", "111"])
+        self.assertIn(protocol_rounds_results[3], ["000", "111"])
+
+    # Test that the Stabilizer Simulator can not be configured for W States (i.e., non-Clifford Quantum Circuits)
+    def test_stabilizer_simulator_does_not_support_w_states(self):
+
+        # Assert that the configuration of the Protocol's Parameters raises a Value Error
+        with self.assertRaises(ValueError):
+            QiskitSQCKAProtocolExecutorService()\
+                .configure_protocol_parameters(3, 4, 2, 2, DISCRETE_VARIABLES, FIBER_OPTIC, ["X", "Z"], W_STATE,
+                                               MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT,
+                                               quantum_simulator_type=STABILIZER_SIMULATOR)
+
+
+# Class for the Tests of the execution of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, on the Sparse State Vector Simulator
+class QiskitSQCKAProtocolExecutorServiceSparseStateVectorSimulatorTests(unittest.TestCase):
+
+    # Test the Batched Execution of 4 Rounds, with 30 Parties and a W State, on the Sparse State Vector Simulator
+    # (i.e., 88 Qubits per Round, which would not be feasible with the State Vector of the QASM Simulator,
+    # neither with the Stabilizer Simulator, since the W States are not prepared only with Clifford Gates)
+    def test_batched_execution_4_rounds_30_parties_w_state(self):
+
+        # The number of Parties
+        num_parties = 30
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Batched Execution of the Rounds, on the Sparse State Vector Simulator
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                num_parties, "0110", strategy_for_eavesdropping_detection=STATISTICAL_TEST,
+                quantum_entanglement_type=W_STATE, execution_mode_type=BATCHED_EXECUTION,
+                quantum_simulator_type=SPARSE_STATE_VECTOR_SIMULATOR
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # For each Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for protocol_round in qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()\
+                .get_protocol_rounds():
+
+            # Assert that the measured W State has exactly one Party with the Bit 1
+            self.assertEqual(len(protocol_round.get_round_results()), num_parties)
+            self.assertEqual(protocol_round.get_round_results().count("1"), 1)
+
+    # Test the Sequential Execution of 4 Rounds, with 3 Parties and a GHZ State, on the Sparse State Vector Simulator
+    def test_sequential_execution_4_rounds_3_parties_ghz_state(self):
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Sequential Execution of the Rounds, on the Sparse State Vector Simulator
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, "0110", quantum_simulator_type=SPARSE_STATE_VECTOR_SIMULATOR
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the Results of the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_rounds_results = [protocol_round.get_round_results() for protocol_round in
+                                   qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+                                   .get_protocol_rounds()]
+
+        # Assert that the CTRL (Reflect) Rounds were measured as |000⟩
+        self.assertEqual(protocol_rounds_results[1:3], ["000", "000"])
+
+        # Assert that the SIFT (Measure and Resend) Rounds are correlated between all the Parties
+        self.assertIn(protocol_rounds_results[0], ["000", "111"])
+        self.assertIn(protocol_rounds_results[3], ["000", "111"])
+
+    # Test that the Sparse State Vector Simulator can not be configured for Resource States
+    # (i.e., whose number of non-null Amplitudes grows exponentially with the number of Qubits)
+    def test_sparse_state_vector_simulator_does_not_support_resource_states(self):
+
+        # Assert that the configuration of the Protocol's Parameters raises a Value Error
+        with self.assertRaises(ValueError):
+            QiskitSQCKAProtocolExecutorService()\
+                .configure_protocol_parameters(3, 4, 2, 2, DISCRETE_VARIABLES, FIBER_OPTIC, ["X", "Z"], RESOURCE_STATE,
+                                               MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT,
+                                               quantum_simulator_type=SPARSE_STATE_VECTOR_SIMULATOR)
+
+
+# Class for the Tests of the Analytic Execution of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceAnalyticExecutionTests(unittest.TestCase):
+
+    # Test the Analytic Execution of 160000 Rounds, with 3 Parties and a GHZ State
+    def test_analytic_execution_160000_rounds_3_parties_ghz_state(self):
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "0100000100100001" * 10000
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Analytic Execution of the Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, bipartite_pre_shared_key, execution_mode_type=ANALYTIC_EXECUTION
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+
+        # Retrieve the Types and the Results of the Rounds
+        protocol_rounds_type_bits = qiskit_sqcka_protocol.get_protocol_rounds_type_bits()
+        protocol_rounds_results_bits = qiskit_sqcka_protocol.get_protocol_rounds_results_bits()
+
+        # Assert the shape of the Results of the Rounds and the number of CTRL (Reflect) Rounds
+        self.assertEqual(protocol_rounds_results_bits.shape, (len(bipartite_pre_shared_key), 3))
+        self.assertEqual(int(protocol_rounds_type_bits.sum()), 40000)
+
+        # Assert that the SIFT (Measure and Resend) Rounds are correlated between all the Parties
+        sift_rounds_results_bits = protocol_rounds_results_bits[protocol_rounds_type_bits == 0]
+        self.assertTrue((sift_rounds_results_bits == sift_rounds_results_bits[:, :1]).all())
+
+        # Assert that the CTRL (Reflect) Rounds were all measured as |000⟩
+        self.assertFalse(protocol_rounds_results_bits[protocol_rounds_type_bits == 1].any())
+
+        # Assert that no Quantum Circuit was built for the Rounds
+        self.assertEqual(qiskit_sqcka_protocol.get_protocol_rounds(), [])
+
+
+# Class for a Distributor Party Entity of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+# whose Multipartite Entanglement reflected back is disturbed in the CTRL (Reflect) Rounds (i.e., as by an Eavesdropper)
+# NOTE: It is defined at the level of the module, in order to be serialized, with the Executor Service,
+#       to the Parallel Workers (i.e., the patches of the main Process are not available in other Processes)
+class DisturbedQiskitSQCKAProtocolPartyEntity(QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity):
+
+    # Receive the Qubits reflected back, flipping the 2nd Qubit of the GHZ State, in the CTRL (Reflect) Rounds
+    def receive_back_quantum_data_information_from_semi_quantum_party_entities(self, num_parties, protocol_round):
+
+        # Receive the Qubits reflected back, as usual
+        protocol_round = super().receive_back_quantum_data_information_from_semi_quantum_party_entities(
+            num_parties, protocol_round
+        )
+
+        # If the current Round is a CTRL (Reflect) Round
+        if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
+
+            # Flip the 2nd Qubit of the GHZ State reflected back (i.e., |000⟩ + |111⟩ ↦ |010⟩ + |101⟩)
+            protocol_round.get_qiskit_quantum_circuit().apply_pauli_x(1)
+
+        # Return the Round
+        return protocol_round
+
+
+# Class for the Tests of the Parallel Execution of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceParallelExecutionTests(unittest.TestCase):
+
+    # Execute the Protocol in parallel, with 3 Parties and a GHZ State,
+    # for the given Bipartite Pre-Shared Key, number of Parallel Workers and Seed, returning its Rounds
+    @staticmethod
+    def execute_protocol_in_parallel(bipartite_pre_shared_key, num_parallel_workers, seed):
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Parallel Execution of the Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, bipartite_pre_shared_key, execution_mode_type=PARALLEL_EXECUTION,
+                num_parallel_workers=num_parallel_workers, seed=seed
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Return the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        return qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()
+
+    # Test the Parallel Execution of 640 Rounds, with 3 Parties and a GHZ State,
+    # where the Rounds are merged in order and the Results are reproducible, for the same Seed,
+    # regardless of the number of Parallel Workers (i.e., even if one single Parallel Worker,
+    # initialised only once with the Executor Service, executes all the shards of Rounds)
+    def test_parallel_execution_640_rounds_3_parties_ghz_state(self):
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "0100000100100001" * 40
+
+        # Execute the Protocol in parallel, with 1, 2 and 3 Parallel Workers, and the same Seed
+        protocol_rounds_1_worker = self.execute_protocol_in_parallel(bipartite_pre_shared_key, 1, 1234)
+        protocol_rounds_2_workers = self.execute_protocol_in_parallel(bipartite_pre_shared_key, 2, 1234)
+        protocol_rounds_3_workers = self.execute_protocol_in_parallel(bipartite_pre_shared_key, 3, 1234)
+
+        # Assert that all the Rounds were merged, in order
+        self.assertEqual([protocol_round.get_num_round() for protocol_round in protocol_rounds_2_workers],
+                         list(range(len(bipartite_pre_shared_key))))
+
+        # Assert that the Results of the Rounds are the expected ones
+        self.assertTrue(all(protocol_round.get_round_results() ==
+                            ("000" if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3 else
+                             protocol_round.get_round_results()[0] * 3)
+                            for protocol_round in protocol_rounds_2_workers))
+
+        # Assert that the Results are the same, regardless of the number of Parallel Workers
+        self.assertEqual([protocol_round.get_round_results() for protocol_round in protocol_rounds_2_workers],
+                         [protocol_round.get_round_results() for protocol_round in protocol_rounds_3_workers])
+        self.assertEqual([protocol_round.get_round_results() for protocol_round in protocol_rounds_1_worker],
+                         [protocol_round.get_round_results() for protocol_round in protocol_rounds_3_workers])
+
+    # Test that the Parallel Execution of 16 Rounds, with 3 Parties and a GHZ State, disturbed in
+    # the CTRL (Reflect) Rounds, emits the Events of the Rounds discarded by the Parallel Workers again, in order,
+    # including the Detection of Eavesdropping, for all the Strategies for Eavesdropping Detection
+    def test_parallel_execution_emits_eavesdropping_alerts_in_order(self):
+
+        # Retrieve the default Event Log
+        default_protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # For each Strategy for Eavesdropping Detection
+        for strategy_for_eavesdropping_detection in [MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT, SWAP_TEST]:
+
+            # Create a Ring Buffer Sink, to keep all the Events of the Protocol
+            ring_buffer_protocol_event_sink = RingBufferProtocolEventSink \
+                .RingBufferProtocolEventSink("ring_buffer_protocol_event_sink", 1024)
+
+            # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            # with 8 CTRL (Reflect) Rounds, configured for the Parallel Execution of the Rounds, in 4 shards
+            qiskit_sqcka_protocol_executor_service = \
+                create_qiskit_sqcka_protocol_executor_service_ghz_state(3, ("0110" * 4),
+                                                                        strategy_for_eavesdropping_detection,
+                                                                        execution_mode_type=PARALLEL_EXECUTION,
+                                                                        num_parallel_workers=2)
+
+            # Disturb the GHZ State reflected back to the Distributor, in all the CTRL (Reflect) Rounds
+            qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_distributor_party_entity()\
+                .__class__ = DisturbedQiskitSQCKAProtocolPartyEntity
+
+            try:
+
+                # Configure the default Event Log, only with the Ring Buffer Sink
+                ProtocolEventLog.ProtocolEventLog\
+                    .configure_default_protocol_event_log([ring_buffer_protocol_event_sink])
+
+                # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # with shards of 4 Rounds
+                with patch("src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.services.executor"
+                           ".QiskitSQCKAProtocolExecutorService.NUM_ROUNDS_PER_PARALLEL_EXECUTION_SHARD", 4):
+                    qiskit_sqcka_protocol_executor_service.start_protocol()
+
+            finally:
+
+                # Restore the previous default Event Log
+                ProtocolEventLog.ProtocolEventLog.default_protocol_event_log = default_protocol_event_log
+
+            # Retrieve the types and the numbers of the Rounds of the Events emitted
+            protocol_events = [(protocol_event.get_event_type(), protocol_event.get_num_round())
+                               for protocol_event in ring_buffer_protocol_event_sink.get_protocol_events()]
+
+            # Assert that each Round started once, in order
+            self.assertEqual([num_round for (event_type, num_round) in protocol_events
+                              if event_type == ROUND_STARTED], list(range(16)))
+
+            # Assert that the reflected back Multipartite Entanglement was measured, and that the Eavesdropping
+            # was detected, in all the CTRL (Reflect) Rounds, in order
+            self.assertEqual([num_round for (event_type, num_round) in protocol_events
+                              if event_type == ENTANGLEMENT_MEASURED], [1, 2, 5, 6, 9, 10, 13, 14])
+            self.assertEqual([num_round for (event_type, num_round) in protocol_events
+                              if event_type == EAVESDROPPING_ALERT], [1, 2, 5, 6, 9, 10, 13, 14])
+
+
+# Class for the Tests of the Raw Conference Keys of the Parties of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceRawConferenceKeysTests(unittest.TestCase):
+
+    # Test that the Sequential Execution of 16 Rounds, with 3 Parties and a GHZ State,
+    # sifts the Results of the SIFT (Measure and Resend) Rounds to the same Raw Conference Key, for all the Parties
+    def test_sequential_execution_sifts_raw_conference_keys(self):
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "0100000100100001"
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, bipartite_pre_shared_key)
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+
+        # Retrieve the Raw Conference Keys of all the Parties
+        raw_conference_keys = qiskit_sqcka_protocol.get_raw_conference_keys()
+
+        # Build the expected Raw Conference Key, from the Results of the SIFT (Measure and Resend) Rounds
+        expected_raw_conference_key = "".join([protocol_round.get_round_results()[0]
+                                               for protocol_round in qiskit_sqcka_protocol.get_protocol_rounds()
+                                               if protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3])
+
+        # Assert that all the Parties have the expected Raw Conference Key, with one Bit per SIFT Round
+        self.assertEqual(sorted(raw_conference_keys.keys()), ["alice", "bob_1", "bob_2"])
+        self.assertEqual(len(expected_raw_conference_key), 12)
+        for raw_conference_key in raw_conference_keys.values():
+            self.assertEqual(raw_conference_key, expected_raw_conference_key)
+
+        # Assert that the Raw Conference Key can also be retrieved for a single Party
+        self.assertEqual(qiskit_sqcka_protocol.get_raw_conference_key("bob_2"), expected_raw_conference_key)
+
+    # Test that the Analytic Execution of 160000 Rounds, with 3 Parties and a GHZ State,
+    # sifts the Results of the SIFT (Measure and Resend) Rounds to the Raw Conference Keys of all the Parties
+    def test_analytic_execution_sifts_raw_conference_keys(self):
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, ("0100000100100001" * 10000),
+                                                                    execution_mode_type=ANALYTIC_EXECUTION)
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the Buffer of the Raw Conference Keys of all the Parties
+        raw_conference_keys_buffer = \
+            qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_raw_conference_keys_buffer()
+
+        # Assert that the Raw Conference Keys have one Bit per SIFT Round and that they are the same for all the Parties
+        self.assertEqual(raw_conference_keys_buffer.get_num_raw_conference_key_bits(), 120000)
+        self.assertEqual(raw_conference_keys_buffer.get_raw_conference_key(1),
+                         raw_conference_keys_buffer.get_raw_conference_key(0))
+        self.assertEqual(raw_conference_keys_buffer.get_raw_conference_key(2),
+                         raw_conference_keys_buffer.get_raw_conference_key(0))
+
+
+# Class for the Tests of the Generation of the Bipartite Pre-Shared Keys of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServicePreSharedKeysTests(unittest.TestCase):
+
+    # Test that the Bipartite Pre-Shared Keys generated for 1000000 Rounds, with 3 Parties,
+    # have exactly the number of CTRL (Reflect) Rounds expected, and are reproducible with the Seed of the Protocol
+    def test_generate_bipartite_pre_shared_key_1000000_rounds_3_parties(self):
+
+        # Initialise the list of the Bipartite Pre-Shared Keys generated
+        bipartite_pre_shared_keys = []
+
+        # For two IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocols, with the same Seed
+        for _ in range(2):
+
+            # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service
+            qiskit_sqcka_protocol_executor_service = QiskitSQCKAProtocolExecutorService()
+
+            # Configure the Protocol's Parameters, for 1000000 Rounds, with 3 Parties and a GHZ State
+            qiskit_sqcka_protocol_executor_service\
+                .configure_protocol_parameters(3, 1000000, 2, 2, DISCRETE_VARIABLES, FIBER_OPTIC, ["X", "Z"],
+                                               GHZ_STATE, MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT,
+                                               [["Alice", "Bob_1"], ["Bob_1", "Alice"],
+                                                ["Alice", "Bob_2"], ["Bob_2", "Alice"]],
+                                               [50, 50], seed=2023)
+
+            # Generate one Bipartite Pre-Shared Key, for the Protocol
+            bipartite_pre_shared_keys\
+                .append(qiskit_sqcka_protocol_executor_service.generate_protocol_bipartite_pre_shared_key())
+
+        # Assert that the Bipartite Pre-Shared Key has one bit per Round and
+        # a quarter of the Rounds as CTRL (Reflect) Rounds, for 3 Parties and 2 Preparing Bases
+        self.assertEqual(len(bipartite_pre_shared_keys[0]), 1000000)
+        self.assertEqual(Utilities.compute_hamming_weight(bipartite_pre_shared_keys[0]), 250000)
+
+        # Assert that both Bipartite Pre-Shared Keys are the same
+        self.assertEqual(bipartite_pre_shared_keys[0], bipartite_pre_shared_keys[1])
+
+    # Test that it is not possible to generate a Bipartite Pre-Shared Key,
+    # before the Parameters of the Protocol are configured
+    def test_generate_bipartite_pre_shared_key_requires_protocol_parameters(self):
+
+        # Assert that a Value Error is raised
+        with self.assertRaises(ValueError):
+            QiskitSQCKAProtocolExecutorService().generate_protocol_bipartite_pre_shared_key()
+
+
+# Class for the Tests of the Diagnostics of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceDiagnosticsTests(unittest.TestCase):
+
+    # Test that the Basic Diagnostics represent the prepared GHZ State from its known structure,
+    # only once for all the Rounds, without simulating any State Vector
+    def test_basic_diagnostics_represent_ghz_state_without_state_vector(self):
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Sequential Execution of the Rounds, with the default Basic Diagnostics
+        qiskit_sqcka_protocol_executor_service = create_qiskit_sqcka_protocol_executor_service_ghz_state(3, "0110")
+
+        # Start the Protocol, asserting that no State Vector is simulated for its Rounds
+        with patch.object(QiskitSQCKAProtocolExecutorService,
+                          "compute_prepared_quantum_entanglement_string_representation") as \
+                compute_prepared_quantum_entanglement_string_representation:
+
+            # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            qiskit_sqcka_protocol_executor_service.start_protocol()
+
+            # Assert that no State Vector was simulated
+            compute_prepared_quantum_entanglement_string_representation.assert_not_called()
+
+        # Assert that the GHZ State was represented only once, for all the Rounds
+        self.assertEqual(qiskit_sqcka_protocol_executor_service.prepared_quantum_entanglement_string_representations,
+                         {(GHZ_STATE, 3): "|Ψ⟩ = 1/sqrt(2) × (|000⟩ + |111⟩)"})
+
+    # Test the representation of the W State, from its known structure
+    def test_known_w_state_string_representation(self):
+
+        # Compute the valid Quantum States of the W State, with 3 Parties
+        valid_quantum_states_binary = QiskitSQCKAProtocolExecutorService\
+            .compute_known_quantum_entanglement_valid_quantum_states_binary(W_STATE, 3)
+
+        # Assert that the W State is represented with one Qubit in the state |1⟩, for each Party
+        self.assertEqual(QiskitSQCKAProtocolExecutorService
+                         .build_quantum_entanglement_string_representation(valid_quantum_states_binary),
+                         "|Ψ⟩ = 1/sqrt(3) × (|001⟩ + |010⟩ + |100⟩)")
+
+    # Test that no representation is computed, when the Diagnostics are disabled
+    def test_no_diagnostics(self):
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Sequential Execution of the Rounds, without Diagnostics
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, "0110", diagnostics_level_type=NO_DIAGNOSTICS)
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Assert that no representation was computed for the Rounds
+        self.assertEqual(qiskit_sqcka_protocol_executor_service.prepared_quantum_entanglement_string_representations,
+                         {})
+
+
+# Class for the Tests of the Events of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceEventsTests(unittest.TestCase):
+
+    # Test that the Sequential Execution of 4 Rounds, with 3 Parties and a GHZ State,
+    # emits the structured Events of each Round to the configured Sinks
+    def test_sequential_execution_emits_round_events(self):
+
+        # Retrieve the default Event Log
+        default_protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # Create a Ring Buffer Sink, to keep all the Events of the Protocol
+        ring_buffer_protocol_event_sink = RingBufferProtocolEventSink \
+            .RingBufferProtocolEventSink("ring_buffer_protocol_event_sink", 1024)
+
+        try:
+
+            # Configure the default Event Log, only with the Ring Buffer Sink
+            ProtocolEventLog.ProtocolEventLog.configure_default_protocol_event_log([ring_buffer_protocol_event_sink])
+
+            # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            # with 2 SIFT (Measure and Resend) Rounds and 2 CTRL (Reflect) Rounds
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, "0110").start_protocol()
+
+        finally:
+
+            # Restore the previous default Event Log
+            ProtocolEventLog.ProtocolEventLog.default_protocol_event_log = default_protocol_event_log
+
+        # Retrieve the types and the numbers of the Rounds of the Events emitted
+        protocol_events = [(protocol_event.get_event_type(), protocol_event.get_num_round())
+                           for protocol_event in ring_buffer_protocol_event_sink.get_protocol_events()]
+
+        # Assert that each Round started and finished once, in order
+        self.assertEqual([num_round for (event_type, num_round) in protocol_events if event_type == ROUND_STARTED],
+                         [0, 1, 2, 3])
+        self.assertEqual([num_round for (event_type, num_round) in protocol_events if event_type == ROUND_FINISHED],
+                         [0, 1, 2, 3])
+
+        # Assert that each Semi-Quantum Party measured its Qubit in the SIFT Rounds and reflected it in the CTRL Rounds
+        self.assertEqual([num_round for (event_type, num_round) in protocol_events if event_type == QUBIT_MEASURED],
+                         [0, 0, 3, 3])
+        self.assertEqual([num_round for (event_type, num_round) in protocol_events
+                          if event_type == QUBIT_REFLECTED], [1, 1, 2, 2])
+
+        # Assert that the Results were obtained for the SIFT Rounds and measured for the CTRL Rounds
+        self.assertEqual([num_round for (event_type, num_round) in protocol_events
+                          if event_type == ROUND_RESULT_OBTAINED], [0, 3])
+        self.assertEqual([num_round for (event_type, num_round) in protocol_events
+                          if event_type == ENTANGLEMENT_MEASURED], [1, 2])
+
+    # Test that the Sequential Execution and the Batched Execution of 16 Rounds, with 3 Parties and a GHZ State,
+    # emit the same Events about the start, the Measurement and the end of each Round
+    def test_sequential_and_batched_executions_emit_same_round_events(self):
+
+        # Retrieve the default Event Log
+        default_protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # Initialise the list of the Events emitted by each Execution Mode
+        protocol_events_execution_modes = []
+
+        # For each Execution Mode of the Rounds
+        for execution_mode_type in [SEQUENTIAL_EXECUTION, BATCHED_EXECUTION]:
+
+            # Create a Ring Buffer Sink, to keep all the Events of the Protocol
+            ring_buffer_protocol_event_sink = RingBufferProtocolEventSink \
+                .RingBufferProtocolEventSink("ring_buffer_protocol_event_sink", 1024)
+
+            try:
+
+                # Configure the default Event Log, only with the Ring Buffer Sink
+                ProtocolEventLog.ProtocolEventLog\
+                    .configure_default_protocol_event_log([ring_buffer_protocol_event_sink])
+
+                # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # with 6 SIFT (Measure and Resend) Rounds and 10 CTRL (Reflect) Rounds
+                create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                    3, "0100000100100001", execution_mode_type=execution_mode_type
+                ).start_protocol()
+
+            finally:
+
+                # Restore the previous default Event Log
+                ProtocolEventLog.ProtocolEventLog.default_protocol_event_log = default_protocol_event_log
+
+            # Keep the types, the numbers of the Rounds and the messages of the Events emitted by both Execution Modes
+            # (i.e., the messages of the Results of the SIFT (Measure and Resend) Rounds are random)
+            protocol_events_execution_modes.append(
+                [(protocol_event.get_event_type(), protocol_event.get_num_round(),
+                  (None if protocol_event.get_event_type() == ROUND_RESULT_OBTAINED else protocol_event.get_message()))
+                 for protocol_event in ring_buffer_protocol_event_sink.get_protocol_events()
+                 if protocol_event.get_event_type() in [ROUND_STARTED, ROUND_RESULT_OBTAINED,
+                                                        ENTANGLEMENT_MEASURED, ROUND_FINISHED]]
+            )
+
+        # Assert that both Execution Modes emitted the same Events, in the same order, for the 16 Rounds
+        self.assertEqual(len(protocol_events_execution_modes[0]), (16 * 3))
+        self.assertEqual(protocol_events_execution_modes[0], protocol_events_execution_modes[1])
+
+
+# Class for the Tests of the Estimation of the Quantum Bit Error Rate (QBER) of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceQuantumBitErrorRateTests(unittest.TestCase):
+
+    # Test that the Analytic Execution of 160000 Rounds, with 3 Parties and a GHZ State,
+    # estimates a null Quantum Bit Error Rate (QBER), for every block of CTRL (Reflect) Rounds
+    def test_analytic_execution_estimates_null_quantum_bit_error_rate(self):
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # with 40000 CTRL (Reflect) Rounds, estimated in blocks of 1000 CTRL (Reflect) Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, ("0100000100100001" * 10000),
+                                                                    execution_mode_type=ANALYTIC_EXECUTION,
+                                                                    quantum_bit_error_rate_estimation_block_size=1000,
+                                                                    quantum_bit_error_rate_abort_threshold=0.11)
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the Estimator of the Quantum Bit Error Rate (QBER) of the Protocol
+        quantum_bit_error_rate_estimator = \
+            qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_quantum_bit_error_rate_estimator()
+
+        # Assert that all the CTRL (Reflect) Rounds were folded, in 40 blocks, without any error
+        self.assertEqual(quantum_bit_error_rate_estimator.get_num_ctrl_rounds(), 40000)
+        self.assertEqual(len(quantum_bit_error_rate_estimator.get_blocks_quantum_bit_error_rates_estimations()), 40)
+        self.assertEqual(quantum_bit_error_rate_estimator.get_quantum_bit_error_rate(), 0.0)
+
+        # Assert that the Protocol was not aborted
+        self.assertFalse(qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().is_aborted())
+
+    # Test that the Sequential Execution, with 3 Parties and a GHZ State, is aborted early,
+    # when the Results of its CTRL (Reflect) Rounds are all erroneous (i.e., as measured with an Eavesdropper)
+    def test_sequential_execution_aborts_when_quantum_bit_error_rate_crosses_threshold(self):
+
+        # Keep the original folding of the Results of a CTRL (Reflect) Round
+        add_ctrl_round_results = QiskitSQCKAProtocolQuantumBitErrorRateEstimator\
+            .QiskitSQCKAProtocolQuantumBitErrorRateEstimator.add_ctrl_round_results
+
+        # Retrieve the default Event Log
+        default_protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # Create a Ring Buffer Sink, to keep all the Events of the Protocol
+        ring_buffer_protocol_event_sink = RingBufferProtocolEventSink \
+            .RingBufferProtocolEventSink("ring_buffer_protocol_event_sink", 1024)
+
+        try:
+
+            # Configure the default Event Log, only with the Ring Buffer Sink
+            ProtocolEventLog.ProtocolEventLog.configure_default_protocol_event_log([ring_buffer_protocol_event_sink])
+
+            # Fold every Result of the CTRL (Reflect) Rounds as an erroneous one
+            with patch.object(QiskitSQCKAProtocolQuantumBitErrorRateEstimator
+                              .QiskitSQCKAProtocolQuantumBitErrorRateEstimator, "add_ctrl_round_results",
+                              lambda estimator, ctrl_round_results:
+                              add_ctrl_round_results(estimator, ("1" * len(ctrl_round_results)))):
+
+                # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # with 16 Rounds, estimating the Quantum Bit Error Rate (QBER) in blocks of 1 CTRL (Reflect) Round
+                qiskit_sqcka_protocol_executor_service = \
+                    create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                        3, "0101010101010101", quantum_bit_error_rate_estimation_block_size=1,
+                        quantum_bit_error_rate_abort_threshold=0.11
+                    )
+                qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        finally:
+
+            # Restore the previous default Event Log
+            ProtocolEventLog.ProtocolEventLog.default_protocol_event_log = default_protocol_event_log
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+
+        # Assert that the Protocol was aborted, right after its 1st CTRL (Reflect) Round (i.e., the 2nd Round)
+        self.assertTrue(qiskit_sqcka_protocol.is_aborted())
+        self.assertEqual(len(qiskit_sqcka_protocol.get_protocol_rounds()), 2)
+
+        # Retrieve the types of the Events emitted
+        protocol_events_types = [protocol_event.get_event_type()
+                                 for protocol_event in ring_buffer_protocol_event_sink.get_protocol_events()]
+
+        # Assert that the Quantum Bit Error Rate (QBER) was estimated once and that the Protocol was aborted once
+        self.assertEqual(protocol_events_types.count(QUANTUM_BIT_ERROR_RATE_ESTIMATED), 1)
+        self.assertEqual(protocol_events_types.count(PROTOCOL_ABORTED), 1)
+
+    # Test that the Parallel Execution, with 3 Parties and a GHZ State, disturbed in the CTRL (Reflect) Rounds,
+    # is aborted early, after the 1st shard of Rounds, discarding the Rounds of the remaining shards
+    def test_parallel_execution_aborts_when_quantum_bit_error_rate_crosses_threshold(self):
+
+        # Retrieve the default Event Log
+        default_protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # Create a Ring Buffer Sink, to keep all the Events of the Protocol
+        ring_buffer_protocol_event_sink = RingBufferProtocolEventSink \
+            .RingBufferProtocolEventSink("ring_buffer_protocol_event_sink", 1024)
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, with 64 Rounds,
+        # executed in parallel, estimating the Quantum Bit Error Rate (QBER) in blocks of 1 CTRL (Reflect) Round
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, ("0101" * 16), execution_mode_type=PARALLEL_EXECUTION, num_parallel_workers=2,
+                quantum_bit_error_rate_estimation_block_size=1, quantum_bit_error_rate_abort_threshold=0.11
+            )
+
+        # Disturb the GHZ State reflected back to the Distributor, in all the CTRL (Reflect) Rounds
+        qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_distributor_party_entity()\
+            .__class__ = DisturbedQiskitSQCKAProtocolPartyEntity
+
+        try:
+
+            # Configure the default Event Log, only with the Ring Buffer Sink
+            ProtocolEventLog.ProtocolEventLog.configure_default_protocol_event_log([ring_buffer_protocol_event_sink])
+
+            # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            # with shards of 4 Rounds
+            with patch("src.ibm_qiskit.cryptography.semi_quantum_conference_key_agreement.services.executor"
+                       ".QiskitSQCKAProtocolExecutorService.NUM_ROUNDS_PER_PARALLEL_EXECUTION_SHARD", 4):
+                qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        finally:
+
+            # Restore the previous default Event Log
+            ProtocolEventLog.ProtocolEventLog.default_protocol_event_log = default_protocol_event_log
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+
+        # Assert that the Protocol was aborted, only with the 4 Rounds of its 1st shard
+        self.assertTrue(qiskit_sqcka_protocol.is_aborted())
+        self.assertEqual([protocol_round.get_num_round()
+                          for protocol_round in qiskit_sqcka_protocol.get_protocol_rounds()], list(range(4)))
+
+        # Retrieve the types of the Events emitted
+        protocol_events_types = [protocol_event.get_event_type()
+                                 for protocol_event in ring_buffer_protocol_event_sink.get_protocol_events()]
+
+        # Assert that the Events of only 4 Rounds were emitted and that the Protocol was aborted once
+        self.assertEqual(protocol_events_types.count(ROUND_STARTED), 4)
+        self.assertEqual(protocol_events_types.count(PROTOCOL_ABORTED), 1)
+
+
+# Class for the Tests of the Information Reconciliation of the Raw Conference Keys of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceInformationReconciliationTests(unittest.TestCase):
+
+    # Test that the Raw Conference Keys of the Analytic Execution of 160000 Rounds, with 3 Parties and a GHZ State,
+    # with errors injected in the Raw Conference Keys of the Semi-Quantum Parties, are reconciled with
+    # the Raw Conference Key of the Distributor, by all the types of Information Reconciliation
+    def test_analytic_execution_reconciles_raw_conference_keys(self):
+
+        # For each type of Information Reconciliation
+        for information_reconciliation_type in [CASCADE_RECONCILIATION, LDPC_RECONCILIATION]:
+
+            # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            qiskit_sqcka_protocol_executor_service = \
+                create_qiskit_sqcka_protocol_executor_service_ghz_state(3, ("0100000100100001" * 10000),
+                                                                        execution_mode_type=ANALYTIC_EXECUTION,
+                                                                        seed=2023)
+            qiskit_sqcka_protocol_executor_service.start_protocol()
+
+            # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            qiskit_sqcka_protocol = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+
+            # Flip 5% of the Bits of the Raw Conference Keys of the Semi-Quantum Parties (i.e., as in noisy Rounds)
+            for party_entity_id in [1, 2]:
+                qiskit_sqcka_protocol.get_raw_conference_keys_buffer()\
+                    .get_raw_conference_key_bits(party_entity_id)[(party_entity_id * 7)::20] ^= 1
+
+            # Reconcile the Raw Conference Keys, for a Quantum Bit Error Rate (QBER) of 5%
+            reconciled_conference_keys = qiskit_sqcka_protocol_executor_service\
+                .reconcile_protocol_raw_conference_keys(information_reconciliation_type, quantum_bit_error_rate=0.05)
+
+            # Assert that all the Parties have the Raw Conference Key of the Distributor, as their Reconciled ones
+            self.assertEqual(sorted(reconciled_conference_keys.keys()), ["alice", "bob_1", "bob_2"])
+            for reconciled_conference_key in reconciled_conference_keys.values():
+                self.assertEqual(reconciled_conference_key, qiskit_sqcka_protocol.get_raw_conference_key("alice"))
+
+            # Assert that 6000 Bits were corrected for each Semi-Quantum Party and that some Bits were leaked
+            for information_reconciliation_statistics in \
+                    qiskit_sqcka_protocol.get_information_reconciliation_statistics().values():
+                self.assertEqual(information_reconciliation_statistics.get_num_corrected_bits(), 6000)
+            self.assertGreater(qiskit_sqcka_protocol.get_num_information_reconciliation_leaked_bits(), 0)
+
+    # Test that the Raw Conference Keys of the Analytic Execution of 160000 Rounds, with 3 Parties and a GHZ State,
+    # are reconciled and amplified, by default, for the Quantum Bit Error Rates (QBERs) estimated for each Party,
+    # instead of the rate of erroneous CTRL (Reflect) Rounds
+    def test_analytic_execution_reconciles_raw_conference_keys_for_parties_quantum_bit_error_rates(self):
+
+        # Keep the original folding of the Results of several CTRL (Reflect) Rounds
+        add_ctrl_rounds_results_bits = QiskitSQCKAProtocolQuantumBitErrorRateEstimator\
+            .QiskitSQCKAProtocolQuantumBitErrorRateEstimator.add_ctrl_rounds_results_bits
+
+        # Flip the Bit of the Semi-Quantum Party #1, in 5% of the Results of the CTRL (Reflect) Rounds
+        def add_ctrl_rounds_results_bits_with_errors(estimator, ctrl_rounds_results_bits):
+            ctrl_rounds_results_bits = ctrl_rounds_results_bits.copy()
+            ctrl_rounds_results_bits[::20, 1] ^= 1
+            return add_ctrl_rounds_results_bits(estimator, ctrl_rounds_results_bits)
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # with 40000 CTRL (Reflect) Rounds, with errors on the Semi-Quantum Party #1
+        with patch.object(QiskitSQCKAProtocolQuantumBitErrorRateEstimator
+                          .QiskitSQCKAProtocolQuantumBitErrorRateEstimator, "add_ctrl_rounds_results_bits",
+                          add_ctrl_rounds_results_bits_with_errors):
+            qiskit_sqcka_protocol_executor_service = \
+                create_qiskit_sqcka_protocol_executor_service_ghz_state(3, ("0100000100100001" * 10000),
+                                                                        execution_mode_type=ANALYTIC_EXECUTION,
+                                                                        seed=2023)
+            qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+
+        # Assert that only the Semi-Quantum Party #1 has a Quantum Bit Error Rate (QBER) of 5%,
+        # while 5% of the CTRL (Reflect) Rounds are erroneous
+        self.assertEqual(qiskit_sqcka_protocol.get_estimated_parties_quantum_bit_error_rates(),
+                         {"alice": 0.0, "bob_1": 0.05, "bob_2": 0.0})
+        self.assertEqual(qiskit_sqcka_protocol.get_estimated_quantum_bit_error_rate(), 0.05)
+
+        # Flip 5% of the Bits of the Raw Conference Key of the Semi-Quantum Party #1 (i.e., as in noisy Rounds)
+        qiskit_sqcka_protocol.get_raw_conference_keys_buffer().get_raw_conference_key_bits(1)[7::20] ^= 1
+
+        # Keep the original Information Reconciliation of a key
+        reconcile_key_bits = QiskitSQCKAProtocolLDPCInformationReconciliation\
+            .QiskitSQCKAProtocolLDPCInformationReconciliation.reconcile_key_bits
+
+        # Initialise the list of the Quantum Bit Error Rates (QBERs) used to reconcile the keys
+        quantum_bit_error_rates = []
+
+        # Reconcile the Raw Conference Keys, for the Quantum Bit Error Rates (QBERs) estimated for each Party,
+        # keeping the ones used to reconcile the keys
+        with patch.object(QiskitSQCKAProtocolLDPCInformationReconciliation
+                          .QiskitSQCKAProtocolLDPCInformationReconciliation, "reconcile_key_bits",
+                          lambda information_reconciliation, reference_key_bits, raw_key_bits, quantum_bit_error_rate:
+                          quantum_bit_error_rates.append(quantum_bit_error_rate) or
+                          reconcile_key_bits(information_reconciliation, reference_key_bits, raw_key_bits,
+                                             quantum_bit_error_rate)):
+            reconciled_conference_keys = qiskit_sqcka_protocol_executor_service\
+                .reconcile_protocol_raw_conference_keys(LDPC_RECONCILIATION)
+
+        # Assert that each Semi-Quantum Party was reconciled for its own Quantum Bit Error Rate (QBER)
+        self.assertEqual(quantum_bit_error_rates, [0.05, 0.0])
+        for reconciled_conference_key in reconciled_conference_keys.values():
+            self.assertEqual(reconciled_conference_key, qiskit_sqcka_protocol.get_raw_conference_key("alice"))
+
+        # Amplify the privacy of the Reconciled Conference Keys, for the highest estimated Quantum Bit Error Rate (QBER)
+        final_conference_keys = qiskit_sqcka_protocol_executor_service.amplify_privacy_of_protocol_conference_keys()
+
+        # Assert that the Final Conference Key has the length given by the highest Quantum Bit Error Rate (QBER)
+        self.assertEqual(len(final_conference_keys["alice"]),
+                         QiskitSQCKAProtocolToeplitzPrivacyAmplification
+                         .QiskitSQCKAProtocolToeplitzPrivacyAmplification("toeplitz_privacy_amplification")
+                         .compute_final_key_length(120000, qiskit_sqcka_protocol
+                                                   .get_num_information_reconciliation_leaked_bits(), 0.05))
+
+    # Test that the Raw Conference Keys can only be reconciled after the Protocol be started
+    def test_raw_conference_keys_can_only_be_reconciled_after_protocol_started(self):
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, without starting it
+        qiskit_sqcka_protocol_executor_service = create_qiskit_sqcka_protocol_executor_service_ghz_state(3, "0110")
+
+        # Assert that the Raw Conference Keys can not be reconciled yet
+        with self.assertRaises(RuntimeError):
+            qiskit_sqcka_protocol_executor_service.reconcile_protocol_raw_conference_keys()
+
+
+# Class for the Tests of the Privacy Amplification of the Reconciled Conference Keys of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServicePrivacyAmplificationTests(unittest.TestCase):
+
+    # Test that the Reconciled Conference Keys of the Analytic Execution of 160000 Rounds, with 3 Parties and
+    # a GHZ State, are compressed to the same Final Conference Key, discounting the Bits leaked to reconcile them
+    def test_analytic_execution_amplifies_privacy_of_reconciled_conference_keys(self):
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, ("0100000100100001" * 10000),
+                                                                    execution_mode_type=ANALYTIC_EXECUTION, seed=2023)
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Assert that the privacy can not be amplified before the Information Reconciliation
+        with self.assertRaises(RuntimeError):
+            qiskit_sqcka_protocol_executor_service.amplify_privacy_of_protocol_conference_keys()
+
+        # Retrieve the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+
+        # Flip 1% of the Bits of the Raw Conference Key of a Semi-Quantum Party (i.e., as in noisy Rounds)
+        qiskit_sqcka_protocol.get_raw_conference_keys_buffer().get_raw_conference_key_bits(1)[::100] ^= 1
+
+        # Reconcile the Raw Conference Keys and amplify the privacy of the Reconciled Conference Keys,
+        # for a Quantum Bit Error Rate (QBER) of 1%
+        qiskit_sqcka_protocol_executor_service\
+            .reconcile_protocol_raw_conference_keys(CASCADE_RECONCILIATION, quantum_bit_error_rate=0.01)
+        final_conference_keys = qiskit_sqcka_protocol_executor_service\
+            .amplify_privacy_of_protocol_conference_keys(quantum_bit_error_rate=0.01)
+
+        # Assert that all the Parties have the same Final Conference Key
+        self.assertEqual(sorted(final_conference_keys.keys()), ["alice", "bob_1", "bob_2"])
+        self.assertEqual(final_conference_keys["bob_1"], final_conference_keys["alice"])
+        self.assertEqual(final_conference_keys["bob_2"], final_conference_keys["alice"])
+
+        # Assert that the Final Conference Key is shorter than the Raw Conference Keys,
+        # by, at least, the Bits leaked during the Information Reconciliation
+        self.assertGreater(len(final_conference_keys["alice"]), 0)
+        self.assertLessEqual(len(final_conference_keys["alice"]),
+                             (120000 - qiskit_sqcka_protocol.get_num_information_reconciliation_leaked_bits()))
+
+
+# Class for the Tests of the SWAP Test, as Strategy for Eavesdropping Detection, of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceSWAPTestTests(unittest.TestCase):
+
+    # Test that the Sequential Execution of 16 Rounds, with 3 Parties and a GHZ State, executes the SWAP Tests of
+    # all its CTRL (Reflect) Rounds, as one single Job, with several Shots, estimating a perfect overlap
+    def test_sequential_execution_executes_all_swap_tests_in_one_job(self):
+
+        # Keep the original execution of the Quantum Circuits, by a Party Entity
+        execute_quantum_circuits = QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity\
+            .execute_quantum_circuits
+
+        # Initialise the list of the numbers of Quantum Circuits and Shots of each Job executed
+        jobs_executed = []
+
+        # Execute the given Quantum Circuits, keeping the number of Quantum Circuits and Shots of the Job
+        def execute_and_keep_quantum_circuits(party_entity, quantum_circuits, num_shots=1, is_transpiled=False):
+            jobs_executed.append((len(quantum_circuits), num_shots))
+            return execute_quantum_circuits(party_entity, quantum_circuits, num_shots, is_transpiled)
+
+        # Keep the number of Quantum Circuits and Shots of all the Jobs executed
+        with patch.object(QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity,
+                          "execute_quantum_circuits", execute_and_keep_quantum_circuits):
+
+            # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            # with 8 SIFT (Measure and Resend) Rounds and 8 CTRL (Reflect) Rounds, with SWAP Tests of 256 Shots
+            qiskit_sqcka_protocol_executor_service = \
+                create_qiskit_sqcka_protocol_executor_service_ghz_state(3, ("0110" * 4), SWAP_TEST,
+                                                                        num_shots_for_swap_test=256)
+            qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Assert that the SWAP Tests of the 8 CTRL (Reflect) Rounds were all executed, as one single Job,
+        # after the 8 SIFT (Measure and Resend) Rounds executed one by one, with a single Shot
+        self.assertEqual(jobs_executed, ([(1, 1)] * 8) + [(8, 256)])
+
+        # Retrieve the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_rounds = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()
+
+        # Assert that all the Rounds were executed, in order
+        self.assertEqual([protocol_round.get_num_round() for protocol_round in protocol_rounds], list(range(16)))
+
+        # Assert that the GHZ State reflected back is identical to the fresh copy of it, in all the CTRL Rounds
+        self.assertTrue(all(protocol_round.get_round_results() == 1.0 for protocol_round in protocol_rounds
+                            if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3))
+
+        # Assert that the measured GHZ State is correlated between all the Parties, in all the SIFT Rounds
+        self.assertTrue(all(protocol_round.get_round_results() in ["000", "111"] for protocol_round in protocol_rounds
+                            if protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3))
+
+    # Test that the Batched Execution of 16 Rounds, with 3 Parties and a GHZ State, detects the Eavesdropping,
+    # by the SWAP Tests, when the GHZ State reflected back is disturbed (i.e., as by an Eavesdropper)
+    def test_batched_execution_detects_disturbed_reflected_entanglement(self):
+
+        # Keep the original reception of the Qubits reflected back, by the Distributor Party Entity
+        receive_back_quantum_data_information = QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity\
+            .receive_back_quantum_data_information_from_semi_quantum_party_entities
+
+        # Receive the Qubits reflected back, flipping the 2nd Qubit of the GHZ State, in the CTRL (Reflect) Rounds
+        def receive_back_and_flip_quantum_data_information(party_entity, num_parties, protocol_round):
+
+            # Receive the Qubits reflected back, as usual
+            protocol_round = receive_back_quantum_data_information(party_entity, num_parties, protocol_round)
+
+            # If the current Round is a CTRL (Reflect) Round
+            if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
+
+                # Flip the 2nd Qubit of the GHZ State reflected back (i.e., |000⟩ + |111⟩ ↦ |010⟩ + |101⟩)
+                protocol_round.get_qiskit_quantum_circuit().apply_pauli_x(1)
+
+            # Return the Round
+            return protocol_round
+
+        # Retrieve the default Event Log
+        default_protocol_event_log = ProtocolEventLog.ProtocolEventLog.get_default_protocol_event_log()
+
+        # Create a Ring Buffer Sink, to keep all the Events of the Protocol
+        ring_buffer_protocol_event_sink = RingBufferProtocolEventSink \
+            .RingBufferProtocolEventSink("ring_buffer_protocol_event_sink", 1024)
+
+        try:
+
+            # Configure the default Event Log, only with the Ring Buffer Sink
+            ProtocolEventLog.ProtocolEventLog.configure_default_protocol_event_log([ring_buffer_protocol_event_sink])
+
+            # Disturb the GHZ State reflected back, in all the CTRL (Reflect) Rounds
+            with patch.object(QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity,
+                              "receive_back_quantum_data_information_from_semi_quantum_party_entities",
+                              receive_back_and_flip_quantum_data_information):
+
+                # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # with 8 CTRL (Reflect) Rounds, configured for the Batched Execution of the Rounds
+                qiskit_sqcka_protocol_executor_service = \
+                    create_qiskit_sqcka_protocol_executor_service_ghz_state(3, ("0110" * 4), SWAP_TEST,
+                                                                            execution_mode_type=BATCHED_EXECUTION)
+                qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        finally:
+
+            # Restore the previous default Event Log
+            ProtocolEventLog.ProtocolEventLog.default_protocol_event_log = default_protocol_event_log
+
+        # Retrieve the estimations of the overlap of the SWAP Tests of the CTRL (Reflect) Rounds
+        swap_tests_overlaps = [protocol_round.get_round_results() for protocol_round in
+                               qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()
+                               if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3]
+
+        # Assert that the orthogonal GHZ State reflected back was estimated with an overlap close to 0
+        self.assertEqual(len(swap_tests_overlaps), 8)
+        self.assertTrue(all(abs(swap_test_overlap) < 0.25 for swap_test_overlap in swap_tests_overlaps))
+
+        # Retrieve the types of the Events emitted
+        protocol_events_types = [protocol_event.get_event_type()
+                                 for protocol_event in ring_buffer_protocol_event_sink.get_protocol_events()]
+
+        # Assert that the Eavesdropping was detected in all the CTRL (Reflect) Rounds,
+        # and that all the SWAP Tests were performed at once
+        self.assertEqual(protocol_events_types.count(EAVESDROPPING_ALERT), 8)
+        self.assertEqual(protocol_events_types.count(SWAP_TESTS_PERFORMED), 1)
+
+    # Test that the Stabilizer Simulator can not be configured for the SWAP Test (i.e., non-Clifford Quantum Circuits)
+    def test_stabilizer_simulator_does_not_support_swap_test(self):
+
+        # Assert that the configuration of the Protocol's Parameters raises a Value Error
+        with self.assertRaises(ValueError):
+            QiskitSQCKAProtocolExecutorService()\
+                .configure_protocol_parameters(3, 4, 2, 2, DISCRETE_VARIABLES, FIBER_OPTIC, ["X", "Z"], GHZ_STATE,
+                                               SWAP_TEST, quantum_simulator_type=STABILIZER_SIMULATOR)
+
+
+# Class for the Tests of the Compact Layout of the Quantum Circuits of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceCompactLayoutTests(unittest.TestCase):
+
+    # Test the Sequential Execution of 16 Rounds, with 3 Parties and a GHZ State, with the Compact Layout,
+    # where the Quantum Circuits of the Rounds have only one Qubit for each Party Entity
+    def test_sequential_execution_16_rounds_3_parties_ghz_state(self):
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "0100000100100001"
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # configured for the Compact Layout of the Quantum Circuits of the Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, bipartite_pre_shared_key,
+                                                                    quantum_circuit_layout_type=COMPACT_LAYOUT)
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_rounds = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()
+
+        # For each Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for protocol_round in protocol_rounds:
+
+            # Assert that the Quantum Circuit of the current Round has only one Qubit for each Party Entity
+            self.assertEqual(protocol_round.get_qiskit_quantum_circuit().quantum_circuit.num_qubits, 3)
+
+            # Assert that the Qubits were all received back by the Distributor Party Entity
+            self.assertEqual([protocol_round.get_qubit_holder_party_entity_id(qubit_index)
+                              for qubit_index in range(1, 3)], [0, 0])
+
+            # If the current Round is a CTRL (Reflect) Round
+            if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
+
+                # Assert that the inverted GHZ State was measured as |000⟩
+                self.assertEqual(protocol_round.get_round_results(), "000")
+
+            # If the current Round is a SIFT (Measure and Resend) Round
+            else:
+
+                # Assert that the measured GHZ State is correlated between all the Parties
+                self.assertIn(protocol_round.get_round_results(), ["000", "111"])
+
+    # Test the Batched Execution of 8 Rounds, with 12 Parties and a GHZ State, with the Compact Layout,
+    # whose Quantum Circuits of 12 Qubits would need 34 Qubits with the Expanded Layout
+    def test_batched_execution_8_rounds_12_parties_ghz_state(self):
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # configured for the Batched Execution and the Compact Layout of the Quantum Circuits of the Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(12, ("0110" * 2),
+                                                                    execution_mode_type=BATCHED_EXECUTION,
+                                                                    diagnostics_level_type=NO_DIAGNOSTICS,
+                                                                    quantum_circuit_layout_type=COMPACT_LAYOUT)
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the Results of the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_rounds_results = [protocol_round.get_round_results() for protocol_round in
+                                   qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+                                   .get_protocol_rounds()]
+
+        # Assert that the inverted GHZ State was measured as |00...0⟩, in all the CTRL (Reflect) Rounds,
+        # and that the measured GHZ State is correlated between all the Parties, in all the SIFT Rounds
+        self.assertEqual([protocol_round_results for num_round, protocol_round_results
+                          in enumerate(protocol_rounds_results) if num_round % 4 in [1, 2]], (["0" * 12] * 4))
+        self.assertTrue(all(protocol_round_results in [("0" * 12), ("1" * 12)]
+                            for protocol_round_results in protocol_rounds_results))
+
+    # Test that a Semi-Quantum Party Entity can not measure a Qubit that it did not receive,
+    # since the Quantum Communication Channels are modeled logically, with the Compact Layout
+    def test_qubit_not_received_cannot_be_measured(self):
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # configured for the Compact Layout of the Quantum Circuits of the Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, "0000",
+                                                                    quantum_circuit_layout_type=COMPACT_LAYOUT)
+
+        # Retrieve the Party Entities of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_party_entities = qiskit_sqcka_protocol_executor_service.get_protocol_party_entities()
+
+        # Create the 1st Round, with only one Qubit for each Party Entity,
+        # and send its Qubits over the Quantum Communication Channels
+        protocol_round = protocol_party_entities[0].create_protocol_round(0, 3)
+        protocol_round = protocol_party_entities[0] \
+            .send_quantum_data_information_to_semi_quantum_party_entities(3, protocol_round)
+
+        # Assert that the Qubits are in transit over the Quantum Communication Channels, by no SWAP Gate
+        self.assertEqual([protocol_round.get_qubit_holder_party_entity_id(qubit_index, -1)
+                          for qubit_index in range(1, 3)], [None, None])
+        self.assertNotIn("swap", protocol_round.get_qiskit_quantum_circuit().quantum_circuit.count_ops())
+
+        # Assert that a Semi-Quantum Party Entity can not measure a Qubit in transit
+        with self.assertRaises(RuntimeError):
+            protocol_party_entities[1].measure_and_resend_or_reflect_qubit(3, protocol_round)
+
+    # Test that an invalid Layout Type of the Quantum Circuits of the Rounds can not be configured
+    def test_invalid_quantum_circuit_layout_type(self):
+
+        # Assert that the configuration of the Protocol's Parameters raises a Value Error
+        with self.assertRaises(ValueError):
+            QiskitSQCKAProtocolExecutorService()\
+                .configure_protocol_parameters(3, 4, 2, 2, DISCRETE_VARIABLES, FIBER_OPTIC, ["X", "Z"], GHZ_STATE,
+                                               MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT,
+                                               quantum_circuit_layout_type="SPARSE_LAYOUT")
+
+
+# Class for the Tests of the Barriers of the Quantum Circuits of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceBarriersTests(unittest.TestCase):
+
+    # Execute the Protocol, with 4 Rounds, with 3 Parties and a GHZ State, and return the number of Barriers
+    # of the Quantum Circuit of each Round, for the given boolean flag about if the Barriers are recorded
+    @staticmethod
+    def execute_protocol_and_count_barriers(barriers_for_visualization_flag):
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, "0110", barriers_for_visualization_flag=barriers_for_visualization_flag
+            )
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Return the number of Barriers of the Quantum Circuit of each Round
+        return [protocol_round.get_qiskit_quantum_circuit().quantum_circuit.count_ops().get("barrier", 0)
+                for protocol_round in qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+                .get_protocol_rounds()]
+
+    # Test that the Barriers are omitted from the Quantum Circuits of the Rounds, by default,
+    # and only recorded when they are requested, for the visualization or export of the Quantum Circuits
+    def test_barriers_only_recorded_for_visualization(self):
+
+        # Assert that no Barrier is recorded in the Quantum Circuits of the Rounds, by default
+        self.assertEqual(self.execute_protocol_and_count_barriers(False), [0, 0, 0, 0])
+
+        # Assert that the Barriers are recorded in the Quantum Circuits of all the Rounds, when requested
+        self.assertTrue(all(num_barriers > 0 for num_barriers in self.execute_protocol_and_count_barriers(True)))
+
+
+# Class for the Tests of the Reproducibility of the Sessions of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, for a given Seed
+class QiskitSQCKAProtocolExecutorServiceSeededSessionTests(unittest.TestCase):
+
+    # Execute the Protocol, with 3 Parties and a GHZ State, for the given Bipartite Pre-Shared Key, Seed and
+    # (additional) Parameters, returning the Results of its Rounds
+    @staticmethod
+    def execute_protocol_and_get_round_results(bipartite_pre_shared_key, seed, **kwargs):
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, bipartite_pre_shared_key, seed=seed, **kwargs)
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Return the Results of the Rounds
+        return [protocol_round.get_round_results()
+                for protocol_round in qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+                .get_protocol_rounds()]
+
+    # Test that the Results of the Rounds are reproducible, for the same Seed, and differ for different Seeds,
+    # when the Rounds are executed one by one
+    def test_seeded_sequential_execution_reproducible(self):
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "0100000100100001" * 2
+
+        # Execute the Protocol, twice, with the same Seed, and once, with another Seed
+        round_results_first_run = self.execute_protocol_and_get_round_results(bipartite_pre_shared_key, 2023)
+        round_results_second_run = self.execute_protocol_and_get_round_results(bipartite_pre_shared_key, 2023)
+        round_results_other_seed = self.execute_protocol_and_get_round_results(bipartite_pre_shared_key, 2024)
+
+        # Assert that the Results of the Rounds are the same, for the same Seed
+        self.assertEqual(round_results_first_run, round_results_second_run)
+
+        # Assert that the Results of the Rounds are not the same, for different Seeds
+        self.assertNotEqual(round_results_first_run, round_results_other_seed)
+
+    # Test that the Results of the Rounds are reproducible, for the same Seed,
+    # when the Rounds are executed in batches
+    def test_seeded_batched_execution_reproducible(self):
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "0100000100100001" * 2
+
+        # Assert that the Results of the Rounds are the same, for the same Seed
+        self.assertEqual(
+            self.execute_protocol_and_get_round_results(bipartite_pre_shared_key, 2023,
+                                                        execution_mode_type=BATCHED_EXECUTION),
+            self.execute_protocol_and_get_round_results(bipartite_pre_shared_key, 2023,
+                                                        execution_mode_type=BATCHED_EXECUTION)
+        )
+
+    # Test that a Session without Seed, executed after a reproducible one, in the same process,
+    # does not reuse the Seed left by it, on the default Simulator Session
+    def test_unseeded_session_after_seeded_session_not_reproducible(self):
+
+        # The fixed Bipartite Pre-Shared Key (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+        bipartite_pre_shared_key = "0100000100100001" * 2
+
+        # Execute the Protocol, once, with a Seed, and once, without any Seed, afterwards
+        round_results_seeded_run = self.execute_protocol_and_get_round_results(bipartite_pre_shared_key, 2023)
+        round_results_unseeded_run = self.execute_protocol_and_get_round_results(bipartite_pre_shared_key, None)
+
+        # Assert that the Seed was discarded from the default Simulator Session
+        self.assertIsNone(QiskitSimulatorSession.QiskitSimulatorSession.get_default_qiskit_simulator_session()
+                          .get_seed())
+
+        # Assert that the Results of the Rounds are not the same (i.e., the Seed of the first Session was not reused)
+        self.assertNotEqual(round_results_seeded_run, round_results_unseeded_run)
+
+
+# Class for the Tests of the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+# executed as Dynamic Quantum Circuits (i.e., with Mid-Circuit Measurements and classically conditioned Gates)
+class QiskitSQCKAProtocolExecutorServiceDynamicCircuitsTests(unittest.TestCase):
+
+    # Assert that the Rounds of the Protocol were executed as Dynamic Quantum Circuits, with correlated Results
+    def assert_dynamic_circuits_rounds(self, protocol_rounds, num_parties):
+
+        # For each Round of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        for protocol_round in protocol_rounds:
+
+            # If the current Round is a CTRL (Reflect) Round
+            if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3:
+
+                # Assert that the inverted GHZ State was measured as |00...0⟩
+                self.assertEqual(protocol_round.get_round_results(), ("0" * num_parties))
+
+            # If the current Round is a SIFT (Measure and Resend) Round
+            else:
+
+                # Assert that the measured GHZ State is correlated between all the Parties
+                self.assertIn(protocol_round.get_round_results(), [("0" * num_parties), ("1" * num_parties)])
+
+                # Assert that the Qubits of all the Party Entities are resent back,
+                # through a Pauli-X Gate, classically conditioned on their Mid-Circuit Measurement
+                self.assertEqual(sum(1 for circuit_instruction in
+                                     protocol_round.get_qiskit_quantum_circuit().quantum_circuit.data
+                                     if (circuit_instruction.operation.name == "x") and
+                                     (circuit_instruction.operation.condition is not None)), num_parties)
+
+    # Test the Sequential Execution of 16 Rounds, with 3 Parties and a GHZ State, as Dynamic Quantum Circuits,
+    # executing each Round, as one single Job, with a single Shot
+    def test_sequential_execution_16_rounds_3_parties_ghz_state(self):
+
+        # Keep the original function to execute the Quantum Circuits of a Party Entity
+        execute_quantum_circuits = QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity\
+            .execute_quantum_circuits
+
+        # Initialise the list of the number of Quantum Circuits and Shots of the Jobs executed
+        jobs_executed = []
+
+        # Execute the given Quantum Circuits, keeping the number of Quantum Circuits and Shots of the Job
+        def execute_and_keep_quantum_circuits(party_entity, quantum_circuits, num_shots=1, is_transpiled=False):
+            jobs_executed.append((len(quantum_circuits), num_shots))
+            return execute_quantum_circuits(party_entity, quantum_circuits, num_shots, is_transpiled)
+
+        # Keep the number of Quantum Circuits and Shots of all the Jobs executed
+        with patch.object(QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity,
+                          "execute_quantum_circuits", execute_and_keep_quantum_circuits):
+
+            # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            # configured for the execution of the Rounds as Dynamic Quantum Circuits
+            qiskit_sqcka_protocol_executor_service = \
+                create_qiskit_sqcka_protocol_executor_service_ghz_state(3, "0100000100100001",
+                                                                        dynamic_circuits_flag=True)
+            qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Assert that each one of the 16 Rounds was executed, as one single Job, with a single Shot
+        self.assertEqual(jobs_executed, ([(1, 1)] * 16))
+
+        # Assert that the Rounds were executed as Dynamic Quantum Circuits, with correlated Results
+        self.assert_dynamic_circuits_rounds(qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+                                            .get_protocol_rounds(), 3)
+
+    # Test the Batched Execution of 16 Rounds, with 4 Parties and a GHZ State, as Dynamic Quantum Circuits,
+    # on the QASM and on the Stabilizer Simulators
+    def test_batched_execution_16_rounds_4_parties_ghz_state(self):
+
+        # For each type of Quantum Simulator, supporting the Dynamic Quantum Circuits
+        for quantum_simulator_type in [AER_QASM_SIMULATOR, STABILIZER_SIMULATOR]:
+
+            # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            # configured for the Batched Execution of the Rounds as Dynamic Quantum Circuits
+            qiskit_sqcka_protocol_executor_service = \
+                create_qiskit_sqcka_protocol_executor_service_ghz_state(4, ("0110" * 4),
+                                                                        execution_mode_type=BATCHED_EXECUTION,
+                                                                        quantum_simulator_type=quantum_simulator_type,
+                                                                        diagnostics_level_type=NO_DIAGNOSTICS,
+                                                                        dynamic_circuits_flag=True)
+            qiskit_sqcka_protocol_executor_service.start_protocol()
+
+            # Assert that the Rounds were executed as Dynamic Quantum Circuits, with correlated Results
+            self.assert_dynamic_circuits_rounds(qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+                                                .get_protocol_rounds(), 4)
+
+
+# Class for the Tests of the Chained Execution of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceChainedExecutionTests(unittest.TestCase):
+
+    # Test the Chained Execution of 32 Rounds, with 3 Parties and a GHZ State, on the QASM and
+    # on the Stabilizer Simulators, where all the Rounds are executed, as one single Job, with a single Shot
+    def test_chained_execution_32_rounds_3_parties_ghz_state(self):
+
+        # Keep the original function to execute the Quantum Circuits of a Party Entity
+        execute_quantum_circuits = QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity\
+            .execute_quantum_circuits
+
+        # For each type of Quantum Simulator
+        for quantum_simulator_type in [AER_QASM_SIMULATOR, STABILIZER_SIMULATOR]:
+
+            # Initialise the list of the number of Quantum Circuits and Shots of the Jobs executed
+            jobs_executed = []
+
+            # Execute the given Quantum Circuits, keeping the number of Quantum Circuits and Shots of the Job
+            def execute_and_keep_quantum_circuits(party_entity, quantum_circuits, num_shots=1, is_transpiled=False):
+                jobs_executed.append((len(quantum_circuits), num_shots))
+                return execute_quantum_circuits(party_entity, quantum_circuits, num_shots, is_transpiled)
+
+            # Keep the number of Quantum Circuits and Shots of all the Jobs executed
+            with patch.object(QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity,
+                              "execute_quantum_circuits", execute_and_keep_quantum_circuits):
+
+                # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # configured for the Chained Execution of the Rounds
+                qiskit_sqcka_protocol_executor_service = \
+                    create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                        3, ("0100000100100001" * 2), execution_mode_type=CHAINED_EXECUTION,
+                        quantum_simulator_type=quantum_simulator_type, diagnostics_level_type=NO_DIAGNOSTICS
+                    )
+                qiskit_sqcka_protocol_executor_service.start_protocol()
+
+            # Assert that all the 32 Rounds were executed, as one single Job, with a single Shot
+            self.assertEqual(jobs_executed, [(1, 1)])
+
+            # Retrieve the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            protocol_rounds = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()
+
+            # Assert that all the Rounds were executed, in order
+            self.assertEqual([protocol_round.get_num_round() for protocol_round in protocol_rounds], list(range(32)))
+
+            # Assert that the inverted GHZ State was measured as |000⟩, in all the CTRL (Reflect) Rounds
+            self.assertTrue(all(protocol_round.get_round_results() == "000" for protocol_round in protocol_rounds
+                                if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3))
+
+            # Assert that the measured GHZ State is correlated between all the Parties, in all the SIFT Rounds
+            self.assertTrue(all(protocol_round.get_round_results() in ["000", "111"]
+                                for protocol_round in protocol_rounds
+                                if protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3))
+
+    # Test that the Chained Execution implies the Dynamic Quantum Circuits, and that the Results of each Round
+    # are decoded from its own Bits of the single Shot of the chained Quantum Circuit
+    def test_chained_execution_implies_dynamic_circuits(self):
+
+        # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+        # configured for the Chained Execution of 24 SIFT (Measure and Resend) Rounds
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(3, ("0" * 24),
+                                                                    execution_mode_type=CHAINED_EXECUTION,
+                                                                    diagnostics_level_type=NO_DIAGNOSTICS)
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Assert that the Chained Execution always executes the Rounds as Dynamic Quantum Circuits
+        self.assertTrue(qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_parameters()
+                        .get_dynamic_circuits_flag())
+
+        # Assert that both the correlated outcomes of the GHZ State were decoded, along the 24 SIFT Rounds
+        self.assertEqual(set(protocol_round.get_round_results() for protocol_round in
+                             qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()),
+                         {"000", "111"})
+
+
+# Class for the Tests of the Multiplexed Execution of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolExecutorServiceMultiplexedExecutionTests(unittest.TestCase):
+
+    # Test the Multiplexed Execution of 16 Rounds, with 3 Parties and a GHZ State, on the QASM and
+    # on the Stabilizer Simulators, where the Rounds sharing the same Quantum Circuit are executed,
+    # as one single Job, with one Shot for each one of them
+    def test_multiplexed_execution_16_rounds_3_parties_ghz_state(self):
+
+        # Keep the original function to execute the Quantum Circuits of a Party Entity
+        execute_quantum_circuits = QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity\
+            .execute_quantum_circuits
+
+        # For each type of Quantum Simulator
+        for quantum_simulator_type in [AER_QASM_SIMULATOR, STABILIZER_SIMULATOR]:
+
+            # Initialise the list of the number of Quantum Circuits and Shots of the Jobs executed
+            jobs_executed = []
+
+            # Execute the given Quantum Circuits, keeping the number of Quantum Circuits and Shots of the Job
+            def execute_and_keep_quantum_circuits(party_entity, quantum_circuits, num_shots=1, is_transpiled=False,
+                                                  memory=False):
+                jobs_executed.append((len(quantum_circuits), num_shots))
+                return execute_quantum_circuits(party_entity, quantum_circuits, num_shots, is_transpiled, memory)
+
+            # Keep the number of Quantum Circuits and Shots of all the Jobs executed
+            with patch.object(QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity,
+                              "execute_quantum_circuits", execute_and_keep_quantum_circuits):
+
+                # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+                # configured for the Multiplexed Execution of 8 SIFT (Measure and Resend) Rounds and
+                # 8 CTRL (Reflect) Rounds
+                qiskit_sqcka_protocol_executor_service = \
+                    create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                        3, ("0110" * 4), execution_mode_type=MULTIPLEXED_EXECUTION,
+                        quantum_simulator_type=quantum_simulator_type, diagnostics_level_type=NO_DIAGNOSTICS
+                    )
+                qiskit_sqcka_protocol_executor_service.start_protocol()
+
+            # Assert that the Quantum Circuits of the SIFT and of the CTRL Rounds were executed, only once,
+            # each one as one single Job, with one Shot for each one of the 8 Rounds sharing it
+            self.assertEqual(jobs_executed, [(1, 8), (1, 8)])
+
+            # Retrieve the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+            protocol_rounds = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()
+
+            # Assert that all the Rounds were executed, in order
+            self.assertEqual([protocol_round.get_num_round() for protocol_round in protocol_rounds], list(range(16)))
+
+            # Assert that the inverted GHZ State was measured as |000⟩, in all the CTRL (Reflect) Rounds
+            self.assertTrue(all(protocol_round.get_round_results() == "000" for protocol_round in protocol_rounds
+                                if protocol_round.get_type_round() == CTRL_REFLECT_ROUND_3))
+
+            # Assert that the measured GHZ State is correlated between all the Parties, in all the SIFT Rounds
+            self.assertTrue(all(protocol_round.get_round_results() in ["000", "111"]
+                                for protocol_round in protocol_rounds
+                                if protocol_round.get_type_round() == SIFT_MEASURE_AND_RESEND_ROUND_3))
+
+
+# Class for the Tests of the execution of the Rounds of
+# the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol, on the Batched State Vector Simulator
+class QiskitSQCKAProtocolExecutorServiceBatchedStateVectorSimulatorTests(unittest.TestCase):
+
+    # Test the Multiplexed Execution of 16 Rounds, with 3 Parties and a W State, on the Batched State Vector
+    # Simulator, where the Rounds sharing the same Quantum Circuit are executed, as one single stack of State Vectors
+    def test_multiplexed_execution_16_rounds_3_parties_w_state(self):
+
+        # Keep the original function to execute the Quantum Circuits of a Party Entity
+        execute_quantum_circuits = QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity\
+            .execute_quantum_circuits
+
+        # Initialise the list of the number of Quantum Circuits and Shots of the Jobs executed
+        jobs_executed = []
+
+        # Execute the given Quantum Circuits, keeping the number of Quantum Circuits and Shots of the Job
+        def execute_and_keep_quantum_circuits(party_entity, quantum_circuits, num_shots=1, is_transpiled=False,
+                                              memory=False):
+            jobs_executed.append((len(quantum_circuits), num_shots))
+            return execute_quantum_circuits(party_entity, quantum_circuits, num_shots, is_transpiled, memory)
+
+        # Keep the number of Quantum Circuits and Shots of all the Jobs executed
+        with patch.object(QiskitSQCKAProtocolPartyEntity.QiskitSQCKAProtocolPartyEntity,
+                          "execute_quantum_circuits", execute_and_keep_quantum_circuits):
+
+            # Create and start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol,
+            # configured for the Multiplexed Execution of 8 SIFT (Measure and Resend) Rounds and
+            # 8 CTRL (Reflect) Rounds, on the Batched State Vector Simulator
+            qiskit_sqcka_protocol_executor_service = \
+                create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                    3, ("0110" * 4), strategy_for_eavesdropping_detection=STATISTICAL_TEST,
+                    quantum_entanglement_type=W_STATE, execution_mode_type=MULTIPLEXED_EXECUTION,
+                    quantum_simulator_type=BATCHED_STATE_VECTOR_SIMULATOR, diagnostics_level_type=NO_DIAGNOSTICS
+                )
+            qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Assert that the Quantum Circuits of the SIFT and of the CTRL Rounds were executed, only once,
+        # each one as one single stack of State Vectors, with one row for each one of the 8 Rounds sharing it
+        self.assertEqual(jobs_executed, [(1, 8), (1, 8)])
+
+        # Retrieve the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_rounds = qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol().get_protocol_rounds()
+
+        # Assert that all the Rounds were executed, in order
+        self.assertEqual([protocol_round.get_num_round() for protocol_round in protocol_rounds], list(range(16)))
+
+        # Assert that the measured W State has exactly one Party with the Bit 1, in all the Rounds
+        self.assertTrue(all(protocol_round.get_round_results() in ["001", "010", "100"]
+                            for protocol_round in protocol_rounds))
+
+    # Test the Sequential Execution of 4 Rounds, with 3 Parties and a GHZ State, on the Batched State Vector Simulator
+    def test_sequential_execution_4_rounds_3_parties_ghz_state(self):
+
+        # Create the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol Executor Service,
+        # configured for the Sequential Execution of the Rounds, on the Batched State Vector Simulator
+        qiskit_sqcka_protocol_executor_service = \
+            create_qiskit_sqcka_protocol_executor_service_ghz_state(
+                3, "0110", quantum_simulator_type=BATCHED_STATE_VECTOR_SIMULATOR
+            )
+
+        # Start the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_executor_service.start_protocol()
+
+        # Retrieve the Results of the Rounds of the IBM Qiskit's Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        protocol_rounds_results = [protocol_round.get_round_results() for protocol_round in
+                                   qiskit_sqcka_protocol_executor_service.get_qiskit_sqcka_protocol()
+                                   .get_protocol_rounds()]
+
+        # Assert that the CTRL (Reflect) Rounds were measured as |000⟩
+        self.assertEqual(protocol_rounds_results[1:3], ["000", "000"])
+
+        # Assert that the SIFT (Measure and Resend) Rounds are correlated between all the Parties
+        self.assertIn(protocol_rounds_results[0], ["000", "111"])
+        self.assertIn(protocol_rounds_results[3], ["000", "111"])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import the Pi constant from Math
+from math import pi
+
+# Import QiskitQuantumCircuit from IBM_Qiskit.Circuit
+from src.ibm_qiskit.circuit import QiskitQuantumCircuit
+
+# Import QiskitClassicalRegister from IBM_Qiskit.Circuit.Classical
+from src.ibm_qiskit.circuit.registers.classical import QiskitClassicalRegister
+
+# Import QiskitQuantumRegister from IBM_Qiskit.Circuit.Quantum
+from src.ibm_qiskit.circuit.registers.quantum import QiskitQuantumRegister
+
+
+# Create an IBM Qiskit's Quantum Circuit, with one Quantum and Classical Registers, for a given number of Qubits
+def create_qiskit_quantum_circuit(name, num_qubits):
+
+    # Creation of the IBM Qiskit's Quantum and Classical Registers
+    qiskit_quantum_register = QiskitQuantumRegister.QiskitQuantumRegister("qr{}".format(name), num_qubits)
+    qiskit_classical_register = QiskitClassicalRegister.QiskitClassicalRegister("cr{}".format(name), num_qubits)
+
+    # Return the IBM Qiskit's Quantum Circuit with one Quantum and Classical Registers
+    return QiskitQuantumCircuit.QiskitQuantumCircuit("qc{}".format(name),
+                                                     qiskit_quantum_register, qiskit_classical_register,
+                                                     global_phase=0)
+
+
+# Apply random Gates, from the given names of Gates, to a given IBM Qiskit's Quantum Circuit,
+# choosing them, and the Qubits they act on, with a given Random Generator
+def apply_random_gates(qiskit_quantum_circuit, gates_names, num_gates, random_generator):
+
+    # For each random Gate of the Quantum Circuit
+    for _ in range(num_gates):
+
+        # Choose the random Gate, the random (distinct) Qubits it acts on and its random angle
+        gate_name = random_generator.choice(gates_names)
+        qubit_index_1, qubit_index_2 = (int(qubit_index) for qubit_index in
+                                        random_generator.choice(qiskit_quantum_circuit.get_num_qubits(), size=2,
+                                                                replace=False))
+        theta = float(random_generator.uniform(0, (2 * pi)))
+
+        # Apply the random Gate to the Quantum Circuit
+        {"h": lambda: qiskit_quantum_circuit.apply_hadamard(qubit_index_1),
+         "s": lambda: qiskit_quantum_circuit.apply_phase_s(qubit_index_1),
+         "sdg": lambda: qiskit_quantum_circuit.apply_phase_s_adjoint(qubit_index_1),
+         "x": lambda: qiskit_quantum_circuit.apply_pauli_x(qubit_index_1),
+         "y": lambda: qiskit_quantum_circuit.apply_pauli_y(qubit_index_1),
+         "z": lambda: qiskit_quantum_circuit.apply_pauli_z(qubit_index_1),
+         "rx": lambda: qiskit_quantum_circuit.apply_rx(theta, qubit_index_1),
+         "ry": lambda: qiskit_quantum_circuit.apply_ry(theta, qubit_index_1),
+         "rz": lambda: qiskit_quantum_circuit.apply_rz(theta, qubit_index_1),
+         "cx": lambda: qiskit_quantum_circuit.apply_controlled_x(qubit_index_1, qubit_index_2),
+         "cz": lambda: qiskit_quantum_circuit.apply_controlled_z(qubit_index_1, qubit_index_2),
+         "swap": lambda: qiskit_quantum_circuit.apply_swap(qubit_index_1, qubit_index_2)}[gate_name]()
+
+    # Return the IBM Qiskit's Quantum Circuit, with the random Gates applied
+    return qiskit_quantum_circuit
@@ -0,0 +1,81 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import the State Vector from Qiskit.Quantum_Info
+from qiskit.quantum_info import Statevector
+
+# Import QiskitBatchedStateVectorSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitBatchedStateVectorSimulator
+
+# Import the helper to create the Quantum Circuits of the Tests of the Simulators
+from test.ibm_qiskit.simulators.QiskitSimulatorsTestUtilities import create_qiskit_quantum_circuit
+
+
+# Test Cases for the Batched State Vector Simulator
+class QiskitBatchedStateVectorSimulatorTests(unittest.TestCase):
+
+    # Test #1 for the Batched State Vector Simulator, with Gates of known unitary Matrices, not used by the Protocol
+    # Description of the Test Case:
+    # 1) Apply a RX Gate, a Phase T Gate and a Controlled-Hadamard Gate, supported through their unitary Matrices;
+    # 2) Measure all the Qubits, with the frequencies matching the exact probabilities, from the State Vector;
+    def test_gates_of_known_unitary_matrices(self):
+
+        # Create the Quantum Circuit, for 2 Qubits, with a RX Gate, a Phase T Gate and a Controlled-Hadamard Gate
+        qiskit_quantum_circuit = create_qiskit_quantum_circuit("unitarymatrices2qubits", 2)
+        qiskit_quantum_circuit.apply_rx(1.2, 0)
+        qiskit_quantum_circuit.apply_phase_t(0)
+        qiskit_quantum_circuit.apply_controlled_h(0, 1)
+
+        # Compute the exact probabilities of the outcomes, from the State Vector of the Quantum Circuit
+        probabilities = Statevector(qiskit_quantum_circuit.quantum_circuit).probabilities_dict()
+
+        # Measure all the Qubits
+        qiskit_quantum_circuit.measure_all_qubits(0, 0)
+
+        # Execute the Quantum Circuit on the Batched State Vector Simulator
+        final_results_quantum_circuit_measurement = QiskitBatchedStateVectorSimulator \
+            .QiskitBatchedStateVectorSimulator("batched_state_vector_simulator", seed=42) \
+            .execute_quantum_circuit(qiskit_quantum_circuit.quantum_circuit, num_shots=4000)
+
+        # For each outcome, and its exact probability
+        for outcome, probability in probabilities.items():
+
+            # Assert that the frequency of the outcome is within 5 standard deviations of its probability
+            self.assertLessEqual(abs((final_results_quantum_circuit_measurement.get(outcome, 0) / 4000) -
+                                     probability),
+                                 5 * ((probability * (1 - probability) / 4000) ** 0.5) + 1e-9)
+
+    # Test #2 for the Batched State Vector Simulator, with too many State Vectors to be held, at once
+    # Description of the Test Case:
+    # 1) Execute a Quantum Circuit of 20 Qubits, with 1000 shots, exceeding the maximum number of Amplitudes;
+    def test_too_many_amplitudes_are_not_supported(self):
+
+        # Create the Quantum Circuit, for 20 Qubits, measuring a Qubit after a Hadamard Gate
+        qiskit_quantum_circuit = create_qiskit_quantum_circuit("toomanyamplitudes20qubits", 20)
+        qiskit_quantum_circuit.apply_hadamard(0)
+        qiskit_quantum_circuit.measure_single_qubit(0, 0, 0, 0)
+
+        # Assert that the execution of the Quantum Circuit on the Batched State Vector Simulator raises a Value Error
+        with self.assertRaises(ValueError):
+            QiskitBatchedStateVectorSimulator.QiskitBatchedStateVectorSimulator("batched_state_vector_simulator") \
+                .execute_quantum_circuit(qiskit_quantum_circuit.quantum_circuit, num_shots=1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
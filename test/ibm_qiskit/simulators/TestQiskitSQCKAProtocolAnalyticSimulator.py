@@ -0,0 +1,120 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import the String IDs of the Quantum Entanglements from Common.Enumerations.QuantumEntanglementTypes
+from src.common.enumerations.QuantumEntanglementTypes import BELL_STATE, GHZ_STATE, W_STATE, GRAPH_STATE
+
+# Import the String IDs of the Strategies for Eavesdropping Detection
+# from Common.Enumerations.StrategiesForEavesdroppingDetection
+from src.common.enumerations.StrategiesForEavesdroppingDetection import \
+    MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT, STATISTICAL_TEST
+
+# Import QiskitSQCKAProtocolAnalyticSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSQCKAProtocolAnalyticSimulator
+
+
+# Constants
+
+# The fixed Bipartite Pre-Shared Key used for the Tests (i.e., 1 for CTRL Rounds and 0 for SIFT Rounds)
+BIPARTITE_PRE_SHARED_KEY = "0100000100100001" * 1000
+
+
+# Test Cases for the Analytic Simulator of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+class QiskitSQCKAProtocolAnalyticSimulatorTests(unittest.TestCase):
+
+    # Sample the Results of the Rounds, for a given Quantum Entanglement and Strategy for Eavesdropping Detection
+    @staticmethod
+    def sample_protocol_rounds_results(quantum_entanglement_type, strategy_for_eavesdropping_detection,
+                                       num_parties):
+
+        # Create the Analytic Simulator of the Semi-Quantum Conference Key Agreement (SQCKA) Protocol
+        qiskit_sqcka_protocol_analytic_simulator = QiskitSQCKAProtocolAnalyticSimulator \
+            .QiskitSQCKAProtocolAnalyticSimulator("sqcka_protocol_analytic_simulator",
+                                                  quantum_entanglement_type, strategy_for_eavesdropping_detection,
+                                                  seed=42)
+
+        # Retrieve the Types of the Rounds, from the Bipartite Pre-Shared Key
+        rounds_type_bits = qiskit_sqcka_protocol_analytic_simulator \
+            .convert_bipartite_pre_shared_key_to_rounds_type_bits(BIPARTITE_PRE_SHARED_KEY)
+
+        # Return the Types of the Rounds and the sampled Results of the Rounds
+        return rounds_type_bits, qiskit_sqcka_protocol_analytic_simulator \
+            .sample_protocol_rounds_results(rounds_type_bits, num_parties)
+
+    # Test #1 for the Analytic Simulator, for GHZ States, with 5 Parties
+    # Description of the Test Case:
+    # 1) The SIFT Rounds are all-0 or all-1, uniformly at random;
+    # 2) The CTRL Rounds, inverted, are always all-0;
+    def test_ghz_state_measurement_by_inverting_quantum_circuit(self):
+
+        # Sample the Results of the Rounds
+        rounds_type_bits, protocol_rounds_results = \
+            self.sample_protocol_rounds_results(GHZ_STATE, MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT, 5)
+
+        # Retrieve the Results of the SIFT and CTRL Rounds
+        sift_rounds_results = protocol_rounds_results[rounds_type_bits == 0]
+        ctrl_rounds_results = protocol_rounds_results[rounds_type_bits == 1]
+
+        # Assert the shape of the Results of the Rounds
+        self.assertEqual(protocol_rounds_results.shape, (len(BIPARTITE_PRE_SHARED_KEY), 5))
+
+        # Assert that the SIFT Rounds are correlated between all the Parties, and balanced
+        self.assertTrue((sift_rounds_results == sift_rounds_results[:, :1]).all())
+        self.assertAlmostEqual(sift_rounds_results[:, 0].mean(), 0.5, delta=0.03)
+
+        # Assert that the CTRL Rounds are all-0
+        self.assertFalse(ctrl_rounds_results.any())
+
+    # Test #2 for the Analytic Simulator, for W States, with 4 Parties and a Statistical Test
+    # Description of the Test Case:
+    # 1) All the Rounds have exactly one Party with the Bit 1;
+    def test_w_state_statistical_test(self):
+
+        # Sample the Results of the Rounds
+        _, protocol_rounds_results = self.sample_protocol_rounds_results(W_STATE, STATISTICAL_TEST, 4)
+
+        # Assert that all the Rounds have a Hamming Weight of 1, with the Parties uniformly chosen
+        self.assertTrue((protocol_rounds_results.sum(axis=1) == 1).all())
+        self.assertTrue((abs(protocol_rounds_results.mean(axis=0) - 0.25) < 0.03).all())
+
+    # Test #3 for the Analytic Simulator, for Graph States, with 3 Parties
+    # Description of the Test Case:
+    # 1) The Bits of the SIFT Rounds are uniformly random;
+    def test_graph_state_measurement_by_inverting_quantum_circuit(self):
+
+        # Sample the Results of the Rounds
+        rounds_type_bits, protocol_rounds_results = \
+            self.sample_protocol_rounds_results(GRAPH_STATE, MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT, 3)
+
+        # Assert that the Bits of the SIFT Rounds are uniformly random and the CTRL Rounds are all-0
+        self.assertTrue((abs(protocol_rounds_results[rounds_type_bits == 0].mean(axis=0) - 0.5) < 0.03).all())
+        self.assertFalse(protocol_rounds_results[rounds_type_bits == 1].any())
+
+    # Test #4 for the Analytic Simulator, for a Quantum Entanglement not supported
+    def test_bell_state_is_not_supported(self):
+
+        # Assert that the creation of the Analytic Simulator raises a Value Error
+        with self.assertRaises(ValueError):
+            QiskitSQCKAProtocolAnalyticSimulator \
+                .QiskitSQCKAProtocolAnalyticSimulator("sqcka_protocol_analytic_simulator",
+                                                      BELL_STATE, MEASUREMENT_BY_INVERTING_QUANTUM_CIRCUIT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import QiskitQuantumCircuit from IBM_Qiskit.Circuit
+from src.ibm_qiskit.circuit import QiskitQuantumCircuit
+
+# Import QiskitClassicalRegister from IBM_Qiskit.Circuit.Classical
+from src.ibm_qiskit.circuit.registers.classical import QiskitClassicalRegister
+
+# Import QiskitQuantumRegister from IBM_Qiskit.Circuit.Quantum
+from src.ibm_qiskit.circuit.registers.quantum import QiskitQuantumRegister
+
+# Import QiskitSimulatorSession from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSimulatorSession
+
+# Import the names of the Backends of the Simulators of the IBM's Qiskit Aer Library
+from src.ibm_qiskit.common.QiskitLibraryParameters import \
+    QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME, QISKIT_AER_STATE_VECTOR_SIMULATOR_BACKEND_NAME
+
+
+# Create a Quantum Circuit, with the given number of Qubits, in a uniform superposition, measuring all of them
+def create_quantum_circuit_uniform_superposition(num_qubits):
+
+    # Creation of the IBM Qiskit's Quantum and Classical Registers
+    qiskit_quantum_register = QiskitQuantumRegister.QiskitQuantumRegister("qr", num_qubits)
+    qiskit_classical_register = QiskitClassicalRegister.QiskitClassicalRegister("cr", num_qubits)
+
+    # Creation of the IBM Qiskit's Quantum Circuit with one Quantum and Classical Registers
+    qiskit_quantum_circuit = QiskitQuantumCircuit.QiskitQuantumCircuit("qc", qiskit_quantum_register,
+                                                                       qiskit_classical_register, global_phase=0)
+
+    # Apply the Hadamard Gate and measure each Qubit
+    for qubit_index in range(num_qubits):
+        qiskit_quantum_circuit.apply_hadamard(qubit_index)
+        qiskit_quantum_circuit.measure_single_qubit(0, 0, qubit_index, qubit_index)
+
+    # Return the IBM Qiskit's Quantum Circuit
+    return qiskit_quantum_circuit.quantum_circuit
+
+
+# Test Cases for the IBM Qiskit's Simulator Session
+class QiskitSimulatorSessionTests(unittest.TestCase):
+
+    # Test #1 for the Simulator Session
+    # Description of the Test Case:
+    # 1) The Backends are instantiated only once, and configured with the options of the Simulator Session;
+    def test_backends_are_instantiated_once_and_configured(self):
+
+        # Create a Simulator Session, with a custom Simulation Method and maximum number of Threads
+        qiskit_simulator_session = QiskitSimulatorSession \
+            .QiskitSimulatorSession("qiskit_simulator_session", simulation_method="stabilizer",
+                                    max_parallel_threads=1)
+
+        # Retrieve the Backend of the QASM Simulator, twice
+        qasm_backend = qiskit_simulator_session.get_backend(QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME)
+
+        # Assert that the same Backend is returned, and configured with the options of the Simulator Session
+        self.assertIs(qiskit_simulator_session.get_backend(QISKIT_AER_QASM_SIMULATOR_BACKEND_NAME), qasm_backend)
+        self.assertEqual(qasm_backend.options.method, "stabilizer")
+        self.assertEqual(qasm_backend.options.max_parallel_threads, 1)
+
+        # Assert that the Backend of the State Vector Simulator is also cached
+        self.assertIs(qiskit_simulator_session.get_backend(QISKIT_AER_STATE_VECTOR_SIMULATOR_BACKEND_NAME),
+                      qiskit_simulator_session.get_backend(QISKIT_AER_STATE_VECTOR_SIMULATOR_BACKEND_NAME))
+
+        # Assert that the Stabilizer Simulator is also cached
+        self.assertIs(qiskit_simulator_session.get_stabilizer_simulator(),
+                      qiskit_simulator_session.get_stabilizer_simulator())
+
+    # Test #2 for the Simulator Session
+    # Description of the Test Case:
+    # 1) Two Simulator Sessions with the same Seed produce the same sequence of Measurement results;
+    # 2) Consecutive Jobs of the same Simulator Session do not repeat the same Seed;
+    def test_seeded_sessions_are_reproducible(self):
+
+        # Create the Quantum Circuit, in a uniform superposition of 16 Qubits
+        quantum_circuit = create_quantum_circuit_uniform_superposition(16)
+
+        # Execute the Quantum Circuit, 5 times, on 2 Simulator Sessions with the same Seed
+        measurement_results = [QiskitSimulatorSession.QiskitSimulatorSession("qiskit_simulator_session", seed=1234)
+                               .execute_quantum_circuits_on_qasm_simulator([quantum_circuit] * 5)
+                               for _ in range(2)]
+
+        # Assert that both Simulator Sessions produced the same Measurement results
+        self.assertEqual(measurement_results[0], measurement_results[1])
+
+        # Create a Simulator Session with a Seed
+        qiskit_simulator_session = QiskitSimulatorSession.QiskitSimulatorSession("qiskit_simulator_session", seed=1234)
+
+        # Execute the Quantum Circuit, in 5 consecutive Jobs
+        consecutive_measurement_results = [qiskit_simulator_session
+                                           .execute_quantum_circuits_on_qasm_simulator([quantum_circuit])[0]
+                                           for _ in range(5)]
+
+        # Assert that the consecutive Jobs produced different Measurement results
+        self.assertGreater(len(set(tuple(counts) for counts in consecutive_measurement_results)), 1)
+
+    # Test #3 for the Simulator Session
+    # Description of the Test Case:
+    # 1) The default Simulator Session is shared, and it can be replaced by a configured one;
+    def test_default_session_can_be_configured(self):
+
+        # Retrieve the default Simulator Session
+        default_qiskit_simulator_session = QiskitSimulatorSession.QiskitSimulatorSession \
+            .get_default_qiskit_simulator_session()
+
+        # Assert that the default Simulator Session is shared
+        self.assertIs(QiskitSimulatorSession.QiskitSimulatorSession.get_default_qiskit_simulator_session(),
+                      default_qiskit_simulator_session)
+
+        try:
+
+            # Configure the default Simulator Session, with a Seed
+            configured_qiskit_simulator_session = QiskitSimulatorSession.QiskitSimulatorSession \
+                .configure_default_qiskit_simulator_session(seed=42)
+
+            # Assert that the default Simulator Session was replaced by the configured one
+            self.assertIs(QiskitSimulatorSession.QiskitSimulatorSession.get_default_qiskit_simulator_session(),
+                          configured_qiskit_simulator_session)
+            self.assertEqual(configured_qiskit_simulator_session.get_seed(), 42)
+
+        finally:
+
+            # Restore the previous default Simulator Session
+            QiskitSimulatorSession.QiskitSimulatorSession.default_qiskit_simulator_session = \
+                default_qiskit_simulator_session
+
+
+if __name__ == '__main__':
+    unittest.main()
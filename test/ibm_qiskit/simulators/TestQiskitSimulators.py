@@ -0,0 +1,382 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import the Default Random Generator from NumPy.Random
+from numpy.random import default_rng
+
+# Import the RY Gate from Qiskit.Circuit.Library
+from qiskit.circuit.library import RYGate
+
+# Import the State Vector from Qiskit.Quantum_Info
+from qiskit.quantum_info import Statevector
+
+# Import QiskitGHZState from IBM_Qiskit.Entanglements.Multipartite
+from src.ibm_qiskit.entanglements.multipartite import QiskitGHZState
+
+# Import QiskitWState from IBM_Qiskit.Entanglements.Multipartite
+from src.ibm_qiskit.entanglements.multipartite import QiskitWState
+
+# Import QiskitStabilizerSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitStabilizerSimulator
+
+# Import QiskitSparseStateVectorSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSparseStateVectorSimulator
+
+# Import QiskitBatchedStateVectorSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitBatchedStateVectorSimulator
+
+# Import the helpers to create the Quantum Circuits of the Tests of the Simulators
+from test.ibm_qiskit.simulators.QiskitSimulatorsTestUtilities import create_qiskit_quantum_circuit, \
+    apply_random_gates
+
+
+# Constants
+
+# The classes of the Simulators implemented in this Library, on which all the Test Cases are executed
+QISKIT_SIMULATORS_CLASSES = [QiskitStabilizerSimulator.QiskitStabilizerSimulator,
+                             QiskitSparseStateVectorSimulator.QiskitSparseStateVectorSimulator,
+                             QiskitBatchedStateVectorSimulator.QiskitBatchedStateVectorSimulator]
+
+
+# Test Cases for all the Simulators implemented in this Library (i.e., parameterized by the Simulator)
+class QiskitSimulatorsTests(unittest.TestCase):
+
+    # Execute a given IBM Qiskit's Quantum Circuit on a Simulator of the given class, with a fixed Seed
+    @staticmethod
+    def execute_quantum_circuit(qiskit_simulator_class, qiskit_quantum_circuit, num_shots, memory=False, seed=42):
+        return qiskit_simulator_class("simulator", seed=seed) \
+            .execute_quantum_circuit(qiskit_quantum_circuit.quantum_circuit, num_shots=num_shots, memory=memory)
+
+    # Assert that the frequencies of the outcomes measured, by a Simulator, match the exact probabilities of
+    # the outcomes, computed from the State Vector of the given Quantum Circuit (i.e., before its Measurements)
+    def assert_outcomes_match_state_vector(self, qiskit_simulator_class, qiskit_quantum_circuit, num_shots, seed):
+
+        # Compute the exact probabilities of the outcomes, from the State Vector of the Quantum Circuit
+        probabilities = {outcome: probability for outcome, probability in
+                         Statevector(qiskit_quantum_circuit.quantum_circuit).probabilities_dict().items()
+                         if probability > 1e-9}
+
+        # Measure all the Qubits
+        qiskit_quantum_circuit.measure_all_qubits(0, 0)
+
+        # Execute the Quantum Circuit on the Simulator
+        final_results_quantum_circuit_measurement = \
+            self.execute_quantum_circuit(qiskit_simulator_class, qiskit_quantum_circuit, num_shots, seed=seed)
+
+        # Assert that the outcomes measured are exactly the ones with a non-null probability
+        # (i.e., with a tolerance, for the outcomes too unlikely to be measured, in the given number of shots)
+        self.assertTrue(set(final_results_quantum_circuit_measurement.keys()) <= set(probabilities.keys()))
+        self.assertTrue({outcome for outcome, probability in probabilities.items() if probability > 0.01} <=
+                        set(final_results_quantum_circuit_measurement.keys()))
+
+        # For each outcome, and its exact probability
+        for outcome, probability in probabilities.items():
+
+            # Assert that the frequency of the outcome is within 5 standard deviations of its probability
+            self.assertLessEqual(abs((final_results_quantum_circuit_measurement.get(outcome, 0) / num_shots) -
+                                     probability),
+                                 5 * ((probability * (1 - probability) / num_shots) ** 0.5) + 1e-9)
+
+    # Test #1 for the Simulators, measuring a GHZ State, for 10 Qubits
+    # Description of the Test Case:
+    # 1) Prepare of the GHZ State, for 10 Qubits: |GHZ_10⟩ = 1/sqrt(2) x (|00...0⟩ + |11...1⟩);
+    # 2) Measure all the Qubits, which should be all equal, in every shot;
+    def test_measure_ghz_state_10_qubits(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively
+        num_qubits = 10
+
+        # For each class of the Simulators
+        for qiskit_simulator_class in QISKIT_SIMULATORS_CLASSES:
+
+            # Execute the Test Case for the current Simulator
+            with self.subTest(qiskit_simulator_class=qiskit_simulator_class.__name__):
+
+                # Prepare the GHZ State, for 10 Qubits, and measure all the Qubits
+                qiskit_quantum_circuit_ghz_state = QiskitGHZState \
+                    .QiskitGHZState("ghz_state_10_qubits",
+                                    create_qiskit_quantum_circuit("ghzstate10qubits", num_qubits),
+                                    0, list(range(1, num_qubits))).prepare_multipartite_entanglement()
+                qiskit_quantum_circuit_ghz_state.measure_all_qubits(0, 0)
+
+                # Execute the Quantum Circuit on the Simulator
+                final_results_quantum_circuit_measurement = \
+                    self.execute_quantum_circuit(qiskit_simulator_class, qiskit_quantum_circuit_ghz_state, 200)
+
+                # Assert that only the states |00...0⟩ and |11...1⟩ were measured, both of them
+                self.assertEqual(set(final_results_quantum_circuit_measurement.keys()),
+                                 {"0" * num_qubits, "1" * num_qubits})
+
+                # Assert that the number of shots is correct
+                self.assertEqual(sum(final_results_quantum_circuit_measurement.values()), 200)
+
+    # Test #2 for the Simulators, inverting a GHZ State, for 6 Qubits
+    # Description of the Test Case:
+    # 1) Prepare of the GHZ State, for 6 Qubits;
+    # 2) Invert the GHZ State and measure all the Qubits, which should be always |000000⟩;
+    def test_invert_ghz_state_6_qubits(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively
+        num_qubits = 6
+
+        # For each class of the Simulators
+        for qiskit_simulator_class in QISKIT_SIMULATORS_CLASSES:
+
+            # Execute the Test Case for the current Simulator
+            with self.subTest(qiskit_simulator_class=qiskit_simulator_class.__name__):
+
+                # Prepare the GHZ State, for 6 Qubits
+                qiskit_quantum_circuit_ghz_state = QiskitGHZState \
+                    .QiskitGHZState("ghz_state_6_qubits",
+                                    create_qiskit_quantum_circuit("ghzstate6qubits", num_qubits),
+                                    0, list(range(1, num_qubits))).prepare_multipartite_entanglement()
+
+                # Invert the GHZ State and measure all the Qubits
+                qiskit_quantum_circuit_ghz_state = QiskitGHZState \
+                    .QiskitGHZState("ghz_state_6_qubits", qiskit_quantum_circuit_ghz_state,
+                                    0, list(range(1, num_qubits))) \
+                    .measure_multipartite_entanglement(is_final_measurement=False)
+                qiskit_quantum_circuit_ghz_state.measure_all_qubits(0, 0)
+
+                # Assert that only the state |000000⟩ was measured
+                self.assertEqual(self.execute_quantum_circuit(qiskit_simulator_class,
+                                                              qiskit_quantum_circuit_ghz_state, 100),
+                                 {"0" * num_qubits: 100})
+
+    # Test #3 for the Simulators, with a Measurement and a Reset in the middle of the Quantum Circuit
+    # Description of the Test Case:
+    # 1) Prepare an EPR Pair on the Qubits 0 and 1 and measure the Qubit 0, resetting it afterwards;
+    # 2) Copy the Qubit 1 to the Qubit 2 and measure all the Qubits;
+    def test_mid_circuit_measurement_and_reset(self):
+
+        # For each class of the Simulators
+        for qiskit_simulator_class in QISKIT_SIMULATORS_CLASSES:
+
+            # Execute the Test Case for the current Simulator
+            with self.subTest(qiskit_simulator_class=qiskit_simulator_class.__name__):
+
+                # Create the Quantum Circuit, for 3 Qubits
+                qiskit_quantum_circuit = create_qiskit_quantum_circuit("midcircuit3qubits", 3)
+
+                # Prepare an EPR Pair on the Qubits 0 and 1, measuring and resetting the Qubit 0
+                qiskit_quantum_circuit.apply_hadamard(0)
+                qiskit_quantum_circuit.apply_controlled_x(0, 1)
+                qiskit_quantum_circuit.measure_single_qubit(0, 0, 0, 0)
+                qiskit_quantum_circuit.reset(0)
+
+                # Copy the Qubit 1 to the Qubit 2 and measure the Qubits 1 and 2
+                qiskit_quantum_circuit.apply_controlled_x(1, 2)
+                qiskit_quantum_circuit.measure_qubits_interval(0, 0, [1, 2], [1, 2])
+
+                # Assert that the Bits are ordered from the most significant to the least significant one,
+                # as in the QASM Simulator, and all of them are correlated
+                self.assertEqual(set(self.execute_quantum_circuit(qiskit_simulator_class,
+                                                                  qiskit_quantum_circuit, 200).keys()),
+                                 {"000", "111"})
+
+    # Test #4 for the Simulators, with a Pauli-X Gate classically conditioned on a Bit
+    # Description of the Test Case:
+    # 1) Prepare an EPR Pair on the Qubits 0 and 1 and measure the Qubit 0, resetting it afterwards;
+    # 2) Flip the Qubit 0, conditioned on its Measurement, recreating the measured state, and measure it again;
+    def test_pauli_x_conditioned_on_bit(self):
+
+        # For each class of the Simulators
+        for qiskit_simulator_class in QISKIT_SIMULATORS_CLASSES:
+
+            # Execute the Test Case for the current Simulator
+            with self.subTest(qiskit_simulator_class=qiskit_simulator_class.__name__):
+
+                # Create the Quantum Circuit, for 3 Qubits (i.e., the Qubit 2 is only used for its Bit)
+                qiskit_quantum_circuit = create_qiskit_quantum_circuit("conditioned3qubits", 3)
+
+                # Prepare an EPR Pair on the Qubits 0 and 1, measuring and resetting the Qubit 0
+                qiskit_quantum_circuit.apply_hadamard(0)
+                qiskit_quantum_circuit.apply_controlled_x(0, 1)
+                qiskit_quantum_circuit.measure_single_qubit(0, 0, 0, 0)
+                qiskit_quantum_circuit.reset(0)
+
+                # Flip the Qubit 0, conditioned on its Measurement, and measure the Qubits 0 and 1, again
+                qiskit_quantum_circuit.apply_pauli_x_conditioned_on_bit(0, 0, 0)
+                qiskit_quantum_circuit.measure_qubits_interval(0, 0, [0, 1], [1, 2])
+
+                # Assert that the measured state was recreated, and thus, all the Bits are correlated
+                self.assertEqual(set(self.execute_quantum_circuit(qiskit_simulator_class,
+                                                                  qiskit_quantum_circuit, 200).keys()),
+                                 {"000", "111"})
+
+    # Test #5 for the Simulators, with the Measurement result of each Shot requested
+    # Description of the Test Case:
+    # 1) Prepare and measure a GHZ State of 4 Qubits, retrieving the Measurement result of each Shot, in order;
+    def test_measurement_result_of_each_shot(self):
+
+        # For each class of the Simulators
+        for qiskit_simulator_class in QISKIT_SIMULATORS_CLASSES:
+
+            # Execute the Test Case for the current Simulator
+            with self.subTest(qiskit_simulator_class=qiskit_simulator_class.__name__):
+
+                # Create the Quantum Circuit, for 4 Qubits, with a GHZ State measured
+                qiskit_quantum_circuit = create_qiskit_quantum_circuit("memory4qubits", 4)
+                qiskit_quantum_circuit.apply_hadamard(0)
+                for qubit_index in range(1, 4):
+                    qiskit_quantum_circuit.apply_controlled_x(0, qubit_index)
+                qiskit_quantum_circuit.measure_all_qubits(0, 0)
+
+                # Execute the Quantum Circuit on the Simulator, with the Measurement result of each Shot
+                final_results_quantum_circuit_memory = \
+                    self.execute_quantum_circuit(qiskit_simulator_class, qiskit_quantum_circuit, 50, memory=True)
+
+                # Assert that there is one Measurement result for each Shot, all of them correlated
+                self.assertEqual(len(final_results_quantum_circuit_memory), 50)
+                self.assertEqual(set(final_results_quantum_circuit_memory), {"0000", "1111"})
+
+    # Test #6 for the Simulators, with a Gate conditioned on a whole Classical Register
+    # Description of the Test Case:
+    # 1) Apply a Pauli-X Gate, conditioned on a whole Classical Register, which is not supported;
+    def test_gate_conditioned_on_classical_register_is_not_supported(self):
+
+        # For each class of the Simulators
+        for qiskit_simulator_class in QISKIT_SIMULATORS_CLASSES:
+
+            # Execute the Test Case for the current Simulator
+            with self.subTest(qiskit_simulator_class=qiskit_simulator_class.__name__):
+
+                # Create the Quantum Circuit, for 2 Qubits, with a Pauli-X Gate conditioned on its Classical Register
+                qiskit_quantum_circuit = create_qiskit_quantum_circuit("conditionedregister2qubits", 2)
+                qiskit_quantum_circuit.quantum_circuit.x(0).c_if(qiskit_quantum_circuit.quantum_circuit.cregs[0], 1)
+
+                # Assert that the execution of the Quantum Circuit on the Simulator raises a Value Error
+                with self.assertRaises(ValueError):
+                    self.execute_quantum_circuit(qiskit_simulator_class, qiskit_quantum_circuit, 1)
+
+    # Test #7 for the Simulators, with random Clifford Quantum Circuits, compared with the State Vector
+    # Description of the Test Case:
+    # 1) Apply random Clifford Gates (including the Phase Gates, the Pauli-Y Gate and the Controlled-Z Gate,
+    #    whose signs only become observable through interference), followed by Hadamard Gates on all the Qubits;
+    # 2) Measure all the Qubits, with the outcomes and their frequencies matching the exact probabilities,
+    #    computed from the State Vector of the same Quantum Circuit;
+    def test_random_clifford_circuits_match_state_vector_probabilities(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively,
+        # the number of random Quantum Circuits, of Gates of each one, and of shots of each execution
+        num_qubits, num_quantum_circuits, num_gates, num_shots = 4, 12, 30, 1000
+
+        # For each class of the Simulators
+        for qiskit_simulator_class in QISKIT_SIMULATORS_CLASSES:
+
+            # Create the Random Generator of the random Quantum Circuits, with a fixed Seed
+            random_generator = default_rng(2024)
+
+            # For each random Quantum Circuit
+            for num_quantum_circuit in range(num_quantum_circuits):
+
+                # Execute the Test Case for the current Simulator and random Quantum Circuit
+                with self.subTest(qiskit_simulator_class=qiskit_simulator_class.__name__,
+                                  num_quantum_circuit=num_quantum_circuit):
+
+                    # Create the Quantum Circuit, for 4 Qubits, with random Clifford Gates
+                    qiskit_quantum_circuit = \
+                        apply_random_gates(create_qiskit_quantum_circuit("randomclifford{}"
+                                                                         .format(num_quantum_circuit), num_qubits),
+                                           ["h", "s", "sdg", "x", "y", "z", "cx", "cz", "swap"], num_gates,
+                                           random_generator)
+
+                    # Apply the Hadamard Gates to all the Qubits, to make the phases observable
+                    for qubit_index in range(num_qubits):
+                        qiskit_quantum_circuit.apply_hadamard(qubit_index)
+
+                    # Assert that the outcomes match the exact probabilities, from the State Vector
+                    self.assert_outcomes_match_state_vector(qiskit_simulator_class, qiskit_quantum_circuit,
+                                                            num_shots, num_quantum_circuit)
+
+    # Test #8 for the Simulators supporting the Rotation Gates, with random Quantum Circuits,
+    # compared with the State Vector
+    # Description of the Test Case:
+    # 1) Apply random Gates, including the Rotation Gates, with random angles, which are not Clifford Gates;
+    # 2) Measure all the Qubits, with the outcomes and their frequencies matching the exact probabilities,
+    #    computed from the State Vector of the same Quantum Circuit;
+    def test_random_rotation_circuits_match_state_vector_probabilities(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively,
+        # the number of random Quantum Circuits, of Gates of each one, and of shots of each execution
+        num_qubits, num_quantum_circuits, num_gates, num_shots = 4, 12, 30, 1000
+
+        # For each class of the Simulators, supporting the Rotation Gates
+        for qiskit_simulator_class in QISKIT_SIMULATORS_CLASSES:
+            if qiskit_simulator_class("simulator").is_operation_supported(RYGate(0.5)):
+
+                # Create the Random Generator of the random Quantum Circuits, with a fixed Seed
+                random_generator = default_rng(2025)
+
+                # For each random Quantum Circuit
+                for num_quantum_circuit in range(num_quantum_circuits):
+
+                    # Execute the Test Case for the current Simulator and random Quantum Circuit
+                    with self.subTest(qiskit_simulator_class=qiskit_simulator_class.__name__,
+                                      num_quantum_circuit=num_quantum_circuit):
+
+                        # Create the Quantum Circuit, for 4 Qubits, with random Gates
+                        qiskit_quantum_circuit = \
+                            apply_random_gates(create_qiskit_quantum_circuit("randomrotation{}"
+                                                                             .format(num_quantum_circuit),
+                                                                             num_qubits),
+                                               ["h", "s", "rx", "ry", "rz", "cx", "cz", "swap"], num_gates,
+                                               random_generator)
+
+                        # Assert that the outcomes match the exact probabilities, from the State Vector
+                        self.assert_outcomes_match_state_vector(qiskit_simulator_class, qiskit_quantum_circuit,
+                                                                num_shots, num_quantum_circuit)
+
+    # Test #9 for the Simulators supporting the Rotation Gates, inverting a W State, for 6 Qubits
+    # Description of the Test Case:
+    # 1) Prepare of the W State, for 6 Qubits, which is not prepared only with Clifford Gates;
+    # 2) Invert the W State and measure all the Qubits, which should be always |000000⟩;
+    def test_invert_w_state_6_qubits(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively
+        num_qubits = 6
+
+        # For each class of the Simulators, supporting the Rotation Gates
+        for qiskit_simulator_class in QISKIT_SIMULATORS_CLASSES:
+            if qiskit_simulator_class("simulator").is_operation_supported(RYGate(0.5)):
+
+                # Execute the Test Case for the current Simulator
+                with self.subTest(qiskit_simulator_class=qiskit_simulator_class.__name__):
+
+                    # Prepare the W State, for 6 Qubits
+                    qiskit_quantum_circuit_w_state = QiskitWState \
+                        .QiskitWState("w_state_6_qubits",
+                                      create_qiskit_quantum_circuit("wstate6qubits", num_qubits),
+                                      list(range(num_qubits))).prepare_multipartite_entanglement()
+
+                    # Invert the W State and measure all the Qubits
+                    qiskit_quantum_circuit_w_state = QiskitWState \
+                        .QiskitWState("w_state_6_qubits", qiskit_quantum_circuit_w_state,
+                                      list(range(num_qubits))) \
+                        .measure_multipartite_entanglement(is_final_measurement=False)
+                    qiskit_quantum_circuit_w_state.measure_all_qubits(0, 0)
+
+                    # Assert that only the state |000000⟩ was measured
+                    self.assertEqual(self.execute_quantum_circuit(qiskit_simulator_class,
+                                                                  qiskit_quantum_circuit_w_state, 100),
+                                     {"0" * num_qubits: 100})
+
+
+if __name__ == '__main__':
+    unittest.main()
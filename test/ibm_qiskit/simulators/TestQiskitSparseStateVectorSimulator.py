@@ -0,0 +1,78 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import QiskitWState from IBM_Qiskit.Entanglements.Multipartite
+from src.ibm_qiskit.entanglements.multipartite import QiskitWState
+
+# Import QiskitSparseStateVectorSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitSparseStateVectorSimulator
+
+# Import the helper to create the Quantum Circuits of the Tests of the Simulators
+from test.ibm_qiskit.simulators.QiskitSimulatorsTestUtilities import create_qiskit_quantum_circuit
+
+
+# Test Cases for the Sparse State Vector Simulator
+class QiskitSparseStateVectorSimulatorTests(unittest.TestCase):
+
+    # Test #1 for the Sparse State Vector Simulator, measuring a W State, for 30 Qubits
+    # Description of the Test Case:
+    # 1) Prepare of the W State, for 30 Qubits: |W_30⟩ = 1/sqrt(30) x (|10...0⟩ + |01...0⟩ + ... + |00...1⟩);
+    # 2) Measure all the Qubits, which should have exactly one Qubit in the state |1⟩, in every shot;
+    def test_measure_w_state_30_qubits(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively
+        num_qubits = 30
+
+        # Prepare and measure the W State, for 30 Qubits
+        qiskit_quantum_circuit_w_state = QiskitWState \
+            .QiskitWState("w_state_30_qubits",
+                          create_qiskit_quantum_circuit("wstate30qubits", num_qubits),
+                          list(range(num_qubits))).prepare_multipartite_entanglement()
+        qiskit_quantum_circuit_w_state.measure_qubits_interval(0, 0, list(range(num_qubits)),
+                                                               list(range(num_qubits)))
+
+        # Execute the Quantum Circuit on the Sparse State Vector Simulator
+        final_results_quantum_circuit_measurement = QiskitSparseStateVectorSimulator \
+            .QiskitSparseStateVectorSimulator("sparse_state_vector_simulator", seed=42) \
+            .execute_quantum_circuit(qiskit_quantum_circuit_w_state.quantum_circuit, num_shots=600)
+
+        # Assert that every state measured has exactly one Qubit in the state |1⟩
+        self.assertTrue(all(measurement_result.count("1") == 1
+                            for measurement_result in final_results_quantum_circuit_measurement.keys()))
+
+        # Assert that (almost) every Qubit was measured in the state |1⟩, at least once
+        self.assertGreater(len(final_results_quantum_circuit_measurement), 25)
+
+    # Test #2 for the Sparse State Vector Simulator, with a Gate not supported
+    # Description of the Test Case:
+    # 1) Apply a Controlled-Hadamard Gate, which is not supported;
+    def test_unsupported_gate_is_not_supported(self):
+
+        # Create the Quantum Circuit, for 2 Qubits, with a Controlled-Hadamard Gate
+        qiskit_quantum_circuit = create_qiskit_quantum_circuit("unsupported2qubits", 2)
+        qiskit_quantum_circuit.apply_controlled_h(0, 1)
+
+        # Assert that the execution of the Quantum Circuit on the Sparse State Vector Simulator raises a Value Error
+        with self.assertRaises(ValueError):
+            QiskitSparseStateVectorSimulator.QiskitSparseStateVectorSimulator("sparse_state_vector_simulator") \
+                .execute_quantum_circuit(qiskit_quantum_circuit.quantum_circuit)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import QiskitGHZState from IBM_Qiskit.Entanglements.Multipartite
+from src.ibm_qiskit.entanglements.multipartite import QiskitGHZState
+
+# Import QiskitGraphState from IBM_Qiskit.Entanglements.Multipartite.Resource_States
+from src.ibm_qiskit.entanglements.multipartite.resource_states import QiskitGraphState
+
+# Import QiskitStabilizerSimulator from IBM_Qiskit.Simulators
+from src.ibm_qiskit.simulators import QiskitStabilizerSimulator
+
+# Import the helper to create the Quantum Circuits of the Tests of the Simulators
+from test.ibm_qiskit.simulators.QiskitSimulatorsTestUtilities import create_qiskit_quantum_circuit
+
+
+# Test Cases for the Stabilizer Simulator
+class QiskitStabilizerSimulatorTests(unittest.TestCase):
+
+    # Test #1 for the Stabilizer Simulator, measuring a GHZ State, for 50 Qubits
+    # Description of the Test Case:
+    # 1) Prepare of the GHZ State, for 50 Qubits: |GHZ_50⟩ = 1/sqrt(2) x (|00...0⟩ + |11...1⟩);
+    # 2) Measure all the Qubits, which should be all equal, in every shot;
+    def test_measure_ghz_state_50_qubits(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively
+        num_qubits = 50
+
+        # Prepare the GHZ State, for 50 Qubits
+        qiskit_quantum_circuit_ghz_state = QiskitGHZState \
+            .QiskitGHZState("ghz_state_50_qubits",
+                            create_qiskit_quantum_circuit("ghzstate50qubits", num_qubits),
+                            0, list(range(1, num_qubits))).prepare_multipartite_entanglement()
+
+        # Measure all the Qubits
+        qiskit_quantum_circuit_ghz_state.measure_qubits_interval(0, 0, list(range(num_qubits)),
+                                                                 list(range(num_qubits)))
+
+        # Execute the Quantum Circuit on the Stabilizer Simulator
+        final_results_quantum_circuit_measurement = QiskitStabilizerSimulator \
+            .QiskitStabilizerSimulator("stabilizer_simulator", seed=42) \
+            .execute_quantum_circuit(qiskit_quantum_circuit_ghz_state.quantum_circuit, num_shots=200)
+
+        # Assert that only the states |00...0⟩ and |11...1⟩ were measured, both of them
+        self.assertEqual(set(final_results_quantum_circuit_measurement.keys()),
+                         {"0" * num_qubits, "1" * num_qubits})
+
+        # Assert that the number of shots is correct
+        self.assertEqual(sum(final_results_quantum_circuit_measurement.values()), 200)
+
+    # Test #2 for the Stabilizer Simulator, inverting a Graph State, for 5 Qubits
+    # Description of the Test Case:
+    # 1) Prepare of the Graph State, for 5 Qubits, as a Line;
+    # 2) Invert the Graph State and measure all the Qubits, which should be always |00000⟩;
+    def test_invert_graph_state_5_qubits(self):
+
+        # The number of Qubits and Bits, for Quantum and Classical Registers, respectively
+        num_qubits = 5
+
+        # The Edges of the Graph State, as a Line
+        qubits_edges_indexes = [[qubit_index, (qubit_index + 1)] for qubit_index in range(num_qubits - 1)]
+
+        # Prepare the Graph State, for 5 Qubits
+        qiskit_quantum_circuit_graph_state = QiskitGraphState \
+            .QiskitGraphState("graph_state_5_qubits",
+                              create_qiskit_quantum_circuit("graphstate5qubits", num_qubits),
+                              list(range(num_qubits)), qubits_edges_indexes).prepare_multipartite_entanglement()
+
+        # Invert the Graph State and measure all the Qubits
+        qiskit_quantum_circuit_graph_state = QiskitGraphState \
+            .QiskitGraphState("graph_state_5_qubits",
+                              qiskit_quantum_circuit_graph_state,
+                              list(range(num_qubits)), qubits_edges_indexes).measure_multipartite_entanglement()
+
+        # Execute the Quantum Circuit on the Stabilizer Simulator
+        final_results_quantum_circuit_measurement = QiskitStabilizerSimulator \
+            .QiskitStabilizerSimulator("stabilizer_simulator", seed=42) \
+            .execute_quantum_circuit(qiskit_quantum_circuit_graph_state.quantum_circuit, num_shots=100)
+
+        # Assert that only the state |00000⟩ was measured
+        self.assertEqual(final_results_quantum_circuit_measurement, {"0" * num_qubits: 100})
+
+    # Test #3 for the Stabilizer Simulator, with a non-Clifford Gate
+    # Description of the Test Case:
+    # 1) Apply a RY Gate, which is not a Clifford Gate, and thus, it is not supported;
+    def test_non_clifford_gate_is_not_supported(self):
+
+        # Create the Quantum Circuit, for 1 Qubit, with a RY Gate
+        qiskit_quantum_circuit = create_qiskit_quantum_circuit("nonclifford1qubit", 1)
+        qiskit_quantum_circuit.apply_ry(0.5, 0)
+
+        # Assert that the execution of the Quantum Circuit on the Stabilizer Simulator raises a Value Error
+        with self.assertRaises(ValueError):
+            QiskitStabilizerSimulator.QiskitStabilizerSimulator("stabilizer_simulator") \
+                .execute_quantum_circuit(qiskit_quantum_circuit.quantum_circuit)
+
+
+if __name__ == '__main__':
+    unittest.main()
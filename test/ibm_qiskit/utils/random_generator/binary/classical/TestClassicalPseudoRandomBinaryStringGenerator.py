@@ -0,0 +1,89 @@
+"""
+Semi-Quantum Conference Key Agreement (SQCKA)
+
+Author:
+- Ruben Andre Barreiro (r.barreiro@campus.fct.unl.pt)
+
+Supervisors:
+- Andre Nuno Souto (ansouto@fc.ul.pt)
+- Antonio Maria Ravara (aravara@fct.unl.pt)
+
+Acknowledgments:
+- Paulo Alexandre Mateus (pmat@math.ist.utl.pt)
+"""
+
+# Import required Libraries and Packages
+
+# Import Unittest for Python's Unitary Tests
+import unittest
+
+# Import the ClassicalPseudoRandomBinaryStringGenerator from IBM_Qiskit.Utils.Random_Generator.Binary.Classical
+from src.ibm_qiskit.utils.random_generator.binary.classical import ClassicalPseudoRandomBinaryStringGenerator
+
+
+# Test Cases for the Classical Pseudo Random Binary String Generator
+class ClassicalPseudoRandomBinaryStringGeneratorTests(unittest.TestCase):
+
+    # Test the generation of Binary Strings with a fixed Hamming Weight, for several lengths and Hamming Weights
+    def test_fixed_hamming_weight_binary_string_has_exact_hamming_weight(self):
+
+        # Create the Classical Pseudo Random Binary String Generator
+        classical_pseudo_random_binary_string_generator = ClassicalPseudoRandomBinaryStringGenerator \
+            .ClassicalPseudoRandomBinaryStringGenerator("classical_pseudo_random_binary_string_generator")
+
+        # For several lengths and Hamming Weights of the Binary Strings
+        for (binary_string_length, hamming_weight) in [(1, 0), (1, 1), (16, 4), (16, 16), (100, 37)]:
+
+            # Generate the Binary String, with a fixed Hamming Weight
+            binary_string = classical_pseudo_random_binary_string_generator\
+                .generate_fixed_hamming_weight_binary_string(binary_string_length, hamming_weight)
+
+            # Assert that the Binary String has the given length, Hamming Weight and only bits
+            self.assertEqual(len(binary_string), binary_string_length)
+            self.assertEqual(binary_string.count("1"), hamming_weight)
+            self.assertEqual(set(binary_string) - {"0", "1"}, set())
+
+    # Test the generation of a Binary String with a fixed Hamming Weight, with a length of millions of bits
+    def test_fixed_hamming_weight_binary_string_with_millions_of_bits(self):
+
+        # Set the length of the Binary String, as 4 millions of bits, and its Hamming Weight, as a quarter of it
+        binary_string_length = 4000000
+        hamming_weight = binary_string_length // 4
+
+        # Generate the Binary String, with a fixed Hamming Weight
+        binary_string = ClassicalPseudoRandomBinaryStringGenerator \
+            .ClassicalPseudoRandomBinaryStringGenerator("classical_pseudo_random_binary_string_generator") \
+            .generate_fixed_hamming_weight_binary_string(binary_string_length, hamming_weight)
+
+        # Assert that the Binary String has the given length and Hamming Weight
+        self.assertEqual(len(binary_string), binary_string_length)
+        self.assertEqual(binary_string.count("1"), hamming_weight)
+
+    # Test that the Binary Strings generated with the same Seed are the same
+    def test_fixed_hamming_weight_binary_string_is_reproducible_with_seed(self):
+
+        # Generate two Binary Strings, with a fixed Hamming Weight, from Generators with the same Seed
+        binary_strings = [ClassicalPseudoRandomBinaryStringGenerator
+                          .ClassicalPseudoRandomBinaryStringGenerator("classical_pseudo_random_binary_string_generator",
+                                                                      seed=2023)
+                          .generate_fixed_hamming_weight_binary_string(1024, 256) for _ in range(2)]
+
+        # Assert that both Binary Strings are the same
+        self.assertEqual(binary_strings[0], binary_strings[1])
+
+    # Test that it is not possible to generate a Binary String with an invalid Hamming Weight
+    def test_invalid_hamming_weight(self):
+
+        # Create the Classical Pseudo Random Binary String Generator
+        classical_pseudo_random_binary_string_generator = ClassicalPseudoRandomBinaryStringGenerator \
+            .ClassicalPseudoRandomBinaryStringGenerator("classical_pseudo_random_binary_string_generator")
+
+        # Assert that a negative Hamming Weight and a Hamming Weight greater than the length are rejected
+        with self.assertRaises(ValueError):
+            classical_pseudo_random_binary_string_generator.generate_fixed_hamming_weight_binary_string(8, -1)
+        with self.assertRaises(ValueError):
+            classical_pseudo_random_binary_string_generator.generate_fixed_hamming_weight_binary_string(8, 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
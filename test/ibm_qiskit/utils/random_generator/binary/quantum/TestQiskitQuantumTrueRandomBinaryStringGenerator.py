@@ -522,6 +522,29 @@ class QiskitQuantumTrueRandomBinaryStringGeneratorTests(unittest.TestCase):
         # Dummy Assert Equal for Unittest
         self.assertEqual(True, True)
 
+    # Test #13 for the Quantum True Random Binary String Generator (QTRBSG)
+    # Description of the Test Case:
+    # 1) Generate 5 Quantum True Random Binary Strings (QTRBS), with a length of 10 bits, for 1 count,
+    #    twice, with Generators with the same Seed, checking that the same Binary Strings are generated;
+    def test_quantum_5_true_random_binary_string_generators_length_10_bits_1_count_with_seed_reproducible(self):
+
+        # Create two Quantum True Random Binary String Generators (QTRBSG), with the same Seed
+        qiskit_quantum_true_random_binary_string_generators = \
+            [QiskitQuantumTrueRandomBinaryStringGenerator
+             .QiskitQuantumTrueRandomBinaryStringGenerator("quantum_true_random_binary_string_generator_10_qubits",
+                                                           binary_string_length=10, num_counts=1, seed=42)
+             for _ in range(2)]
+
+        # Generate 5 Quantum True Random Binary Strings (QTRBS), with each Generator
+        quantum_true_random_binary_strings_lists = \
+            [[qiskit_quantum_true_random_binary_string_generator.generate_true_random_binary_string(0, 0)
+              for _ in range(5)]
+             for qiskit_quantum_true_random_binary_string_generator in
+             qiskit_quantum_true_random_binary_string_generators]
+
+        # Assert that the same Quantum True Random Binary Strings (QTRBS) were generated, with the same Seed
+        self.assertEqual(quantum_true_random_binary_strings_lists[0], quantum_true_random_binary_strings_lists[1])
+
 
 if __name__ == '__main__':
 